@@ -8,9 +8,10 @@ error handling, and retry logic.
 import threading
 
 from .types import ModelSource
-from .errors import APIError, APIErrorType, RetryableAPIError
+from .errors import APIError, APIErrorType, CircuitOpenError, RequestCancelledError, RetryableAPIError
 from .providers import APIProvider
 from .manager import APIManager
+from .streaming import TranslationStream
 
 # Singleton management
 _api_manager: APIManager | None = None
@@ -62,7 +63,10 @@ __all__ = [
     "APIError",
     "APIErrorType",
     "RetryableAPIError",
+    "RequestCancelledError",
+    "CircuitOpenError",
     "ModelSource",
+    "TranslationStream",
     "get_api_manager",
     "init_api_manager",
 ]
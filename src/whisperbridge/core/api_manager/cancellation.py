@@ -0,0 +1,141 @@
+"""
+Request cancellation for the API Manager package.
+
+A CancelToken is a ``threading.Event`` that, when set, also aborts the
+provider calls bound to it: adapters run their HTTP request as a task on the
+event loop and the token cancels that task, which closes the underlying
+connection or stream. Blocking callers therefore get their thread back as
+soon as the token is set instead of waiting for the provider's timeout.
+"""
+
+import asyncio
+import inspect
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, List, TypeVar
+
+from loguru import logger
+
+from .errors import RequestCancelledError
+
+T = TypeVar("T")
+
+
+class CancelToken(threading.Event):
+    """
+    Cancellation flag that aborts the in-flight work bound to it.
+
+    Being an Event, a token can be passed wherever a cancellation
+    ``threading.Event`` is accepted; ``set()`` and ``cancel()`` are the same.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._callbacks: List[Callable[[], None]] = []
+        self._callbacks_lock = threading.Lock()
+
+    def set(self) -> None:
+        """Flag the token and run the registered callbacks (once)."""
+        with self._callbacks_lock:
+            if self.is_set():
+                return
+            super().set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"Cancellation callback failed: {e}")
+
+    cancel = set
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the token has been cancelled."""
+        return self.is_set()
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Run ``callback`` when the token is cancelled (now, if it already is).
+
+        Returns:
+            A function that unregisters the callback.
+        """
+        with self._callbacks_lock:
+            if not self.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._callbacks_lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raises:
+            RequestCancelledError: If the token has been cancelled.
+        """
+        if self.is_set():
+            raise RequestCancelledError("Request cancelled")
+
+    async def run(self, awaitable: Awaitable[T]) -> T:
+        """
+        Await ``awaitable`` as a task that is cancelled when the token is.
+
+        The token may be cancelled from any thread; the task is cancelled on
+        its own loop, so httpx closes the connection of an unfinished request.
+
+        Raises:
+            RequestCancelledError: If the token was cancelled first.
+        """
+        if self.is_set():
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise RequestCancelledError("Request cancelled")
+
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(awaitable)
+        remove = self.add_callback(lambda: loop.call_soon_threadsafe(task.cancel))
+        try:
+            return await task
+        except asyncio.CancelledError:
+            # Only the token's own cancellation becomes RequestCancelledError
+            # (Task.cancelling() tells outer cancellation apart on Python 3.11+)
+            cancelling = getattr(asyncio.current_task(), "cancelling", None)
+            if self.is_set() and not (cancelling and cancelling()):
+                raise RequestCancelledError("Request cancelled") from None
+            raise
+        finally:
+            remove()
+
+    async def iterate(self, stream: Any) -> AsyncIterator[Any]:
+        """
+        Relay an async chunk stream, aborting the pending read on cancellation.
+
+        The stream is closed (``aclose()`` or ``close()``) when iteration ends
+        for any reason, which releases its connection.
+
+        Raises:
+            RequestCancelledError: If the token is cancelled mid-stream.
+        """
+        iterator = stream.__aiter__()
+        try:
+            while True:
+                try:
+                    chunk = await self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield chunk
+        finally:
+            close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+            if callable(close):
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+
+
+__all__ = [
+    "CancelToken",
+]
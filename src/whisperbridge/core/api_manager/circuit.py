@@ -0,0 +1,247 @@
+"""
+Per-provider circuit breakers for the API Manager package.
+
+A breaker opens after a number of consecutive outage errors (network,
+timeout, server error) from its provider. While it is open, requests to the
+provider fail fast with ``CircuitOpenError`` instead of waiting through
+connect timeouts and retries. Once the open period has passed, the breaker
+goes half-open and lets a single trial through: a cheap unauthenticated
+probe sent by the API manager, or the next real request if the provider
+cannot be probed. A successful trial closes the breaker; a failed one opens
+it again for twice as long (up to a limit).
+
+Any answer from the provider that is not an outage (e.g. an authentication
+or rate-limit error) proves it is reachable and counts as a success here.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Optional, Set
+
+from loguru import logger
+
+from .errors import APIErrorType, CircuitOpenError
+
+# Error classifications that indicate the provider is unreachable or failing
+OUTAGE_ERROR_TYPES = frozenset({APIErrorType.NETWORK, APIErrorType.TIMEOUT, APIErrorType.SERVER_ERROR})
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitPolicy:
+    """Thresholds and timings of a circuit breaker."""
+
+    failure_threshold: int = 3
+    open_seconds: float = 15.0
+    max_open_seconds: float = 300.0
+    # A trial not finished within this time (e.g. a cancelled request) frees its slot
+    trial_timeout: float = 60.0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of one provider.
+
+    Args:
+        name: Provider name (for logs and errors).
+        policy: Thresholds and timings (defaults if omitted).
+    """
+
+    def __init__(self, name: str, policy: Optional[CircuitPolicy] = None):
+        self.name = name
+        self.policy = policy or CircuitPolicy()
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._open_seconds = self.policy.open_seconds
+        self._opened_at = 0.0
+        self._trial_started: Optional[float] = None
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state."""
+        with self._lock:
+            return self._state
+
+    def _retry_in_locked(self, now: float) -> float:
+        return max(0.0, self._opened_at + self._open_seconds - now)
+
+    def _trial_busy_locked(self, now: float) -> bool:
+        return self._trial_started is not None and now - self._trial_started < self.policy.trial_timeout
+
+    def retry_in(self) -> Optional[float]:
+        """Seconds until the next trial is due (0 if due now), or None while closed."""
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return None
+            return self._retry_in_locked(time.monotonic())
+
+    def is_available(self) -> bool:
+        """Check whether a request would currently be let through."""
+        now = time.monotonic()
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return True
+            return self._retry_in_locked(now) == 0 and not self._trial_busy_locked(now)
+
+    def allow_request(self) -> None:
+        """
+        Admit a request, taking the trial slot if the breaker is due for one.
+
+        Raises:
+            CircuitOpenError: While the breaker is open or another trial is running.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return
+            retry_in = self._retry_in_locked(now)
+            if retry_in == 0 and not self._trial_busy_locked(now):
+                self._state = CircuitState.HALF_OPEN
+                self._trial_started = now
+                logger.info(f"Circuit for {self.name} half-open: sending a trial request")
+                return
+            self._rejected += 1
+        raise CircuitOpenError(self.name, retry_in)
+
+    def try_probe(self) -> bool:
+        """Take the trial slot for a probe if one is due; returns False otherwise."""
+        now = time.monotonic()
+        with self._lock:
+            if self._state == CircuitState.CLOSED or self._retry_in_locked(now) > 0 or self._trial_busy_locked(now):
+                return False
+            self._state = CircuitState.HALF_OPEN
+            self._trial_started = now
+            return True
+
+    def release_trial(self) -> None:
+        """Give the trial slot back without an outcome (e.g. the provider cannot be probed)."""
+        with self._lock:
+            self._trial_started = None
+
+    def record_success(self) -> None:
+        """Record an answer from the provider; closes the breaker."""
+        with self._lock:
+            if self._state != CircuitState.CLOSED:
+                logger.info(f"Circuit for {self.name} closed: provider is responding again")
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._open_seconds = self.policy.open_seconds
+            self._trial_started = None
+
+    def record_failure(self, error_type: Optional[APIErrorType]) -> bool:
+        """
+        Record a failed request.
+
+        Returns:
+            True if this failure opened the breaker.
+        """
+        if error_type not in OUTAGE_ERROR_TYPES:
+            self.record_success()
+            return False
+
+        now = time.monotonic()
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == CircuitState.HALF_OPEN:
+                # The trial failed: stay away twice as long
+                self._open_seconds = min(self.policy.max_open_seconds, self._open_seconds * 2)
+            elif self._state == CircuitState.OPEN or self._consecutive_failures < self.policy.failure_threshold:
+                return False
+            self._state = CircuitState.OPEN
+            self._opened_at = now
+            self._trial_started = None
+            self._times_opened += 1
+            open_seconds = self._open_seconds
+            failures = self._consecutive_failures
+        logger.warning(
+            f"Circuit for {self.name} opened after {failures} consecutive failures; "
+            f"failing fast for {open_seconds:.0f}s"
+        )
+        return True
+
+    def reset(self) -> None:
+        """Close the breaker and clear its counters."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._open_seconds = self.policy.open_seconds
+            self._trial_started = None
+            self._times_opened = 0
+            self._rejected = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """State, consecutive failures, times opened, fast-failed requests and seconds until the next trial."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "state": self._state.value,
+                "consecutive_failures": self._consecutive_failures,
+                "opened": self._times_opened,
+                "rejected": self._rejected,
+                "retry_in": None if self._state == CircuitState.CLOSED else self._retry_in_locked(now),
+            }
+
+
+class CircuitBreakers:
+    """Thread-safe registry of circuit breakers keyed by provider name."""
+
+    def __init__(self, policy: Optional[CircuitPolicy] = None):
+        self._policy = policy
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._probing: Set[str] = set()
+
+    def get(self, provider: str) -> CircuitBreaker:
+        """Breaker of a provider, created on first use."""
+        with self._lock:
+            breaker = self._breakers.get(provider)
+            if breaker is None:
+                breaker = self._breakers[provider] = CircuitBreaker(provider, self._policy)
+            return breaker
+
+    def start_probing(self, provider: str) -> bool:
+        """Mark a provider as being probed; returns False if a prober already runs."""
+        with self._lock:
+            if provider in self._probing:
+                return False
+            self._probing.add(provider)
+            return True
+
+    def stop_probing(self, provider: str) -> None:
+        """Clear the probing mark of a provider."""
+        with self._lock:
+            self._probing.discard(provider)
+
+    def reset(self) -> None:
+        """Close all breakers."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider breaker statistics (see ``CircuitBreaker.stats``)."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.stats() for name, breaker in breakers.items()}
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "CircuitPolicy",
+    "CircuitState",
+    "OUTAGE_ERROR_TYPES",
+]
@@ -0,0 +1,249 @@
+"""
+Request coalescing for the API Manager package.
+
+This module provides the RequestCoalescer class which collapses identical
+concurrent provider requests into a single in-flight call (single-flight).
+"""
+
+import asyncio
+import contextvars
+import functools
+import hashlib
+import json
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+from .cancellation import CancelToken
+from .errors import RequestCancelledError
+
+# How often waiting callers re-check their own cancellation flag
+_WAIT_POLL_SECONDS = 0.05
+
+
+class _InFlightRequest:
+    """Shared state of one in-flight request and the callers attached to it."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.done = threading.Event()
+        # Cancelled once every attached caller has cancelled; aborts the request bound to it
+        self.cancelled = CancelToken()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.refcount = 0
+
+
+class _AsyncInFlightRequest:
+    """Shared task of one in-flight async request and its caller count."""
+
+    def __init__(self, key: str, task: "asyncio.Task[Any]"):
+        self.key = key
+        self.task = task
+        self.refcount = 0
+
+
+class RequestCoalescer:
+    """
+    Single-flight coalescing of identical requests.
+
+    The first caller for a key starts the request on a background thread;
+    concurrent callers with the same key attach to it and receive the same
+    response or error. Cancellation is reference counted: a caller that
+    cancels only detaches itself, and the shared request's CancelToken is
+    cancelled only when no callers remain.
+
+    ``run_async`` offers the same semantics for coroutines: the shared request
+    is a task on the caller's event loop and is cancelled once every awaiting
+    caller has been cancelled.
+    """
+
+    def __init__(self):
+        """Initialize the RequestCoalescer."""
+        self._inflight: Dict[str, _InFlightRequest] = {}
+        # Tasks are bound to their loop, so async requests are grouped per loop
+        self._async_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _AsyncInFlightRequest]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._started = 0
+        self._coalesced = 0
+
+    @staticmethod
+    def make_key(provider: str, params: Dict[str, Any]) -> str:
+        """
+        Build a coalescing key from the fully resolved request.
+
+        Args:
+            provider: Provider identifier.
+            params: Final request parameters (model, messages and kwargs).
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        payload = json.dumps({"provider": provider, "params": params}, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def run(
+        self,
+        key: str,
+        func: Callable[[CancelToken], Any],
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Any:
+        """
+        Run ``func`` once for all concurrent callers of ``key``.
+
+        Args:
+            key: Coalescing key from ``make_key``.
+            func: Request function; receives the shared cancellation token,
+                which is cancelled only when every attached caller has cancelled.
+            cancel_event: Optional per-caller cancellation flag.
+
+        Returns:
+            The shared request result.
+
+        Raises:
+            RequestCancelledError: If this caller cancelled before completion.
+            Exception: The error raised by the shared request.
+        """
+        with self._lock:
+            request = self._inflight.get(key)
+            is_leader = request is None
+            if is_leader:
+                request = _InFlightRequest(key)
+                self._inflight[key] = request
+                self._started += 1
+            else:
+                self._coalesced += 1
+            request.refcount += 1
+
+        if is_leader:
+            # Run in a copy of the leader's context so its request_deadline/request_priority apply
+            thread = threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(self._execute, request, func),
+                name="coalesced-request",
+                daemon=True,
+            )
+            thread.start()
+        else:
+            logger.debug(f"Coalesced duplicate request onto in-flight call {key[:12]}")
+
+        while not request.done.wait(_WAIT_POLL_SECONDS if cancel_event is not None else None):
+            if cancel_event is not None and cancel_event.is_set():
+                self._detach(request)
+                raise RequestCancelledError("Request cancelled")
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _execute(self, request: _InFlightRequest, func: Callable[[CancelToken], Any]) -> None:
+        """Run the shared request and publish its outcome."""
+        try:
+            request.result = func(request.cancelled)
+        except BaseException as e:  # noqa: BLE001 - propagated to every caller
+            request.error = e
+        finally:
+            with self._lock:
+                if self._inflight.get(request.key) is request:
+                    self._inflight.pop(request.key, None)
+            request.done.set()
+
+    def _detach(self, request: _InFlightRequest) -> None:
+        """Detach one caller; flag the request cancelled when none remain."""
+        with self._lock:
+            request.refcount -= 1
+            if request.refcount > 0:
+                return
+            # Nobody is waiting anymore: later identical requests must start fresh
+            if self._inflight.get(request.key) is request:
+                self._inflight.pop(request.key, None)
+        request.cancelled.set()
+        logger.debug(f"All callers cancelled in-flight request {request.key[:12]}")
+
+    async def run_async(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``factory()`` once for all concurrent callers of ``key`` on this loop.
+
+        Args:
+            key: Coalescing key from ``make_key``.
+            factory: Zero-argument callable returning the request coroutine.
+
+        Returns:
+            The shared request result.
+
+        Raises:
+            asyncio.CancelledError: If this caller was cancelled.
+            Exception: The error raised by the shared request.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            requests = self._async_inflight.setdefault(loop, {})
+            request = requests.get(key)
+            if request is None:
+                request = _AsyncInFlightRequest(key, loop.create_task(factory()))
+                requests[key] = request
+                self._started += 1
+                # The callback must not hold the loop: it lives in the table the loop keys
+                request.task.add_done_callback(functools.partial(self._forget_async, request))
+            else:
+                self._coalesced += 1
+                logger.debug(f"Coalesced duplicate request onto in-flight call {key[:12]}")
+            request.refcount += 1
+
+        try:
+            # Shielded so one caller's cancellation does not abort the others
+            return await asyncio.shield(request.task)
+        except asyncio.CancelledError:
+            self._detach_async(loop, request)
+            raise
+
+    def _pop_async_locked(self, loop: asyncio.AbstractEventLoop, request: _AsyncInFlightRequest) -> None:
+        """Remove an async request from its loop's in-flight table; caller must hold ``_lock``."""
+        requests = self._async_inflight.get(loop)
+        if requests is None or requests.get(request.key) is not request:
+            return
+        del requests[request.key]
+        if not requests:
+            del self._async_inflight[loop]
+
+    def _forget_async(self, request: _AsyncInFlightRequest, task: "asyncio.Task[Any]") -> None:
+        """Remove a finished async request from the in-flight table."""
+        with self._lock:
+            self._pop_async_locked(task.get_loop(), request)
+
+    def _detach_async(self, loop: asyncio.AbstractEventLoop, request: _AsyncInFlightRequest) -> None:
+        """Detach one async caller; cancel the shared task when none remain."""
+        with self._lock:
+            request.refcount -= 1
+            if request.refcount > 0 or request.task.done():
+                return
+            self._pop_async_locked(loop, request)
+        request.task.cancel()
+        logger.debug(f"All callers cancelled in-flight request {request.key[:12]}")
+
+    def in_flight_count(self) -> int:
+        """Return the number of distinct requests currently in flight."""
+        with self._lock:
+            return len(self._inflight) + self._async_count_locked()
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters for started and coalesced requests."""
+        with self._lock:
+            return {
+                "started": self._started,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._inflight) + self._async_count_locked(),
+            }
+
+    def _async_count_locked(self) -> int:
+        """Number of async requests in flight on all loops; caller must hold ``_lock``."""
+        return sum(len(requests) for requests in self._async_inflight.values())
+
+
+__all__ = [
+    "RequestCoalescer",
+]
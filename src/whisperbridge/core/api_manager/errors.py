@@ -5,17 +5,23 @@ This module contains:
 - APIErrorType enum for categorizing errors
 - APIError dataclass for error information
 - RetryableAPIError exception for retryable errors
+- RequestCancelledError exception for cancelled requests
+- CircuitOpenError exception for requests skipped by an open circuit breaker
 - requires_initialization decorator
+- parse_retry_after function for Retry-After / rate-limit headers
 - classify_error function for error classification
 - log_network_diagnostics function for network debugging
 """
 
 import importlib
+import inspect
 import os
 import platform
+import re
 import sys
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
 from functools import wraps
 from typing import Any, Dict, Optional
@@ -43,7 +49,7 @@ class APIError:
     error_type: APIErrorType
     message: str
     status_code: Optional[int] = None
-    retry_after: Optional[int] = None
+    retry_after: Optional[float] = None
     timestamp: Optional[datetime] = None
 
     def __post_init__(self):
@@ -52,13 +58,59 @@ class APIError:
 
 
 class RetryableAPIError(Exception):
-    """Custom exception to signal a retryable API error."""
+    """
+    Custom exception to signal a retryable API error.
+
+    Attributes:
+        error_type: Classification of the underlying error.
+        retry_after: Seconds the provider asked to wait before retrying, if known.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        error_type: Optional[APIErrorType] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.error_type = error_type
+        self.retry_after = retry_after
+
+
+class RequestCancelledError(Exception):
+    """Raised to a caller whose request was cancelled before completion."""
 
     pass
 
 
+class CircuitOpenError(Exception):
+    """
+    Raised without contacting a provider whose circuit breaker is open.
+
+    Attributes:
+        provider: Name of the unavailable provider.
+        retry_in: Seconds until the provider is checked again.
+    """
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(
+            f"{provider} is not responding; skipping requests to it for {max(0.0, retry_in):.0f}s"
+        )
+        self.provider = provider
+        self.retry_in = retry_in
+
+
 def requires_initialization(func):
     """Decorator to ensure API manager is initialized before method execution."""
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            if not self.is_initialized():
+                raise RuntimeError("API manager not initialized")
+            return await func(self, *args, **kwargs)
+
+        return async_wrapper
+
     @wraps(func)
     def sync_wrapper(self, *args, **kwargs):
         if not self.is_initialized():
@@ -68,6 +120,139 @@ def requires_initialization(func):
     return sync_wrapper
 
 
+# Explicit retry delays, most specific first. OpenAI sends "retry-after-ms".
+_RETRY_AFTER_HEADERS = (
+    "retry-after-ms",
+    "retry-after",
+)
+# Limits with "x-ratelimit-reset-<limit>" durations such as "1s", "6m0s" or
+# "20ms" and a matching "x-ratelimit-remaining-<limit>" count. OpenAI sends
+# them on every response, so they only mean "wait" on a rate-limit error.
+_RATE_LIMITS = ("requests", "tokens")
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse a header duration: plain seconds, an HTTP date, or a "6m0s"-style duration."""
+    value = value.strip().lower()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(number + unit for number, unit in parts) == value:
+        return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _header_seconds(headers: Any, name: str) -> Optional[float]:
+    """Read one header as a delay in seconds."""
+    try:
+        value = headers.get(name)
+    except Exception:
+        return None
+    if not isinstance(value, str) or not value.strip():
+        return None
+    seconds = _parse_duration(value)
+    if seconds is None:
+        return None
+    return seconds / 1000.0 if name == "retry-after-ms" else seconds
+
+
+def _header_retry_after(headers: Any, rate_limited: bool) -> Optional[float]:
+    """Read the retry delay from response headers.
+
+    ``Retry-After`` always wins. On a rate-limit error the reset of the
+    exhausted limit is used, or the latest reset when none is reported as
+    exhausted, so the retry does not run into the other limit again.
+    """
+    for name in _RETRY_AFTER_HEADERS:
+        seconds = _header_seconds(headers, name)
+        if seconds is not None:
+            return seconds
+    if not rate_limited:
+        return None
+
+    resets = {limit: _header_seconds(headers, f"x-ratelimit-reset-{limit}") for limit in _RATE_LIMITS}
+    exhausted = []
+    for limit, seconds in resets.items():
+        try:
+            remaining = str(headers.get(f"x-ratelimit-remaining-{limit}", "")).strip()
+        except Exception:
+            remaining = ""
+        if seconds is not None and remaining == "0":
+            exhausted.append(seconds)
+    if exhausted:
+        return max(exhausted)
+
+    candidates = [seconds for seconds in resets.values() if seconds is not None]
+    generic = _header_seconds(headers, "x-ratelimit-reset")
+    if generic is not None:
+        candidates.append(generic)
+    return max(candidates) if candidates else None
+
+
+def _details_retry_after(details: Any) -> Optional[float]:
+    """Read ``google.rpc.RetryInfo.retryDelay`` (e.g. "20s") from a Gemini error payload."""
+    if isinstance(details, dict):
+        delay = details.get("retryDelay")
+        if isinstance(delay, str):
+            return _parse_duration(delay)
+        details = list(details.values())
+    if isinstance(details, list):
+        for item in details:
+            seconds = _details_retry_after(item)
+            if seconds is not None:
+                return seconds
+    return None
+
+
+def parse_retry_after(error: BaseException, rate_limited: bool = True) -> Optional[float]:
+    """
+    Extract the provider's requested retry delay from an error.
+
+    Checks an explicit ``retry_after`` attribute, then ``Retry-After`` /
+    rate-limit reset headers of the attached HTTP response, then Gemini's
+    ``RetryInfo`` error details.
+
+    Args:
+        error: The exception raised by a provider client.
+        rate_limited: Whether the error is a rate limit; only then are the
+            ``x-ratelimit-reset-*`` headers read.
+
+    Returns:
+        Delay in seconds, or None if the error carries no hint.
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if isinstance(retry_after, (int, float)) and not isinstance(retry_after, bool):
+        return max(0.0, float(retry_after))
+
+    for source in (getattr(error, "response", None), error):
+        headers = getattr(source, "headers", None)
+        if headers is not None:
+            seconds = _header_retry_after(headers, rate_limited)
+            if seconds is not None:
+                return seconds
+
+    return _details_retry_after(getattr(error, "details", None))
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """Get the HTTP status code of an error, from the error or its response."""
+    for source in (error, getattr(error, "response", None)):
+        status_code = getattr(source, "status_code", None)
+        if isinstance(status_code, int):
+            return status_code
+    return None
+
+
 def classify_error(error: Exception, provider: Optional[str] = None) -> APIError:
     """
     Classify exception into API error type.
@@ -81,17 +266,15 @@ def classify_error(error: Exception, provider: Optional[str] = None) -> APIError
     """
     error_str = str(error).lower()
     error_type = type(error).__name__.lower()
+    status_code = _status_code(error)
 
     # Authentication errors
     if any(keyword in error_str for keyword in ["unauthorized", "invalid api key", "authentication"]):
         return APIError(APIErrorType.AUTHENTICATION, str(error))
 
     # Rate limit errors
-    if any(keyword in error_str for keyword in ["rate limit", "too many requests"]):
-        retry_after = None
-        if hasattr(error, "retry_after"):
-            retry_after = getattr(error, "retry_after", None)
-        return APIError(APIErrorType.RATE_LIMIT, str(error), retry_after=retry_after)
+    if status_code == 429 or any(keyword in error_str for keyword in ["rate limit", "too many requests"]):
+        return APIError(APIErrorType.RATE_LIMIT, str(error), status_code, retry_after=parse_retry_after(error))
 
     # Quota exceeded
     if any(keyword in error_str for keyword in ["quota", "billing"]):
@@ -108,10 +291,8 @@ def classify_error(error: Exception, provider: Optional[str] = None) -> APIError
         return APIError(APIErrorType.INVALID_REQUEST, str(error))
 
     # Server errors
-    if hasattr(error, "status_code"):
-        status_code = getattr(error, "status_code", None)
-        if status_code and status_code >= 500:
-            return APIError(APIErrorType.SERVER_ERROR, str(error), status_code)
+    if status_code and status_code >= 500:
+        return APIError(APIErrorType.SERVER_ERROR, str(error), status_code, retry_after=parse_retry_after(error, rate_limited=False))
 
     # Unknown error
     return APIError(APIErrorType.UNKNOWN, str(error))
@@ -174,7 +355,10 @@ __all__ = [
     "APIErrorType",
     "APIError",
     "RetryableAPIError",
+    "RequestCancelledError",
+    "CircuitOpenError",
     "requires_initialization",
     "classify_error",
+    "parse_retry_after",
     "log_network_diagnostics",
 ]
@@ -0,0 +1,234 @@
+"""
+Hedged requests for the API Manager package.
+
+With hedging enabled, a request that the primary provider has not answered
+within a percentile of its recent latency is also sent to a secondary
+provider; the first successful answer wins and the other request is
+cancelled. A primary that fails outright starts the hedge immediately.
+
+Provider order, percentile and the initial delay are configured per request
+mode in the ``hedge_policies`` setting.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from loguru import logger
+
+from ..config import HEDGE_POLICY_DEFAULTS, SUPPORTED_PROVIDERS
+
+T = TypeVar("T")
+
+# Builds (messages, model_hint, api_kwargs) of a request for another provider,
+# or returns None if that provider cannot serve it
+HedgeRequestBuilder = Callable[[str], Optional[Tuple[List[Dict[str, Any]], Optional[str], Dict[str, Any]]]]
+
+# Latency samples kept per provider and mode, and needed before the percentile is used
+_SAMPLE_WINDOW = 50
+_MIN_SAMPLES = 5
+
+# Never hedge sooner than this, to keep duplicate requests (and cost) rare
+MIN_HEDGE_DELAY_SECONDS = 0.25
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """Hedging settings of one request mode."""
+
+    providers: Tuple[str, ...]
+    percentile: float = 95.0
+    delay: float = 2.0
+
+    @classmethod
+    def from_config(cls, config_service: Any, mode: str) -> Optional["HedgePolicy"]:
+        """
+        Build the policy of a mode from application settings.
+
+        Missing or invalid values fall back to ``HEDGE_POLICY_DEFAULTS``.
+
+        Returns:
+            The policy, or None if hedging is disabled.
+        """
+        if config_service.get_setting("hedging_enabled") is not True:
+            return None
+        defaults = HEDGE_POLICY_DEFAULTS.get(mode, HEDGE_POLICY_DEFAULTS["translate"])
+        policies = config_service.get_setting("hedge_policies")
+        raw = policies.get(mode) if isinstance(policies, dict) else None
+        raw = raw if isinstance(raw, dict) else {}
+
+        providers = raw.get("providers", defaults["providers"])
+        if not isinstance(providers, list):
+            providers = defaults["providers"]
+        providers = tuple(
+            dict.fromkeys(
+                str(name).strip().lower() for name in providers if str(name).strip().lower() in SUPPORTED_PROVIDERS
+            )
+        )
+
+        def number(key: str, low: float, high: float) -> float:
+            try:
+                value = float(raw.get(key, defaults[key]))
+            except (TypeError, ValueError):
+                value = float(defaults[key])
+            return min(high, max(low, value))
+
+        return cls(
+            providers=providers,
+            percentile=number("percentile", 50, 99.9),
+            delay=number("delay_ms", MIN_HEDGE_DELAY_SECONDS * 1000, 60000) / 1000,
+        )
+
+
+class HedgeLatencies:
+    """Sliding windows of successful request latencies per provider and mode."""
+
+    def __init__(self, window: int = _SAMPLE_WINDOW):
+        self._window = window
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, mode: str, seconds: float) -> None:
+        """Record the latency of a successful request."""
+        with self._lock:
+            self._samples.setdefault((provider, mode), deque(maxlen=self._window)).append(seconds)
+
+    def percentile(self, provider: str, mode: str, percentile: float) -> Optional[float]:
+        """
+        Latency percentile of a provider in a mode (nearest-rank).
+
+        Returns:
+            The latency in seconds, or None with too few samples.
+        """
+        with self._lock:
+            samples = sorted(self._samples.get((provider, mode), ()))
+        if len(samples) < _MIN_SAMPLES:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * len(samples)))
+        return samples[rank - 1]
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        with self._lock:
+            self._samples.clear()
+
+
+class Hedger:
+    """Runs requests with an optional hedge to a secondary provider."""
+
+    def __init__(self):
+        self.latencies = HedgeLatencies()
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "hedged": 0, "primary_wins": 0, "hedge_wins": 0}
+
+    def hedge_delay(self, provider: str, mode: str, policy: HedgePolicy) -> float:
+        """Delay before hedging: the primary's latency percentile, else the policy delay."""
+        observed = self.latencies.percentile(provider, mode, policy.percentile)
+        return max(MIN_HEDGE_DELAY_SECONDS, observed if observed is not None else policy.delay)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counters[key] += 1
+
+    async def _timed(self, provider: str, mode: str, request: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        result = await request()
+        self.latencies.record(provider, mode, time.monotonic() - started)
+        return result
+
+    async def run(
+        self,
+        mode: str,
+        policy: HedgePolicy,
+        primary: Tuple[str, Callable[[], Awaitable[T]]],
+        secondary: Optional[Tuple[str, Callable[[], Awaitable[T]]]] = None,
+        discard: Optional[Callable[[T], Awaitable[None]]] = None,
+    ) -> Tuple[T, str]:
+        """
+        Run the primary request, hedging to the secondary if it is slow or fails.
+
+        Args:
+            mode: Request mode (``translate``, ``style`` or ``ocr``).
+            policy: Hedging policy of the mode.
+            primary: (provider name, request factory) of the primary provider.
+            secondary: (provider name, request factory) of the hedge, if any.
+            discard: Releases a result that lost the race (e.g. closes a stream).
+
+        Returns:
+            Tuple of (result, provider name that produced it).
+
+        Raises:
+            Exception: The primary's error if no request succeeded.
+        """
+        self._count("requests")
+        primary_name, primary_request = primary
+        if secondary is None:
+            return await self._timed(primary_name, mode, primary_request), primary_name
+
+        tasks = {asyncio.ensure_future(self._timed(primary_name, mode, primary_request)): primary_name}
+        delay = self.hedge_delay(primary_name, mode, policy)
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            first = next(iter(tasks))
+            if first in done and first.exception() is None:
+                self._count("primary_wins")
+                return first.result(), primary_name
+
+            secondary_name, secondary_request = secondary
+            reason = "failed" if done else f"no answer after {delay * 1000:.0f} ms"
+            logger.info(f"Hedging {mode} request: {primary_name} {reason}; sending to {secondary_name}")
+            self._count("hedged")
+            tasks[asyncio.ensure_future(self._timed(secondary_name, mode, secondary_request))] = secondary_name
+
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None:
+                    name = tasks[winner]
+                    self._count("primary_wins" if name == primary_name else "hedge_wins")
+                    logger.debug(f"Hedged {mode} request answered by {name}")
+                    await self._release_losers(tasks, winner, discard)
+                    return winner.result(), name
+
+            # Everything failed: report the primary's error
+            raise first.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    async def _release_losers(
+        tasks: Dict["asyncio.Future[Any]", str],
+        winner: "asyncio.Future[Any]",
+        discard: Optional[Callable[[Any], Awaitable[None]]],
+    ) -> None:
+        """Cancel requests that lost the race; discard results that arrived anyway."""
+        for task in tasks:
+            if task is winner:
+                continue
+            if not task.done():
+                task.cancel()
+            elif discard is not None and not task.cancelled() and task.exception() is None:
+                try:
+                    await discard(task.result())
+                except Exception as e:
+                    logger.debug(f"Failed to discard hedged result: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: requests, hedged requests, and wins of primary vs. hedge."""
+        with self._lock:
+            return dict(self._counters)
+
+
+__all__ = [
+    "HedgeLatencies",
+    "HedgePolicy",
+    "HedgeRequestBuilder",
+    "Hedger",
+    "MIN_HEDGE_DELAY_SECONDS",
+]
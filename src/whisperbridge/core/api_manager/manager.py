@@ -5,25 +5,53 @@ This module provides the APIManager class which coordinates all components
 of the API management system.
 """
 
+import asyncio
+import concurrent.futures
+import inspect
 import threading
 import time
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
-from ..config import ensure_config_dir, get_deepl_identifier
+from ..async_runtime import get_async_runtime
+from ..completion_budget import MODE_OCR, MODE_STYLE, MODE_TRANSLATE, get_completion_budget, is_truncated
+from ..config import (
+    API_TIMEOUT_DEFAULT,
+    API_TIMEOUT_MAX,
+    API_TIMEOUT_MIN,
+    SUPPORTED_PROVIDERS,
+    ensure_config_dir,
+    get_deepl_identifier,
+    is_llm_provider,
+)
+from ..image_parts import is_image_part
 from ..model_limits import get_model_max_completion_tokens
 from ...services.config_service import ConfigService
 from .cache import ModelCache
-from .errors import APIError, APIErrorType, RetryableAPIError, classify_error, log_network_diagnostics, requires_initialization
+from .cancellation import CancelToken
+from .circuit import CircuitBreakers
+from .coalescing import RequestCoalescer
+from .errors import (
+    APIError,
+    APIErrorType,
+    RequestCancelledError,
+    RetryableAPIError,
+    classify_error,
+    log_network_diagnostics,
+    requires_initialization,
+)
+from .hedging import HedgePolicy, HedgeRequestBuilder, Hedger
 from .models import ModelManager
 from .providers import APIProvider, ProviderRegistry
+from .retry import RetryEngine, request_deadline
+from .routing import ProviderRouter
+from .streaming import TranslationStream
+from .throttling import RateLimiter, RateLimits, RatePermit, estimate_request_tokens
+from .warmup import ConnectionWarmer, LatencyTracker
+
+# Providers that accept image input
+_VISION_PROVIDERS = (APIProvider.OPENAI.value, APIProvider.GOOGLE.value)
 
 
 class APIManager:
@@ -51,6 +79,15 @@ class APIManager:
         self._cache = ModelCache(config_dir)
         self._providers = ProviderRegistry(config_service)
         self._model_manager = ModelManager(self._cache, config_service, self._providers)
+        self._coalescer = RequestCoalescer()
+        self._latency = LatencyTracker()
+        self._warmer = ConnectionWarmer(self._providers, self._latency)
+        self._retry = RetryEngine()
+        self._hedger = Hedger()
+        self._router = ProviderRouter(config_dir)
+        self._breakers = CircuitBreakers()
+        self._limiter = RateLimiter()
+        self._probes: Dict[str, concurrent.futures.Future] = {}
 
     def initialize(self) -> bool:
         """
@@ -70,6 +107,8 @@ class APIManager:
             # Always finalize to allow offline/partial functionality
             # This sets _is_initialized to True and loads the cache
             self._finalize_initialization()
+            if success:
+                self.schedule_warm_up("startup")
             return success
 
     def reinitialize(self) -> bool:
@@ -87,6 +126,11 @@ class APIManager:
         with self._lock:
             self._providers.clear()
             self._cache.clear(delete_persisted=True)
+            self._latency.reset()
+            self._retry.metrics.reset()
+            self._hedger.latencies.reset()
+            self._breakers.reset()
+            self._limiter.reset()
             self._is_initialized = False
 
         return self.initialize()
@@ -113,6 +157,74 @@ class APIManager:
         """Check if any API clients are configured."""
         return self._providers.has_any_clients()
 
+    def get_transport_stats(self) -> Dict[str, int]:
+        """Get connection pool statistics (requests, connections opened and reused)."""
+        return self._providers.transport_stats()
+
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """Get request latency statistics for cold vs. warm requests and warm-ups."""
+        return self._latency.stats()
+
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """Per-attempt timings by outcome, retries, backoff time and early give-ups."""
+        return self._retry.metrics.stats()
+
+    def get_hedge_stats(self) -> Dict[str, int]:
+        """Hedged request counters: requests, hedges sent, and wins of primary vs. hedge."""
+        return self._hedger.stats()
+
+    def get_router_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per provider/model request counts, error rate, EWMA and p95 latency used for routing."""
+        return self._router.stats()
+
+    def get_circuit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider circuit breaker state, failures, times opened and fast-failed requests."""
+        return self._breakers.stats()
+
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Client-side rate limiter statistics per provider/model (see ``RateLimiter.stats``)."""
+        return self._limiter.stats()
+
+    def get_circuit_state(self, provider_name: str) -> str:
+        """Circuit breaker state of a provider: ``closed``, ``open`` or ``half_open``."""
+        return self._breakers.get(provider_name.strip().lower()).state.value
+
+    def schedule_warm_up(self, reason: str = "manual") -> Optional[concurrent.futures.Future]:
+        """
+        Pre-warm provider connections in the background.
+
+        Runs on the shared async runtime: loads lazily imported SDK modules and
+        opens pooled connections to the provider endpoints. No billable
+        requests are sent. Skipped when disabled in settings, when no clients
+        are configured or while another warm-up is running.
+
+        Args:
+            reason: Why the warm-up runs (for logging).
+
+        Returns:
+            Future of the warm-up, or None if it was skipped.
+        """
+        if self.config_service.get_setting("connection_warmup_enabled") is not True:
+            return None
+        if not self._providers.has_any_clients() or not self._warmer.try_begin():
+            return None
+        logger.debug(f"Scheduling connection warm-up ({reason})")
+        return get_async_runtime().submit(self._warmer.warm_up(reason))
+
+    def warm_up_if_idle(self) -> Optional[concurrent.futures.Future]:
+        """
+        Re-warm connections if the pool has been idle past the keep-alive expiry.
+
+        Intended for user actions that usually precede a request (hotkeys), so
+        reconnecting overlaps with text capture instead of delaying the request.
+
+        Returns:
+            Future of the warm-up, or None if connections are still warm or it was skipped.
+        """
+        if not self._is_initialized or not self._latency.is_idle():
+            return None
+        return self.schedule_warm_up("idle")
+
     def _resolve_provider(self, provider_name: Optional[str] = None) -> APIProvider:
         """
         Resolve and validate the configured API provider.
@@ -140,6 +252,60 @@ class APIManager:
 
         return selected_provider
 
+    @staticmethod
+    def _supports_mode(provider_name: str, mode: str) -> bool:
+        """Check whether a provider can serve a request mode (OCR needs vision, styling an LLM)."""
+        if mode == MODE_OCR:
+            return provider_name in _VISION_PROVIDERS
+        if mode == MODE_STYLE:
+            return is_llm_provider(provider_name)
+        return True
+
+    def _default_model(self, provider_name: str, mode: str) -> Optional[str]:
+        """Configured model of a provider for a request mode (the vision model for OCR)."""
+        if not is_llm_provider(provider_name):
+            return get_deepl_identifier()
+        model_key = f"{provider_name}_vision_model" if mode == MODE_OCR else f"{provider_name}_model"
+        return self.config_service.get_setting(model_key) or None
+
+    def resolve_provider_name(self, mode: str = MODE_TRANSLATE) -> str:
+        """
+        Name of the provider that should serve the next request of a mode.
+
+        This is the provider selected in settings unless automatic provider
+        selection is enabled; then the router picks the fastest healthy
+        available provider that supports the mode and has a model configured,
+        skipping providers whose circuit breaker is open.
+
+        Args:
+            mode: Request mode (``translate``, ``style`` or ``ocr``).
+
+        Returns:
+            The provider name.
+        """
+        selected = (self.config_service.get_setting("api_provider") or "openai").strip().lower()
+        if self.config_service.get_setting("auto_provider_routing") is not True:
+            return selected
+
+        candidates = []
+        for name in SUPPORTED_PROVIDERS:
+            if not self._supports_mode(name, mode) or not self._providers.is_provider_available(APIProvider(name)):
+                continue
+            model = self._default_model(name, mode)
+            if model:
+                candidates.append((name, model))
+
+        # Fail over from providers whose circuit breaker is open
+        reachable = [c for c in candidates if self._breakers.get(c[0]).is_available()]
+        if len(reachable) < len(candidates):
+            skipped = sorted({name for name, _ in candidates} - {name for name, _ in reachable})
+            logger.debug(f"Routing {mode} request: skipping {', '.join(skipped)} (circuit open)")
+        candidates = reachable or candidates
+        if not candidates:
+            return selected
+        provider_name, _ = self._router.choose(mode, candidates, preferred=selected)
+        return provider_name
+
     def _resolve_model(self, model_hint: Optional[str], provider: APIProvider, *, missing_message: str) -> str:
         """
         Resolve model name, applying provider-specific defaults if needed.
@@ -162,26 +328,83 @@ class APIManager:
             raise ValueError(missing_message)
         return final_model
 
-    def _build_llm_params(self, model: str, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Build common parameters for an LLM chat-completion request."""
+    def _build_llm_params(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        mode: str = MODE_TRANSLATE,
+        max_completion_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build common parameters for an LLM chat-completion request.
+
+        The completion budget is sized to the input (see ``completion_budget``)
+        unless adaptive budgets are disabled in settings, in which case the
+        model's hard output limit is used. An explicit ``max_completion_tokens``
+        overrides both.
+        """
+        if max_completion_tokens is None:
+            if self.config_service.get_setting("adaptive_completion_tokens") is False:
+                max_completion_tokens = get_model_max_completion_tokens(model)
+            else:
+                max_completion_tokens = get_completion_budget(model, messages, mode)
         return {
             "model": model,
             "messages": messages,
-            "max_completion_tokens": get_model_max_completion_tokens(model),
+            "max_completion_tokens": max_completion_tokens,
         }
 
+    def _truncation_retry_params(
+        self, provider: APIProvider, api_params: Dict[str, Any], response: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get parameters for retrying a response truncated by an adaptive budget.
+
+        Returns:
+            The request parameters with the model's hard output limit, or None if
+            the response is complete or already used the full limit.
+        """
+        budget = api_params.get("max_completion_tokens")
+        if provider == APIProvider.DEEPL or budget is None or not is_truncated(response):
+            return None
+        cap = get_model_max_completion_tokens(api_params["model"])
+        if budget >= cap:
+            return None
+        logger.info(f"Response truncated at max_completion_tokens={budget}; retrying once with {cap}")
+        return {**api_params, "max_completion_tokens": cap}
+
+    def _request_budget(self) -> int:
+        """Time budget for a request without an explicit deadline: the ``api_timeout`` setting."""
+        try:
+            timeout = int(self.config_service.get_setting("api_timeout"))
+        except (TypeError, ValueError):
+            return API_TIMEOUT_DEFAULT
+        return timeout if API_TIMEOUT_MIN <= timeout <= API_TIMEOUT_MAX else API_TIMEOUT_DEFAULT
+
+    def _get_request_client(self, provider: APIProvider, kwargs: Dict[str, Any]) -> Any:
+        """Validate request arguments and return the provider client."""
+        if "temperature" in kwargs:
+            raise TypeError("temperature is not a supported API request parameter")
+
+        client = self._providers.get_client(provider)
+        if not client:
+            raise ValueError(f"Provider {provider.value} not configured. Please set up your API key in settings.")
+        return client
+
     @requires_initialization
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type(RetryableAPIError),
-    )
-    def make_request_sync(self, provider: APIProvider, **kwargs) -> Any:
+    def make_request_sync(
+        self, provider: APIProvider, cancel_token: Optional[CancelToken] = None, **kwargs
+    ) -> Any:
         """
         Make API request with retry logic.
 
+        Retries run within the current request deadline (see
+        ``retry.request_deadline``), or within ``api_timeout`` if none is set.
+
         Args:
             provider: The API provider to use.
+            cancel_token: Optional token; cancelling it aborts the provider call
+                (closing its connection) and any pending retry backoff.
             **kwargs: Additional keyword arguments for the API request.
 
         Returns:
@@ -189,51 +412,272 @@ class APIManager:
 
         Raises:
             ValueError: If provider is not configured.
+            RequestCancelledError: If ``cancel_token`` was cancelled.
+            RetryError: If a retryable error persists past the retry policy.
             Exception: For non-retryable errors.
         """
-        if "temperature" in kwargs:
-            raise TypeError("temperature is not a supported API request parameter")
+        client = self._get_request_client(provider, kwargs)
+        with request_deadline(self._request_budget()):
+            return self._retry.call(
+                self._request_once_sync, client, provider, kwargs, cancel_token, cancel_token=cancel_token
+            )
 
-        client = self._providers.get_client(provider)
-        if not client:
-            raise ValueError(f"Provider {provider.value} not configured. Please set up your API key in settings.")
+    def _request_once_sync(
+        self,
+        client: Any,
+        provider: APIProvider,
+        kwargs: Dict[str, Any],
+        cancel_token: Optional[CancelToken] = None,
+    ) -> Any:
+        """
+        Make a single request attempt.
 
+        Fails fast with CircuitOpenError while the provider is down, and waits
+        for the client-side rate limit of the provider and model. The adapter
+        receives ``cancel_token`` so cancelling aborts the call itself.
+        """
+        breaker = self._breakers.get(provider.value)
+        breaker.allow_request()
+        limits = RateLimits.from_config(self.config_service, provider.value, kwargs.get("model"))
+        permit = None
+        if limits is not None:
+            try:
+                permit = self._limiter.acquire(
+                    provider.value, kwargs.get("model"), limits, estimate_request_tokens(kwargs)
+                )
+            except BaseException:
+                breaker.release_trial()
+                raise
         try:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
             logger.debug(f"Making API request to provider '{provider.value}' with args: {kwargs}")
             if not self._diag_logged:
                 log_network_diagnostics()
                 self._diag_logged = True
+            cold = self._latency.begin_request()
+            start_time = time.time()
+            if cancel_token is None:
+                response = client.chat.completions.create(**kwargs)
+            else:
+                response = client.chat.completions.create(**kwargs, cancel_token=cancel_token)
+            request_time = time.time() - start_time
+            self._latency.record_request(request_time, cold)
+            self._record_route(provider, kwargs, request_time)
+            breaker.record_success()
+            self._settle_rate_limit(permit, kwargs, response)
+            logger.debug(f"Raw API response: {response}")
+
+            logger.debug(f"API request completed in {request_time:.2f}s ({'cold' if cold else 'warm'})")
+            return response
+
+        except RequestCancelledError:
+            self._abandon_attempt(provider, permit)
+            raise
+        except Exception as e:
+            self._record_route(provider, kwargs, None)
+            self._handle_request_error(e, provider, permit)
+
+    @requires_initialization
+    async def make_request_async(self, provider: APIProvider, **kwargs) -> Any:
+        """
+        Make an API request on the running event loop, with retry logic.
+
+        Uses the client's native ``chat.completions.acreate`` when available so
+        concurrent requests share one loop without blocking threads; clients
+        without it are called in a worker thread. Retries run within the
+        current request deadline, or within ``api_timeout`` if none is set.
+
+        Args:
+            provider: The API provider to use.
+            **kwargs: Additional keyword arguments for the API request.
+
+        Returns:
+            The API response (an async chunk iterator when ``stream=True``).
+
+        Raises:
+            ValueError: If provider is not configured.
+            RetryError: If a retryable error persists past the retry policy.
+            Exception: For non-retryable errors.
+        """
+        client = self._get_request_client(provider, kwargs)
+        with request_deadline(self._request_budget()):
+            return await self._retry.acall(self._request_once_async, client, provider, kwargs)
+
+    async def _request_once_async(self, client: Any, provider: APIProvider, kwargs: Dict[str, Any]) -> Any:
+        """Async counterpart of ``_request_once_sync``; waits for the rate limit on the event loop."""
+        breaker = self._breakers.get(provider.value)
+        breaker.allow_request()
+        limits = RateLimits.from_config(self.config_service, provider.value, kwargs.get("model"))
+        permit = None
+        if limits is not None:
+            try:
+                permit = await self._limiter.acquire_async(
+                    provider.value, kwargs.get("model"), limits, estimate_request_tokens(kwargs)
+                )
+            except BaseException:
+                breaker.release_trial()
+                raise
+        try:
+            logger.debug(f"Making async API request to provider '{provider.value}' with args: {kwargs}")
+            if not self._diag_logged:
+                log_network_diagnostics()
+                self._diag_logged = True
+            cold = self._latency.begin_request()
             start_time = time.time()
-            response = client.chat.completions.create(**kwargs)
+            acreate = getattr(client.chat.completions, "acreate", None)
+            if inspect.iscoroutinefunction(acreate):
+                response = await acreate(**kwargs)
+            else:
+                response = await asyncio.to_thread(client.chat.completions.create, **kwargs)
             request_time = time.time() - start_time
+            self._latency.record_request(request_time, cold)
+            self._record_route(provider, kwargs, request_time)
+            breaker.record_success()
+            self._settle_rate_limit(permit, kwargs, response)
             logger.debug(f"Raw API response: {response}")
 
-            logger.debug(f"API request completed in {request_time:.2f}s")
+            logger.debug(f"Async API request completed in {request_time:.2f}s ({'cold' if cold else 'warm'})")
             return response
 
+        except (asyncio.CancelledError, RequestCancelledError):
+            self._abandon_attempt(provider, permit)
+            raise
+        except Exception as e:
+            self._record_route(provider, kwargs, None)
+            self._handle_request_error(e, provider, permit)
+
+    def _record_route(self, provider: APIProvider, kwargs: Dict[str, Any], seconds: Optional[float]) -> None:
+        """Feed an attempt into the router statistics (None for a failure).
+
+        Only failures are recorded for streams: their latency is the time to
+        the first chunk and not comparable to that of complete responses.
+        """
+        if seconds is None:
+            self._router.record_failure(provider.value, kwargs.get("model"))
+        elif not kwargs.get("stream"):
+            self._router.record_success(provider.value, kwargs.get("model"), seconds)
+
+    def _abandon_attempt(self, provider: APIProvider, permit: Optional[RatePermit]) -> None:
+        """Undo the bookkeeping of a cancelled attempt; it says nothing about the provider's health."""
+        self._breakers.get(provider.value).release_trial()
+        if permit is not None:
+            self._limiter.release(permit)
+        logger.debug(f"Request to provider '{provider.value}' cancelled")
+
+    def _settle_rate_limit(self, permit: Optional[RatePermit], kwargs: Dict[str, Any], response: Any) -> None:
+        """Correct the rate limiter's token estimate from the reported usage (not available for streams)."""
+        if permit is not None and not kwargs.get("stream"):
+            self._limiter.settle(permit, getattr(getattr(response, "usage", None), "total_tokens", None))
+
+    def _schedule_probe(self, provider: APIProvider) -> None:
+        """Start probing a provider whose circuit opened, unless a prober already runs."""
+        if not self._breakers.start_probing(provider.value):
+            return
+        try:
+            self._probes[provider.value] = get_async_runtime().submit(self._probe_until_closed(provider))
         except Exception as e:
-            api_error = classify_error(e, provider.value)
+            self._breakers.stop_probing(provider.value)
+            logger.debug(f"Failed to schedule probe for {provider.value}: {e}")
 
-            logger.error(f"API request failed: {api_error.error_type.value} - {api_error.message}")
+    async def _probe_until_closed(self, provider: APIProvider) -> None:
+        """
+        Half-open an open circuit with cheap probes until the provider answers.
 
-            # Check if the error is retryable based on its type
-            if api_error.error_type in [
-                APIErrorType.RATE_LIMIT,
-                APIErrorType.NETWORK,
-                APIErrorType.TIMEOUT,
-                APIErrorType.SERVER_ERROR,
-            ]:
-                # Wrap in custom exception to trigger tenacity retry
-                raise RetryableAPIError(f"Retryable error occurred: {api_error.message}") from e
+        Providers that cannot be probed leave the trial to the next real request.
+        """
+        breaker = self._breakers.get(provider.value)
+        try:
+            while True:
+                retry_in = breaker.retry_in()
+                if retry_in is None:
+                    return
+                if retry_in > 0 or not breaker.try_probe():
+                    # Not due yet, or a real request is the trial right now
+                    await asyncio.sleep(retry_in or 1.0)
+                    continue
+
+                logger.debug(f"Probing {provider.value} (circuit half-open)")
+                reachable = await self._warmer.probe(self._providers.get_client(provider))
+                if reachable is None:
+                    breaker.release_trial()
+                    return
+                if reachable:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure(APIErrorType.NETWORK)
+        finally:
+            self._breakers.stop_probing(provider.value)
+            self._probes.pop(provider.value, None)
+
+    def _handle_request_error(
+        self, error: Exception, provider: APIProvider, permit: Optional[RatePermit] = None
+    ) -> None:
+        """
+        Classify a failed request and re-raise it.
 
-            # For non-retryable errors, re-raise the original exception
-            raise e
+        A provider 429 also pauses the request's rate limit route (see ``RateLimiter.release``).
+
+        Raises:
+            RetryableAPIError: For rate limit, network, timeout and server errors.
+            Exception: The original error otherwise.
+        """
+        api_error = classify_error(error, provider.value)
+
+        logger.error(f"API request failed: {api_error.error_type.value} - {api_error.message}")
+
+        if self._breakers.get(provider.value).record_failure(api_error.error_type):
+            self._schedule_probe(provider)
+        if permit is not None:
+            self._limiter.release(permit, api_error.error_type == APIErrorType.RATE_LIMIT, api_error.retry_after)
+
+        # Check if the error is retryable based on its type
+        if api_error.error_type in [
+            APIErrorType.RATE_LIMIT,
+            APIErrorType.NETWORK,
+            APIErrorType.TIMEOUT,
+            APIErrorType.SERVER_ERROR,
+        ]:
+            # Wrap in custom exception to trigger a retry
+            raise RetryableAPIError(
+                f"Retryable error occurred: {api_error.message}",
+                error_type=api_error.error_type,
+                retry_after=api_error.retry_after,
+            ) from error
+
+        # For non-retryable errors, re-raise the original exception
+        raise error
+
+    def _make_coalesced_request(
+        self,
+        provider: APIProvider,
+        api_params: Dict[str, Any],
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Any:
+        """
+        Run a request through the single-flight coalescer.
+
+        Identical concurrent requests (same provider, model, messages and kwargs)
+        share one provider call and all receive its response or error. Once
+        every caller has cancelled, the shared call is aborted.
+        """
+        key = RequestCoalescer.make_key(provider.value, api_params)
+        return self._coalescer.run(
+            key,
+            lambda shared_cancel: self.make_request_sync(provider, cancel_token=shared_cancel, **api_params),
+            cancel_event,
+        )
 
     @requires_initialization
     def make_translation_request(
         self,
         messages: List[Dict[str, Any]],
         model_hint: Optional[str] = None,
+        *,
+        cancel_event: Optional[threading.Event] = None,
+        completion_mode: str = MODE_TRANSLATE,
+        max_completion_tokens: Optional[int] = None,
+        provider_name: Optional[str] = None,
         **api_kwargs
     ) -> tuple[Any, str]:
         """
@@ -242,18 +686,57 @@ class APIManager:
         This method encapsulates the logic for:
         1. Selecting the provider specified in the settings.
         2. Applying provider-specific optimizations (e.g., for OpenAI).
-        3. Calling the core `make_request_sync` method.
+        3. Calling the core `make_request_sync` method through the request coalescer.
 
         Args:
             messages: A list of messages for the chat completion.
             model_hint: The model name to use for the request.
+            cancel_event: Optional flag; once set, this caller stops waiting and
+                gets RequestCancelledError without aborting the request for other
+                callers attached to the same in-flight call. The provider call
+                is aborted when no caller is left.
+            completion_mode: Request mode used to size the completion budget
+                (``translate`` or ``style``).
+            max_completion_tokens: Explicit completion budget (overrides the policy).
+            provider_name: Provider to use instead of the selected one (see ``resolve_provider_name``).
             api_kwargs: Additional provider-specific kwargs (e.g., target_lang/source_lang for DeepL).
 
         Returns:
             A tuple containing the API response and the model name used.
         """
+        selected_provider, final_model, api_params = self._prepare_translation_params(
+            messages, model_hint, api_kwargs, completion_mode, max_completion_tokens, provider_name
+        )
+
+        # Make the API call (identical in-flight requests share one call)
+        response = self._make_coalesced_request(selected_provider, api_params, cancel_event)
+
+        retry_params = self._truncation_retry_params(selected_provider, api_params, response)
+        if retry_params is not None:
+            response = self._make_coalesced_request(selected_provider, retry_params, cancel_event)
+
+        return response, final_model
+
+    def _prepare_translation_params(
+        self,
+        messages: List[Dict[str, Any]],
+        model_hint: Optional[str],
+        api_kwargs: Dict[str, Any],
+        completion_mode: str = MODE_TRANSLATE,
+        max_completion_tokens: Optional[int] = None,
+        provider_name: Optional[str] = None,
+    ) -> tuple[APIProvider, str, Dict[str, Any]]:
+        """
+        Resolve provider and model and build the final translation request parameters.
+
+        Args:
+            provider_name: Provider to use instead of the configured one (routing, hedging).
+
+        Returns:
+            Tuple of (provider, final_model, api_params).
+        """
         # 1. Select the configured provider
-        selected_provider = self._resolve_provider()
+        selected_provider = self._resolve_provider(provider_name)
 
         # 2. Resolve model (provider-specific defaults)
         final_model = self._resolve_model(
@@ -268,11 +751,10 @@ class APIManager:
                 {key: value for key, value in api_kwargs.items() if value is not None}
             )
             logger.debug(f"Final API parameters for {selected_provider.value}: {api_params}")
-            response = self.make_request_sync(selected_provider, **api_params)
-            return response, final_model
+            return selected_provider, final_model, api_params
 
         # 3. Prepare API call parameters for LLM providers
-        api_params = self._build_llm_params(final_model, messages)
+        api_params = self._build_llm_params(final_model, messages, completion_mode, max_completion_tokens)
 
         # Reasoning effort is intentionally limited to text translation;
         # vision/OCR requests use make_vision_request and do not inherit it.
@@ -282,14 +764,238 @@ class APIManager:
                 api_params["reasoning_effort"] = reasoning_effort
 
         logger.debug(f"Final API parameters for {selected_provider.value}: {api_params}")
+        return selected_provider, final_model, api_params
 
-        # 4. Make the API call
-        response = self.make_request_sync(selected_provider, **api_params)
+    def _hedge_target(
+        self,
+        primary: APIProvider,
+        mode: str,
+        policy: HedgePolicy,
+        messages: List[Dict[str, Any]],
+        hedge_request: Optional[HedgeRequestBuilder],
+    ) -> Optional[tuple[str, List[Dict[str, Any]], Optional[str], Dict[str, Any]]]:
+        """
+        Pick the secondary provider of a hedged request.
 
-        return response, final_model
+        The first available provider after the primary in the mode's policy
+        order that can serve the request is used. Without ``hedge_request`` the
+        same messages are sent to LLM providers with their configured model
+        (vision model for OCR).
+
+        Returns:
+            Tuple of (provider name, messages, model_hint, api_kwargs), or None.
+        """
+        for name in policy.providers:
+            if name == primary.value or not self._providers.is_provider_available(APIProvider(name)):
+                continue
+            if not self._supports_mode(name, mode) or not self._breakers.get(name).is_available():
+                continue
+            if hedge_request is not None:
+                request = hedge_request(name)
+            elif is_llm_provider(name):
+                model = self._default_model(name, mode)
+                request = (messages, model, {}) if model else None
+            else:
+                request = None
+            if request is not None:
+                return (name, *request)
+        return None
+
+    @requires_initialization
+    def make_translation_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        model_hint: Optional[str] = None,
+        *,
+        completion_mode: str = MODE_TRANSLATE,
+        provider_name: Optional[str] = None,
+        **api_kwargs
+    ) -> TranslationStream:
+        """
+        Makes a streaming translation request using the configured provider.
+
+        LLM providers stream tokens as they are generated. Providers without
+        streaming support (DeepL) return their complete result as a single delta.
+        Connection errors before the first chunk are retried like regular requests.
+        A stream cut off by its completion budget is not retried; check
+        ``stream.truncated`` after consuming it.
+
+        Args:
+            messages: A list of messages for the chat completion.
+            model_hint: The model name to use for the request.
+            completion_mode: Request mode used to size the completion budget.
+            provider_name: Provider to use instead of the selected one.
+            api_kwargs: Additional provider-specific kwargs (e.g., target_lang/source_lang for DeepL).
+
+        Returns:
+            A TranslationStream yielding text deltas; ``stream.model`` holds the model used.
+        """
+        selected_provider, final_model, api_params = self._prepare_translation_params(
+            messages, model_hint, api_kwargs, completion_mode, provider_name=provider_name
+        )
+        started_at = time.time()
+
+        if selected_provider == APIProvider.DEEPL:
+            response = self._make_coalesced_request(selected_provider, api_params)
+            return TranslationStream.from_response(response, final_model, started_at)
+
+        chunks = self.make_request_sync(selected_provider, stream=True, **api_params)
+        stream = TranslationStream(chunks, final_model, started_at)
+        stream.max_completion_tokens = api_params.get("max_completion_tokens")
+        return stream
 
     @requires_initialization
-    def make_vision_request(self, messages: List[Dict[str, Any]], model_hint: str) -> tuple[Any, str]:
+    async def make_translation_request_async(
+        self,
+        messages: List[Dict[str, Any]],
+        model_hint: Optional[str] = None,
+        *,
+        completion_mode: str = MODE_TRANSLATE,
+        max_completion_tokens: Optional[int] = None,
+        hedge_request: Optional[HedgeRequestBuilder] = None,
+        provider_name: Optional[str] = None,
+        **api_kwargs
+    ) -> tuple[Any, str]:
+        """
+        Async counterpart of ``make_translation_request``.
+
+        Identical concurrent requests on the same event loop share one provider
+        call. Cancelling the awaiting task detaches it; the provider call itself
+        is cancelled once no caller is waiting for it.
+
+        With hedging enabled, a slow or failing request is also sent to a
+        secondary provider and the first successful answer is returned.
+
+        Args:
+            messages: A list of messages for the chat completion.
+            model_hint: The model name to use for the request.
+            completion_mode: Request mode used to size the completion budget.
+            max_completion_tokens: Explicit completion budget (overrides the policy).
+            hedge_request: Builds the request for another provider when hedging
+                (needed when messages differ per provider, e.g. for DeepL).
+            provider_name: Provider to use instead of the selected one.
+            api_kwargs: Additional provider-specific kwargs (e.g., target_lang/source_lang for DeepL).
+
+        Returns:
+            A tuple containing the API response and the model name used.
+        """
+        selected_provider, final_model, api_params = self._prepare_translation_params(
+            messages, model_hint, api_kwargs, completion_mode, max_completion_tokens, provider_name
+        )
+
+        policy = HedgePolicy.from_config(self.config_service, completion_mode)
+        if policy is None:
+            return await self._request_complete_async(selected_provider, api_params), final_model
+
+        async def request(provider: APIProvider, params: Dict[str, Any], model: str) -> tuple[Any, str]:
+            return await self._request_complete_async(provider, params), model
+
+        secondary = None
+        target = self._hedge_target(selected_provider, completion_mode, policy, messages, hedge_request)
+        if target is not None:
+            name, hedge_messages, hedge_model, hedge_kwargs = target
+            provider, model, params = self._prepare_translation_params(
+                hedge_messages, hedge_model, hedge_kwargs, completion_mode, max_completion_tokens, name
+            )
+            secondary = (name, lambda: request(provider, params, model))
+
+        result, _ = await self._hedger.run(
+            completion_mode,
+            policy,
+            (selected_provider.value, lambda: request(selected_provider, api_params, final_model)),
+            secondary,
+        )
+        return result
+
+    async def _request_complete_async(self, provider: APIProvider, api_params: Dict[str, Any]) -> Any:
+        """Make a coalesced request, retrying once with the model cap if it was truncated."""
+        response = await self._make_coalesced_request_async(provider, api_params)
+
+        retry_params = self._truncation_retry_params(provider, api_params, response)
+        if retry_params is not None:
+            response = await self._make_coalesced_request_async(provider, retry_params)
+        return response
+
+    async def _make_coalesced_request_async(self, provider: APIProvider, api_params: Dict[str, Any]) -> Any:
+        """Async counterpart of ``_make_coalesced_request``."""
+        key = RequestCoalescer.make_key(provider.value, api_params)
+        return await self._coalescer.run_async(key, lambda: self.make_request_async(provider, **api_params))
+
+    @requires_initialization
+    async def make_translation_stream_async(
+        self,
+        messages: List[Dict[str, Any]],
+        model_hint: Optional[str] = None,
+        *,
+        completion_mode: str = MODE_TRANSLATE,
+        hedge_request: Optional[HedgeRequestBuilder] = None,
+        provider_name: Optional[str] = None,
+        **api_kwargs
+    ) -> TranslationStream:
+        """
+        Async counterpart of ``make_translation_stream``.
+
+        With hedging enabled, a stream whose provider has not responded in
+        time is also opened on a secondary provider; the first stream to
+        start is returned and the other one is cancelled or closed.
+
+        Args:
+            hedge_request: Builds the request for another provider when hedging.
+            provider_name: Provider to use instead of the selected one.
+
+        Returns:
+            A TranslationStream to consume with ``async for``.
+        """
+        selected_provider, final_model, api_params = self._prepare_translation_params(
+            messages, model_hint, api_kwargs, completion_mode, provider_name=provider_name
+        )
+
+        policy = HedgePolicy.from_config(self.config_service, completion_mode)
+        if policy is None:
+            return await self._open_stream_async(selected_provider, final_model, api_params)
+
+        secondary = None
+        target = self._hedge_target(selected_provider, completion_mode, policy, messages, hedge_request)
+        if target is not None:
+            name, hedge_messages, hedge_model, hedge_kwargs = target
+            provider, model, params = self._prepare_translation_params(
+                hedge_messages, hedge_model, hedge_kwargs, completion_mode, provider_name=name
+            )
+            secondary = (name, lambda: self._open_stream_async(provider, model, params))
+
+        stream, _ = await self._hedger.run(
+            completion_mode,
+            policy,
+            (selected_provider.value, lambda: self._open_stream_async(selected_provider, final_model, api_params)),
+            secondary,
+            discard=lambda loser: loser.aclose(),
+        )
+        return stream
+
+    async def _open_stream_async(
+        self, provider: APIProvider, model: str, api_params: Dict[str, Any]
+    ) -> TranslationStream:
+        """Start a streaming request; providers without streaming return their result as one delta."""
+        started_at = time.time()
+
+        if provider == APIProvider.DEEPL:
+            response = await self._make_coalesced_request_async(provider, api_params)
+            return TranslationStream.from_response(response, model, started_at)
+
+        chunks = await self.make_request_async(provider, stream=True, **api_params)
+        stream = TranslationStream(chunks, model, started_at)
+        stream.max_completion_tokens = api_params.get("max_completion_tokens")
+        return stream
+
+    @requires_initialization
+    def make_vision_request(
+        self,
+        messages: List[Dict[str, Any]],
+        model_hint: str,
+        provider_name: Optional[str] = None,
+        max_completion_tokens: Optional[int] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> tuple[Any, str]:
         """
         Makes a vision request using the configured provider for multimodal content.
 
@@ -299,15 +1005,20 @@ class APIManager:
         Args:
             messages: OpenAI-style message list with multimodal content.
             model_hint: Suggested model name (e.g., settings.openai_vision_model or settings.google_vision_model).
+            provider_name: Provider to use instead of the selected one (see ``resolve_provider_name``).
+            max_completion_tokens: Completion budget instead of the adaptive OCR budget.
+            cancel_token: Optional token; cancelling it aborts the provider call
+                (closing its connection) and any pending retry backoff.
 
         Returns:
             Tuple of (response_object, final_model_str) where response_object has OpenAI-like structure.
 
         Raises:
             ValueError: If provider doesn't support vision or input validation fails.
+            RequestCancelledError: If ``cancel_token`` was cancelled.
         """
         # 1. Select provider from settings
-        selected_provider = self._resolve_provider()
+        selected_provider = self._resolve_provider(provider_name)
 
         # 2. Resolve final model
         final_model = self._resolve_model(
@@ -317,34 +1028,66 @@ class APIManager:
         )
 
         # 3. Validate provider supports vision
-        if selected_provider not in (APIProvider.OPENAI, APIProvider.GOOGLE):
+        if selected_provider.value not in _VISION_PROVIDERS:
             raise ValueError(f"Provider '{selected_provider.value}' does not support vision requests.")
 
         # 3.5. Validate input: require at least one image part for vision request
-        has_image = False
-        for msg in messages:
-            if msg.get("role") == "user" and isinstance(msg.get("content"), list):
-                for part in msg["content"]:
-                    if isinstance(part, dict) and part.get("type") == "image_url":
-                        has_image = True
-                        break
-            if has_image:
-                break
+        has_image = any(
+            msg.get("role") == "user"
+            and isinstance(msg.get("content"), list)
+            and any(is_image_part(part) for part in msg["content"])
+            for msg in messages
+        )
         if not has_image:
             raise ValueError("Vision request requires an image part")
 
         logger.debug(f"Vision request: provider={selected_provider.value}, model={final_model}")
 
         # 4. Build LLM params
-        api_params = self._build_llm_params(final_model, messages)
+        api_params = self._build_llm_params(final_model, messages, MODE_OCR, max_completion_tokens)
+
+        # 5. Hedge to the other vision provider if enabled
+        policy = HedgePolicy.from_config(self.config_service, MODE_OCR)
+        if policy is not None:
+            hedged = self._make_hedged_vision_request(policy, selected_provider, final_model, api_params)
+            return get_async_runtime().run(cancel_token.run(hedged) if cancel_token is not None else hedged)
 
-        # 5. Route to adapter (both providers now use the same path)
+        # 6. Route to adapter (both providers now use the same path)
         response = self.make_request_sync(
             selected_provider,
+            cancel_token=cancel_token,
             **api_params
         )
+
+        retry_params = self._truncation_retry_params(selected_provider, api_params, response)
+        if retry_params is not None:
+            response = self.make_request_sync(selected_provider, cancel_token=cancel_token, **retry_params)
         return response, final_model
 
+    async def _make_hedged_vision_request(
+        self, policy: HedgePolicy, provider: APIProvider, model: str, api_params: Dict[str, Any]
+    ) -> tuple[Any, str]:
+        """Run a vision request on the async runtime, hedged to a secondary vision provider."""
+
+        async def request(target: APIProvider, params: Dict[str, Any]) -> tuple[Any, str]:
+            response = await self.make_request_async(target, **params)
+            retry_params = self._truncation_retry_params(target, params, response)
+            if retry_params is not None:
+                response = await self.make_request_async(target, **retry_params)
+            return response, params["model"]
+
+        secondary = None
+        target = self._hedge_target(provider, MODE_OCR, policy, api_params["messages"], None)
+        if target is not None:
+            name, hedge_messages, hedge_model, _ = target
+            hedge_params = self._build_llm_params(hedge_model, hedge_messages, MODE_OCR)
+            secondary = (name, lambda: request(APIProvider(name), hedge_params))
+
+        result, _ = await self._hedger.run(
+            MODE_OCR, policy, (provider.value, lambda: request(provider, api_params)), secondary
+        )
+        return result
+
     def extract_text_from_response(self, response: Any) -> str:
         """
         Safely extracts text content from API response objects.
@@ -413,6 +1156,41 @@ class APIManager:
     def shutdown(self) -> None:
         """Shutdown API manager and cleanup resources."""
         with self._lock:
+            stats = self._latency.stats()
+            if stats["cold"]["count"] or stats["warm"]["count"]:
+                logger.info(
+                    f"Request latency: cold avg {stats['cold']['avg_ms']:.0f} ms ({stats['cold']['count']}), "
+                    f"warm avg {stats['warm']['avg_ms']:.0f} ms ({stats['warm']['count']}), "
+                    f"{stats['warmups']} warm-ups"
+                )
+            retry_stats = self._retry.metrics.stats()
+            if retry_stats["retries"] or retry_stats["gave_up"]:
+                logger.info(
+                    f"Request retries: {retry_stats['retries']} "
+                    f"({retry_stats['backoff_ms'] / 1000:.1f}s backoff), gave up early: {retry_stats['gave_up']}"
+                )
+            circuit_stats = {name: stats for name, stats in self._breakers.stats().items() if stats["opened"]}
+            if circuit_stats:
+                logger.info(
+                    "Circuit breakers: " + ", ".join(
+                        f"{name} opened {stats['opened']}x, {stats['rejected']} requests failed fast"
+                        for name, stats in circuit_stats.items()
+                    )
+                )
+            delayed = {
+                name: stats for name, stats in self._limiter.stats().items() if stats["delayed"] or stats["pauses"]
+            }
+            if delayed:
+                logger.info(
+                    "Rate limits: " + ", ".join(
+                        f"{name} delayed {stats['delayed']} requests ({stats['wait_ms'] / 1000:.1f}s), "
+                        f"{stats['pauses']} provider 429s"
+                        for name, stats in delayed.items()
+                    )
+                )
+            for probe in list(self._probes.values()):
+                probe.cancel()
+            self._router.save()
             self._providers.clear()
             self._cache.clear()
             self._is_initialized = False
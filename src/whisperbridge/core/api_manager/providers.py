@@ -6,14 +6,16 @@ This module provides:
 - ProviderRegistry class for managing API provider clients
 """
 
+import threading
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from ..config import validate_api_key_format
 from ...providers.deepl_adapter import DeepLClientAdapter
 from ...providers.google_chat_adapter import GoogleChatClientAdapter
+from ...providers.http_transport import HttpTransport, TransportConfig
 from ...providers.openai_adapter import OpenAIChatClientAdapter
 
 
@@ -30,7 +32,11 @@ class ProviderRegistry:
     Registry for managing API provider clients.
 
     This class handles initialization and management of API provider
-    clients with graceful degradation for missing credentials.
+    clients with graceful degradation for missing credentials. All clients
+    share one pooled HTTP transport built from the network settings.
+
+    Initialization only validates the API keys; each client is built on
+    first use, so the SDKs of providers that are never used are not loaded.
     """
 
     def __init__(self, config_service):
@@ -41,18 +47,25 @@ class ProviderRegistry:
             config_service: The application's configuration service.
         """
         self._clients: Dict[APIProvider, Any] = {}
+        # Providers with a valid key whose client is not built yet: (name, factory)
+        self._pending: Dict[APIProvider, Tuple[str, Callable[[], Any]]] = {}
+        self._build_lock = threading.Lock()
         self._config = config_service
+        self._transport: Optional[HttpTransport] = None
 
     def initialize_all(self) -> None:
         """
         Initialize all available API providers.
 
-        This method attempts to initialize OpenAI, Google and DeepL providers
-        to ensure seamless switching between them in the UI without needing
-        to restart or re-save settings.
+        This method registers OpenAI, Google and DeepL providers whose keys
+        are valid, to ensure seamless switching between them in the UI without
+        needing to restart or re-save settings. Clients are built on first use.
         """
         logger.debug("Initializing all available API providers.")
 
+        if self._transport is None:
+            self._transport = HttpTransport(TransportConfig.from_config(self._config))
+
         # Always try to initialize all providers
         self._init_openai_provider()
         self._init_google_provider()
@@ -73,6 +86,9 @@ class ProviderRegistry:
         """
         Generic method to initialize an API provider.
 
+        Validates the API key and registers the client factory; the client
+        itself is built by ``get_client``.
+
         Args:
             provider: The APIProvider enum member.
             config_key_name: The key for the API key in config_service.
@@ -97,13 +113,29 @@ class ProviderRegistry:
             )
             return
 
-        try:
-            timeout = self._config.get_setting("api_timeout")
-            client = client_factory(api_key, timeout)
+        timeout = self._config.get_setting("api_timeout")
+        with self._build_lock:
+            self._pending[provider] = (provider_name, lambda: client_factory(api_key, timeout))
+        logger.info(f"{provider_name} provider configured")
+
+    def _build_client(self, provider: APIProvider) -> Optional[Any]:
+        """Build a registered client on first use (thread-safe, once per provider)."""
+        with self._build_lock:
+            client = self._clients.get(provider)
+            if client is not None or provider not in self._pending:
+                return client
+            # Stays pending while building, so concurrent callers wait for this build
+            provider_name, factory = self._pending[provider]
+            try:
+                client = factory()
+            except Exception as e:
+                logger.error(f"Failed to initialize {provider_name} provider: {e}")
+                return None
+            finally:
+                del self._pending[provider]
             self._clients[provider] = client
             logger.info(f"{provider_name} client initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize {provider_name} provider: {e}")
+            return client
 
     def _init_openai_provider(self) -> None:
         """Initialize OpenAI provider with graceful degradation."""
@@ -111,7 +143,9 @@ class ProviderRegistry:
             provider=APIProvider.OPENAI,
             config_key_name="openai_api_key",
             key_prefix="sk-",
-            client_factory=lambda key, timeout: OpenAIChatClientAdapter(api_key=key, timeout=timeout),
+            client_factory=lambda key, timeout: OpenAIChatClientAdapter(
+                api_key=key, timeout=timeout, transport=self._transport
+            ),
             provider_name="OpenAI",
         )
 
@@ -121,7 +155,9 @@ class ProviderRegistry:
             provider=APIProvider.GOOGLE,
             config_key_name="google_api_key",
             key_prefix="AIza",
-            client_factory=lambda key, timeout: GoogleChatClientAdapter(api_key=key, timeout=timeout),
+            client_factory=lambda key, timeout: GoogleChatClientAdapter(
+                api_key=key, timeout=timeout, transport=self._transport
+            ),
             provider_name="Google Generative AI",
         )
 
@@ -135,13 +171,14 @@ class ProviderRegistry:
                 api_key=key,
                 timeout=timeout,
                 plan=(self._config.get_setting("deepl_plan") or "free"),
+                transport=self._transport,
             ),
             provider_name="DeepL",
         )
 
     def get_client(self, provider: APIProvider) -> Optional[Any]:
         """
-        Get the client for a specific provider.
+        Get the client for a specific provider, building it on first use.
 
         Args:
             provider: The API provider to get the client for.
@@ -149,32 +186,90 @@ class ProviderRegistry:
         Returns:
             The provider client if available, None otherwise.
         """
-        return self._clients.get(provider)
+        client = self._clients.get(provider)
+        if client is None and provider in self._pending:
+            client = self._build_client(provider)
+        return client
+
+    def get_selected_client(self) -> Optional[Any]:
+        """
+        Get the client of the provider selected in settings, building it on first use.
+
+        Returns:
+            The provider client, or None if the selected provider is not available.
+        """
+        try:
+            provider = APIProvider((self._config.get_setting("api_provider") or "").strip().lower())
+        except ValueError:
+            return None
+        return self.get_client(provider)
+
+    def get_all_clients(self) -> List[Any]:
+        """
+        Get the provider clients built so far.
+
+        Returns:
+            List of clients in the order they were built.
+        """
+        return list(self._clients.values())
+
+    def get_transport(self) -> Optional[HttpTransport]:
+        """
+        Get the HTTP transport shared by the clients.
+
+        Returns:
+            The transport, or None before initialization and after ``clear``.
+        """
+        return self._transport
 
     def is_provider_available(self, provider: APIProvider) -> bool:
         """
         Check if a provider is available.
 
+        Answered from the key validation done at initialization; the client
+        is not built.
+
         Args:
             provider: The API provider to check.
 
         Returns:
-            True if the provider has an initialized client, False otherwise.
+            True if the provider has a valid key (or a built client), False otherwise.
         """
-        return provider in self._clients
+        return provider in self._clients or provider in self._pending
 
     def has_any_clients(self) -> bool:
         """
         Check if any API clients are configured.
 
         Returns:
-            True if at least one provider has an initialized client, False otherwise.
+            True if at least one provider is available, False otherwise.
+        """
+        return bool(self._clients or self._pending)
+
+    def transport_stats(self) -> Dict[str, int]:
         """
-        return bool(self._clients)
+        Get connection pool statistics of the shared HTTP transport.
+
+        Returns:
+            Counters for requests sent, connections opened and connections reused.
+        """
+        if self._transport is None:
+            return {"requests": 0, "connections_opened": 0, "connections_reused": 0}
+        return self._transport.stats()
 
     def clear(self) -> None:
-        """Clear all registered providers."""
-        self._clients.clear()
+        """Clear all registered providers and close the shared transport."""
+        with self._build_lock:
+            self._clients.clear()
+            self._pending.clear()
+        transport, self._transport = self._transport, None
+        if transport is not None:
+            stats = transport.stats()
+            logger.debug(
+                f"Closing HTTP transport: {stats['requests']} requests, "
+                f"{stats['connections_opened']} connections opened, {stats['connections_reused']} reused"
+            )
+            transport.close()
 
 
 __all__ = [
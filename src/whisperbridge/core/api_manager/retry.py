@@ -0,0 +1,284 @@
+"""
+Deadline-aware retry engine for the API Manager package.
+
+Requests carry a deadline (a monotonic timestamp in a context variable) set
+by whoever owns the time budget: the UI workers set it from ``api_timeout``,
+and the API manager falls back to the same setting for direct callers. The
+engine retries ``RetryableAPIError`` with short jittered backoffs, waits
+exactly as long as the provider asks via ``Retry-After`` / rate-limit
+headers, and gives up early when the remaining budget cannot fit the wait
+plus another attempt. Every attempt's duration and outcome is recorded in
+``RetryMetrics``.
+
+The engine drives tenacity, so exhausted retries still raise
+``tenacity.RetryError`` wrapping the last ``RetryableAPIError``.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, Optional, TypeVar
+
+from loguru import logger
+from tenacity import AsyncRetrying, RetryCallState, Retrying, retry_if_exception_type
+
+from .errors import RequestCancelledError, RetryableAPIError
+
+T = TypeVar("T")
+
+# Monotonic deadline of the current request, None when unbounded
+_deadline: ContextVar[Optional[float]] = ContextVar("whisperbridge_request_deadline", default=None)
+
+# Number of recent attempts kept for inspection
+_RECENT_ATTEMPTS = 50
+
+
+@contextmanager
+def request_deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Bound the requests made inside the block to ``seconds`` from now.
+
+    Nested deadlines never extend an outer one: the earlier deadline wins.
+
+    Args:
+        seconds: Time budget in seconds; None leaves the current deadline unchanged.
+
+    Yields:
+        The effective monotonic deadline, or None if unbounded.
+    """
+    current = _deadline.get()
+    deadline = current
+    if seconds is not None:
+        candidate = time.monotonic() + max(0.0, float(seconds))
+        deadline = candidate if current is None else min(current, candidate)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left until the current request deadline, or None if unbounded."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Attempt limits and backoff settings for RetryEngine."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 4.0
+    max_retry_after: float = 30.0
+    min_attempt_seconds: float = 1.0
+
+    def backoff(self, attempt_number: int) -> float:
+        """Jittered exponential backoff after the given failed attempt (equal jitter)."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** max(0, attempt_number - 1)))
+        return random.uniform(ceiling / 2, ceiling)
+
+
+class RetryMetrics:
+    """Thread-safe counters for request attempts, retries and give-ups."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._outcomes: Dict[str, Dict[str, float]] = {}
+            self._retries = 0
+            self._backoff_seconds = 0.0
+            self._gave_up: Dict[str, int] = {}
+            self._recent: Deque[Dict[str, Any]] = deque(maxlen=_RECENT_ATTEMPTS)
+
+    def record_attempt(self, attempt_number: int, seconds: float, outcome: str) -> None:
+        """Record one finished attempt and its outcome (``success`` or an error type)."""
+        with self._lock:
+            entry = self._outcomes.setdefault(outcome, {"count": 0, "total": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+            self._recent.append({"attempt": attempt_number, "outcome": outcome, "ms": seconds * 1000})
+
+    def record_retry(self, delay: float) -> None:
+        """Record a scheduled retry and its backoff delay."""
+        with self._lock:
+            self._retries += 1
+            self._backoff_seconds += delay
+
+    def record_give_up(self, reason: str) -> None:
+        """Record a request abandoned before its attempts ran out (``deadline``, ``retry_after``)."""
+        with self._lock:
+            self._gave_up[reason] = self._gave_up.get(reason, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the counters.
+
+        Returns:
+            ``attempts`` per outcome (count, avg_ms, max_ms), ``retries``,
+            ``backoff_ms`` spent waiting, ``gave_up`` per reason and the
+            ``recent`` attempts, oldest first.
+        """
+        with self._lock:
+            return {
+                "attempts": {
+                    outcome: {
+                        "count": int(entry["count"]),
+                        "avg_ms": entry["total"] / entry["count"] * 1000,
+                        "max_ms": entry["max"] * 1000,
+                    }
+                    for outcome, entry in self._outcomes.items()
+                },
+                "retries": self._retries,
+                "backoff_ms": self._backoff_seconds * 1000,
+                "gave_up": dict(self._gave_up),
+                "recent": list(self._recent),
+            }
+
+
+def _outcome(error: BaseException) -> str:
+    """Metrics label for a failed attempt."""
+    if isinstance(error, RetryableAPIError) and error.error_type is not None:
+        return error.error_type.value
+    if isinstance(error, (asyncio.CancelledError, RequestCancelledError)):
+        return "cancelled"
+    return "error"
+
+
+class RetryEngine:
+    """
+    Retries retryable API errors within the current request deadline.
+
+    Args:
+        policy: Attempt limits and backoff settings (defaults if omitted).
+        metrics: Attempt metrics sink (a new one if omitted).
+    """
+
+    def __init__(self, policy: Optional[RetryPolicy] = None, metrics: Optional[RetryMetrics] = None):
+        self.policy = policy or RetryPolicy()
+        self.metrics = metrics or RetryMetrics()
+
+    def _next_delay(self, retry_state: RetryCallState) -> float:
+        """tenacity ``wait``: the provider's Retry-After if given, else a jittered backoff."""
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            # Small jitter so clients released by the same reset do not collide
+            return retry_after + random.uniform(0, self.policy.base_delay / 2)
+        return self.policy.backoff(retry_state.attempt_number)
+
+    def _should_stop(self, retry_state: RetryCallState) -> bool:
+        """tenacity ``stop``: out of attempts, asked to wait too long, or out of time."""
+        if retry_state.attempt_number >= self.policy.max_attempts:
+            return True
+
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None and retry_after > self.policy.max_retry_after:
+            logger.warning(f"Provider asked to retry after {retry_after:.1f}s; giving up instead of waiting")
+            self.metrics.record_give_up("retry_after")
+            return True
+
+        remaining = remaining_time()
+        needed = retry_state.upcoming_sleep + self.policy.min_attempt_seconds
+        if remaining is not None and needed > remaining:
+            logger.warning(
+                f"Not retrying: {remaining:.1f}s left before the request deadline, "
+                f"next attempt needs {needed:.1f}s"
+            )
+            self.metrics.record_give_up("deadline")
+            return True
+        return False
+
+    def _before_sleep(self, retry_state: RetryCallState) -> None:
+        delay = retry_state.upcoming_sleep
+        self.metrics.record_retry(delay)
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        logger.warning(f"Attempt {retry_state.attempt_number} failed ({error}); retrying in {delay:.2f}s")
+
+    def _retry_kwargs(self) -> Dict[str, Any]:
+        return {
+            "stop": self._should_stop,
+            "wait": self._next_delay,
+            "retry": retry_if_exception_type(RetryableAPIError),
+            "before_sleep": self._before_sleep,
+        }
+
+    def call(
+        self, fn: Callable[..., T], *args: Any, cancel_token: Optional[threading.Event] = None, **kwargs: Any
+    ) -> T:
+        """
+        Call ``fn`` with retries, blocking the calling thread during backoff.
+
+        Args:
+            cancel_token: Optional cancellation flag; setting it cuts a pending
+                backoff short (``fn`` is expected to fail fast once it is set).
+
+        Raises:
+            tenacity.RetryError: When a retryable error persists past the policy.
+            Exception: Non-retryable errors from ``fn``, unchanged.
+        """
+        attempt_number = 0
+
+        def attempt() -> T:
+            nonlocal attempt_number
+            attempt_number += 1
+            started = time.monotonic()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                self.metrics.record_attempt(attempt_number, time.monotonic() - started, _outcome(e))
+                raise
+            self.metrics.record_attempt(attempt_number, time.monotonic() - started, "success")
+            return result
+
+        retry_kwargs = self._retry_kwargs()
+        if cancel_token is not None:
+            retry_kwargs["sleep"] = cancel_token.wait
+        return Retrying(**retry_kwargs)(attempt)
+
+    async def acall(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """
+        Await ``fn`` with retries, sleeping on the event loop during backoff.
+
+        Raises:
+            tenacity.RetryError: When a retryable error persists past the policy.
+            Exception: Non-retryable errors from ``fn``, unchanged.
+        """
+        attempt_number = 0
+
+        async def attempt() -> T:
+            nonlocal attempt_number
+            attempt_number += 1
+            started = time.monotonic()
+            try:
+                result = await fn(*args, **kwargs)
+            except BaseException as e:
+                self.metrics.record_attempt(attempt_number, time.monotonic() - started, _outcome(e))
+                raise
+            self.metrics.record_attempt(attempt_number, time.monotonic() - started, "success")
+            return result
+
+        return await AsyncRetrying(**self._retry_kwargs())(attempt)
+
+
+__all__ = [
+    "RetryEngine",
+    "RetryMetrics",
+    "RetryPolicy",
+    "remaining_time",
+    "request_deadline",
+]
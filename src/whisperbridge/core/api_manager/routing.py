@@ -0,0 +1,278 @@
+"""
+Latency-aware provider routing for the API Manager package.
+
+Every request attempt made by the API manager is recorded per provider and
+model: an exponentially weighted moving average (EWMA) of the latency, an
+EWMA of the error rate and a window of recent latencies for the p95. With
+automatic provider selection enabled, the router picks the fastest healthy
+provider that can serve a request. Statistics are persisted in the config
+directory so routing decisions survive restarts.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional, Sequence, Tuple
+
+from loguru import logger
+
+# Smoothing factor of the latency and error-rate averages
+_EWMA_ALPHA = 0.2
+
+# Latency samples kept per provider and model for the p95
+_SAMPLE_WINDOW = 50
+
+# Requests needed before a candidate is ranked by its latency; candidates
+# with fewer are tried first so every provider gets measured
+_MIN_SAMPLES = 3
+
+# A candidate whose error-rate average reaches this share is skipped ...
+UNHEALTHY_ERROR_RATE = 0.5
+
+# ... until this long after its last failure, when it gets another chance
+UNHEALTHY_RECHECK_SECONDS = 300.0
+
+# Minimum time between two writes of the statistics file
+_SAVE_INTERVAL_SECONDS = 30.0
+
+_STATS_FILE = "provider_stats.json"
+_STATS_VERSION = 1
+
+
+@dataclass
+class RouteStats:
+    """Rolling request statistics of one provider and model."""
+
+    requests: int = 0
+    failures: int = 0
+    latency_ewma: Optional[float] = None
+    error_ewma: float = 0.0
+    last_failure: float = 0.0
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=_SAMPLE_WINDOW))
+
+    def record(self, seconds: Optional[float]) -> None:
+        """Record a successful request (``seconds``) or a failure (None)."""
+        self.requests += 1
+        ok = seconds is not None
+        self.error_ewma += _EWMA_ALPHA * ((0.0 if ok else 1.0) - self.error_ewma)
+        if not ok:
+            self.failures += 1
+            self.last_failure = time.time()
+            return
+        self.samples.append(seconds)
+        if self.latency_ewma is None:
+            self.latency_ewma = seconds
+        else:
+            self.latency_ewma += _EWMA_ALPHA * (seconds - self.latency_ewma)
+
+    def p95(self) -> Optional[float]:
+        """95th percentile of the recent latencies (nearest-rank), or None without samples."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[max(1, math.ceil(0.95 * len(ordered))) - 1]
+
+    def is_healthy(self, now: float) -> bool:
+        """False while the error rate is high and the last failure is recent."""
+        if self.error_ewma < UNHEALTHY_ERROR_RATE:
+            return True
+        return now - self.last_failure >= UNHEALTHY_RECHECK_SECONDS
+
+    def score(self) -> float:
+        """Expected latency used for ranking: the mean of the EWMA and the p95."""
+        if self.latency_ewma is None:
+            return math.inf
+        return (self.latency_ewma + self.p95()) / 2
+
+    def describe(self) -> str:
+        """Short summary for routing logs."""
+        if self.latency_ewma is None:
+            return f"no latency yet, errors {self.error_ewma:.0%}"
+        return (
+            f"ewma {self.latency_ewma * 1000:.0f} ms, p95 {self.p95() * 1000:.0f} ms, "
+            f"errors {self.error_ewma:.0%} ({len(self.samples)} samples)"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "latency_ewma": self.latency_ewma,
+            "error_ewma": self.error_ewma,
+            "last_failure": self.last_failure,
+            "samples": list(self.samples),
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "RouteStats":
+        stats = cls(
+            requests=int(raw.get("requests", 0)),
+            failures=int(raw.get("failures", 0)),
+            latency_ewma=None if raw.get("latency_ewma") is None else float(raw["latency_ewma"]),
+            error_ewma=min(1.0, max(0.0, float(raw.get("error_ewma", 0.0)))),
+            last_failure=float(raw.get("last_failure", 0.0)),
+        )
+        stats.samples.extend(float(seconds) for seconds in raw.get("samples", [])[-_SAMPLE_WINDOW:])
+        return stats
+
+
+class ProviderRouter:
+    """
+    Keeps per-provider/model request statistics and picks providers from them.
+
+    Args:
+        config_dir: Directory of the persisted statistics; None keeps them in memory only.
+    """
+
+    def __init__(self, config_dir: Optional[Path] = None):
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], RouteStats] = {}
+        self._path = config_dir / _STATS_FILE if config_dir is not None else None
+        self._last_save = time.monotonic()
+        self._dirty = False
+        self._load()
+
+    def record_success(self, provider: str, model: Optional[str], seconds: float) -> None:
+        """Record the latency of a successful request."""
+        self._record(provider, model, seconds)
+
+    def record_failure(self, provider: str, model: Optional[str]) -> None:
+        """Record a failed request."""
+        self._record(provider, model, None)
+
+    def _record(self, provider: str, model: Optional[str], seconds: Optional[float]) -> None:
+        with self._lock:
+            self._stats.setdefault((provider, model or ""), RouteStats()).record(seconds)
+            self._dirty = True
+            save = time.monotonic() - self._last_save >= _SAVE_INTERVAL_SECONDS
+        if save:
+            self.save()
+
+    def choose(
+        self, mode: str, candidates: Sequence[Tuple[str, str]], preferred: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Pick the candidate to send a request to.
+
+        Healthy candidates with too few requests are tried first (the preferred
+        provider before others) so that every provider gets measured; then the
+        healthy candidate with the lowest expected latency wins. If no candidate
+        is healthy, the one with the lowest error rate is used.
+
+        Args:
+            mode: Request mode, for logging.
+            candidates: (provider, model) pairs able to serve the request, in preference order.
+            preferred: Provider to favor among unmeasured candidates (the selected provider).
+
+        Returns:
+            The chosen (provider, model) pair.
+
+        Raises:
+            ValueError: If there are no candidates.
+        """
+        if not candidates:
+            raise ValueError("No provider candidates to route between")
+
+        now = time.time()
+        with self._lock:
+            stats = {candidate: self._stats.get(candidate) for candidate in candidates}
+            lines = [
+                f"{provider}/{model}: {route.describe() if route else 'no data'}"
+                + ("" if route is None or route.is_healthy(now) else " [unhealthy]")
+                for (provider, model), route in stats.items()
+            ]
+
+            healthy = [c for c, route in stats.items() if route is None or route.is_healthy(now)]
+            unmeasured = [c for c in healthy if stats[c] is None or stats[c].requests < _MIN_SAMPLES]
+            measured = [c for c in healthy if c not in unmeasured]
+
+            if unmeasured:
+                unmeasured.sort(key=lambda c: c[0] != preferred)
+                choice, reason = unmeasured[0], "not measured yet"
+            elif measured:
+                choice = min(measured, key=lambda c: stats[c].score())
+                reason = f"lowest expected latency ({stats[choice].score() * 1000:.0f} ms)"
+            else:
+                choice = min(candidates, key=lambda c: stats[c].error_ewma)
+                reason = "no healthy provider; lowest error rate"
+
+        logger.debug(f"Routing {mode} request: {'; '.join(lines)} -> {choice[0]}/{choice[1]} ({reason})")
+        return choice
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Snapshot per ``provider/model``: requests, failures, error_rate (EWMA),
+        ewma_ms, p95_ms and healthy.
+        """
+        now = time.time()
+        with self._lock:
+            return {
+                f"{provider}/{model}": {
+                    "requests": route.requests,
+                    "failures": route.failures,
+                    "error_rate": route.error_ewma,
+                    "ewma_ms": None if route.latency_ewma is None else route.latency_ewma * 1000,
+                    "p95_ms": None if not route.samples else route.p95() * 1000,
+                    "healthy": route.is_healthy(now),
+                }
+                for (provider, model), route in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Drop all statistics, including the persisted ones."""
+        with self._lock:
+            self._stats.clear()
+            self._dirty = True
+        self.save()
+
+    def _load(self) -> None:
+        """Load persisted statistics, ignoring a missing or unreadable file."""
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            with self._path.open("r", encoding="utf-8") as f:
+                raw = json.load(f)
+            if raw.get("version") != _STATS_VERSION:
+                return
+            for entry in raw.get("routes", []):
+                self._stats[(entry["provider"], entry["model"])] = RouteStats.from_dict(entry)
+            logger.debug(f"Loaded provider statistics for {len(self._stats)} routes")
+        except Exception as e:
+            logger.warning(f"Failed to load provider statistics: {e}")
+
+    def save(self) -> None:
+        """Persist the statistics if they changed since the last save."""
+        if self._path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                routes = [
+                    {"provider": provider, "model": model, **route.to_dict()}
+                    for (provider, model), route in self._stats.items()
+                ]
+                self._dirty = False
+                self._last_save = time.monotonic()
+            # Write a temporary file first so a crash never leaves a truncated file behind
+            tmp_path = self._path.with_suffix(".tmp")
+            try:
+                with tmp_path.open("w", encoding="utf-8") as f:
+                    json.dump({"version": _STATS_VERSION, "routes": routes}, f, indent=2)
+                os.replace(tmp_path, self._path)
+            except Exception as e:
+                logger.warning(f"Failed to save provider statistics: {e}")
+
+
+__all__ = [
+    "ProviderRouter",
+    "RouteStats",
+    "UNHEALTHY_ERROR_RATE",
+    "UNHEALTHY_RECHECK_SECONDS",
+]
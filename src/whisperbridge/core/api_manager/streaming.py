@@ -0,0 +1,155 @@
+"""
+Streaming responses for the API Manager package.
+
+This module provides the TranslationStream class which turns OpenAI-style
+chat completion chunks into an iterator of text deltas.
+"""
+
+import inspect
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional
+
+from loguru import logger
+
+from ..completion_budget import TRUNCATED_FINISH_REASONS
+
+
+class TranslationStream:
+    """
+    Iterator over the text deltas of a streamed chat completion.
+
+    Consumes chunks shaped like OpenAI's ``ChatCompletionChunk``
+    (``choices[0].delta.content``, optional ``usage``) and records the
+    accumulated text, token usage, finish reason and time to first token.
+    The underlying provider stream is closed when iteration ends.
+
+    Streams from async provider clients are consumed with ``async for``.
+    """
+
+    def __init__(self, chunks: Iterable[Any], model: str, started_at: Optional[float] = None):
+        """
+        Initialize the TranslationStream.
+
+        Args:
+            chunks: Provider chunk iterator.
+            model: Model name used for the request.
+            started_at: ``time.time()`` when the request was sent (for latency logging).
+        """
+        self.model = model
+        self.tokens_used = 0
+        self.finish_reason: Optional[str] = None
+        self.first_token_latency: Optional[float] = None
+        # Completion budget of the request, set by the API manager
+        self.max_completion_tokens: Optional[int] = None
+        self._chunks = chunks
+        self._parts: List[str] = []
+        self._started_at = started_at if started_at is not None else time.time()
+        self._consumed = False
+
+    @classmethod
+    def from_response(cls, response: Any, model: str, started_at: Optional[float] = None) -> "TranslationStream":
+        """Wrap a complete (non-streamed) response as a single-chunk stream."""
+        choices = getattr(response, "choices", None) or []
+        content = ""
+        finish_reason = None
+        if choices:
+            message = getattr(choices[0], "message", None)
+            content = getattr(message, "content", "") or ""
+            finish_reason = getattr(choices[0], "finish_reason", None)
+        chunk = SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)],
+            usage=getattr(response, "usage", None),
+        )
+        return cls([chunk], model, started_at)
+
+    @property
+    def text(self) -> str:
+        """Text received so far."""
+        return "".join(self._parts)
+
+    @property
+    def truncated(self) -> bool:
+        """Whether the output was cut off by its completion token budget."""
+        return (self.finish_reason or "").lower() in TRUNCATED_FINISH_REASONS
+
+    def _mark_consumed(self) -> None:
+        if self._consumed:
+            raise RuntimeError("TranslationStream can only be iterated once")
+        self._consumed = True
+
+    def _consume_chunk(self, chunk: Any) -> List[str]:
+        """Record usage and finish reason of one chunk and return its text deltas."""
+        usage = getattr(chunk, "usage", None)
+        if usage is not None:
+            self.tokens_used = int(getattr(usage, "total_tokens", 0) or 0)
+        deltas: List[str] = []
+        for choice in getattr(chunk, "choices", None) or []:
+            finish_reason = getattr(choice, "finish_reason", None)
+            if finish_reason:
+                self.finish_reason = finish_reason
+            delta = getattr(choice, "delta", None)
+            content = getattr(delta, "content", None) if delta is not None else None
+            if not content:
+                continue
+            if self.first_token_latency is None:
+                self.first_token_latency = time.time() - self._started_at
+            self._parts.append(content)
+            deltas.append(content)
+        return deltas
+
+    def _log_finished(self) -> None:
+        if self.first_token_latency is not None:
+            logger.debug(
+                f"Stream finished: first token after {self.first_token_latency:.2f}s, "
+                f"total {time.time() - self._started_at:.2f}s"
+            )
+
+    def __iter__(self) -> Iterator[str]:
+        self._mark_consumed()
+        try:
+            for chunk in self._chunks:
+                yield from self._consume_chunk(chunk)
+        finally:
+            self.close()
+            self._log_finished()
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        self._mark_consumed()
+        try:
+            if hasattr(self._chunks, "__aiter__"):
+                async for chunk in self._chunks:
+                    for content in self._consume_chunk(chunk):
+                        yield content
+            else:
+                for chunk in self._chunks:
+                    for content in self._consume_chunk(chunk):
+                        yield content
+        finally:
+            await self.aclose()
+            self._log_finished()
+
+    def close(self) -> None:
+        """Close the underlying provider stream, releasing its connection."""
+        close = getattr(self._chunks, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.debug(f"Failed to close provider stream: {e}")
+
+    async def aclose(self) -> None:
+        """Close an async provider stream (``aclose`` or awaitable ``close``)."""
+        close = getattr(self._chunks, "aclose", None) or getattr(self._chunks, "close", None)
+        if callable(close):
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"Failed to close provider stream: {e}")
+
+
+__all__ = [
+    "TranslationStream",
+]
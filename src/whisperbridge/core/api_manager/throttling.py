@@ -0,0 +1,398 @@
+"""
+Client-side rate limiting for the API Manager package.
+
+Each provider and model gets two token buckets: requests per minute (RPM)
+and tokens per minute (TPM). Before a request is sent it takes one request
+and its estimated tokens (prompt estimate plus ``max_completion_tokens``),
+waiting for the buckets to refill if they are empty, so bursts from long
+texts, the Stylist and OCR are spread out instead of bouncing off the
+provider's 429 responses. The estimate is corrected from
+``usage.total_tokens`` once the response arrives, and a 429 that still
+gets through pauses the buckets for its ``Retry-After``.
+
+Interactive requests have priority: background requests (see
+``request_priority``) leave a reserve in both buckets and wait while
+interactive requests are queued.
+
+Limits come from the ``rate_limits`` setting when ``rate_limiting_enabled``
+is on.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from loguru import logger
+
+from ..completion_budget import estimate_message_tokens
+from ..config import RATE_LIMIT_DEFAULTS
+from ..image_parts import is_image_part
+from .errors import APIErrorType, RetryableAPIError
+from .retry import remaining_time
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+
+# Priority of the requests made in the current context
+_priority: ContextVar[str] = ContextVar("whisperbridge_request_priority", default=PRIORITY_INTERACTIVE)
+
+# Burst size of a bucket, in seconds of its refill rate
+_BURST_SECONDS = 10.0
+
+# Share of each bucket that background requests leave to interactive ones
+_BACKGROUND_RESERVE = 0.25
+
+# Longest single sleep while waiting, so pauses and new interactive requests are noticed
+_MAX_SLEEP_SECONDS = 1.0
+
+# Longest wait for a slot when the request has no deadline
+_MAX_WAIT_SECONDS = 60.0
+
+# Pause after a provider 429 that did not say how long to wait
+_DEFAULT_PAUSE_SECONDS = 1.0
+
+# Rough token cost of an image part (images are not counted by the text estimate)
+_IMAGE_TOKENS = 1000
+
+# Shortfall treated as none, so floating-point refill drift cannot cause endless tiny waits
+_LEVEL_EPSILON = 1e-6
+
+
+@contextmanager
+def request_priority(priority: str) -> Iterator[None]:
+    """
+    Mark the requests made inside the block as interactive or background.
+
+    Args:
+        priority: ``PRIORITY_INTERACTIVE`` or ``PRIORITY_BACKGROUND``.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def estimate_request_tokens(api_params: Dict[str, Any]) -> int:
+    """
+    Estimate the tokens a request counts against the TPM limit.
+
+    Providers count the prompt plus the requested completion budget until the
+    response reports the real usage.
+    """
+    messages = api_params.get("messages") or []
+    images = sum(
+        1
+        for message in messages
+        if isinstance(message.get("content"), list)
+        for part in message["content"]
+        if is_image_part(part)
+    )
+    completion = api_params.get("max_completion_tokens") or 0
+    return estimate_message_tokens(messages) + images * _IMAGE_TOKENS + int(completion)
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Requests and tokens per minute of one provider and model (None = unlimited)."""
+
+    rpm: Optional[float] = None
+    tpm: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, config_service: Any, provider: str, model: Optional[str]) -> Optional["RateLimits"]:
+        """
+        Build the limits of a provider and model from application settings.
+
+        ``rate_limits`` entries for ``provider/model`` override those for
+        ``provider``, which override ``RATE_LIMIT_DEFAULTS``. Missing, invalid
+        or non-positive values mean no limit.
+
+        Returns:
+            The limits, or None if rate limiting is disabled or nothing is limited.
+        """
+        if config_service.get_setting("rate_limiting_enabled") is not True:
+            return None
+        configured = config_service.get_setting("rate_limits")
+        configured = configured if isinstance(configured, dict) else {}
+
+        raw: Dict[str, Any] = dict(RATE_LIMIT_DEFAULTS.get(provider, {}))
+        for key in (provider, f"{provider}/{model}"):
+            entry = configured.get(key)
+            if isinstance(entry, dict):
+                raw.update(entry)
+
+        def limit(key: str) -> Optional[float]:
+            try:
+                value = float(raw.get(key) or 0)
+            except (TypeError, ValueError):
+                return None
+            return value if value > 0 else None
+
+        limits = cls(rpm=limit("rpm"), tpm=limit("tpm"))
+        return limits if limits.rpm or limits.tpm else None
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a per-minute rate.
+
+    The level may go negative when a request takes more than is left (an
+    oversized request, or usage above the estimate); later requests then
+    wait until the debt is refilled.
+
+    Args:
+        per_minute: Refill rate per minute.
+    """
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * _BURST_SECONDS)
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def configure(self, per_minute: float) -> None:
+        """Change the refill rate, keeping the current level within the new capacity."""
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * _BURST_SECONDS)
+        self.level = min(self.level, self.capacity)
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, reserve: float = 0.0) -> float:
+        """Seconds until ``amount`` can be taken while leaving ``reserve`` (a share of the capacity)."""
+        # Amounts larger than the bucket are admitted once it is full
+        needed = min(self.capacity, amount + reserve * self.capacity)
+        shortfall = needed - self.level
+        return shortfall / self.rate if shortfall > _LEVEL_EPSILON else 0.0
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+    def give(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+@dataclass
+class RatePermit:
+    """Admission of one request; settle or release it once the request finished."""
+
+    key: Tuple[str, str]
+    tokens: int
+
+
+class _Route:
+    """Buckets, waiters and counters of one provider and model."""
+
+    def __init__(self, limits: RateLimits):
+        self.limits = limits
+        self.requests = TokenBucket(limits.rpm) if limits.rpm else None
+        self.tokens = TokenBucket(limits.tpm) if limits.tpm else None
+        self.paused_until = 0.0
+        self.interactive_waiting = 0
+        self.admitted = 0
+        self.delayed = 0
+        self.wait_seconds = 0.0
+        self.pauses = 0
+
+    def configure(self, limits: RateLimits) -> None:
+        """Apply changed limits, keeping the current levels where possible."""
+        if limits == self.limits:
+            return
+        self.limits = limits
+        for name, per_minute in (("requests", limits.rpm), ("tokens", limits.tpm)):
+            bucket = getattr(self, name)
+            if not per_minute:
+                setattr(self, name, None)
+            elif bucket is None:
+                setattr(self, name, TokenBucket(per_minute))
+            else:
+                bucket.configure(per_minute)
+
+
+class RateLimiter:
+    """Thread-safe RPM/TPM admission of requests per provider and model."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[Tuple[str, str], _Route] = {}
+
+    def _try_acquire(
+        self, key: Tuple[str, str], limits: RateLimits, tokens: int, priority: str
+    ) -> Optional[float]:
+        """Take a slot if one is free; otherwise return the seconds to wait."""
+        now = time.monotonic()
+        with self._lock:
+            route = self._routes.get(key)
+            if route is None:
+                route = self._routes[key] = _Route(limits)
+            route.configure(limits)
+
+            background = priority == PRIORITY_BACKGROUND
+            reserve = _BACKGROUND_RESERVE if background else 0.0
+            wait = max(0.0, route.paused_until - now)
+            for bucket, amount in ((route.requests, 1), (route.tokens, tokens)):
+                if bucket is not None:
+                    bucket.refill(now)
+                    wait = max(wait, bucket.wait_time(amount, reserve))
+            if background and route.interactive_waiting and wait == 0:
+                # Let queued interactive requests go first
+                wait = _MAX_SLEEP_SECONDS / 10
+            if wait > 0:
+                return wait
+
+            if route.requests is not None:
+                route.requests.take(1)
+            if route.tokens is not None:
+                route.tokens.take(tokens)
+            route.admitted += 1
+            return None
+
+    def _begin_wait(self, key: Tuple[str, str], priority: str) -> None:
+        with self._lock:
+            route = self._routes[key]
+            route.delayed += 1
+            if priority != PRIORITY_BACKGROUND:
+                route.interactive_waiting += 1
+
+    def _end_wait(self, key: Tuple[str, str], priority: str, waited: float) -> None:
+        with self._lock:
+            route = self._routes[key]
+            route.wait_seconds += waited
+            if priority != PRIORITY_BACKGROUND:
+                route.interactive_waiting -= 1
+
+    @staticmethod
+    def _check_wait(key: Tuple[str, str], wait: float, waited: float) -> None:
+        """Give up when the wait would not fit into the request deadline."""
+        remaining = remaining_time()
+        limit = _MAX_WAIT_SECONDS - waited if remaining is None else remaining
+        if wait > limit:
+            raise RetryableAPIError(
+                f"Local rate limit for {key[0]}/{key[1]}: no free slot for {wait:.1f}s",
+                error_type=APIErrorType.RATE_LIMIT,
+                retry_after=wait,
+            )
+
+    def acquire(self, provider: str, model: Optional[str], limits: RateLimits, tokens: int) -> RatePermit:
+        """
+        Wait for a slot, blocking the calling thread.
+
+        Raises:
+            RetryableAPIError: (rate limit) If no slot frees up before the request deadline.
+        """
+        key, priority = (provider, model or ""), _priority.get()
+        wait = self._try_acquire(key, limits, tokens, priority)
+        if wait is None:
+            return RatePermit(key, tokens)
+
+        self._begin_wait(key, priority)
+        started = time.monotonic()
+        try:
+            while wait is not None:
+                self._check_wait(key, wait, time.monotonic() - started)
+                time.sleep(min(wait, _MAX_SLEEP_SECONDS))
+                wait = self._try_acquire(key, limits, tokens, priority)
+        finally:
+            self._end_wait(key, priority, time.monotonic() - started)
+        logger.debug(f"Rate limit: {provider}/{model} request waited {time.monotonic() - started:.2f}s ({priority})")
+        return RatePermit(key, tokens)
+
+    async def acquire_async(
+        self, provider: str, model: Optional[str], limits: RateLimits, tokens: int
+    ) -> RatePermit:
+        """Async counterpart of ``acquire``; waits on the event loop."""
+        key, priority = (provider, model or ""), _priority.get()
+        wait = self._try_acquire(key, limits, tokens, priority)
+        if wait is None:
+            return RatePermit(key, tokens)
+
+        self._begin_wait(key, priority)
+        started = time.monotonic()
+        try:
+            while wait is not None:
+                self._check_wait(key, wait, time.monotonic() - started)
+                await asyncio.sleep(min(wait, _MAX_SLEEP_SECONDS))
+                wait = self._try_acquire(key, limits, tokens, priority)
+        finally:
+            self._end_wait(key, priority, time.monotonic() - started)
+        logger.debug(f"Rate limit: {provider}/{model} request waited {time.monotonic() - started:.2f}s ({priority})")
+        return RatePermit(key, tokens)
+
+    def settle(self, permit: RatePermit, total_tokens: Any) -> None:
+        """Correct the token estimate of a finished request with its reported usage."""
+        # Providers without token accounting (DeepL) report no usage or 0
+        if not isinstance(total_tokens, int) or isinstance(total_tokens, bool) or total_tokens <= 0:
+            return
+        with self._lock:
+            route = self._routes.get(permit.key)
+            if route is None or route.tokens is None:
+                return
+            route.tokens.refill(time.monotonic())
+            difference = permit.tokens - total_tokens
+            if difference > 0:
+                route.tokens.give(difference)
+            else:
+                route.tokens.take(-difference)
+
+    def release(self, permit: RatePermit, rate_limited: bool = False, retry_after: Optional[float] = None) -> None:
+        """
+        Return the tokens of a failed request (the request itself still counts).
+
+        Args:
+            rate_limited: The provider answered 429; hold back all requests of the route.
+            retry_after: How long the provider asked to wait, if it said.
+        """
+        pause = (retry_after or _DEFAULT_PAUSE_SECONDS) if rate_limited else 0.0
+        with self._lock:
+            route = self._routes.get(permit.key)
+            if route is None:
+                return
+            if route.tokens is not None:
+                route.tokens.give(permit.tokens)
+            if rate_limited:
+                route.paused_until = max(route.paused_until, time.monotonic() + pause)
+                route.pauses += 1
+        if rate_limited:
+            logger.warning(f"Provider rate limit hit for {permit.key[0]}/{permit.key[1]}; pausing requests for {pause:.1f}s")
+
+    def reset(self) -> None:
+        """Drop all buckets and counters."""
+        with self._lock:
+            self._routes.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Snapshot per ``provider/model``: rpm and tpm limits, admitted requests,
+        delayed requests, wait_ms spent waiting and pauses after provider 429s.
+        """
+        with self._lock:
+            return {
+                f"{provider}/{model}": {
+                    "rpm": route.limits.rpm,
+                    "tpm": route.limits.tpm,
+                    "admitted": route.admitted,
+                    "delayed": route.delayed,
+                    "wait_ms": route.wait_seconds * 1000,
+                    "pauses": route.pauses,
+                }
+                for (provider, model), route in self._routes.items()
+            }
+
+
+__all__ = [
+    "PRIORITY_BACKGROUND",
+    "PRIORITY_INTERACTIVE",
+    "RateLimiter",
+    "RateLimits",
+    "RatePermit",
+    "TokenBucket",
+    "estimate_request_tokens",
+    "request_priority",
+]
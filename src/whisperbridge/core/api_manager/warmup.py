@@ -0,0 +1,212 @@
+"""
+Connection pre-warming for the API Manager package.
+
+This module provides:
+- LatencyTracker recording request latency split into cold and warm requests
+- ConnectionWarmer opening pooled connections and loading lazy SDK modules
+  before the first real request, and probing whether an endpoint answers
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from ...providers.http_transport import TransportConfig
+from .providers import ProviderRegistry
+
+# Pooled connections are dropped after this much idle time, so a request
+# arriving later pays for DNS/TCP/TLS again (a "cold" request)
+IDLE_THRESHOLD_SECONDS = TransportConfig().keepalive_expiry
+
+# Timeout of a reachability probe (see ConnectionWarmer.probe)
+PROBE_TIMEOUT_SECONDS = 5.0
+
+
+class LatencyTracker:
+    """
+    Request latency split into cold and warm requests.
+
+    A request is cold when no request or warm-up happened within the idle
+    threshold before it (first request after startup or after idling), i.e.
+    when it most likely had to open new connections.
+    """
+
+    def __init__(self, idle_threshold: float = IDLE_THRESHOLD_SECONDS):
+        """
+        Initialize the LatencyTracker.
+
+        Args:
+            idle_threshold: Seconds without activity after which connections count as cold.
+        """
+        self._idle_threshold = idle_threshold
+        self._lock = threading.Lock()
+        self._last_activity: Optional[float] = None
+        self._samples: Dict[str, List[float]] = {"cold": [], "warm": []}
+        self._warmups = 0
+        self._last_warmup_ms: Optional[float] = None
+
+    def is_idle(self) -> bool:
+        """Check whether no activity happened within the idle threshold."""
+        with self._lock:
+            return self._is_idle_locked()
+
+    def _is_idle_locked(self) -> bool:
+        return self._last_activity is None or time.monotonic() - self._last_activity > self._idle_threshold
+
+    def begin_request(self) -> bool:
+        """
+        Mark the start of a request.
+
+        Returns:
+            True if the request is cold.
+        """
+        with self._lock:
+            cold = self._is_idle_locked()
+            self._last_activity = time.monotonic()
+            return cold
+
+    def record_request(self, seconds: float, cold: bool) -> None:
+        """Record the latency of a completed request."""
+        with self._lock:
+            self._samples["cold" if cold else "warm"].append(seconds * 1000)
+            self._last_activity = time.monotonic()
+
+    def record_warmup(self, seconds: float) -> None:
+        """Record a completed warm-up; following requests count as warm."""
+        with self._lock:
+            self._warmups += 1
+            self._last_warmup_ms = seconds * 1000
+            self._last_activity = time.monotonic()
+
+    def reset(self) -> None:
+        """Forget past activity so the next request counts as cold."""
+        with self._lock:
+            self._last_activity = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get latency statistics.
+
+        Returns:
+            Request count, average and maximum latency (ms) for cold and warm
+            requests, plus the number and duration of warm-ups.
+        """
+        with self._lock:
+            result: Dict[str, Any] = {
+                kind: {
+                    "count": len(samples),
+                    "avg_ms": round(sum(samples) / len(samples), 1) if samples else 0.0,
+                    "max_ms": round(max(samples), 1) if samples else 0.0,
+                }
+                for kind, samples in self._samples.items()
+            }
+            result["warmups"] = self._warmups
+            result["last_warmup_ms"] = round(self._last_warmup_ms, 1) if self._last_warmup_ms is not None else None
+            return result
+
+
+class ConnectionWarmer:
+    """
+    Pre-warms provider clients without sending billable requests.
+
+    A warm-up builds the client of the selected provider (clients are built
+    on first use), loads the SDK modules the clients import lazily and opens
+    pooled connections to the provider endpoints with unauthenticated HEAD
+    requests, so DNS, TCP and TLS setup happen off the critical path.
+    """
+
+    def __init__(self, providers: ProviderRegistry, tracker: LatencyTracker):
+        """
+        Initialize the ConnectionWarmer.
+
+        Args:
+            providers: Registry holding the provider clients and the shared transport.
+            tracker: Latency tracker receiving warm-up timings.
+        """
+        self._providers = providers
+        self._tracker = tracker
+        self._lock = threading.Lock()
+        self._in_progress = False
+
+    def try_begin(self) -> bool:
+        """Reserve the warmer; returns False if a warm-up is already running."""
+        with self._lock:
+            if self._in_progress:
+                return False
+            self._in_progress = True
+            return True
+
+    async def warm_up(self, reason: str) -> int:
+        """
+        Run a warm-up reserved with ``try_begin``.
+
+        Args:
+            reason: Why the warm-up runs (for logging), e.g. "startup" or "idle".
+
+        Returns:
+            Number of endpoints that answered.
+        """
+        try:
+            start_time = time.monotonic()
+            await asyncio.to_thread(self._providers.get_selected_client)
+            clients = self._providers.get_all_clients()
+
+            for client in clients:
+                warm_up = getattr(client, "warm_up", None)
+                if callable(warm_up):
+                    try:
+                        await asyncio.to_thread(warm_up)
+                    except Exception as e:
+                        logger.debug(f"SDK warm-up failed for {type(client).__name__}: {e}")
+
+            urls = sorted({
+                url for url in (getattr(client, "warmup_url", None) for client in clients) if isinstance(url, str)
+            })
+            transport = self._providers.get_transport()
+            reached = await transport.awarm(urls) if transport is not None and urls else 0
+
+            elapsed = time.monotonic() - start_time
+            self._tracker.record_warmup(elapsed)
+            logger.info(
+                f"Connection warm-up ({reason}) finished in {elapsed * 1000:.0f} ms: "
+                f"{reached}/{len(urls)} endpoints reachable"
+            )
+            return reached
+        finally:
+            with self._lock:
+                self._in_progress = False
+
+    async def probe(self, client: Any, timeout: float = PROBE_TIMEOUT_SECONDS) -> Optional[bool]:
+        """
+        Check whether a provider endpoint answers, without a billable request.
+
+        Sends one unauthenticated HEAD request to the client's warm-up URL.
+        Any response below 500 (including 401/404) counts as reachable.
+
+        Args:
+            client: Provider client exposing ``warmup_url``.
+            timeout: Request timeout in seconds.
+
+        Returns:
+            True if reachable, False if not, None if the client cannot be probed.
+        """
+        url = getattr(client, "warmup_url", None)
+        transport = self._providers.get_transport()
+        if not isinstance(url, str) or transport is None:
+            return None
+        try:
+            response = await transport.async_client.head(url, timeout=timeout)
+        except Exception as e:
+            logger.debug(f"Probe of {url} failed: {e}")
+            return False
+        return response.status_code < 500
+
+
+__all__ = [
+    "ConnectionWarmer",
+    "IDLE_THRESHOLD_SECONDS",
+    "LatencyTracker",
+]
@@ -0,0 +1,183 @@
+"""
+Shared asyncio runtime for WhisperBridge.
+
+Runs one long-lived event loop on a background thread. Workers submit
+coroutines to it instead of creating a loop per request, so connection
+pools, async SDK clients and the default executor persist across requests.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional
+
+from loguru import logger
+
+# Grace period for pending tasks to handle cancellation during shutdown
+_SHUTDOWN_GRACE_SECONDS = 5.0
+
+
+class AsyncRuntime:
+    """
+    Background thread running a single asyncio event loop.
+
+    Coroutines are submitted with ``submit`` and return a
+    ``concurrent.futures.Future``; cancelling that future cancels the task on
+    the loop. The loop is started lazily on first use and lives until
+    ``shutdown``.
+    """
+
+    def __init__(self, name: str = "whisperbridge-asyncio"):
+        """
+        Initialize the AsyncRuntime.
+
+        Args:
+            name: Name of the runtime thread.
+        """
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runtime event loop, starting the runtime if needed."""
+        self.start()
+        assert self._loop is not None
+        return self._loop
+
+    def is_running(self) -> bool:
+        """Check whether the runtime thread and loop are running."""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def in_runtime_thread(self) -> bool:
+        """Check whether the caller runs on the runtime thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def start(self) -> None:
+        """Start the runtime thread (no-op if already running)."""
+        with self._lock:
+            if self.is_running():
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run_loop,
+                args=(loop, ready),
+                name=self._name,
+                daemon=True,
+            )
+            thread.start()
+            ready.wait()
+            self._loop = loop
+            self._thread = thread
+            logger.debug(f"Async runtime '{self._name}' started")
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        """Thread target: run the event loop until it is stopped."""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+            except Exception as e:
+                logger.debug(f"Error finalizing async runtime loop: {e}")
+            finally:
+                asyncio.set_event_loop(None)
+                loop.close()
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> "concurrent.futures.Future[Any]":
+        """
+        Schedule a coroutine on the runtime loop.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            Future resolving to the coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the runtime loop and block until it completes.
+
+        Args:
+            coro: Coroutine to run.
+            timeout: Optional timeout in seconds; the task is cancelled when it expires.
+
+        Returns:
+            The coroutine's result.
+
+        Raises:
+            RuntimeError: If called from the runtime thread (it would deadlock).
+            concurrent.futures.TimeoutError: If the timeout expires.
+        """
+        if self.in_runtime_thread():
+            coro.close()
+            raise RuntimeError("AsyncRuntime.run() cannot be called from the runtime thread")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = _SHUTDOWN_GRACE_SECONDS) -> None:
+        """
+        Cancel pending tasks, stop the loop and join the runtime thread.
+
+        Args:
+            timeout: Grace period for tasks to handle cancellation.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+
+        async def cancel_pending() -> None:
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            if not pending:
+                return
+            logger.debug(f"Cancelling {len(pending)} pending tasks")
+            for task in pending:
+                task.cancel()
+            _, still_pending = await asyncio.wait(pending, timeout=timeout)
+            if still_pending:
+                logger.warning(
+                    f"Task cancellation timed out after {timeout:g} seconds, proceeding with loop shutdown"
+                )
+
+        try:
+            asyncio.run_coroutine_threadsafe(cancel_pending(), loop).result(timeout + 1)
+        except Exception as e:
+            logger.debug(f"Error during task cancellation: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        logger.debug(f"Async runtime '{self._name}' stopped")
+
+
+# Singleton management
+_runtime: Optional[AsyncRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_async_runtime() -> AsyncRuntime:
+    """Get the global AsyncRuntime instance (started on first submit)."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = AsyncRuntime()
+        return _runtime
+
+
+__all__ = [
+    "AsyncRuntime",
+    "get_async_runtime",
+]
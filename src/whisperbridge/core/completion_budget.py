@@ -0,0 +1,121 @@
+"""
+Completion token budget policy.
+
+Sizes ``max_completion_tokens`` to the request instead of always reserving the
+model's hard output limit (e.g. 128000 tokens for gpt-5.x even for a ten-word
+translation). The budget is the estimated input size times a per-mode
+multiplier, raised to a per-mode floor, plus an allowance for hidden reasoning
+tokens on reasoning models, and clamped to the model cap from
+``model_limits``.
+
+A response cut off by the budget (``finish_reason == "length"``) is retried
+once with the model cap by the API manager.
+"""
+
+import math
+from typing import Any, Dict, Iterable, Optional
+
+from ..utils.translation_utils import estimate_tokens
+from .model_limits import get_model_max_completion_tokens
+
+# Request modes
+MODE_TRANSLATE = "translate"
+MODE_STYLE = "style"
+MODE_OCR = "ocr"
+
+# Output tokens reserved per input token. Translations rarely grow beyond 2x
+# (CJK <-> Latin scripts); style rewrites may expand the text; OCR output
+# size depends on the image rather than the prompt.
+COMPLETION_BUDGET_MULTIPLIERS: Dict[str, float] = {
+    MODE_TRANSLATE: 2.0,
+    MODE_STYLE: 2.5,
+    MODE_OCR: 2.0,
+}
+
+# Minimum budget per mode (covers short inputs and prompt-format overhead)
+COMPLETION_BUDGET_FLOORS: Dict[str, int] = {
+    MODE_TRANSLATE: 512,
+    MODE_STYLE: 512,
+    MODE_OCR: 4096,
+}
+
+# Reasoning models spend completion tokens on hidden reasoning before the answer
+REASONING_TOKEN_ALLOWANCE = 4096
+_REASONING_MODEL_PREFIXES = ("gpt-5", "o1", "o3", "o4", "gemini-2.5", "gemini-3")
+
+# finish_reason values meaning the output hit max_completion_tokens
+TRUNCATED_FINISH_REASONS = frozenset({"length", "max_tokens"})
+
+
+def is_reasoning_model(model: Optional[str]) -> bool:
+    """Check whether a model spends completion tokens on hidden reasoning."""
+    return (model or "").strip().lower().startswith(_REASONING_MODEL_PREFIXES)
+
+
+def estimate_message_tokens(messages: Iterable[Dict[str, Any]]) -> int:
+    """
+    Estimate the text tokens of chat messages.
+
+    String contents and ``text`` parts of multimodal contents are counted;
+    image parts are ignored.
+    """
+    total = 0
+    for message in messages or []:
+        content = message.get("content")
+        if isinstance(content, str):
+            total += estimate_tokens(content)
+        elif isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict) and part.get("type") == "text":
+                    total += estimate_tokens(str(part.get("text", "")))
+    return total
+
+
+def get_completion_budget(
+    model: Optional[str], messages: Iterable[Dict[str, Any]], mode: str = MODE_TRANSLATE, outputs: int = 1
+) -> int:
+    """
+    Compute ``max_completion_tokens`` for a request.
+
+    Args:
+        model: Model name.
+        messages: Chat messages of the request.
+        mode: Request mode (``translate``, ``style`` or ``ocr``).
+        outputs: Number of results the response holds for the same input
+            (e.g. one translation per target language).
+
+    Returns:
+        Completion budget, never above the model's hard output limit.
+    """
+    cap = get_model_max_completion_tokens(model)
+    multiplier = COMPLETION_BUDGET_MULTIPLIERS.get(mode, COMPLETION_BUDGET_MULTIPLIERS[MODE_TRANSLATE])
+    floor = COMPLETION_BUDGET_FLOORS.get(mode, COMPLETION_BUDGET_FLOORS[MODE_TRANSLATE])
+
+    budget = max(floor, math.ceil(estimate_message_tokens(messages) * multiplier)) * max(1, outputs)
+    if is_reasoning_model(model):
+        budget += REASONING_TOKEN_ALLOWANCE
+    return min(cap, budget)
+
+
+def is_truncated(response: Any) -> bool:
+    """Check whether a chat completion response was cut off by its token budget."""
+    choices = getattr(response, "choices", None)
+    if not isinstance(choices, (list, tuple)) or not choices:
+        return False
+    finish_reason = getattr(choices[0], "finish_reason", None)
+    return isinstance(finish_reason, str) and finish_reason.lower() in TRUNCATED_FINISH_REASONS
+
+
+__all__ = [
+    "COMPLETION_BUDGET_FLOORS",
+    "COMPLETION_BUDGET_MULTIPLIERS",
+    "MODE_OCR",
+    "MODE_STYLE",
+    "MODE_TRANSLATE",
+    "REASONING_TOKEN_ALLOWANCE",
+    "TRUNCATED_FINISH_REASONS",
+    "estimate_message_tokens",
+    "get_completion_budget",
+    "is_reasoning_model",
+    "is_truncated",
+]
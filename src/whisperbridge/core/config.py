@@ -49,6 +49,24 @@ API_TIMEOUT_DEFAULT = 30
 API_TIMEOUT_MIN = 1
 API_TIMEOUT_MAX = 60
 
+# Hedged requests, per request mode: provider order for the hedge, latency
+# percentile of the primary provider after which the hedge is sent, and the
+# delay used until enough latency samples exist.
+HEDGE_POLICY_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "translate": {"providers": ["openai", "google", "deepl"], "percentile": 95, "delay_ms": 2000},
+    "style": {"providers": ["openai", "google"], "percentile": 95, "delay_ms": 3000},
+    "ocr": {"providers": ["openai", "google"], "percentile": 90, "delay_ms": 6000},
+}
+
+# Client-side rate limits per provider: requests and tokens per minute. The
+# rate_limits setting overrides them per provider or per "provider/model";
+# keep the values at or below the limits of your API account.
+RATE_LIMIT_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "openai": {"rpm": 500, "tpm": 200000},
+    "google": {"rpm": 1000, "tpm": 1000000},
+    "deepl": {"rpm": 600},
+}
+
 
 def normalize_translator_font_size(value: Any) -> int:
     """Return a safe translator font size clamped to the supported range."""
@@ -182,9 +200,46 @@ class Settings(BaseSettings):
     )
     google_model: str = Field(default="gemini-2.5-flash", description="Default Google model")
     api_timeout: int = Field(default=API_TIMEOUT_DEFAULT, description="API request timeout in seconds")
+    adaptive_completion_tokens: bool = Field(
+        default=True,
+        description="Size max_completion_tokens to the input instead of the model's output limit",
+    )
     default_models: Optional[List[str]] = Field(
         default=None, description="Custom default models list (overrides built-in default)"
     )
+    http2_enabled: bool = Field(
+        default=False,
+        description="Use HTTP/2 for provider connections (requires the 'h2' package)",
+    )
+    http_proxy: str = Field(default="", description="Proxy URL for provider requests (empty = direct connection)")
+    http_max_connections: int = Field(
+        default=20, description="Maximum number of pooled HTTP connections shared by all providers"
+    )
+    http_connect_timeout: int = Field(default=10, description="HTTP connect timeout in seconds")
+    connection_warmup_enabled: bool = Field(
+        default=True,
+        description="Open provider connections at startup and after idle periods (no billable requests)",
+    )
+    hedging_enabled: bool = Field(
+        default=False,
+        description="Send slow requests to a second configured provider as well and use the first answer",
+    )
+    hedge_policies: Dict[str, Dict[str, Any]] = Field(
+        default_factory=lambda: json.loads(json.dumps(HEDGE_POLICY_DEFAULTS)),
+        description="Per-mode hedging policy (translate, style, ocr): providers, percentile, delay_ms",
+    )
+    rate_limiting_enabled: bool = Field(
+        default=False,
+        description="Queue requests locally to stay within provider requests/tokens-per-minute limits",
+    )
+    rate_limits: Dict[str, Dict[str, Any]] = Field(
+        default_factory=lambda: json.loads(json.dumps(RATE_LIMIT_DEFAULTS)),
+        description="Client-side rate limits per provider or 'provider/model': rpm, tpm (0 = unlimited)",
+    )
+    auto_provider_routing: bool = Field(
+        default=False,
+        description="Send each request to the fastest healthy configured provider instead of the selected one",
+    )
 
     # Overlay UI-specific language selections (do not affect core behavior)
     # - ui_source_language: "auto" or explicit ISO code
@@ -193,6 +248,10 @@ class Settings(BaseSettings):
     ui_source_language: str = Field(default="auto", description="Overlay UI source language ('auto' or ISO code)")
     ui_target_mode: Literal["auto_swap", "explicit"] = Field(default="explicit", description="Overlay UI target selection mode")
     ui_target_language: str = Field(default="en", description="Overlay UI explicit target language (ISO code)")
+    ui_extra_target_languages: List[str] = Field(
+        default_factory=list,
+        description="Overlay UI languages translated together with the target language (ISO codes), shown in tabs",
+    )
 
     # Translation behavior flags
     # When True, OCR translation will auto-swap between English and Russian:
@@ -202,6 +261,26 @@ class Settings(BaseSettings):
         default=True,
         description="If enabled, OCR translations will auto-swap EN <-> RU based on detected language",
     )
+    translation_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse cached results for repeated translation/style requests instead of calling the provider",
+    )
+    translation_memory_enabled: bool = Field(
+        default=True,
+        description="Reuse stored translations of known sentences and send only new segments to the provider",
+    )
+    streaming_enabled: bool = Field(
+        default=True,
+        description="Show translation/style output in the overlay while it is being generated",
+    )
+    translation_chunk_max_tokens: int = Field(
+        default=1500,
+        description="Estimated input tokens per chunk when long texts are split for translation",
+    )
+    translation_max_parallel_chunks: int = Field(
+        default=4,
+        description="Maximum number of chunks of one text translated concurrently",
+    )
 
     # Hotkeys
     translate_hotkey: str = Field(default="ctrl+shift+t", description="Translate hotkey")
@@ -233,6 +312,26 @@ class Settings(BaseSettings):
         default="Extract plain text from the image in natural reading order. Output only the text.",
         description="Prompt for LLM-based OCR",
     )
+    ocr_translate_in_one_request: bool = Field(
+        default=True,
+        description="Recognize and translate captured text in one vision request when translating with an LLM provider",
+    )
+    ocr_crop_to_text: bool = Field(
+        default=True,
+        description="Crop captures to the detected text before uploading them for OCR",
+    )
+    ocr_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse the recognized text of a capture that looks the same as one read before",
+    )
+    ocr_cache_persistent: bool = Field(
+        default=False,
+        description="Keep cached OCR results (text and a small grayscale thumbnail) on disk between sessions",
+    )
+    ocr_adaptive_image_encoding: bool = Field(
+        default=True,
+        description="Pick image format, colours and size per capture to keep OCR uploads small",
+    )
     openai_vision_model: str = Field(
         default=OPENAI_MODEL_POLICY.default_model,
         description="OpenAI vision model for OCR",
@@ -270,6 +369,10 @@ class Settings(BaseSettings):
         ],
         description="Preset styles for text rewriting (Text Stylist mode).",
     )
+    ui_extra_styles: List[str] = Field(
+        default_factory=list,
+        description="Style presets rewritten together with the selected style (names), shown in tabs",
+    )
 
     model_config = SettingsConfigDict(
         env_file=Path(__file__).resolve().parent.parent.parent.parent / ".env",
@@ -293,6 +396,27 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid language code: {v}")
         return v
 
+    @field_validator("ui_extra_target_languages")
+    @classmethod
+    def validate_extra_target_languages(cls, v: List[str]) -> List[str]:
+        """Validate and de-duplicate extra target language codes."""
+        codes = [code.strip().lower() for code in v if code and code.strip()]
+        invalid = [code for code in codes if len(code) != 2]
+        if invalid:
+            raise ValueError(f"Invalid language code: {', '.join(invalid)}")
+        return list(dict.fromkeys(codes))
+
+    @field_validator("ui_extra_styles")
+    @classmethod
+    def validate_extra_styles(cls, v: List[str]) -> List[str]:
+        """Strip and de-duplicate extra style preset names (case-insensitively, like preset lookup)."""
+        names: Dict[str, str] = {}
+        for name in v:
+            name = (name or "").strip()
+            if name:
+                names.setdefault(name.lower(), name)
+        return list(names.values())
+
     @field_validator("translator_font_size", mode="before")
     @classmethod
     def validate_translator_font_size(cls, value: Any) -> int:
@@ -345,6 +469,76 @@ class Settings(BaseSettings):
             raise ValueError("clipboard_poll_timeout_ms must be between 500 and 10000")
         return iv
 
+    @field_validator("translation_chunk_max_tokens")
+    @classmethod
+    def validate_translation_chunk_max_tokens(cls, v: Any) -> int:
+        """Validate the chunk size budget. Must be between 200 and 32000 tokens."""
+        try:
+            iv = int(v)
+        except Exception:
+            raise ValueError("translation_chunk_max_tokens must be an integer")
+        if iv < 200 or iv > 32000:
+            raise ValueError("translation_chunk_max_tokens must be between 200 and 32000")
+        return iv
+
+    @field_validator("translation_max_parallel_chunks")
+    @classmethod
+    def validate_translation_max_parallel_chunks(cls, v: Any) -> int:
+        """Validate the chunk parallelism cap. Must be between 1 and 16."""
+        try:
+            iv = int(v)
+        except Exception:
+            raise ValueError("translation_max_parallel_chunks must be an integer")
+        if iv < 1 or iv > 16:
+            raise ValueError("translation_max_parallel_chunks must be between 1 and 16")
+        return iv
+
+    @field_validator("http_max_connections")
+    @classmethod
+    def validate_http_max_connections(cls, v: Any) -> int:
+        """Validate the HTTP connection pool size. Must be between 1 and 100."""
+        try:
+            iv = int(v)
+        except Exception:
+            raise ValueError("http_max_connections must be an integer")
+        if iv < 1 or iv > 100:
+            raise ValueError("http_max_connections must be between 1 and 100")
+        return iv
+
+    @field_validator("http_connect_timeout")
+    @classmethod
+    def validate_http_connect_timeout(cls, v: Any) -> int:
+        """Validate the HTTP connect timeout (seconds). Must be between 1 and 60."""
+        try:
+            iv = int(v)
+        except Exception:
+            raise ValueError("http_connect_timeout must be an integer")
+        if iv < 1 or iv > 60:
+            raise ValueError("http_connect_timeout must be between 1 and 60 seconds")
+        return iv
+
+    @field_validator("hedge_policies", mode="before")
+    @classmethod
+    def validate_hedge_policies(cls, v: Any) -> Dict[str, Dict[str, Any]]:
+        """Validate hedging policies: a mapping of request mode to policy dict."""
+        if not isinstance(v, dict) or not all(isinstance(policy, dict) for policy in v.values()):
+            raise ValueError("hedge_policies must map request modes to policy objects")
+        unknown = set(v) - set(HEDGE_POLICY_DEFAULTS)
+        if unknown:
+            raise ValueError(f"Unknown hedge_policies modes: {sorted(unknown)}")
+        return v
+
+    @field_validator("rate_limits", mode="before")
+    @classmethod
+    def validate_rate_limits(cls, v: Any) -> Dict[str, Dict[str, Any]]:
+        """Validate rate limits: a mapping of provider or 'provider/model' to limits dict."""
+        if not isinstance(v, dict) or not all(isinstance(limits, dict) for limits in v.values()):
+            raise ValueError("rate_limits must map providers to limit objects")
+        unknown = {key for key in v if str(key).split("/", 1)[0] not in SUPPORTED_PROVIDERS}
+        if unknown:
+            raise ValueError(f"Unknown rate_limits providers: {sorted(unknown)}")
+        return v
+
     @field_validator("api_timeout")
     @classmethod
     def validate_api_timeout(cls, v: Any) -> int:
@@ -0,0 +1,74 @@
+"""
+Image parts for vision requests.
+
+OCR captures travel through the API Manager as raw encoded bytes instead of
+base64 data URLs: Gemini takes the bytes as they are, and providers that
+need a data URL (OpenAI) encode it once, right before the request is sent.
+"""
+
+import base64
+import hashlib
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List
+
+__all__ = ["EncodedImage", "IMAGE_BYTES_PART", "image_part", "is_image_part", "to_data_url_parts"]
+
+# Part type of an image carried as raw bytes (``{"type": ..., "image": EncodedImage}``)
+IMAGE_BYTES_PART = "image_bytes"
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    """An encoded image (e.g. JPEG bytes) and its MIME type."""
+
+    data: bytes = field(repr=False)
+    mime_type: str = "image/jpeg"
+
+    @cached_property
+    def digest(self) -> str:
+        """SHA-256 of the image bytes."""
+        return hashlib.sha256(self.data).hexdigest()
+
+    def to_data_url(self) -> str:
+        """Encode the image as a base64 data URL."""
+        return f"data:{self.mime_type};base64,{base64.b64encode(self.data).decode('ascii')}"
+
+    def __str__(self) -> str:
+        # Short and stable, so request keys and logs never carry the bytes
+        return f"{self.mime_type};sha256={self.digest}"
+
+
+def image_part(image: EncodedImage) -> Dict[str, Any]:
+    """Build a message content part for an encoded image."""
+    return {"type": IMAGE_BYTES_PART, "image": image}
+
+
+def is_image_part(part: Any) -> bool:
+    """Whether a content part is an image (raw bytes or an ``image_url``)."""
+    return isinstance(part, dict) and part.get("type") in (IMAGE_BYTES_PART, "image_url")
+
+
+def to_data_url_parts(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Replace raw-bytes image parts with OpenAI-style ``image_url`` parts.
+
+    Messages without such parts are returned unchanged (the same list).
+    """
+    converted = []
+    changed = False
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list) and any(
+            isinstance(part, dict) and part.get("type") == IMAGE_BYTES_PART for part in content
+        ):
+            content = [
+                {"type": "image_url", "image_url": {"url": part["image"].to_data_url()}}
+                if isinstance(part, dict) and part.get("type") == IMAGE_BYTES_PART
+                else part
+                for part in content
+            ]
+            message = {**message, "content": content}
+            changed = True
+        converted.append(message)
+    return converted if changed else messages
@@ -5,13 +5,24 @@ Provides OpenAI-compatible surface for DeepL translation API.
 """
 
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus
 
-import httpx
 from loguru import logger
+from ..core.async_runtime import get_async_runtime
 from ..core.config import get_deepl_identifier
+from .http_transport import HttpTransport, TransportConfig
 
-__all__ = ["DeepLClientAdapter"]
+if TYPE_CHECKING:
+    from ..core.api_manager.cancellation import CancelToken
+
+__all__ = ["DeepLClientAdapter", "pack_texts"]
+
+# /v2/translate limits: up to 50 texts and 128 KiB of request body per call
+MAX_TEXTS_PER_REQUEST = 50
+MAX_REQUEST_BYTES = 128 * 1024
+# Room left in the body for the language fields and other parameters
+_REQUEST_OVERHEAD_BYTES = 1024
 
 
 def _normalize_lang_code(code: Optional[str]) -> Optional[str]:
@@ -33,46 +44,86 @@ def _normalize_lang_code(code: Optional[str]) -> Optional[str]:
     return c
 
 
+def pack_texts(
+    texts: List[str],
+    max_texts: int = MAX_TEXTS_PER_REQUEST,
+    max_bytes: int = MAX_REQUEST_BYTES - _REQUEST_OVERHEAD_BYTES,
+) -> List[Tuple[int, int]]:
+    """
+    Split texts into as few consecutive /v2/translate batches as the limits allow.
+
+    A text that is larger than ``max_bytes`` on its own gets a batch of its own.
+
+    Returns:
+        ``(start, end)`` index ranges into ``texts``, in order.
+    """
+    batches: List[Tuple[int, int]] = []
+    start, size = 0, 0
+    for index, text in enumerate(texts):
+        # Form-encoded size of one "text=..." field including its separator
+        field_bytes = len(quote_plus(text)) + len("text=&")
+        if index > start and (index - start >= max_texts or size + field_bytes > max_bytes):
+            batches.append((start, index))
+            start, size = index, 0
+        size += field_bytes
+    if start < len(texts):
+        batches.append((start, len(texts)))
+    return batches
+
+
 class DeepLClientAdapter:
     """
     Minimal adapter to mimic the OpenAI client's surface for DeepL.
 
     Exposes:
       - chat.completions.create(...)
+      - chat.completions.acreate(...) (async)
+      - translate_many(...) / atranslate_many(...) (several texts per request)
       - models.list()
+      - warm_up() / warmup_url (connection pre-warming)
 
     returning OpenAI-like response objects that the current pipeline expects.
+    Passing ``texts=[...]`` to ``create``/``acreate`` translates each text
+    separately and returns one choice per text.
     """
 
-    def __init__(self, api_key: str, timeout: Optional[int] = None, plan: str = "free"):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: Optional[int] = None,
+        plan: str = "free",
+        transport: Optional[HttpTransport] = None,
+    ):
         if not api_key or not isinstance(api_key, str):
             raise ValueError("DeepL API key is required")
         self._api_key = api_key
         self._timeout = timeout or 30
+        # Pooled clients keep the connection alive between translations
+        self._transport = transport or HttpTransport(TransportConfig(read_timeout=float(self._timeout)))
         self._base_url = "https://api-free.deepl.com" if (plan or "free").lower() == "free" else "https://api.deepl.com"
-        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create, acreate=self._acreate))
         self.models = SimpleNamespace(list=self._list_models)
+        self.warmup_url = self._base_url
 
-    def _create(
-        self,
-        model: str,
-        messages: List[Dict[str, str]],
-        max_completion_tokens: int = 256,
-        **kwargs: Any,
-    ) -> Any:
-        """
-        Translate using DeepL API with an OpenAI-compatible interface.
-        Only user messages are concatenated and sent as text for translation.
-        """
-        # Collect user content
-        parts: List[str] = []
-        for msg in messages or []:
-            if (msg.get("role") or "").strip().lower() == "user":
-                parts.append(str(msg.get("content", "")))
-        text = "\n".join([p for p in parts if p]).strip()
-        if not text:
-            # Ensure non-empty text
-            text = ""
+    def warm_up(self) -> None:
+        """No-op: DeepL is called over plain HTTP without an SDK to load."""
+
+    def _build_request(self, messages: List[Dict[str, str]], kwargs: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Build headers and form data for a /v2/translate request (``kwargs["texts"]`` for a batch)."""
+        texts = kwargs.get("texts")
+        if texts is not None:
+            # One repeated "text" field per text
+            text: Any = [str(t) for t in texts]
+        else:
+            # Collect user content
+            parts: List[str] = []
+            for msg in messages or []:
+                if (msg.get("role") or "").strip().lower() == "user":
+                    parts.append(str(msg.get("content", "")))
+            text = "\n".join([p for p in parts if p]).strip()
+            if not text:
+                # Ensure non-empty text
+                text = ""
 
         # Language params
         target_lang = _normalize_lang_code(kwargs.get("target_lang"))
@@ -94,27 +145,146 @@ class DeepLClientAdapter:
         }
         if source_lang:
             data["source_lang"] = source_lang
+        return headers, data
+
+    def _parse_payload(self, payload: Dict[str, Any]) -> Any:
+        """Convert a /v2/translate JSON payload to an OpenAI-like response."""
+        translations = payload.get("translations") or [{}]
+        return self._mock_response(
+            [(item.get("text", ""), item.get("detected_source_language", "")) for item in translations]
+        )
+
+    def _batch_kwargs(self, texts: List[str], kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Request kwargs of each /v2/translate call needed for a batch of texts."""
+        return [{**kwargs, "texts": texts[start:end]} for start, end in pack_texts(texts)]
+
+    def _merge_responses(self, responses: List[Any]) -> Any:
+        """Combine the responses of a split batch into one response with a choice per text."""
+        return self._mock_response([
+            (choice.message.content, choice.detected_source_language)
+            for response in responses
+            for choice in response.choices
+        ])
+
+    def _create(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        max_completion_tokens: int = 256,
+        cancel_token: Optional["CancelToken"] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Translate using DeepL API with an OpenAI-compatible interface.
+        Only user messages are concatenated and sent as text for translation.
+
+        With a ``cancel_token`` the request runs on the shared async runtime,
+        so cancelling it closes the connection and returns immediately.
+        """
+        if cancel_token is not None:
+            return get_async_runtime().run(
+                self._acreate(model, messages, max_completion_tokens, cancel_token=cancel_token, **kwargs)
+            )
+        if kwargs.get("texts") is not None:
+            batches = self._batch_kwargs(kwargs["texts"], kwargs)
+            if len(batches) != 1:
+                return self._merge_responses([self._create(model, [], **batch) for batch in batches])
+
+        headers, data = self._build_request(messages, kwargs)
 
         try:
-            with httpx.Client(timeout=self._timeout) as client:
-                resp = client.post(f"{self._base_url}/v2/translate", headers=headers, data=data)
-                resp.raise_for_status()
-                payload = resp.json()
-            translations = payload.get("translations") or []
-            translated_text = translations[0].get("text", "") if translations else ""
-            detected = translations[0].get("detected_source_language", "") if translations else ""
-            return self._mock_response(translated_text, detected)
+            resp = self._transport.client.post(
+                f"{self._base_url}/v2/translate", headers=headers, data=data, timeout=self._timeout
+            )
+            resp.raise_for_status()
+            payload = resp.json()
+            return self._parse_payload(payload)
         except Exception as e:
             logger.error(f"DeepL API request failed: {e}")
             raise
 
-    def _mock_response(self, text: str, detected_lang: str) -> Any:
-        message = SimpleNamespace(content=text)
-        choice = SimpleNamespace(message=message)
+    async def _acreate(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        max_completion_tokens: int = 256,
+        cancel_token: Optional["CancelToken"] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Async counterpart of ``_create`` using the transport's async client."""
+        if kwargs.get("texts") is not None:
+            batches = self._batch_kwargs(kwargs["texts"], kwargs)
+            if len(batches) != 1:
+                return self._merge_responses(
+                    [await self._acreate(model, [], cancel_token=cancel_token, **batch) for batch in batches]
+                )
+
+        headers, data = self._build_request(messages, kwargs)
+
+        try:
+            request = self._transport.async_client.post(
+                f"{self._base_url}/v2/translate", headers=headers, data=data, timeout=self._timeout
+            )
+            resp = await (request if cancel_token is None else cancel_token.run(request))
+            resp.raise_for_status()
+            payload = resp.json()
+            return self._parse_payload(payload)
+        except Exception as e:
+            logger.error(f"DeepL API request failed: {e}")
+            raise
+
+    def _mock_response(self, translations: List[Tuple[str, str]]) -> Any:
+        choices = [
+            SimpleNamespace(index=index, message=SimpleNamespace(content=text), detected_source_language=detected)
+            for index, (text, detected) in enumerate(translations)
+        ]
         usage = SimpleNamespace(total_tokens=0)
-        response = SimpleNamespace(choices=[choice], usage=usage)
+        response = SimpleNamespace(choices=choices, usage=usage)
         return response
 
+    def translate_many(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str] = None,
+        cancel_token: Optional["CancelToken"] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        Translate several texts in as few requests as the DeepL limits allow.
+
+        Args:
+            texts: Texts to translate, each translated on its own.
+            target_lang: Target language code.
+            source_lang: Source language code, or None/"auto" to detect it per text.
+            cancel_token: Optional token aborting the requests.
+
+        Returns:
+            ``(translation, detected_source_language)`` per text, in order.
+        """
+        if not texts:
+            return []
+        response = self._create(
+            get_deepl_identifier(), [], texts=texts, target_lang=target_lang, source_lang=source_lang,
+            cancel_token=cancel_token,
+        )
+        return [(choice.message.content, choice.detected_source_language) for choice in response.choices]
+
+    async def atranslate_many(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str] = None,
+        cancel_token: Optional["CancelToken"] = None,
+    ) -> List[Tuple[str, str]]:
+        """Async counterpart of ``translate_many``."""
+        if not texts:
+            return []
+        response = await self._acreate(
+            get_deepl_identifier(), [], texts=texts, target_lang=target_lang, source_lang=source_lang,
+            cancel_token=cancel_token,
+        )
+        return [(choice.message.content, choice.detected_source_language) for choice in response.choices]
+
     def _list_models(self) -> Any:
         # DeepL has no models; return a single pseudo-model for compatibility
         model_info = SimpleNamespace(id=get_deepl_identifier())
@@ -8,11 +8,23 @@ existing translation pipelines can reuse the same request code path.
 import base64
 import re
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from ..core.async_runtime import get_async_runtime
+from ..core.image_parts import IMAGE_BYTES_PART, is_image_part
+from .http_transport import HttpTransport
+
+if TYPE_CHECKING:
+    from ..core.api_manager.cancellation import CancelToken
 
 __all__ = ["GoogleChatClientAdapter"]
 
+# Gemini API host, used to open pooled connections ahead of the first request
+_WARMUP_URL = "https://generativelanguage.googleapis.com/"
+
+# Gemini finish reasons mapped to their OpenAI equivalents
+_FINISH_REASONS = {"STOP": "stop", "MAX_TOKENS": "length", "SAFETY": "content_filter"}
+
 
 class GoogleChatClientAdapter:
     """
@@ -20,12 +32,14 @@ class GoogleChatClientAdapter:
 
     Exposes:
       - chat.completions.create(...)
+      - chat.completions.acreate(...) (async, via the SDK's aio client; cancellable)
       - models.list()
+      - warm_up() / warmup_url (connection pre-warming)
 
     returning OpenAI-like response objects that the current pipeline expects.
     """
 
-    def __init__(self, api_key: str, timeout: Optional[int] = None):
+    def __init__(self, api_key: str, timeout: Optional[int] = None, transport: Optional[HttpTransport] = None):
         try:
             from google import genai  # type: ignore
             from google.genai import types  # type: ignore
@@ -33,49 +47,112 @@ class GoogleChatClientAdapter:
             raise ImportError("google-genai is not installed") from exc
 
         # Configure HTTP options for timeout (SDK expects milliseconds)
-        http_options = None
+        http_options: Optional[Dict[str, Any]] = None
         if timeout:
             http_options = {"timeout": timeout * 1000}
+        # Custom httpx clients need a google-genai release that knows the fields;
+        # older ones reject unknown keys, so they keep their own client
+        if transport is not None and "httpx_client" in getattr(types.HttpOptions, "model_fields", {}):
+            http_options = dict(http_options or {})
+            http_options["httpx_client"] = transport.client
+            http_options["httpx_async_client"] = transport.async_client
+        elif transport is not None:
+            from loguru import logger
+            logger.debug("google-genai does not accept custom httpx clients; Gemini uses its own connection pool")
 
         self._client = genai.Client(api_key=(api_key or "").strip(), http_options=http_options)
         self._types = types
         self._timeout = timeout
-        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create, acreate=self._acreate))
         self.models = SimpleNamespace(list=self._list_models)
+        self.warmup_url = _WARMUP_URL
+
+    def warm_up(self) -> None:
+        """Load the SDK's lazily created model services (sync and async)."""
+        _ = self._client.models, self._client.aio.models
 
     def _create(
         self,
         model: str,
         messages: List[Dict[str, Any]],
         max_completion_tokens: int = 256,
+        stream: bool = False,
+        cancel_token: Optional["CancelToken"] = None,
         **kwargs: Any,
     ) -> Any:
+        if cancel_token is not None and not stream:
+            # On the shared loop, cancelling the token closes the request's connection
+            return get_async_runtime().run(
+                self._acreate(model, messages, max_completion_tokens, cancel_token=cancel_token, **kwargs)
+            )
+
         # Detect if this is a multimodal request
         is_multimodal = self._is_multimodal_request(messages)
         
         if is_multimodal:
             return self._create_multimodal(model, messages, max_completion_tokens, **kwargs)
+        elif stream:
+            return self._stream_text_only(model, messages, max_completion_tokens, **kwargs)
         else:
             return self._create_text_only(model, messages, max_completion_tokens, **kwargs)
 
+    async def _acreate(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_completion_tokens: int = 256,
+        stream: bool = False,
+        cancel_token: Optional["CancelToken"] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Async counterpart of ``_create``.
+
+        With ``stream`` set the result is an async iterator of OpenAI-like
+        chunks (text-only requests). Cancelling ``cancel_token`` aborts the
+        request or the pending stream read.
+        """
+        if self._is_multimodal_request(messages):
+            if stream:
+                raise ValueError("Streaming supports text-only messages")
+            contents, config = self._build_multimodal_request(model, messages, max_completion_tokens)
+        else:
+            contents, config = self._build_text_request(model, messages, max_completion_tokens)
+
+        if stream:
+            request = self._client.aio.models.generate_content_stream(
+                model=model,
+                contents=contents,
+                config=config
+            )
+            response_stream = await (request if cancel_token is None else cancel_token.run(request))
+            chunks = self._aiter_stream_chunks(response_stream)
+            return chunks if cancel_token is None else cancel_token.iterate(chunks)
+
+        request = self._client.aio.models.generate_content(
+            model=model,
+            contents=contents,
+            config=config
+        )
+        response = await (request if cancel_token is None else cancel_token.run(request))
+        return self._to_completion(response)
+
     def _is_multimodal_request(self, messages: List[Dict[str, Any]]) -> bool:
         """Check if messages contain image content."""
         for msg in messages:
             content = msg.get("content")
             if isinstance(content, list):
                 for part in content:
-                    if isinstance(part, dict) and part.get("type") == "image_url":
+                    if is_image_part(part):
                         return True
         return False
 
-    def _create_text_only(
+    def _build_text_request(
         self,
         model: str,
         messages: List[Dict[str, Any]],
         max_completion_tokens: int = 256,
-        **kwargs: Any,
-    ) -> Any:
-        """Handle text-only chat completion requests."""
+    ) -> Tuple[str, Any]:
+        """Build the prompt and generation config for a text-only request."""
         # Extract system instruction for native SDK support
         system_parts = [
             message.get("content", "")
@@ -102,6 +179,18 @@ class GoogleChatClientAdapter:
         if model.startswith("gemini-3"):
             config.thinking_config = self._types.ThinkingConfig(thinking_level=self._types.ThinkingLevel.LOW)
 
+        return prompt, config
+
+    def _create_text_only(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_completion_tokens: int = 256,
+        **kwargs: Any,
+    ) -> Any:
+        """Handle text-only chat completion requests."""
+        prompt, config = self._build_text_request(model, messages, max_completion_tokens)
+
         # Generate content with new SDK
         response = self._client.models.generate_content(
             model=model,
@@ -109,10 +198,81 @@ class GoogleChatClientAdapter:
             config=config
         )
 
+        return self._to_completion(response)
+
+    def _to_completion(self, response: Any) -> Any:
+        """Convert an SDK response to an OpenAI-compatible completion object."""
         # Extract text from new SDK response with safety handling
         text = self._extract_text(response)
 
-        # Extract usage metadata
+        # Create OpenAI-compatible response using SimpleNamespace
+        message = SimpleNamespace(content=text)
+        choice = SimpleNamespace(message=message, finish_reason=self._extract_finish_reason(response))
+        usage = SimpleNamespace(total_tokens=self._extract_total_tokens(response))
+        return SimpleNamespace(choices=[choice], usage=usage)
+
+    def _stream_text_only(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_completion_tokens: int = 256,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Handle text-only requests as a stream of OpenAI-like chunks."""
+        prompt, config = self._build_text_request(model, messages, max_completion_tokens)
+
+        response_stream = self._client.models.generate_content_stream(
+            model=model,
+            contents=prompt,
+            config=config
+        )
+        return self._iter_stream_chunks(response_stream)
+
+    def _iter_stream_chunks(self, response_stream: Iterable[Any]) -> Iterator[Any]:
+        """Convert Gemini stream responses to chunks with ``choices[0].delta.content``."""
+        total_tokens = 0
+        for response in response_stream:
+            # Usage metadata is cumulative; the last reported value wins
+            total_tokens = self._extract_total_tokens(response) or total_tokens
+            chunk = self._to_delta_chunk(response)
+            if chunk is not None:
+                yield chunk
+        yield SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=total_tokens))
+
+    async def _aiter_stream_chunks(self, response_stream: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        """Async counterpart of ``_iter_stream_chunks``."""
+        total_tokens = 0
+        async for response in response_stream:
+            total_tokens = self._extract_total_tokens(response) or total_tokens
+            chunk = self._to_delta_chunk(response)
+            if chunk is not None:
+                yield chunk
+        yield SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=total_tokens))
+
+    def _to_delta_chunk(self, response: Any) -> Optional[Any]:
+        """Convert one stream response to an OpenAI-like delta chunk (None if it has no text or finish reason)."""
+        text = self._extract_text(response)
+        finish_reason = self._extract_finish_reason(response)
+        if not text and not finish_reason:
+            return None
+        delta = SimpleNamespace(content=text)
+        return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)], usage=None)
+
+    def _extract_finish_reason(self, response: Any) -> Optional[str]:
+        """Map the first candidate's finish reason to OpenAI names ("stop", "length", ...)."""
+        candidates = getattr(response, "candidates", None)
+        if not isinstance(candidates, (list, tuple)) or not candidates:
+            return None
+        reason = getattr(candidates[0], "finish_reason", None)
+        if reason is None:
+            return None
+        name = str(getattr(reason, "name", reason)).upper()
+        if name in ("", "FINISH_REASON_UNSPECIFIED"):
+            return None
+        return _FINISH_REASONS.get(name, name.lower())
+
+    def _extract_total_tokens(self, response: Any) -> int:
+        """Extract total token usage from an SDK response."""
         usage_metadata = getattr(response, "usage_metadata", None)
         total_tokens = 0
         if usage_metadata is not None:
@@ -120,13 +280,7 @@ class GoogleChatClientAdapter:
                 getattr(usage_metadata, "input_token_count", 0)
                 + getattr(usage_metadata, "output_token_count", 0)
             )
-
-        # Create OpenAI-compatible response using SimpleNamespace
-        message = SimpleNamespace(content=text)
-        choice = SimpleNamespace(message=message)
-        usage = SimpleNamespace(total_tokens=int(total_tokens or 0))
-        response = SimpleNamespace(choices=[choice], usage=usage)
-        return response
+        return int(total_tokens or 0)
 
     def _create_multimodal(
         self,
@@ -136,6 +290,24 @@ class GoogleChatClientAdapter:
         **kwargs: Any,
     ) -> Any:
         """Handle multimodal (text + image) completion requests."""
+        contents, config = self._build_multimodal_request(model, messages, max_completion_tokens)
+
+        # Generate content with new SDK
+        response = self._client.models.generate_content(
+            model=model,
+            contents=contents,
+            config=config
+        )
+
+        return self._to_completion(response)
+
+    def _build_multimodal_request(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_completion_tokens: int = 256,
+    ) -> Tuple[List[Any], Any]:
+        """Build the contents (prompt and first image) and generation config for a multimodal request."""
         # Parse messages to extract system instruction, text, and image data
         system_parts = []
         user_text_parts = []
@@ -154,6 +326,9 @@ class GoogleChatClientAdapter:
                         if isinstance(part, dict):
                             if part.get("type") == "text":
                                 user_text_parts.append(part.get("text", ""))
+                            elif part.get("type") == IMAGE_BYTES_PART and not image_data:
+                                # Raw bytes are passed to the SDK as they are
+                                image_data, mime_type = part["image"].data, part["image"].mime_type
                             elif part.get("type") == "image_url" and not image_data:
                                 # Extract first image
                                 image_url = part.get("image_url", {}).get("url", "")
@@ -186,31 +361,7 @@ class GoogleChatClientAdapter:
             self._types.Part.from_bytes(data=image_data, mime_type=mime_type)
         ]
 
-        # Generate content with new SDK
-        response = self._client.models.generate_content(
-            model=model,
-            contents=contents,
-            config=config
-        )
-
-        # Extract text from new SDK response with safety handling
-        text = self._extract_text(response)
-
-        # Extract usage metadata
-        usage_metadata = getattr(response, "usage_metadata", None)
-        total_tokens = 0
-        if usage_metadata is not None:
-            total_tokens = getattr(usage_metadata, "total_token_count", None) or (
-                getattr(usage_metadata, "input_token_count", 0)
-                + getattr(usage_metadata, "output_token_count", 0)
-            )
-
-        # Create OpenAI-compatible response using SimpleNamespace
-        message = SimpleNamespace(content=text)
-        choice = SimpleNamespace(message=message)
-        usage = SimpleNamespace(total_tokens=int(total_tokens or 0))
-        response = SimpleNamespace(choices=[choice], usage=usage)
-        return response
+        return contents, config
 
     def _extract_text(self, response: Any) -> str:
         """Extract text from SDK response with safety filter handling."""
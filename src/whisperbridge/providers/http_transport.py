@@ -0,0 +1,246 @@
+"""
+Shared HTTP transport for WhisperBridge provider adapters.
+
+Provides one pooled ``httpx.Client`` / ``httpx.AsyncClient`` pair that the
+OpenAI, Gemini and DeepL adapters reuse, so requests keep their TCP/TLS
+connections alive instead of reconnecting on every call.
+"""
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+from loguru import logger
+
+__all__ = ["HttpTransport", "TransportConfig"]
+
+# httpcore trace event emitted when a new TCP connection is opened
+_CONNECT_EVENT = "connection.connect_tcp.started"
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Connection pool, timeout and proxy settings for HttpTransport."""
+
+    read_timeout: float = 30.0
+    connect_timeout: float = 10.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    proxy: Optional[str] = None
+
+    @classmethod
+    def from_config(cls, config_service: Any) -> "TransportConfig":
+        """Build a config from application settings; missing or invalid values use defaults."""
+        defaults = cls()
+
+        def number(key: str, default: float) -> float:
+            try:
+                value = float(config_service.get_setting(key))
+            except (TypeError, ValueError):
+                return default
+            return value if value > 0 else default
+
+        read_timeout = number("api_timeout", defaults.read_timeout)
+        max_connections = int(number("http_max_connections", defaults.max_connections))
+        proxy = config_service.get_setting("http_proxy")
+        return cls(
+            read_timeout=read_timeout,
+            connect_timeout=min(number("http_connect_timeout", defaults.connect_timeout), read_timeout),
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_connections, defaults.max_keepalive_connections),
+            http2=config_service.get_setting("http2_enabled") is True,
+            proxy=(proxy.strip() or None) if isinstance(proxy, str) else None,
+        )
+
+
+class HttpTransport:
+    """
+    Pooled HTTP clients shared by all provider adapters.
+
+    The sync client is created on first use. Async connection pools are bound
+    to the event loop that first uses them, so one async client is kept per
+    running loop. Every request is traced to count connections opened versus
+    connections reused.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        """
+        Initialize the HttpTransport.
+
+        Args:
+            config: Pool, timeout and proxy settings (defaults if omitted).
+        """
+        self.config = config or TransportConfig()
+        self._client: Optional[httpx.Client] = None
+        # Keyed by the loop itself: ids of closed loops can be reused by new ones
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._detached_client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._opened = 0
+        self._http2 = self.config.http2 and self._http2_available()
+
+    @staticmethod
+    def _http2_available() -> bool:
+        if importlib.util.find_spec("h2") is not None:
+            return True
+        logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+        return False
+
+    def _client_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments shared by the sync and async clients."""
+        config = self.config
+        kwargs: Dict[str, Any] = {
+            "timeout": httpx.Timeout(config.read_timeout, connect=config.connect_timeout),
+            "limits": httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            "http2": self._http2,
+        }
+        if config.proxy:
+            kwargs["proxy"] = config.proxy
+        return kwargs
+
+    @property
+    def client(self) -> httpx.Client:
+        """The shared sync client."""
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    event_hooks={"request": [self._trace_request]},
+                    **self._client_kwargs(),
+                )
+                logger.debug(
+                    f"HTTP transport created (http2={self._http2}, "
+                    f"max_connections={self.config.max_connections}, proxy={'on' if self.config.proxy else 'off'})"
+                )
+            return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The shared async client for the running event loop.
+
+        Outside a running loop (SDKs that take their async client at
+        construction time) a separate client is returned whose pool binds to
+        the first loop that uses it, i.e. the application's async runtime.
+        """
+        loop = self._running_loop()
+        with self._lock:
+            client = self._detached_client if loop is None else self._async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    event_hooks={"request": [self._atrace_request]},
+                    **self._client_kwargs(),
+                )
+                if loop is None:
+                    self._detached_client = client
+                else:
+                    self._async_clients[loop] = client
+            return client
+
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _record_request(self) -> None:
+        with self._lock:
+            self._requests += 1
+
+    def _record_event(self, event_name: str) -> None:
+        if event_name == _CONNECT_EVENT:
+            with self._lock:
+                self._opened += 1
+
+    def _trace_request(self, request: httpx.Request) -> None:
+        self._record_request()
+        request.extensions["trace"] = lambda event_name, info: self._record_event(event_name)
+
+    async def _atrace_request(self, request: httpx.Request) -> None:
+        self._record_request()
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            self._record_event(event_name)
+
+        request.extensions["trace"] = trace
+
+    async def awarm(self, urls: Iterable[str]) -> int:
+        """
+        Open pooled connections to the given endpoints.
+
+        Sends an unauthenticated HEAD request per endpoint through the sync
+        client, the running loop's async client and the loop-agnostic async
+        client (if one was handed to an SDK). Any HTTP response, including
+        401/404, leaves a kept-alive connection in the pool; nothing billable
+        is sent.
+
+        Args:
+            urls: Endpoint URLs to connect to.
+
+        Returns:
+            Number of endpoints that answered.
+        """
+        clients = [self.async_client]
+        with self._lock:
+            detached = self._detached_client
+        if detached is not None and detached not in clients and not detached.is_closed:
+            clients.append(detached)
+
+        async def warm(url: str) -> bool:
+            results = await asyncio.gather(
+                asyncio.to_thread(self.client.head, url),
+                *(client.head(url) for client in clients),
+                return_exceptions=True,
+            )
+            errors = [result for result in results if isinstance(result, BaseException)]
+            for error in errors:
+                logger.debug(f"Warm-up request to {url} failed: {error}")
+            return len(errors) < len(results)
+
+        reached = await asyncio.gather(*(warm(url) for url in urls))
+        return sum(reached)
+
+    def stats(self) -> Dict[str, int]:
+        """Return request counters: total requests, connections opened and reused."""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "connections_opened": self._opened,
+                "connections_reused": max(0, self._requests - self._opened),
+            }
+
+    def close(self) -> None:
+        """Close the sync client and drop async clients.
+
+        Async clients can only be closed on their own loop (see ``aclose``);
+        here their references are released.
+        """
+        with self._lock:
+            client, self._client = self._client, None
+            self._async_clients.clear()
+            self._detached_client = None
+        if client is not None:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"Failed to close HTTP client: {e}")
+
+    async def aclose(self) -> None:
+        """Close the async client of the running loop."""
+        loop = self._running_loop()
+        with self._lock:
+            client = self._async_clients.pop(loop, None) if loop is not None else None
+        if client is not None:
+            await client.aclose()
@@ -5,14 +5,22 @@ Provides an OpenAI-compatible interface that wraps the native OpenAI SDK.
 """
 
 from types import SimpleNamespace
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import openai
 from loguru import logger
-from openai.types.chat import ChatCompletionMessageParam
 
+from .http_transport import HttpTransport
+
+from ..core.async_runtime import get_async_runtime
+from ..core.image_parts import to_data_url_parts
 from ..core.config import OPENAI_MODEL_POLICY
 
+if TYPE_CHECKING:
+    import openai
+    from openai.types.chat import ChatCompletionMessageParam
+
+    from ..core.api_manager.cancellation import CancelToken
+
 __all__ = ["OpenAIChatClientAdapter", "DEFAULT_GPT_MODELS"]
 
 # Default GPT models list
@@ -26,29 +34,88 @@ class OpenAIChatClientAdapter:
 
     Exposes:
       - chat.completions.create(...)
+      - chat.completions.acreate(...) (async)
       - models.list()
+      - warm_up() / warmup_url (connection pre-warming)
 
     Passes provider-specific request parameters supplied by the API manager.
     """
 
-    def __init__(self, api_key: str, timeout: Optional[int] = None):
+    def __init__(self, api_key: str, timeout: Optional[int] = None, transport: Optional[HttpTransport] = None):
         """
         Initialize the OpenAI adapter.
 
         Args:
             api_key: OpenAI API key.
             timeout: Optional timeout for API requests in seconds.
+            transport: Optional shared HTTP transport; the SDK's own pool is used if omitted.
         """
-        self._client = openai.OpenAI(api_key=api_key, timeout=timeout)
-        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        # The SDK is heavy to import, so it is loaded when the first client is built
+        import openai
+
+        self._transport = transport
+        self._client = openai.OpenAI(
+            api_key=api_key,
+            timeout=timeout,
+            http_client=transport.client if transport is not None else None,
+        )
+        self._api_key = api_key
+        self._async_client: Optional["openai.AsyncOpenAI"] = None
+        self._async_http_client: Any = None
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create, acreate=self._acreate))
         self.models = SimpleNamespace(list=self._list_models)
         self._timeout = timeout
+        self.warmup_url = str(self._client.base_url)
+
+    def warm_up(self) -> None:
+        """Load the SDK resources that are imported lazily on first access."""
+        _ = self._client.chat.completions, self._client.models
+
+    def _get_async_client(self) -> "openai.AsyncOpenAI":
+        """Create the async SDK client on first use (and when the event loop's HTTP client changes)."""
+        http_client = self._transport.async_client if self._transport is not None else None
+        if self._async_client is None or http_client is not self._async_http_client:
+            import openai
+
+            # Same endpoint as the sync client: cancellable sync calls run through this one
+            self._async_client = openai.AsyncOpenAI(
+                api_key=self._api_key,
+                base_url=self._client.base_url,
+                timeout=self._timeout,
+                http_client=http_client,
+            )
+            self._async_http_client = http_client
+        return self._async_client
+
+    def _build_params(
+        self,
+        model: str,
+        messages: List["ChatCompletionMessageParam"],
+        max_completion_tokens: int,
+        stream: bool,
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Build chat completion parameters shared by the sync and async paths."""
+        api_params = {
+            "model": model,
+            # Raw image bytes become data URLs here, once per request
+            "messages": to_data_url_parts(messages),
+            "max_completion_tokens": max_completion_tokens,
+            **kwargs,
+        }
+        if stream:
+            # Usage arrives in a final chunk with empty choices
+            api_params["stream"] = True
+            api_params["stream_options"] = {"include_usage": True}
+        return api_params
 
     def _create(
         self,
         model: str,
-        messages: List[ChatCompletionMessageParam],
+        messages: List["ChatCompletionMessageParam"],
         max_completion_tokens: int = 256,
+        stream: bool = False,
+        cancel_token: Optional["CancelToken"] = None,
         **kwargs: Any,
     ) -> Any:
         """
@@ -58,18 +125,25 @@ class OpenAIChatClientAdapter:
             model: Model name to use.
             messages: List of message dictionaries with role and content.
             max_completion_tokens: Maximum tokens to generate.
+            stream: If True, return an iterator of chat completion chunks.
+            cancel_token: Optional token that aborts the request; the call then
+                runs on the shared async runtime so cancelling closes its
+                connection (not supported for streams).
             **kwargs: Additional parameters (e.g., GPT-5 options).
 
         Returns:
-            OpenAI API response object.
+            OpenAI API response object, or a chunk stream when ``stream`` is set.
+
+        Raises:
+            RequestCancelledError: If ``cancel_token`` is cancelled before the response.
         """
+        if cancel_token is not None and not stream:
+            return get_async_runtime().run(
+                self._acreate(model, messages, max_completion_tokens, cancel_token=cancel_token, **kwargs)
+            )
+
         # Prepare API parameters
-        api_params = {
-            "model": model,
-            "messages": messages,
-            "max_completion_tokens": max_completion_tokens,
-            **kwargs,
-        }
+        api_params = self._build_params(model, messages, max_completion_tokens, stream, kwargs)
 
         logger.debug(f"OpenAI API parameters: {api_params}")
 
@@ -77,6 +151,32 @@ class OpenAIChatClientAdapter:
         response = self._client.chat.completions.create(**api_params)
         return response
 
+    async def _acreate(
+        self,
+        model: str,
+        messages: List["ChatCompletionMessageParam"],
+        max_completion_tokens: int = 256,
+        stream: bool = False,
+        cancel_token: Optional["CancelToken"] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Handle a chat completion request without blocking the event loop.
+
+        Accepts the same arguments as ``_create``; with ``stream`` set the
+        result is an async iterator of chat completion chunks. Cancelling
+        ``cancel_token`` aborts the request or the pending stream read.
+        """
+        api_params = self._build_params(model, messages, max_completion_tokens, stream, kwargs)
+
+        logger.debug(f"OpenAI async API parameters: {api_params}")
+
+        request = self._get_async_client().chat.completions.create(**api_params)
+        if cancel_token is None:
+            return await request
+        response = await cancel_token.run(request)
+        return cancel_token.iterate(response) if stream else response
+
     def _list_models(self) -> Any:
         """
         Fetch and normalize OpenAI models.
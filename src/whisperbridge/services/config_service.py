@@ -220,11 +220,18 @@ class ConfigService(QObject):
                 except Exception:
                     pass
 
+            # Check if network settings changed (clients share one HTTP transport)
+            if not must_reinit:
+                for key in ("api_timeout", "http2_enabled", "http_proxy", "http_max_connections", "http_connect_timeout"):
+                    if getattr(old_settings, key, None) != getattr(new_settings, key, None):
+                        must_reinit = True
+                        break
+
             if must_reinit:
                 from ..core.api_manager import get_api_manager
                 api_manager = get_api_manager()
                 api_manager.reinitialize()
-                logger.info("API manager reinitialized after settings change (provider/key/plan).")
+                logger.info("API manager reinitialized after settings change (provider/key/plan/network).")
 
         except Exception as e:
             logger.error(f"Failed to reinitialize API manager after settings change: {e}")
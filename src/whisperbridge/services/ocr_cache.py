@@ -0,0 +1,280 @@
+"""
+OCR result cache for WhisperBridge.
+
+Re-capturing the same on-screen region (a dialog, a subtitle frame) rarely
+yields byte-identical images, so captures are matched by a perceptual hash
+(dHash of a normalized grayscale thumbnail) within a Hamming distance, for
+the same provider, model and prompt. Perceptual hashes cannot tell a changed
+digit from antialiasing noise, so every hash match is confirmed against the
+stored thumbnail before its text is returned.
+
+Entries live in a bounded in-memory LRU; with a cache directory they are also
+persisted to SQLite and loaded back on first use.
+"""
+
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+from PIL import Image, ImageChops, ImageOps
+
+from .translation_cache import hash_prompt
+
+CACHE_FILE_NAME = "ocr_cache.sqlite3"
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_DISTANCE = 8
+
+# Long edge of the stored grayscale thumbnail used to confirm hash matches
+_THUMBNAIL_EDGE = 256
+
+# Approximate number of hash bits; the grid follows the capture's aspect ratio
+# so text lines get columns and paragraphs get rows
+_HASH_BITS = 256
+
+# Largest per-pixel difference (0-255) between thumbnails of the same capture;
+# a changed glyph or a blinking cursor exceeds it
+_MAX_PIXEL_DIFFERENCE = 24
+
+
+@dataclass(frozen=True)
+class CaptureFingerprint:
+    """Perceptual hash and verification thumbnail of a capture."""
+
+    hash: int
+    grid: Tuple[int, int]  # (columns, rows) of the hash
+    thumbnail: Image.Image  # grayscale, long edge _THUMBNAIL_EDGE
+
+    @classmethod
+    def from_image(cls, image: Image.Image) -> "CaptureFingerprint":
+        """Compute the fingerprint of a capture."""
+        gray = image.convert("L")
+        scale = min(1.0, _THUMBNAIL_EDGE / max(gray.width, gray.height, 1))
+        thumbnail = gray.resize((max(1, round(gray.width * scale)), max(1, round(gray.height * scale))), Image.BOX)
+
+        columns = max(8, min(64, round(math.sqrt(_HASH_BITS * thumbnail.width / thumbnail.height))))
+        rows = max(4, min(32, _HASH_BITS // columns))
+        # dHash: one bit per horizontally adjacent pair of the normalized grid
+        pixels = ImageOps.autocontrast(thumbnail).resize((columns + 1, rows), Image.BOX).tobytes()
+        bits = 0
+        for y in range(rows):
+            row = pixels[y * (columns + 1):(y + 1) * (columns + 1)]
+            for x in range(columns):
+                bits = (bits << 1) | (row[x] > row[x + 1])
+        return cls(bits, (columns, rows), thumbnail)
+
+    def distance(self, other: "CaptureFingerprint") -> Optional[int]:
+        """Hamming distance to another fingerprint, or None if the hashes are not comparable."""
+        if self.grid != other.grid:
+            return None
+        return bin(self.hash ^ other.hash).count("1")
+
+    def same_content(self, other: "CaptureFingerprint") -> bool:
+        """Whether the thumbnails match pixel for pixel within the noise tolerance."""
+        thumbnail = other.thumbnail
+        if thumbnail.size != self.thumbnail.size:
+            thumbnail = thumbnail.resize(self.thumbnail.size, Image.BOX)
+        return ImageChops.difference(self.thumbnail, thumbnail).getextrema()[1] <= _MAX_PIXEL_DIFFERENCE
+
+
+class OCRResultCache:
+    """
+    Cache of recognized text keyed by capture fingerprints.
+
+    The memory tier is a bounded LRU scanned for the closest matching hash;
+    the optional disk tier mirrors it in SQLite. All public methods are
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+    ):
+        """
+        Initialize the OCRResultCache.
+
+        Args:
+            cache_dir: Directory to persist entries in, or None for memory only.
+            max_entries: Maximum entries kept (least recently used are dropped).
+            max_distance: Largest Hamming distance between matching hashes.
+        """
+        self._entries: "OrderedDict[str, Tuple[str, CaptureFingerprint, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max(1, int(max_entries))
+        self._max_distance = max_distance
+        self._db_path = cache_dir / CACHE_FILE_NAME if cache_dir is not None else None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_loaded = False
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def persistent(self) -> bool:
+        """Whether entries are persisted to disk."""
+        return self._db_path is not None
+
+    @staticmethod
+    def make_context(provider: Optional[str], model: Optional[str], prompt: Optional[str]) -> str:
+        """Build the part of the key that must match exactly (provider, model and prompt hash)."""
+        return "\x1f".join([(provider or "").strip().lower(), (model or "").strip(), hash_prompt(prompt)])
+
+    @staticmethod
+    def _entry_key(context: str, fingerprint: CaptureFingerprint) -> str:
+        columns, rows = fingerprint.grid
+        return f"{context}\x1f{columns}x{rows}\x1f{fingerprint.hash:x}"
+
+    def _load_locked(self) -> None:
+        """Open the SQLite store and load the most recent entries; caller must hold ``_lock``."""
+        if self._disk_loaded or self._db_path is None:
+            return
+        self._disk_loaded = True
+        try:
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, context TEXT NOT NULL, hash TEXT NOT NULL, "
+                "columns INTEGER NOT NULL, rows INTEGER NOT NULL, width INTEGER NOT NULL, "
+                "height INTEGER NOT NULL, thumbnail BLOB NOT NULL, text TEXT NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.commit()
+            rows = conn.execute(
+                "SELECT key, context, hash, columns, rows, width, height, thumbnail, text "
+                "FROM entries ORDER BY accessed DESC LIMIT ?",
+                (self._max_entries,),
+            ).fetchall()
+            for key, context, hash_hex, columns, grid_rows, width, height, thumbnail, text in reversed(rows):
+                fingerprint = CaptureFingerprint(
+                    int(hash_hex, 16), (columns, grid_rows), Image.frombytes("L", (width, height), thumbnail)
+                )
+                self._entries[key] = (context, fingerprint, text)
+            self._conn = conn
+        except Exception as e:
+            logger.warning(f"OCR cache disk store unavailable, using memory only: {e}")
+            self._conn = None
+
+    def get(self, fingerprint: CaptureFingerprint, context: str) -> Optional[str]:
+        """
+        Get the text of a matching capture.
+
+        Args:
+            fingerprint: Fingerprint of the new capture.
+            context: Context from ``make_context``.
+
+        Returns:
+            The stored text of the closest confirmed match, or None on a miss.
+        """
+        with self._lock:
+            self._load_locked()
+            candidates = []
+            for key, (entry_context, entry_fingerprint, text) in self._entries.items():
+                if entry_context != context:
+                    continue
+                distance = fingerprint.distance(entry_fingerprint)
+                if distance is not None and distance <= self._max_distance:
+                    candidates.append((distance, key, entry_fingerprint, text))
+
+            for _, key, entry_fingerprint, text in sorted(candidates, key=lambda candidate: candidate[0]):
+                if fingerprint.same_content(entry_fingerprint):
+                    self._entries.move_to_end(key)
+                    self._touch_locked(key)
+                    self._hits += 1
+                    return text
+
+            self._misses += 1
+            return None
+
+    def set(self, fingerprint: CaptureFingerprint, context: str, text: str) -> None:
+        """
+        Store the text recognized in a capture.
+
+        Args:
+            fingerprint: Fingerprint of the capture.
+            context: Context from ``make_context``.
+            text: Recognized text.
+        """
+        key = self._entry_key(context, fingerprint)
+        with self._lock:
+            self._load_locked()
+            self._entries[key] = (context, fingerprint, text)
+            self._entries.move_to_end(key)
+            evicted = []
+            while len(self._entries) > self._max_entries:
+                evicted.append(self._entries.popitem(last=False)[0])
+
+            if self._conn is None:
+                return
+            try:
+                thumbnail = fingerprint.thumbnail
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(key, context, hash, columns, rows, width, height, thumbnail, text, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key, context, f"{fingerprint.hash:x}", *fingerprint.grid,
+                        thumbnail.width, thumbnail.height, thumbnail.tobytes(), text, time.time(),
+                    ),
+                )
+                self._conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in evicted])
+                self._conn.commit()
+            except Exception as e:
+                logger.debug(f"OCR cache disk write failed: {e}")
+
+    def _touch_locked(self, key: str) -> None:
+        """Record an access on disk; caller must hold ``_lock``."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        except Exception as e:
+            logger.debug(f"OCR cache disk update failed: {e}")
+
+    def clear(self, *, delete_persisted: bool = False) -> None:
+        """
+        Clear cache entries.
+
+        Args:
+            delete_persisted: Also remove all entries from the disk store.
+        """
+        with self._lock:
+            self._entries.clear()
+            if delete_persisted:
+                self._load_locked()
+                if self._conn is not None:
+                    try:
+                        self._conn.execute("DELETE FROM entries")
+                        self._conn.commit()
+                    except Exception as e:
+                        logger.debug(f"Failed to clear OCR cache on disk: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current number of entries."""
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "entries": len(self._entries)}
+
+    def close(self) -> None:
+        """Close the disk store; entries are loaded again if the cache is used after closing."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close OCR cache: {e}")
+                self._conn = None
+            self._entries.clear()
+            self._disk_loaded = False
+
+
+__all__ = [
+    "CaptureFingerprint",
+    "OCRResultCache",
+]
@@ -7,13 +7,19 @@ This module provides the main OCR service using LLM vision capabilities.
 import time
 from dataclasses import dataclass
 from time import perf_counter
-from typing import Literal, Optional
+from typing import Literal, Optional, Tuple
 
 from loguru import logger
 from PIL import Image
 
 from ..core.api_manager import get_api_manager
-from ..utils.image_utils import to_data_url_jpeg
+from ..core.api_manager.cancellation import CancelToken
+from ..core.completion_budget import MODE_OCR, MODE_TRANSLATE, get_completion_budget
+from ..core.config import ensure_config_dir, is_llm_provider
+from ..core.image_parts import EncodedImage, image_part
+from ..utils.image_utils import AdaptiveImageEncoder, crop_to_text, encode_jpeg, resize_long_edge
+from ..utils.translation_utils import parse_gpt_response, parse_tagged_response
+from .ocr_cache import CaptureFingerprint, OCRResultCache
 
 
 @dataclass
@@ -26,6 +32,8 @@ class OCRResult:
     processing_time: float
     error_message: Optional[str] = None
     success: bool = True
+    # Translation returned by the OCR request itself; None if the text still needs translating
+    translated_text: Optional[str] = None
 
 
 @dataclass
@@ -34,6 +42,31 @@ class OCRRequest:
 
     image: Image.Image
     preprocess: bool = True
+    # Languages (UI selection) to translate the text into in the same vision request; None = OCR only
+    translate_from: str = "auto"
+    translate_to: Optional[str] = None
+
+
+def _format_ocr_translate_instructions(
+    source_lang: str, target_lang: str, auto_swap: bool, translation_prompt: Optional[str] = None
+) -> str:
+    """Format instructions for returning the extracted text and its translation as tagged parts.
+
+    ``translation_prompt`` is the configured translation system prompt; it
+    applies to the translation only, as it does in a separate translation request.
+    """
+    source = "" if not source_lang or source_lang == "auto" else f" from {source_lang}"
+    target = target_lang
+    if auto_swap:
+        target = f"Russian if the text is in English, English if it is in Russian, otherwise {target_lang}"
+    guidelines = ""
+    if translation_prompt and translation_prompt.strip():
+        guidelines = f"When translating, follow these instructions:\n{translation_prompt.strip()}\n"
+    return f"""Then translate the extracted text{source} into {target}.
+{guidelines}Return both inside tags, exactly in this format and nothing else:
+<part name="text">extracted text</part>
+<part name="translation">translated text</part>
+If the image contains no text, return both tags empty."""
 
 
 class OCRService:
@@ -46,6 +79,8 @@ class OCRService:
             config_service: Config service instance for settings access.
         """
         self.config_service = config_service
+        self._image_encoder = AdaptiveImageEncoder()
+        self._result_cache: Optional[OCRResultCache] = None
 
     def _handle_ocr_error(self, e: Exception, start_time: float, context: str) -> OCRResult:
         """Unified error handling for OCR operations."""
@@ -63,11 +98,24 @@ class OCRService:
             success=False,
         )
 
-    def _process_llm_image(self, image: "Image.Image") -> OCRResult:
+    def _process_llm_image(
+        self,
+        image: "Image.Image",
+        translate_from: str = "auto",
+        translate_to: Optional[str] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> OCRResult:
         """Process image with LLM vision API.
 
+        With ``translate_to`` set and an LLM translation provider, the same
+        request also returns the translation; if its answer cannot be parsed,
+        the image is recognized again with the plain OCR prompt.
+
         Args:
             image: Input PIL image
+            translate_from: Source language for the translation (or "auto")
+            translate_to: Target language to translate into, or None for OCR only
+            cancel_token: Optional token; cancelling it aborts the vision request
 
         Returns:
             OCRResult with LLM processing results
@@ -76,34 +124,74 @@ class OCRService:
         logger.debug("Processing image with LLM vision API")
 
         try:
-            # Build image data URL
-            data_url = to_data_url_jpeg(image, max_edge=1280, quality=80)
+            # Determine provider (selected, or routed with automatic selection) and model
+            api_manager = get_api_manager()
+            provider = api_manager.resolve_provider_name(MODE_OCR)
+            if provider == "openai":
+                model_hint = self.config_service.get_setting("openai_vision_model")
+            elif provider == "google":
+                model_hint = self.config_service.get_setting("google_vision_model")
+            else:
+                raise ValueError("Selected provider does not support vision OCR")
 
-            # Compose messages
             system_prompt = self.config_service.get_setting("ocr_llm_prompt") or "Extract the text as-is. Keep natural reading order. Return only the text."
+            image = self._crop_capture(image)
+
+            # A capture that matches one read before returns the stored text without a request
+            cache = self._get_result_cache()
+            fingerprint = cache_context = None
+            if cache is not None:
+                fingerprint = CaptureFingerprint.from_image(image)
+                cache_context = OCRResultCache.make_context(provider, model_hint, system_prompt)
+                cached_text = cache.get(fingerprint, cache_context)
+                if cached_text is not None:
+                    processing_time = perf_counter() - start_time
+                    logger.info(f"LLM OCR served from cache in {processing_time * 1000:.1f} ms")
+                    return OCRResult(
+                        text=cached_text, confidence=0.90, engine="llm", processing_time=processing_time
+                    )
+
+            # Encode the image once; adapters convert the bytes to their wire format
+            encoded_image = self._encode_image(image)
+
+            # Compose messages
             messages = [
                 {"role": "system", "content": system_prompt},
                 {
                     "role": "user",
                     "content": [
                         {"type": "text", "text": "Extract the text as-is. Keep natural reading order. Return only the text."},
-                        {"type": "image_url", "image_url": {"url": data_url}}
+                        image_part(encoded_image)
                     ]
                 }
             ]
 
-            # Determine provider and model
-            provider = self.config_service.get_setting("api_provider")
-            if provider == "openai":
-                model_hint = self.config_service.get_setting("openai_vision_model")
-            elif provider == "google":
-                model_hint = self.config_service.get_setting("google_vision_model")
-            else:
-                raise ValueError("Selected provider does not support vision OCR")
+            if translate_to and self._translates_in_one_request(api_manager):
+                parts = self._request_text_and_translation(
+                    api_manager, encoded_image, model_hint, provider, translate_from, translate_to, cancel_token
+                )
+                if parts is not None:
+                    extracted_text, translated_text = parts
+                    processing_time = perf_counter() - start_time
+                    success = bool(extracted_text)
+                    if cache is not None and success:
+                        cache.set(fingerprint, cache_context, extracted_text)
+                    logger.info(f"LLM OCR and translation completed in {processing_time:.2f}s, success={success}")
+                    return OCRResult(
+                        text=extracted_text,
+                        confidence=0.90 if success else 0.0,
+                        engine="llm",
+                        processing_time=processing_time,
+                        success=success,
+                        error_message=None if success else "Empty OCR text from LLM",
+                        translated_text=translated_text if success else None,
+                    )
+                logger.warning("Malformed OCR and translation response; recognizing and translating separately")
 
             # Call vision API
-            api_manager = get_api_manager()
-            response, _ = api_manager.make_vision_request(messages, model_hint)
+            response, _ = api_manager.make_vision_request(
+                messages, model_hint, provider_name=provider, cancel_token=cancel_token
+            )
 
             logger.debug(f"LLM vision API response: {response}")
 
@@ -116,6 +204,8 @@ class OCRService:
 
             # Create result
             success = bool(extracted_text)
+            if cache is not None and success:
+                cache.set(fingerprint, cache_context, extracted_text)
             result = OCRResult(
                 text=extracted_text,
                 confidence=0.90 if success else 0.0,
@@ -140,8 +230,105 @@ class OCRService:
                 success=False,
             )
 
-    def process_image(self, request: OCRRequest) -> OCRResult:
-        """Process image with OCR using LLM vision API."""
+    def _crop_capture(self, image: "Image.Image") -> "Image.Image":
+        """Crop a capture to its text unless cropping is disabled."""
+        if self.config_service.get_setting("ocr_crop_to_text") is False:
+            return image
+        cropped = crop_to_text(image)
+        if cropped is not image:
+            logger.debug(f"Cropped capture to text: {image.size} -> {cropped.size}")
+        return cropped
+
+    def _get_result_cache(self) -> Optional[OCRResultCache]:
+        """Return the result cache for the current settings, or None if caching is off."""
+        if self.config_service.get_setting("ocr_cache_enabled") is False:
+            return None
+        persistent = self.config_service.get_setting("ocr_cache_persistent") is True
+        if self._result_cache is None or self._result_cache.persistent != persistent:
+            if self._result_cache is not None:
+                self._result_cache.close()
+            self._result_cache = OCRResultCache(ensure_config_dir() if persistent else None)
+        return self._result_cache
+
+    def _encode_image(self, image: "Image.Image") -> EncodedImage:
+        """Encode a capture for upload (adaptive format and size, or fixed JPEG)."""
+        if self.config_service.get_setting("ocr_adaptive_image_encoding") is False:
+            return EncodedImage(encode_jpeg(resize_long_edge(image, max_edge=1280), quality=80), "image/jpeg")
+        encoded_image = self._image_encoder.encode(image)
+        logger.debug(f"Encoded capture as {encoded_image.mime_type}, {len(encoded_image.data)} bytes")
+        return encoded_image
+
+    def _translates_in_one_request(self, api_manager) -> bool:
+        """Whether OCR requests may return the translation too (LLM translation provider only)."""
+        if self.config_service.get_setting("ocr_translate_in_one_request") is False:
+            return False
+        return is_llm_provider(api_manager.resolve_provider_name(MODE_TRANSLATE))
+
+    def _request_text_and_translation(
+        self,
+        api_manager,
+        encoded_image: EncodedImage,
+        model_hint: str,
+        provider: str,
+        translate_from: str,
+        translate_to: str,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """Recognize the text in an image and translate it with one vision request.
+
+        Returns:
+            (text, translation) with translation None if it is missing from the
+            answer, ("", None) for an image without text, or None if the answer
+            has no recognizable structure.
+        """
+        ocr_prompt = self.config_service.get_setting("ocr_llm_prompt") or "Extract the text as-is. Keep natural reading order. Return only the text."
+        auto_swap = bool(self.config_service.get_setting("auto_swap_en_ru"))
+        instructions = _format_ocr_translate_instructions(
+            translate_from, translate_to, auto_swap, self.config_service.get_setting("system_prompt")
+        )
+        messages = [
+            {
+                "role": "system",
+                "content": f"{ocr_prompt}\n\n{instructions}",
+            },
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "Extract the text as-is and translate it. Return only the two tags."},
+                    image_part(encoded_image)
+                ]
+            }
+        ]
+        # The answer holds the text twice: size the budget for both
+        max_completion_tokens = None
+        if self.config_service.get_setting("adaptive_completion_tokens") is not False:
+            max_completion_tokens = get_completion_budget(model_hint, messages, MODE_OCR, outputs=2)
+
+        response, _ = api_manager.make_vision_request(
+            messages,
+            model_hint,
+            provider_name=provider,
+            max_completion_tokens=max_completion_tokens,
+            cancel_token=cancel_token,
+        )
+        raw_text = api_manager.extract_text_from_response(response)
+        # The extracted text is returned as read, like plain OCR; only the translation is cleaned up
+        parts = parse_tagged_response(raw_text, "part", "name", clean=False)
+        if "text" in parts:
+            return parts["text"], parse_gpt_response(parts.get("translation", "")) or None
+        if not parts and "<part" in raw_text.lower():
+            return "", None  # Tags present but empty: no text in the image
+        logger.debug(f"Unparseable OCR and translation response: '{raw_text[:200]}'")
+        return None
+
+    def process_image(self, request: OCRRequest, cancel_token: Optional[CancelToken] = None) -> OCRResult:
+        """Process image with OCR using LLM vision API.
+
+        Args:
+            request: Image and translation options.
+            cancel_token: Optional token; cancelling it aborts the vision request
+                and the result reports the cancellation as an error.
+        """
 
         start_time = time.time()
 
@@ -154,7 +341,9 @@ class OCRService:
         try:
             # Use LLM vision API
             # Note: request.preprocess is ignored for LLM as it handles raw images better
-            result = self._process_llm_image(request.image)
+            result = self._process_llm_image(
+                request.image, request.translate_from, request.translate_to, cancel_token
+            )
 
             if result.success and result.text.strip():
                 logger.info(f"LLM OCR succeeded: confidence={result.confidence:.3f}, text_length={len(result.text)}")
@@ -0,0 +1,291 @@
+"""
+Translation result cache for WhisperBridge.
+
+This module provides a two-tier cache (in-memory LRU + SQLite on disk) for
+finished translation and style results, so repeated requests for the same
+text/language/model/prompt combination never reach the provider.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+CACHE_FILE_NAME = "translation_cache.sqlite3"
+
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_DISK_ENTRIES = 5000
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600  # 30 days
+
+# How many writes between disk eviction passes
+_PRUNE_EVERY_WRITES = 100
+
+
+def normalize_cache_text(text: str) -> str:
+    """Normalize text for cache keys without changing its visible structure.
+
+    Line endings and Unicode composition are unified and surrounding whitespace
+    is stripped; inner whitespace and line breaks are preserved because the
+    providers keep them in the output.
+    """
+    if not text:
+        return ""
+    normalized = unicodedata.normalize("NFC", text)
+    normalized = normalized.replace("\r\n", "\n").replace("\r", "\n")
+    return normalized.strip()
+
+
+def hash_prompt(prompt: Optional[str]) -> str:
+    """Return a short stable hash for a system/style prompt."""
+    return hashlib.sha256((prompt or "").encode("utf-8")).hexdigest()[:16]
+
+
+class TranslationCache:
+    """
+    Two-tier cache for translation results.
+
+    Entries are JSON-serializable dictionaries. The memory tier is a bounded
+    LRU; the disk tier is a SQLite table with age- and size-based eviction.
+    All public methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_disk_entries: int = DEFAULT_DISK_ENTRIES,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ):
+        """
+        Initialize the TranslationCache.
+
+        Args:
+            cache_dir: Directory to store the SQLite cache file.
+            max_memory_entries: Maximum entries kept in the in-memory LRU.
+            max_disk_entries: Maximum entries kept on disk.
+            ttl_seconds: Time-to-live for entries in both tiers.
+        """
+        self._memory: "OrderedDict[str, tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_memory = max(1, int(max_memory_entries))
+        self._max_disk = max(1, int(max_disk_entries))
+        self._ttl = ttl_seconds
+        self._db_path = cache_dir / CACHE_FILE_NAME
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_failed = False
+        self._writes_since_prune = 0
+
+        self._hits = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(
+        text: str,
+        source_lang: Optional[str],
+        target_lang: Optional[str],
+        provider: Optional[str],
+        model: Optional[str],
+        prompt: Optional[str] = None,
+    ) -> str:
+        """
+        Build a cache key for a request.
+
+        Args:
+            text: Source text (normalized internally).
+            source_lang: Source language code or "auto".
+            target_lang: Target language code (or style name for style requests).
+            provider: Provider identifier.
+            model: Model name.
+            prompt: System or style prompt; only its hash enters the key.
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        parts = [
+            normalize_cache_text(text),
+            (source_lang or "auto").strip().lower(),
+            (target_lang or "").strip().lower(),
+            (provider or "").strip().lower(),
+            (model or "").strip(),
+            hash_prompt(prompt),
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def _get_conn(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite store lazily; caller must hold ``_lock``."""
+        if self._conn is not None or self._disk_failed:
+            return self._conn
+        try:
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed)")
+            conn.commit()
+            self._conn = conn
+            self._prune_locked()
+        except Exception as e:
+            logger.warning(f"Translation cache disk store unavailable, using memory only: {e}")
+            self._disk_failed = True
+            self._conn = None
+        return self._conn
+
+    def _remember_locked(self, key: str, value: Dict[str, Any], created: float) -> None:
+        """Insert into the memory LRU; caller must hold ``_lock``."""
+        self._memory[key] = (value, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached entry.
+
+        Args:
+            key: Cache key from ``make_key``.
+
+        Returns:
+            A copy of the cached dictionary, or None on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created = entry
+                if now - created < self._ttl:
+                    self._memory.move_to_end(key)
+                    self._hits += 1
+                    self._memory_hits += 1
+                    return dict(value)
+                self._memory.pop(key, None)
+
+            conn = self._get_conn()
+            if conn is not None:
+                try:
+                    row = conn.execute(
+                        "SELECT payload, created FROM entries WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        payload, created = row
+                        if now - created < self._ttl:
+                            value = json.loads(payload)
+                            conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+                            conn.commit()
+                            self._remember_locked(key, value, created)
+                            self._hits += 1
+                            self._disk_hits += 1
+                            return dict(value)
+                        conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                        conn.commit()
+                except Exception as e:
+                    logger.debug(f"Translation cache disk lookup failed: {e}")
+
+            self._misses += 1
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store an entry in both tiers.
+
+        Args:
+            key: Cache key from ``make_key``.
+            value: JSON-serializable dictionary to cache.
+        """
+        now = time.time()
+        with self._lock:
+            self._remember_locked(key, dict(value), now)
+
+            conn = self._get_conn()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, payload, created, accessed) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), now, now),
+                )
+                conn.commit()
+                self._writes_since_prune += 1
+                if self._writes_since_prune >= _PRUNE_EVERY_WRITES:
+                    self._prune_locked()
+            except Exception as e:
+                logger.debug(f"Translation cache disk write failed: {e}")
+
+    def _prune_locked(self) -> None:
+        """Apply age- and size-based eviction to the disk tier; caller must hold ``_lock``."""
+        self._writes_since_prune = 0
+        conn = self._conn
+        if conn is None:
+            return
+        try:
+            conn.execute("DELETE FROM entries WHERE created < ?", (time.time() - self._ttl,))
+            conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self._max_disk,),
+            )
+            conn.commit()
+        except Exception as e:
+            logger.debug(f"Translation cache eviction failed: {e}")
+
+    def prune(self) -> None:
+        """Evict expired and surplus entries from the disk tier."""
+        with self._lock:
+            if self._get_conn() is not None:
+                self._prune_locked()
+
+    def clear(self, *, delete_persisted: bool = False) -> None:
+        """
+        Clear cache entries.
+
+        Args:
+            delete_persisted: Also remove all entries from the disk tier.
+        """
+        with self._lock:
+            self._memory.clear()
+            if delete_persisted:
+                conn = self._get_conn()
+                if conn is not None:
+                    try:
+                        conn.execute("DELETE FROM entries")
+                        conn.commit()
+                    except Exception as e:
+                        logger.debug(f"Failed to clear translation cache on disk: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current memory size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "memory_entries": len(self._memory),
+            }
+
+    def close(self) -> None:
+        """Close the disk store; the cache reopens it lazily if used again."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close translation cache: {e}")
+                self._conn = None
+
+
+__all__ = [
+    "TranslationCache",
+    "normalize_cache_text",
+    "hash_prompt",
+]
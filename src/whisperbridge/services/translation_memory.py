@@ -0,0 +1,279 @@
+"""
+Segment-level translation memory for WhisperBridge.
+
+Texts are split into sentence segments by ``translation_utils.split_sentences``;
+this module stores translated segment pairs in SQLite and finds exact or
+near-duplicate segments through a character-trigram inverted index, so
+repeatedly translated documents with small edits only send their new
+segments to the provider.
+"""
+
+import difflib
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+MEMORY_FILE_NAME = "translation_memory.sqlite3"
+
+NGRAM_SIZE = 3
+FUZZY_MATCH_THRESHOLD = 0.95
+DEFAULT_MAX_SEGMENTS = 20000
+
+# Segments longer than this are matched exactly only (no fuzzy search)
+_MAX_FUZZY_SEGMENT_CHARS = 1000
+_MAX_CANDIDATES = 20
+
+
+@dataclass
+class MemoryMatch:
+    """A translation memory hit for a segment."""
+
+    source: str
+    target: str
+    score: float
+
+
+def _normalize_segment(text: str) -> str:
+    """Normalize a segment for matching (case, Unicode form, inner whitespace)."""
+    normalized = unicodedata.normalize("NFC", text or "").lower()
+    return " ".join(normalized.split())
+
+
+def _ngrams(text: str) -> List[str]:
+    """Return the distinct character n-grams of a normalized segment."""
+    padded = f" {text} "
+    if len(padded) < NGRAM_SIZE:
+        return [padded]
+    return sorted({padded[i:i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)})
+
+
+class TranslationMemory:
+    """
+    Persistent translation memory with a fuzzy n-gram index.
+
+    Segment pairs are scoped by a context key (languages, provider, model and
+    prompt), so reuse never crosses language pairs or prompt changes.
+    All public methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        memory_dir: Path,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+        threshold: float = FUZZY_MATCH_THRESHOLD,
+    ):
+        """
+        Initialize the TranslationMemory.
+
+        Args:
+            memory_dir: Directory to store the SQLite database.
+            max_segments: Maximum stored segment pairs (oldest are evicted).
+            threshold: Minimum similarity ratio for a fuzzy match.
+        """
+        self._db_path = memory_dir / MEMORY_FILE_NAME
+        self._max_segments = max(1, int(max_segments))
+        self._threshold = threshold
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_failed = False
+
+    @staticmethod
+    def make_context(
+        source_lang: Optional[str],
+        target_lang: Optional[str],
+        provider: Optional[str],
+        model: Optional[str],
+        prompt: Optional[str] = None,
+    ) -> str:
+        """Build the context key that scopes stored segment pairs."""
+        parts = [
+            (source_lang or "auto").strip().lower(),
+            (target_lang or "").strip().lower(),
+            (provider or "").strip().lower(),
+            (model or "").strip(),
+            hashlib.sha256((prompt or "").encode("utf-8")).hexdigest()[:16],
+        ]
+        return "|".join(parts)
+
+    def _get_conn(self) -> Optional[sqlite3.Connection]:
+        """Open the database lazily; caller must hold ``_lock``."""
+        if self._conn is not None or self._disk_failed:
+            return self._conn
+        try:
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            conn.executescript(
+                "CREATE TABLE IF NOT EXISTS segments ("
+                " id INTEGER PRIMARY KEY,"
+                " context TEXT NOT NULL,"
+                " norm TEXT NOT NULL,"
+                " length INTEGER NOT NULL,"
+                " target TEXT NOT NULL,"
+                " created REAL NOT NULL,"
+                " UNIQUE(context, norm));"
+                "CREATE TABLE IF NOT EXISTS grams ("
+                " gram TEXT NOT NULL,"
+                " segment_id INTEGER NOT NULL,"
+                " PRIMARY KEY (gram, segment_id)) WITHOUT ROWID;"
+                "CREATE INDEX IF NOT EXISTS idx_grams_segment ON grams(segment_id);"
+            )
+            conn.commit()
+            self._conn = conn
+        except Exception as e:
+            logger.warning(f"Translation memory unavailable: {e}")
+            self._disk_failed = True
+            self._conn = None
+        return self._conn
+
+    def lookup(self, segment: str, context: str) -> Optional[MemoryMatch]:
+        """
+        Find the best stored translation for a segment.
+
+        Args:
+            segment: Source segment text.
+            context: Context key from ``make_context``.
+
+        Returns:
+            A MemoryMatch for an exact or above-threshold fuzzy match, or None.
+        """
+        norm = _normalize_segment(segment)
+        if not norm:
+            return None
+        with self._lock:
+            conn = self._get_conn()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT target FROM segments WHERE context = ? AND norm = ?", (context, norm)
+                ).fetchone()
+                if row is not None:
+                    return MemoryMatch(source=norm, target=row[0], score=1.0)
+
+                if len(norm) > _MAX_FUZZY_SEGMENT_CHARS:
+                    return None
+
+                return self._fuzzy_lookup_locked(conn, norm, context)
+            except Exception as e:
+                logger.debug(f"Translation memory lookup failed: {e}")
+                return None
+
+    def _fuzzy_lookup_locked(self, conn: sqlite3.Connection, norm: str, context: str) -> Optional[MemoryMatch]:
+        """Search the n-gram index for near-duplicates; caller must hold ``_lock``."""
+        grams = _ngrams(norm)
+        # A ratio >= threshold bounds the length difference of the candidates
+        slack = int(len(norm) * (1 - self._threshold) * 2) + 1
+        placeholders = ",".join("?" * len(grams))
+        rows = conn.execute(
+            f"SELECT s.norm, s.target, COUNT(*) AS shared FROM grams g "
+            f"JOIN segments s ON s.id = g.segment_id "
+            f"WHERE g.gram IN ({placeholders}) AND s.context = ? AND ABS(s.length - ?) <= ? "
+            f"GROUP BY s.id ORDER BY shared DESC LIMIT ?",
+            (*grams, context, len(norm), slack, _MAX_CANDIDATES),
+        ).fetchall()
+
+        best: Optional[MemoryMatch] = None
+        for candidate_norm, target, _shared in rows:
+            score = difflib.SequenceMatcher(None, norm, candidate_norm, autojunk=False).ratio()
+            if score >= self._threshold and (best is None or score > best.score):
+                best = MemoryMatch(source=candidate_norm, target=target, score=score)
+        return best
+
+    def store(self, pairs: List[Tuple[str, str]], context: str) -> int:
+        """
+        Store translated segment pairs.
+
+        Args:
+            pairs: (source_segment, translated_segment) tuples.
+            context: Context key from ``make_context``.
+
+        Returns:
+            Number of pairs written.
+        """
+        now = time.time()
+        written = 0
+        with self._lock:
+            conn = self._get_conn()
+            if conn is None:
+                return 0
+            try:
+                for source, target in pairs:
+                    norm = _normalize_segment(source)
+                    if not norm or not (target or "").strip():
+                        continue
+                    conn.execute(
+                        "DELETE FROM grams WHERE segment_id IN "
+                        "(SELECT id FROM segments WHERE context = ? AND norm = ?)",
+                        (context, norm),
+                    )
+                    cursor = conn.execute(
+                        "INSERT OR REPLACE INTO segments (context, norm, length, target, created) VALUES (?, ?, ?, ?, ?)",
+                        (context, norm, len(norm), target, now),
+                    )
+                    if len(norm) <= _MAX_FUZZY_SEGMENT_CHARS:
+                        conn.executemany(
+                            "INSERT OR IGNORE INTO grams (gram, segment_id) VALUES (?, ?)",
+                            [(gram, cursor.lastrowid) for gram in _ngrams(norm)],
+                        )
+                    written += 1
+                self._evict_locked(conn)
+                conn.commit()
+            except Exception as e:
+                logger.debug(f"Translation memory store failed: {e}")
+        return written
+
+    def _evict_locked(self, conn: sqlite3.Connection) -> None:
+        """Drop the oldest segment pairs beyond the size limit; caller must hold ``_lock``."""
+        count = conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+        surplus = count - self._max_segments
+        if surplus <= 0:
+            return
+        stale = [row[0] for row in conn.execute("SELECT id FROM segments ORDER BY created ASC LIMIT ?", (surplus,))]
+        conn.executemany("DELETE FROM grams WHERE segment_id = ?", [(sid,) for sid in stale])
+        conn.executemany("DELETE FROM segments WHERE id = ?", [(sid,) for sid in stale])
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of stored segments and index entries."""
+        with self._lock:
+            conn = self._get_conn()
+            if conn is None:
+                return {"segments": 0, "grams": 0}
+            return {
+                "segments": conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0],
+                "grams": conn.execute("SELECT COUNT(*) FROM grams").fetchone()[0],
+            }
+
+    def clear(self) -> None:
+        """Remove all stored segment pairs."""
+        with self._lock:
+            conn = self._get_conn()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM grams")
+                conn.execute("DELETE FROM segments")
+                conn.commit()
+            except Exception as e:
+                logger.debug(f"Failed to clear translation memory: {e}")
+
+    def close(self) -> None:
+        """Close the database; it is reopened lazily if used again."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close translation memory: {e}")
+                self._conn = None
+
+
+__all__ = [
+    "MemoryMatch",
+    "TranslationMemory",
+]
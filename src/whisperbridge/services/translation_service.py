@@ -7,23 +7,48 @@ error handling and async processing.
 
 import asyncio
 import threading
-from typing import Optional
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from loguru import logger
 from tenacity import RetryError
 
-from ..core.api_manager import get_api_manager
+from ..core.api_manager import RequestCancelledError, RetryableAPIError, get_api_manager
+from ..core.api_manager.throttling import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, request_priority
+from ..core.async_runtime import get_async_runtime
 from ..services.config_service import config_service
 from ..utils.language_utils import detect_language
 from ..utils.translation_utils import (
+    TextChunk,
     TranslationRequest,
     TranslationResponse,
     StyleRequest,
+    join_chunks,
+    split_sentences,
+    split_text_into_chunks,
+    format_multi_style_prompt,
+    format_multi_target_prompt,
     format_translation_prompt,
     format_style_prompt,
     parse_gpt_response,
+    parse_multi_style_response,
+    parse_multi_target_response,
 )
-from ..core.config import get_deepl_identifier, requires_model_selection, is_llm_provider
+from ..core.config import ensure_config_dir, get_deepl_identifier, requires_model_selection, is_llm_provider
+from ..core.completion_budget import MODE_STYLE, MODE_TRANSLATE, get_completion_budget
+from ..core.model_limits import get_model_max_completion_tokens
+from .translation_cache import TranslationCache
+from .translation_memory import TranslationMemory
+
+# Minimum share of segments found in translation memory before a text is
+# translated piecewise; below it a single full request is cheaper and keeps context
+MIN_MEMORY_REUSE_RATIO = 0.5
+
+# Defaults for long-text chunking (see Settings.translation_chunk_max_tokens)
+DEFAULT_CHUNK_MAX_TOKENS = 1500
+DEFAULT_MAX_PARALLEL_CHUNKS = 4
+# Attempts per chunk on top of the API manager's own retries
+CHUNK_MAX_ATTEMPTS = 2
 
 
 class TranslationService:
@@ -32,6 +57,8 @@ class TranslationService:
     def __init__(self):
         self._api_manager = get_api_manager()
         self._is_initialized = False
+        self._result_cache = TranslationCache(ensure_config_dir())
+        self._memory = TranslationMemory(ensure_config_dir())
 
     def initialize(self) -> bool:
         """Initialize the translation service."""
@@ -87,12 +114,19 @@ class TranslationService:
             tokens_used=tokens_used,
         )
 
-    def _get_active_model(self) -> str:
+    def _active_provider(self, mode: str = MODE_TRANSLATE) -> str:
+        """Provider for the next request: the selected one, or the fastest one with automatic selection."""
+        return self._api_manager.resolve_provider_name(mode)
+
+    def _get_active_model(self, provider: Optional[str] = None) -> str:
         """
         Gets the currently configured model based on the selected API provider.
         Dynamically constructs the model setting key (e.g., 'openai_model').
+
+        Args:
+            provider: Provider to get the model for instead of the selected one.
         """
-        provider = config_service.get_setting("api_provider")
+        provider = provider or config_service.get_setting("api_provider")
         if not provider:
             raise ValueError("API provider is not configured in settings.")
 
@@ -111,6 +145,146 @@ class TranslationService:
 
         return model
 
+    def _is_cache_enabled(self) -> bool:
+        """Check whether the result cache is enabled in settings."""
+        return bool(getattr(config_service.get_settings(), "translation_cache_enabled", True))
+
+    def _translation_cache_key(
+        self,
+        text: str,
+        ui_source_lang: Optional[str],
+        ui_target_lang: Optional[str],
+        provider: Optional[str] = None,
+        auto_swap: bool = True,
+    ) -> Optional[str]:
+        """Build the result cache key for a translation request, or None if caching is off.
+
+        The key uses the raw UI selection (plus the auto-swap flag) rather than the
+        resolved languages, so a lookup needs no language detection. Callers that
+        never swap the target (multi-target translation) pass ``auto_swap=False``
+        so their entries cannot be mistaken for swapped results.
+        """
+        if not text or not text.strip() or not self._is_cache_enabled():
+            return None
+        try:
+            settings = config_service.get_settings()
+            provider = provider or self._active_provider(MODE_TRANSLATE)
+            target = ui_target_lang or getattr(settings, "ui_target_language", "en")
+            if auto_swap and getattr(settings, "auto_swap_en_ru", False):
+                target = f"{target}|swap"
+            prompt = settings.system_prompt if is_llm_provider(provider) else ""
+            return TranslationCache.make_key(
+                text, ui_source_lang or "auto", target, provider, self._get_active_model(provider), prompt
+            )
+        except Exception as e:
+            logger.debug(f"Translation cache key unavailable: {e}")
+            return None
+
+    def _style_cache_key(
+        self, text: str, style_name: str, style_prompt: str, provider: Optional[str] = None
+    ) -> Optional[str]:
+        """Build the result cache key for a style request, or None if caching is off."""
+        if not text or not text.strip() or not self._is_cache_enabled():
+            return None
+        try:
+            provider = provider or self._active_provider(MODE_STYLE)
+            return TranslationCache.make_key(
+                text, "style", style_name, provider, self._get_active_model(provider), style_prompt
+            )
+        except Exception as e:
+            logger.debug(f"Style cache key unavailable: {e}")
+            return None
+
+    def _lookup_cache(self, key: Optional[str]) -> Optional[TranslationResponse]:
+        """Return a cached response for the key, if any."""
+        if key is None:
+            return None
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        logger.debug(f"Translation cache hit ({self._result_cache.stats()})")
+        return self._make_response(success=True, **entry)
+
+    def _store_cache(self, key: Optional[str], response: TranslationResponse) -> None:
+        """Store a successful, non-empty response under the key."""
+        if key is None or not response.success or not response.translated_text:
+            return
+        self._result_cache.set(
+            key,
+            {
+                "translated_text": response.translated_text,
+                "source_lang": response.source_lang,
+                "target_lang": response.target_lang,
+                "model": response.model,
+            },
+        )
+
+    def get_cached_translation(
+        self,
+        text: str,
+        ui_source_lang: Optional[str] = None,
+        ui_target_lang: Optional[str] = None,
+    ) -> Optional[TranslationResponse]:
+        """Return a cached translation synchronously, without touching the provider."""
+        try:
+            return self._lookup_cache(self._translation_cache_key(text, ui_source_lang, ui_target_lang))
+        except Exception as e:
+            logger.debug(f"Translation cache lookup failed: {e}")
+            return None
+
+    def cache_translation(
+        self,
+        text: str,
+        translated_text: str,
+        ui_source_lang: Optional[str] = None,
+        ui_target_lang: Optional[str] = None,
+    ) -> None:
+        """Store a translation made outside the service (e.g. with OCR) as if it had been translated here."""
+        try:
+            response = self._make_response(
+                success=True, translated_text=translated_text, source_lang=ui_source_lang, target_lang=ui_target_lang
+            )
+            self._store_cache(self._translation_cache_key(text, ui_source_lang, ui_target_lang), response)
+        except Exception as e:
+            logger.debug(f"Translation cache store failed: {e}")
+
+    def get_cached_style(self, text: str, style_name: str) -> Optional[TranslationResponse]:
+        """Return a cached style rewrite synchronously, without touching the provider."""
+        try:
+            resolved_name, style_prompt = self._resolve_style(style_name)
+            return self._lookup_cache(self._style_cache_key(text, resolved_name, style_prompt))
+        except Exception as e:
+            logger.debug(f"Style cache lookup failed: {e}")
+            return None
+
+    def get_cache_stats(self) -> dict:
+        """Return result cache hit/miss counters."""
+        return self._result_cache.stats()
+
+    def _resolve_style(self, style_name: str) -> tuple[str, str]:
+        """Resolve a style preset to its (name, prompt), falling back to the first preset."""
+        settings = config_service.get_settings()
+        styles = getattr(settings, "text_styles", []) or []
+        style_entry = None
+        for s in styles:
+            try:
+                if (s.get("name") or "").strip().lower() == style_name.strip().lower():
+                    style_entry = s
+                    break
+            except Exception:
+                continue
+        if not style_entry and styles:
+            style_entry = styles[0]  # fallback to first preset if provided style not found
+            logger.warning(f"Style '{style_name}' not found. Falling back to preset '{style_entry.get('name','')}'.")
+            style_name = style_entry.get("name", style_name)
+        if not style_entry:
+            raise ValueError("No style presets configured. Please add styles in settings.")
+
+        style_prompt = style_entry.get("prompt", "").strip()
+        if not style_prompt:
+            raise ValueError(f"Selected style '{style_name}' has empty prompt")
+        return style_name, style_prompt
+
     async def _determine_languages(self, text: str, ui_source_lang: Optional[str], ui_target_lang: Optional[str]) -> tuple[str, str]:
         """Determines the effective source and target languages for translation."""
         detected_lang = await self._detect_language_async(text) or "auto"
@@ -139,20 +313,44 @@ class TranslationService:
         self,
         text: str,
         ui_source_lang: Optional[str] = None,
-        ui_target_lang: Optional[str] = None,
+        ui_target_lang: Optional[Union[str, Sequence[str]]] = None,
+        on_partial: Optional[Callable[[str], None]] = None,
     ) -> TranslationResponse:
-        """Translate text asynchronously using API."""
+        """Translate text asynchronously using API.
+
+        Args:
+            text: Text to translate.
+            ui_source_lang: Source language selected in the UI (or "auto").
+            ui_target_lang: Target language selected in the UI, or a list of
+                target languages to translate into at once; the response then
+                holds the result per language in ``translations`` (partial
+                text is not streamed for several targets).
+            on_partial: Optional callback receiving text deltas while the
+                response streams in; the returned response holds the final text.
+        """
+        if ui_target_lang is not None and not isinstance(ui_target_lang, str):
+            targets = list(dict.fromkeys(lang for lang in ui_target_lang if lang))
+            if len(targets) > 1:
+                return await self._translate_multi_target_async(text, ui_source_lang, targets)
+            ui_target_lang = targets[0] if targets else None
 
         logger.info(f"Starting translation for text: '{text[:30]}...'")
         source_lang = ui_source_lang
         target_lang = ui_target_lang
 
         try:
+            # Pick the provider once so the cache key, prompt and model all match it
+            provider = self._active_provider(MODE_TRANSLATE)
+            cache_key = self._translation_cache_key(text, ui_source_lang, ui_target_lang, provider)
+            cached = self._lookup_cache(cache_key)
+            if cached is not None:
+                return cached
+
             # Determine languages using the new helper
             source_lang, target_lang = await self._determine_languages(text, ui_source_lang, ui_target_lang)
 
             # Get the active model once
-            intended_model = self._get_active_model()
+            intended_model = self._get_active_model(provider)
 
             # Prepare and execute translation request
             current_settings = config_service.get_settings()
@@ -162,15 +360,17 @@ class TranslationService:
                 target_lang=target_lang,
                 system_prompt=current_settings.system_prompt,
                 model=intended_model,
+                provider=provider,
             )
 
-            response = await self._call_gpt_api_async(request)
+            response = await self._translate_with_memory(request, on_partial)
 
             # Validate response
             if not response.success:
                 logger.error(f"Invalid translation response format: {response}")
                 raise ValueError("Invalid translation response format")
 
+            self._store_cache(cache_key, response)
             return response
 
         except RetryError as e:
@@ -194,39 +394,231 @@ class TranslationService:
                 target_lang=target_lang,
             )
 
+    async def _translate_multi_target_async(
+        self, text: str, ui_source_lang: Optional[str], target_langs: List[str]
+    ) -> TranslationResponse:
+        """Translate text into several target languages.
+
+        LLM providers get one request returning a tagged translation per
+        language; languages missing from it are requested on their own. DeepL
+        translates each language with concurrent requests over the pooled
+        connection. Cached languages are not requested again.
+        """
+        logger.info(f"Starting translation into {', '.join(target_langs)} for text: '{text[:30]}...'")
+        results: Dict[str, TranslationResponse] = {}
+        source_lang = ui_source_lang or "auto"
+        try:
+            provider = self._active_provider(MODE_TRANSLATE)
+            cache_keys = {
+                lang: self._translation_cache_key(text, ui_source_lang, lang, provider, auto_swap=False)
+                for lang in target_langs
+            }
+            pending = []
+            for lang in target_langs:
+                cached = self._lookup_cache(cache_keys[lang])
+                if cached is not None:
+                    results[lang] = cached
+                else:
+                    pending.append(lang)
+
+            if pending:
+                source_lang, _ = await self._determine_languages(text, ui_source_lang, pending[0])
+                request = TranslationRequest(
+                    text=text,
+                    source_lang=source_lang,
+                    target_lang=pending[0],
+                    system_prompt=config_service.get_settings().system_prompt,
+                    model=self._get_active_model(provider),
+                    provider=provider,
+                )
+                fetched: Dict[str, TranslationResponse] = {}
+                if is_llm_provider(provider) and len(pending) > 1:
+                    fetched = await self._request_multi_target_async(request, pending)
+
+                missing = [lang for lang in pending if lang not in fetched]
+                if fetched and missing:
+                    logger.warning(f"Multi-target response lacks {', '.join(missing)}; requesting them separately")
+                responses = await asyncio.gather(
+                    *(self._request_translation_async(replace(request, target_lang=lang)) for lang in missing),
+                    return_exceptions=True,
+                )
+                for lang, response in zip(missing, responses):
+                    if isinstance(response, BaseException):
+                        if isinstance(response, RetryError):
+                            response = response.last_attempt.exception() or response
+                        logger.error(f"Translation into {lang} failed: {response}")
+                        response = self._make_response(
+                            success=False, error_message=str(response), source_lang=source_lang, target_lang=lang
+                        )
+                    fetched[lang] = response
+
+                for lang in pending:
+                    results[lang] = fetched[lang]
+                    self._store_cache(cache_keys[lang], fetched[lang])
+
+        except Exception as e:
+            logger.error(f"Translation failed: {e}")
+            return self._make_response(success=False, error_message=str(e), source_lang=source_lang)
+
+        translations = {lang: results[lang] for lang in target_langs}
+        succeeded = [lang for lang, response in translations.items() if response.success]
+        failed = [f"{lang}: {response.error_message}" for lang, response in translations.items() if not response.success]
+        combined = self._make_response(
+            success=bool(succeeded),
+            translated_text="\n\n".join(f"[{lang.upper()}]\n{translations[lang].translated_text}" for lang in succeeded),
+            error_message="; ".join(failed),
+            source_lang=source_lang,
+            target_lang=",".join(target_langs),
+            model=next((translations[lang].model for lang in succeeded), ""),
+            tokens_used=sum(response.tokens_used for response in translations.values()),
+        )
+        combined.translations = translations
+        return combined
+
+    async def _request_multi_target_async(
+        self, request: TranslationRequest, target_langs: List[str]
+    ) -> Dict[str, TranslationResponse]:
+        """Send one LLM request for all target languages and split the tagged result.
+
+        Returns:
+            Responses for the languages found in the result (may be fewer than requested).
+        """
+        messages = [
+            {"role": "system", "content": request.system_prompt},
+            {"role": "user", "content": format_multi_target_prompt(request, target_langs)},
+        ]
+        max_completion_tokens = None
+        if config_service.get_setting("adaptive_completion_tokens") is not False:
+            max_completion_tokens = get_completion_budget(request.model, messages, MODE_TRANSLATE, len(target_langs))
+        response, final_model = await self._api_manager.make_translation_request_async(
+            messages=messages,
+            model_hint=request.model,
+            max_completion_tokens=max_completion_tokens,
+            provider_name=request.provider,
+        )
+
+        translations = parse_multi_target_response(response.choices[0].message.content, target_langs)
+        tokens_used = response.usage.total_tokens if response.usage else 0
+        return {
+            lang: self._make_response(
+                success=True,
+                translated_text=translated_text,
+                source_lang=request.source_lang,
+                target_lang=lang,
+                model=final_model,
+                # The shared request's usage is reported once
+                tokens_used=tokens_used if index == 0 else 0,
+            )
+            for index, (lang, translated_text) in enumerate(translations.items())
+        }
+
+    async def translate_many_async(
+        self,
+        texts: List[str],
+        ui_source_lang: Optional[str] = None,
+        ui_target_lang: Optional[str] = None,
+    ) -> List[TranslationResponse]:
+        """Translate several independent texts.
+
+        With DeepL the uncached texts go out as one batch, split only where the
+        request limits require it, and each response's ``source_lang`` is the
+        language DeepL detected for that text when the source is "auto". LLM
+        providers translate the texts concurrently (bounded) one by one.
+
+        Args:
+            texts: Texts to translate.
+            ui_source_lang: Source language selected in the UI (or "auto").
+            ui_target_lang: Target language selected in the UI.
+
+        Returns:
+            One response per text, in order.
+        """
+        provider = self._active_provider(MODE_TRANSLATE)
+        if is_llm_provider(provider):
+            limit = self._get_int_setting("translation_max_parallel_chunks", DEFAULT_MAX_PARALLEL_CHUNKS)
+            semaphore = asyncio.Semaphore(max(1, limit))
+
+            async def translate(text: str) -> TranslationResponse:
+                async with semaphore:
+                    return await self.translate_text_async(text, ui_source_lang, ui_target_lang)
+
+            return list(await asyncio.gather(*(translate(text) for text in texts)))
+
+        source_lang = ui_source_lang or "auto"
+        target_lang = ui_target_lang or getattr(config_service.get_settings(), "ui_target_language", "en")
+        responses: List[Optional[TranslationResponse]] = [None] * len(texts)
+        cache_keys = [self._translation_cache_key(text, ui_source_lang, ui_target_lang, provider) for text in texts]
+        pending = []
+        for index, (text, key) in enumerate(zip(texts, cache_keys)):
+            if not text.strip():
+                responses[index] = self._make_response(
+                    success=True, translated_text="", source_lang=source_lang, target_lang=target_lang
+                )
+                continue
+            responses[index] = self._lookup_cache(key)
+            if responses[index] is None:
+                pending.append(index)
+
+        if pending:
+            request = TranslationRequest(
+                text="",
+                source_lang=source_lang,
+                target_lang=target_lang,
+                system_prompt="",
+                model=get_deepl_identifier(),
+                provider=provider,
+            )
+            try:
+                results = await self._request_translation_batch_async(request, [texts[i] for i in pending])
+            except Exception as e:
+                # Unwrap the original exception from a RetryError
+                original_error = e.last_attempt.exception() if isinstance(e, RetryError) else None
+                error_msg = str(original_error or e)
+                logger.error(f"Batch translation failed: {error_msg}")
+                for index in pending:
+                    responses[index] = self._make_response(
+                        success=False, error_message=error_msg, source_lang=source_lang, target_lang=target_lang
+                    )
+                return responses
+            for index, (translated_text, detected) in zip(pending, results):
+                responses[index] = self._make_response(
+                    success=True,
+                    translated_text=translated_text,
+                    source_lang=(detected or "").lower() or source_lang,
+                    target_lang=target_lang,
+                    model=request.model,
+                )
+                self._store_cache(cache_keys[index], responses[index])
+        return responses
+
     async def style_text_async(
         self,
         text: str,
         style_name: str,
+        on_partial: Optional[Callable[[str], None]] = None,
     ) -> TranslationResponse:
-        """Rewrite text in a selected style using the same API pipeline as translation."""
+        """Rewrite text in a selected style using the same API pipeline as translation.
+
+        Args:
+            text: Text to rewrite.
+            style_name: Name of the style preset.
+            on_partial: Optional callback receiving text deltas while the
+                response streams in; the returned response holds the final text.
+        """
         logger.info(f"Starting style rewrite for text: '{text[:30]}...' with style '{style_name}'")
 
         try:
-            # Get the active model once
-            intended_model = self._get_active_model()
+            # Get the provider and its model once
+            provider = self._active_provider(MODE_STYLE)
+            intended_model = self._get_active_model(provider)
 
             # Resolve style preset
-            settings = config_service.get_settings()
-            styles = getattr(settings, "text_styles", []) or []
-            style_entry = None
-            for s in styles:
-                try:
-                    if (s.get("name") or "").strip().lower() == style_name.strip().lower():
-                        style_entry = s
-                        break
-                except Exception:
-                    continue
-            if not style_entry and styles:
-                style_entry = styles[0]  # fallback to first preset if provided style not found
-                logger.warning(f"Style '{style_name}' not found. Falling back to preset '{style_entry.get('name','')}'.")
-                style_name = style_entry.get("name", style_name)
-            if not style_entry:
-                raise ValueError("No style presets configured. Please add styles in settings.")
-
-            style_prompt = style_entry.get("prompt", "").strip()
-            if not style_prompt:
-                raise ValueError(f"Selected style '{style_name}' has empty prompt")
+            style_name, style_prompt = self._resolve_style(style_name)
+
+            cache_key = self._style_cache_key(text, style_name, style_prompt, provider)
+            cached = self._lookup_cache(cache_key)
+            if cached is not None:
+                return cached
 
             request = StyleRequest(
                 text=text,
@@ -249,38 +641,42 @@ class TranslationService:
                 )
 
             # Enforce "respond in the same language as input" policy for stylist mode
-            detected_lang = await self._detect_language_async(text)
-            language_policy_lines = [
-                "Important language policy:",
-                "- Detect the input language and return the rewritten text in the same language.",
-                "- Do not translate into another language.",
-                "- Output only the rewritten text without explanations.",
-            ]
-            if detected_lang:
-                language_policy_lines.append(f"- Input language code: {detected_lang}. Respond in {detected_lang}.")
-
-            language_policy = "\n".join(language_policy_lines)
+            language_policy = self._style_language_policy(await self._detect_language_async(text))
 
             messages = [
                 {"role": "system", "content": f"{style_prompt}\n\n{language_policy}"},
                 {"role": "user", "content": format_style_prompt(request)},
             ]
 
-            response, final_model = self._api_manager.make_translation_request(
-                messages=messages, model_hint=intended_model
-            )
+            if on_partial is not None and self._is_streaming_enabled():
+                stream = await self._api_manager.make_translation_stream_async(
+                    messages=messages, model_hint=intended_model, completion_mode=MODE_STYLE, provider_name=provider
+                )
+                async for delta in stream:
+                    on_partial(delta)
+                raw_text, tokens_used = await self._complete_truncated_stream(
+                    stream, messages, intended_model, MODE_STYLE, provider_name=provider
+                )
+                final_model = stream.model
+            else:
+                response, final_model = await self._api_manager.make_translation_request_async(
+                    messages=messages, model_hint=intended_model, completion_mode=MODE_STYLE, provider_name=provider
+                )
+                raw_text = response.choices[0].message.content
+                tokens_used = response.usage.total_tokens if response.usage else 0
 
-            raw_text = response.choices[0].message.content
             styled_text = parse_gpt_response(raw_text).strip()
 
-            return self._make_response(
+            result = self._make_response(
                 success=True,
                 translated_text=styled_text,
                 source_lang="style",
                 target_lang=style_name,
                 model=final_model,
-                tokens_used=response.usage.total_tokens if response.usage else 0,
+                tokens_used=tokens_used,
             )
+            self._store_cache(cache_key, result)
+            return result
 
         except RetryError as e:
             # Unwrap the original exception from the RetryError
@@ -303,6 +699,134 @@ class TranslationService:
                 target_lang=style_name,
             )
 
+    async def style_many_async(self, text: str, style_names: Sequence[str]) -> List[TranslationResponse]:
+        """Rewrite text in several style presets with a single request.
+
+        LLM providers get one request returning a tagged rewrite per preset,
+        with the language policy detected and stated once. Presets missing
+        from the answer or with an empty rewrite are requested on their own;
+        cached rewrites are not requested again.
+
+        Args:
+            text: Text to rewrite.
+            style_names: Names of the style presets.
+
+        Returns:
+            One response per style name, in the given order.
+        """
+        logger.info(f"Starting style rewrite for text: '{text[:30]}...' with styles {list(style_names)}")
+        results: Dict[str, TranslationResponse] = {}
+        resolved_names: List[str] = list(style_names)
+        error_msg = "Styling failed"
+
+        try:
+            provider = self._active_provider(MODE_STYLE)
+            intended_model = self._get_active_model(provider)
+
+            styles: Dict[str, str] = {}
+            resolved_names = []
+            for style_name in style_names:
+                resolved_name, style_prompt = self._resolve_style(style_name)
+                resolved_names.append(resolved_name)
+                styles.setdefault(resolved_name, style_prompt)
+
+            cache_keys = {name: self._style_cache_key(text, name, prompt, provider) for name, prompt in styles.items()}
+            pending = []
+            for name in styles:
+                cached = self._lookup_cache(cache_keys[name])
+                if cached is not None:
+                    results[name] = cached
+                else:
+                    pending.append(name)
+
+            if (
+                len(pending) > 1
+                and is_llm_provider(provider)
+                and self._api_manager.is_initialized()
+                and self._api_manager.has_clients()
+            ):
+                fetched = await self._request_multi_style_async(
+                    text, [(name, styles[name]) for name in pending], intended_model, provider
+                )
+                for name, response in fetched.items():
+                    results[name] = response
+                    self._store_cache(cache_keys[name], response)
+
+                missing = [name for name in pending if name not in fetched]
+                if missing:
+                    logger.warning(f"Multi-style response lacks {', '.join(missing)}; requesting them separately")
+            else:
+                missing = pending
+
+            # style_text_async reports its own failures and caches its results
+            responses = await asyncio.gather(*(self.style_text_async(text, name) for name in missing))
+            results.update(zip(missing, responses))
+
+        except RetryError as e:
+            # Unwrap the original exception from the RetryError
+            original_error = e.last_attempt.exception()
+            error_msg = str(original_error) if original_error else str(e)
+            logger.error(f"Styling failed (retries exhausted): {error_msg}")
+            results = {}
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Styling failed: {e}")
+            results = {}
+
+        return [
+            results.get(name)
+            or self._make_response(success=False, error_message=error_msg, source_lang="style", target_lang=name)
+            for name in resolved_names
+        ]
+
+    async def _request_multi_style_async(
+        self, text: str, styles: List[Tuple[str, str]], model: str, provider: str
+    ) -> Dict[str, TranslationResponse]:
+        """Send one LLM request for all style presets and split the tagged result.
+
+        Args:
+            styles: (name, prompt) pairs of the presets to rewrite in.
+
+        Returns:
+            Responses for the styles found in the result (may be fewer than requested).
+        """
+        language_policy = self._style_language_policy(await self._detect_language_async(text), tagged=True)
+        request = StyleRequest(
+            text=text,
+            style_name=", ".join(name for name, _ in styles),
+            style_prompt=format_multi_style_prompt(styles),
+            model=model,
+        )
+        messages = [
+            {"role": "system", "content": f"{request.style_prompt}\n\n{language_policy}"},
+            {"role": "user", "content": format_style_prompt(request)},
+        ]
+        max_completion_tokens = None
+        if config_service.get_setting("adaptive_completion_tokens") is not False:
+            max_completion_tokens = get_completion_budget(model, messages, MODE_STYLE, len(styles))
+        response, final_model = await self._api_manager.make_translation_request_async(
+            messages=messages,
+            model_hint=model,
+            completion_mode=MODE_STYLE,
+            max_completion_tokens=max_completion_tokens,
+            provider_name=provider,
+        )
+
+        rewrites = parse_multi_style_response(response.choices[0].message.content, [name for name, _ in styles])
+        tokens_used = response.usage.total_tokens if response.usage else 0
+        return {
+            name: self._make_response(
+                success=True,
+                translated_text=styled_text,
+                source_lang="style",
+                target_lang=name,
+                model=final_model,
+                # The shared request's usage is reported once
+                tokens_used=tokens_used if index == 0 else 0,
+            )
+            for index, (name, styled_text) in enumerate(rewrites.items())
+        }
+
     def detect_language_sync(self, text: str) -> Optional[str]:
         """Detect language of the input text synchronously."""
         try:
@@ -311,6 +835,26 @@ class TranslationService:
             logger.warning(f"Language detection failed: {e}")
             return None
 
+    @staticmethod
+    def _style_language_policy(detected_lang: Optional[str], tagged: bool = False) -> str:
+        """Build the stylist instruction to answer in the language of the input.
+
+        Args:
+            detected_lang: Detected input language code, if any.
+            tagged: Whether the answer holds tagged rewrites of several styles.
+        """
+        language_policy_lines = [
+            "Important language policy:",
+            "- Detect the input language and return the rewritten text in the same language.",
+            "- Do not translate into another language.",
+            "- Output only the tagged rewrites without explanations."
+            if tagged
+            else "- Output only the rewritten text without explanations.",
+        ]
+        if detected_lang:
+            language_policy_lines.append(f"- Input language code: {detected_lang}. Respond in {detected_lang}.")
+        return "\n".join(language_policy_lines)
+
     async def _detect_language_async(self, text: str) -> Optional[str]:
         """Detect language of the input text asynchronously."""
         try:
@@ -320,8 +864,17 @@ class TranslationService:
             logger.warning(f"Language detection failed: {e}")
             return None
 
-    async def _call_gpt_api_async(self, request: TranslationRequest) -> TranslationResponse:
-        """Make actual API call using the API manager's logic."""
+    async def _call_gpt_api_async(
+        self,
+        request: TranslationRequest,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> TranslationResponse:
+        """Make actual API call using the API manager's logic.
+
+        Texts that exceed the chunk token budget are split at paragraph/sentence
+        boundaries and the chunks are translated concurrently. Single-chunk
+        requests are streamed to ``on_partial`` when streaming is enabled.
+        """
         if not self._api_manager.is_initialized():
             raise RuntimeError("API manager not initialized")
 
@@ -336,43 +889,238 @@ class TranslationService:
                 model=(request.model or ""),
             )
 
+        chunks = split_text_into_chunks(request.text, self._chunk_token_budget(request.model, request.provider))
+        if len(chunks) > 1 and not is_llm_provider(self._request_provider(request)):
+            return await self._translate_chunks_batched_async(request, chunks, on_partial)
+        if len(chunks) > 1:
+            return await self._translate_chunks_async(request, chunks, on_partial)
+
+        if on_partial is not None and self._is_streaming_enabled():
+            return await self._request_translation_stream_async(request, on_partial)
+        return await self._request_translation_async(request)
+
+    def _get_int_setting(self, key: str, default: int) -> int:
+        """Read an integer setting, falling back to a default for missing/invalid values."""
         try:
-            # Determine provider and prepare request accordingly
-            provider_name = (config_service.get_setting("api_provider") or "openai").strip().lower()
-
-            if not is_llm_provider(provider_name):
-                # Non-LLM flow (e.g., DeepL): no system prompts; send raw user text and pass langs explicitly
-                messages = [
-                    {"role": "user", "content": request.text},
-                ]
-                # Map 'auto' to None to let DeepL auto-detect
-                source_arg = None if (request.source_lang or "auto") == "auto" else request.source_lang
-                target_arg = request.target_lang
-
-                response, final_model = self._api_manager.make_translation_request(
-                    messages=messages,
-                    model_hint=get_deepl_identifier(),
-                    target_lang=target_arg,
-                    source_lang=source_arg,
-                )
+            return int(getattr(config_service.get_settings(), key, default))
+        except (TypeError, ValueError):
+            return default
 
-                raw_text = response.choices[0].message.content
-                translated_text = (raw_text or "").strip()
-            else:
-                # LLM flow (OpenAI/Google): use system prompt + formatted user prompt
-                messages = [
-                    {"role": "system", "content": request.system_prompt},
-                    {"role": "user", "content": format_translation_prompt(request)},
-                ]
-
-                # Delegate provider selection, model adjustment, and API call to the manager
-                response, final_model = self._api_manager.make_translation_request(
-                    messages=messages, model_hint=request.model
-                )
+    def _chunk_token_budget(self, model: Optional[str], provider: Optional[str] = None) -> int:
+        """Return the estimated input token budget per chunk for the provider/model.
 
-                # Extract translation from response
-                raw_text = response.choices[0].message.content
+        Args:
+            model: Model of the request.
+            provider: Provider of the request instead of the selected one.
+        """
+        budget = self._get_int_setting("translation_chunk_max_tokens", DEFAULT_CHUNK_MAX_TOKENS)
+        provider = (provider or config_service.get_setting("api_provider") or "openai").strip().lower()
+        if is_llm_provider(provider):
+            # The translation is about as long as its source; keep it within the completion limit
+            budget = min(budget, get_model_max_completion_tokens(model) // 2)
+        return max(1, budget)
+
+    async def _translate_chunks_async(
+        self,
+        request: TranslationRequest,
+        chunks: List[TextChunk],
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> TranslationResponse:
+        """Translate chunks concurrently (bounded) and reassemble them in order.
+
+        Each chunk is retried on its own, so a transient failure does not redo
+        the chunks that already succeeded. ``on_partial`` receives each chunk's
+        translation once all chunks before it are done. Only the first chunk is
+        an interactive request for the rate limiter; the others queue behind
+        requests the user is waiting on.
+        """
+        limit = self._get_int_setting("translation_max_parallel_chunks", DEFAULT_MAX_PARALLEL_CHUNKS)
+        semaphore = asyncio.Semaphore(max(1, limit))
+        total = len(chunks)
+        logger.info(f"Translating long text in {total} chunks (parallelism {limit})")
+
+        parts: List[Optional[str]] = [None] * total
+        emitted = 0
+
+        def flush_partials() -> None:
+            # Chunks finish out of order; report only the completed prefix
+            nonlocal emitted
+            while emitted < total and parts[emitted] is not None:
+                if on_partial is not None:
+                    on_partial(parts[emitted])
+                emitted += 1
+
+        async def translate_chunk(index: int, chunk: TextChunk) -> Optional[TranslationResponse]:
+            response = None
+            if chunk.text.strip():
+                chunk_request = replace(request, text=chunk.text)
+                priority = PRIORITY_INTERACTIVE if index == 0 else PRIORITY_BACKGROUND
+                async with semaphore:
+                    with request_priority(priority):
+                        for attempt in range(1, CHUNK_MAX_ATTEMPTS + 1):
+                            try:
+                                response = await self._request_translation_async(chunk_request)
+                                break
+                            except RequestCancelledError:
+                                raise
+                            except (RetryableAPIError, RetryError) as e:
+                                # Only transient failures are worth another attempt
+                                if attempt == CHUNK_MAX_ATTEMPTS:
+                                    raise
+                                logger.warning(
+                                    f"Chunk {index + 1}/{total} failed (attempt {attempt}): {e}; retrying chunk"
+                                )
+            text = response.translated_text if response is not None else chunk.text
+            parts[index] = text + chunk.separator
+            flush_partials()
+            return response
+
+        responses = await asyncio.gather(*(translate_chunk(i, chunk) for i, chunk in enumerate(chunks)))
+
+        final_model = request.model
+        tokens_used = 0
+        for response in responses:
+            if response is None:
+                continue
+            tokens_used += response.tokens_used
+            final_model = response.model or final_model
+
+        return self._make_response(
+            success=True,
+            translated_text="".join(parts).strip(),
+            source_lang=request.source_lang,
+            target_lang=request.target_lang,
+            model=final_model,
+            tokens_used=tokens_used,
+        )
+
+    async def _translate_chunks_batched_async(
+        self,
+        request: TranslationRequest,
+        chunks: List[TextChunk],
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> TranslationResponse:
+        """Translate the chunks of a long text with a single batch request (DeepL)."""
+        indexes = [i for i, chunk in enumerate(chunks) if chunk.text.strip()]
+        logger.info(f"Translating long text in {len(chunks)} chunks as one batch")
+        results = await self._request_translation_batch_async(request, [chunks[i].text for i in indexes])
+
+        translations = dict(zip(indexes, (text for text, _ in results)))
+        parts = [translations.get(i, chunk.text) + chunk.separator for i, chunk in enumerate(chunks)]
+        if on_partial is not None:
+            for part in parts:
+                on_partial(part)
+
+        return self._make_response(
+            success=True,
+            translated_text="".join(parts).strip(),
+            source_lang=request.source_lang,
+            target_lang=request.target_lang,
+            model=request.model,
+        )
+
+    async def _request_translation_batch_async(
+        self, request: TranslationRequest, texts: List[str]
+    ) -> List[tuple[str, str]]:
+        """Translate texts with one DeepL batch request.
+
+        Returns:
+            ``(translation, detected_source_language)`` per text, in order.
+        """
+        source_arg = None if (request.source_lang or "auto") == "auto" else request.source_lang
+        response, _ = await self._api_manager.make_translation_request_async(
+            messages=[],
+            model_hint=get_deepl_identifier(),
+            # Other providers cannot answer a batch, so it is never hedged
+            hedge_request=lambda provider_name: None,
+            provider_name=request.provider,
+            texts=texts,
+            target_lang=request.target_lang,
+            source_lang=source_arg,
+        )
+        if len(response.choices) != len(texts):
+            raise ValueError(f"Batch translation returned {len(response.choices)} results for {len(texts)} texts")
+        return [
+            ((choice.message.content or "").strip(), getattr(choice, "detected_source_language", "") or "")
+            for choice in response.choices
+        ]
+
+    def _build_translation_call(
+        self, request: TranslationRequest, provider_name: Optional[str] = None
+    ) -> tuple[list, str, dict, bool]:
+        """Build messages and provider arguments for a translation request.
+
+        Args:
+            request: The translation request.
+            provider_name: Provider to build the call for instead of the selected one.
+
+        Returns:
+            Tuple of (messages, model_hint, api_kwargs, is_llm).
+        """
+        # Determine provider and prepare request accordingly
+        provider_name = (provider_name or self._request_provider(request)).strip().lower()
+
+        if not is_llm_provider(provider_name):
+            # Non-LLM flow (e.g., DeepL): no system prompts; send raw user text and pass langs explicitly
+            messages = [
+                {"role": "user", "content": request.text},
+            ]
+            # Map 'auto' to None to let DeepL auto-detect
+            source_arg = None if (request.source_lang or "auto") == "auto" else request.source_lang
+            api_kwargs = {"target_lang": request.target_lang, "source_lang": source_arg}
+            return messages, get_deepl_identifier(), api_kwargs, False
+
+        # LLM flow (OpenAI/Google): use system prompt + formatted user prompt
+        messages = [
+            {"role": "system", "content": request.system_prompt},
+            {"role": "user", "content": format_translation_prompt(request)},
+        ]
+        return messages, request.model, {}, True
+
+    @staticmethod
+    def _request_provider(request: TranslationRequest) -> str:
+        """Provider of a request: the one it was routed to, else the selected one."""
+        return (request.provider or config_service.get_setting("api_provider") or "openai").strip().lower()
+
+    def _hedge_request(self, request: TranslationRequest):
+        """Build the request for another provider when the API manager hedges a translation."""
+
+        def build(provider_name: str) -> Optional[tuple[list, str, dict]]:
+            try:
+                hedge_request = replace(request, model=self._get_active_model(provider_name), provider=provider_name)
+            except ValueError as e:
+                logger.debug(f"Cannot hedge to {provider_name}: {e}")
+                return None
+            messages, model_hint, api_kwargs, _ = self._build_translation_call(hedge_request, provider_name)
+            return messages, model_hint, api_kwargs
+
+        return build
+
+    @staticmethod
+    def _is_llm_result(model: Optional[str]) -> bool:
+        """Check whether a result came from an LLM (a hedged request may be answered by DeepL)."""
+        return model != get_deepl_identifier()
+
+    async def _request_translation_async(self, request: TranslationRequest) -> TranslationResponse:
+        """Send one translation request for the whole request text."""
+        try:
+            messages, model_hint, api_kwargs, _ = self._build_translation_call(request)
+
+            # Delegate provider selection, model adjustment, and API call to the manager
+            response, final_model = await self._api_manager.make_translation_request_async(
+                messages=messages,
+                model_hint=model_hint,
+                hedge_request=self._hedge_request(request),
+                provider_name=request.provider,
+                **api_kwargs,
+            )
+
+            # Extract translation from response
+            raw_text = response.choices[0].message.content
+            if self._is_llm_result(final_model):
                 translated_text = parse_gpt_response(raw_text).strip()
+            else:
+                translated_text = (raw_text or "").strip()
 
             return self._make_response(
                 success=True,
@@ -387,6 +1135,159 @@ class TranslationService:
             logger.error(f"API call failed: {e}")
             raise
 
+    async def _request_translation_stream_async(
+        self, request: TranslationRequest, on_partial: Callable[[str], None]
+    ) -> TranslationResponse:
+        """Send one streaming translation request, reporting text deltas as they arrive."""
+        try:
+            messages, model_hint, api_kwargs, _ = self._build_translation_call(request)
+            stream = await self._api_manager.make_translation_stream_async(
+                messages=messages,
+                model_hint=model_hint,
+                hedge_request=self._hedge_request(request),
+                provider_name=request.provider,
+                **api_kwargs,
+            )
+            async for delta in stream:
+                on_partial(delta)
+
+            raw_text, tokens_used = await self._complete_truncated_stream(
+                stream, messages, model_hint, MODE_TRANSLATE, provider_name=request.provider, **api_kwargs
+            )
+            is_llm = self._is_llm_result(stream.model)
+            translated_text = parse_gpt_response(raw_text).strip() if is_llm else raw_text.strip()
+            return self._make_response(
+                success=True,
+                translated_text=translated_text,
+                source_lang=request.source_lang,
+                target_lang=request.target_lang,
+                model=stream.model,
+                tokens_used=tokens_used,
+            )
+
+        except Exception as e:
+            logger.error(f"Streaming API call failed: {e}")
+            raise
+
+    async def _complete_truncated_stream(
+        self, stream, messages: list, model_hint: Optional[str], completion_mode: str, **api_kwargs
+    ) -> tuple[str, int]:
+        """Return the text and token usage of a consumed stream.
+
+        A stream cut off by an adaptive completion budget cannot be resumed, so
+        the request is repeated once (non-streamed) with the model's full output
+        limit; its text supersedes the partial deltas already reported.
+        """
+        cap = get_model_max_completion_tokens(stream.model)
+        if not stream.truncated or (stream.max_completion_tokens or cap) >= cap:
+            return stream.text, stream.tokens_used
+
+        logger.info(
+            f"Streamed output truncated at max_completion_tokens={stream.max_completion_tokens}; "
+            f"re-requesting with {cap}"
+        )
+        response, _ = await self._api_manager.make_translation_request_async(
+            messages=messages,
+            model_hint=model_hint,
+            completion_mode=completion_mode,
+            max_completion_tokens=cap,
+            **api_kwargs,
+        )
+        tokens_used = stream.tokens_used + (response.usage.total_tokens if response.usage else 0)
+        return response.choices[0].message.content or "", tokens_used
+
+    def _is_streaming_enabled(self) -> bool:
+        """Check whether streaming responses are enabled in settings."""
+        return bool(getattr(config_service.get_settings(), "streaming_enabled", True))
+
+    def _memory_context(self, request: TranslationRequest) -> Optional[str]:
+        """Build the translation memory context for a request, or None if memory is off."""
+        if not getattr(config_service.get_settings(), "translation_memory_enabled", True):
+            return None
+        provider = self._request_provider(request)
+        prompt = request.system_prompt if is_llm_provider(provider) else ""
+        return TranslationMemory.make_context(
+            request.source_lang, request.target_lang, provider, request.model, prompt
+        )
+
+    def _remember_segments(self, context: Optional[str], segments: List[TextChunk], translated_text: str) -> None:
+        """Store source/translation segment pairs when the translation aligns segment by segment."""
+        if context is None or not segments or not translated_text:
+            return
+        if len(segments) == 1:
+            pairs = [(segments[0].text, translated_text.strip())]
+        else:
+            translated = split_sentences(translated_text)
+            if len(translated) != len(segments):
+                logger.debug("Translation memory: segment counts differ, skipping store")
+                return
+            pairs = [(src.text, dst.text) for src, dst in zip(segments, translated)]
+        self._memory.store(pairs, context)
+
+    async def _translate_with_memory(
+        self,
+        request: TranslationRequest,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> TranslationResponse:
+        """Translate a request, reusing translation memory for known segments.
+
+        When enough segments are exact or fuzzy matches, only runs of consecutive
+        unknown segments are sent to the provider and the result is stitched back
+        together with the original separators. Otherwise the full text is sent.
+        """
+        context = self._memory_context(request)
+        segments = split_sentences(request.text) if context is not None else []
+        if not segments or not self._api_manager.has_clients():
+            return await self._call_gpt_api_async(request, on_partial)
+
+        matches = [self._memory.lookup(segment.text, context) for segment in segments]
+        reused = sum(1 for match in matches if match is not None)
+        if reused / len(segments) < MIN_MEMORY_REUSE_RATIO:
+            response = await self._call_gpt_api_async(request, on_partial)
+            if response.success:
+                self._remember_segments(context, segments, response.translated_text)
+            return response
+
+        logger.debug(f"Translation memory reuses {reused}/{len(segments)} segments")
+        parts: List[str] = []
+        tokens_used = 0
+        final_model = request.model
+        index = 0
+        while index < len(segments):
+            match = matches[index]
+            if match is not None:
+                parts.append(match.target + segments[index].separator)
+                if on_partial is not None:
+                    on_partial(parts[-1])
+                index += 1
+                continue
+
+            # Translate the whole run of consecutive unknown segments in one request
+            end = index
+            while end < len(segments) and matches[end] is None:
+                end += 1
+            run = segments[index:end]
+            run_text = join_chunks(run[:-1]) + run[-1].text
+            response = await self._call_gpt_api_async(replace(request, text=run_text), on_partial)
+            if not response.success:
+                return response
+            self._remember_segments(context, run, response.translated_text)
+            parts.append(response.translated_text + run[-1].separator)
+            if on_partial is not None and run[-1].separator:
+                on_partial(run[-1].separator)
+            tokens_used += response.tokens_used
+            final_model = response.model or final_model
+            index = end
+
+        return self._make_response(
+            success=True,
+            translated_text="".join(parts).strip(),
+            source_lang=request.source_lang,
+            target_lang=request.target_lang,
+            model=final_model,
+            tokens_used=tokens_used,
+        )
+
     def translate_text_sync(
         self,
         text: str,
@@ -394,9 +1295,12 @@ class TranslationService:
         target_lang: Optional[str] = None,
     ) -> TranslationResponse:
         """Synchronous wrapper for translate_text_async."""
+        cached = self.get_cached_translation(text, source_lang, target_lang)
+        if cached is not None:
+            return cached
         try:
-            # asyncio.run() handles the event loop management automatically.
-            return asyncio.run(
+            # Run on the shared runtime so pools and clients are reused across calls
+            return get_async_runtime().run(
                 self.translate_text_async(text, source_lang, target_lang)
             )
         except Exception as e:
@@ -408,14 +1312,35 @@ class TranslationService:
                 target_lang=target_lang,
             )
 
+    def translate_many_sync(
+        self,
+        texts: List[str],
+        source_lang: Optional[str] = None,
+        target_lang: Optional[str] = None,
+    ) -> List[TranslationResponse]:
+        """Synchronous wrapper for translate_many_async."""
+        try:
+            return get_async_runtime().run(self.translate_many_async(texts, source_lang, target_lang))
+        except Exception as e:
+            logger.error(f"Synchronous batch translation failed: {e}")
+            return [
+                self._make_response(
+                    success=False, error_message=str(e), source_lang=source_lang, target_lang=target_lang
+                )
+                for _ in texts
+            ]
+
     def style_text_sync(
         self,
         text: str,
         style_name: str,
     ) -> TranslationResponse:
         """Synchronous wrapper for style_text_async."""
+        cached = self.get_cached_style(text, style_name)
+        if cached is not None:
+            return cached
         try:
-            return asyncio.run(self.style_text_async(text, style_name))
+            return get_async_runtime().run(self.style_text_async(text, style_name))
         except Exception as e:
             logger.error(f"Synchronous styling failed: {e}")
             return self._make_response(
@@ -425,9 +1350,22 @@ class TranslationService:
                 target_lang=style_name,
             )
 
+    def style_many_sync(self, text: str, style_names: Sequence[str]) -> List[TranslationResponse]:
+        """Synchronous wrapper for style_many_async."""
+        try:
+            return get_async_runtime().run(self.style_many_async(text, style_names))
+        except Exception as e:
+            logger.error(f"Synchronous styling failed: {e}")
+            return [
+                self._make_response(success=False, error_message=str(e), source_lang="style", target_lang=style_name)
+                for style_name in style_names
+            ]
+
     def shutdown(self):
         """Shutdown the translation service."""
         self._is_initialized = False
+        self._result_cache.close()
+        self._memory.close()
         logger.info("Translation service shutdown")
 
 
@@ -28,6 +28,7 @@ from ..services.config_service import SettingsObserver, config_service
 from ..services.theme_service import ThemeService
 from ..services.translation_service import get_translation_service
 from ..core.api_manager import get_api_manager
+from ..core.async_runtime import get_async_runtime
 from ..core.config import BUILD_OCR_ENABLED
 
 # UI service extracted to manage window/overlay lifecycle
@@ -241,9 +242,17 @@ class QtApp(QObject, SettingsObserver):
         self._handle_ocr_setting_change(key, old_value, new_value)
         self._handle_notification_setting_change(key, old_value, new_value)
         
+    def _warm_up_if_idle(self):
+        """Re-warm provider connections when a hotkey follows an idle period."""
+        try:
+            get_api_manager().warm_up_if_idle()
+        except Exception as e:
+            logger.debug(f"Connection warm-up skipped: {e}")
+
     def _on_translate_hotkey(self):
         """Handle main translation hotkey press."""
         logger.info("Main translation hotkey pressed")
+        self._warm_up_if_idle()
         translate_hotkey = config_service.get_setting("translate_hotkey")
         logger.debug(f"Hotkey: {translate_hotkey}")
 
@@ -252,6 +261,7 @@ class QtApp(QObject, SettingsObserver):
     def _on_quick_translate_hotkey(self):
         """Handle quick translation hotkey press - shows overlay translator window."""
         logger.info("Quick translation hotkey pressed - showing overlay translator")
+        self._warm_up_if_idle()
         quick_translate_hotkey = config_service.get_setting("quick_translate_hotkey")
         logger.debug(f"Hotkey: {quick_translate_hotkey}")
         self.toggle_overlay_signal.emit()
@@ -262,6 +272,7 @@ class QtApp(QObject, SettingsObserver):
         Added: API key presence check and structured performance logging.
         """
         logger.info("Copy-translate hotkey pressed (simulated copy handler)")
+        self._warm_up_if_idle()
         if self.copy_translator:
             try:
                 self.copy_translator.run()
@@ -458,6 +469,8 @@ class QtApp(QObject, SettingsObserver):
         global_services = [
             (get_translation_service(), "translation service"),
             (get_api_manager(), "API manager"),
+            # Last: the services above may still have work on the shared loop
+            (get_async_runtime(), "async runtime"),
         ]
 
         for service, name in global_services:
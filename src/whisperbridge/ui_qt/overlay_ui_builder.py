@@ -37,6 +37,7 @@ from PySide6.QtWidgets import (
     QToolButton,
     QSizePolicy,
     QSpacerItem,
+    QTabBar,
     QTextEdit,
     QVBoxLayout,
 )
@@ -1070,6 +1071,12 @@ class OverlayUIBuilder:
 
         self._translated_label, _ = self._create_widget_from_config('label', 'translation', QLabel)
 
+        # One tab per target language; shown only when several languages were translated
+        self._target_tabs = QTabBar()
+        self._target_tabs.setObjectName("targetTabs")
+        self._target_tabs.setDocumentMode(True)
+        self._target_tabs.setVisible(False)
+
     def _create_panels(self, owner):
         """Create panel widgets for organizing buttons and text areas."""
         self._original_buttons = [self._translate_btn, self._clear_original_btn, self._copy_original_btn]
@@ -1085,7 +1092,7 @@ class OverlayUIBuilder:
         Ownership is transferred to the overlay window, which manages signals, layout, and lifecycle.
         
         Returns:
-            OverlayUIComponents: Dataclass containing all 35 UI components
+            OverlayUIComponents: Dataclass containing all 36 UI components
         """
         # Create main UI widgets
         info_row = self._create_info_row()
@@ -1133,6 +1140,7 @@ class OverlayUIBuilder:
             translated_label=self._translated_label,
             original_panel=self._original_panel,
             translated_panel=self._translated_panel,
+            target_tabs=self._target_tabs,
             
             # Action buttons
             translate_btn=self._translate_btn,
@@ -17,6 +17,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QSpacerItem,
+    QTabBar,
     QTextEdit,
     QToolButton,
 )
@@ -36,7 +37,7 @@ class OverlayUIComponents:
     This follows the Data Transfer Object pattern for better
     separation of concerns and improved testability.
     
-    Total: 35 fields organized into logical groups.
+    Total: 36 fields organized into logical groups.
     """
     
     # === Layout containers (3 fields) ===
@@ -59,12 +60,13 @@ class OverlayUIComponents:
     original_label: QLabel
     language_spacer: QSpacerItem
     
-    # === Text panels (5 fields) ===
+    # === Text panels (6 fields) ===
     original_text: QTextEdit
     translated_text: QTextEdit
     translated_label: QLabel
     original_panel: "PanelWidget"
     translated_panel: "PanelWidget"
+    target_tabs: QTabBar
     
     # === Action buttons (8 fields) ===
     translate_btn: QPushButton
@@ -23,6 +23,7 @@ from PySide6.QtWidgets import (
     QMenu,
 )
 
+from ..core.api_manager import get_api_manager
 from ..services.config_service import config_service, SettingsObserver
 from ..utils.language_utils import detect_language, get_language_name
 from ..core.config import (
@@ -71,6 +72,8 @@ class OverlayWindow(StyledOverlayWindow):
         self._translator_settings_dialog = None
         self._translation_start_time = None
         self._translation_error_handled = False
+        self._streaming_started = False
+        self._request_status_text = "Request sent"
 
         # Animation state for loading spinner + dots
         self._loading_timer: Optional[QTimer] = None
@@ -110,6 +113,8 @@ class OverlayWindow(StyledOverlayWindow):
         self.translated_label = ui.translated_label
         self.original_panel = ui.original_panel
         self.translated_panel = ui.translated_panel
+        self.target_tabs = ui.target_tabs
+        self._target_results: dict = {}
         
         # Action buttons
         self.translate_btn = ui.translate_btn
@@ -151,6 +156,7 @@ class OverlayWindow(StyledOverlayWindow):
                 pass
         layout.addWidget(self.original_panel)
         layout.addWidget(self.translated_label)
+        layout.addWidget(self.target_tabs)
         layout.addWidget(self.translated_panel)
         layout.addWidget(self.footer_widget)
 
@@ -213,6 +219,7 @@ class OverlayWindow(StyledOverlayWindow):
         self.swap_btn.clicked.connect(self._on_swap_clicked)
         self.original_text.textChanged.connect(self._on_original_text_changed)
         self.translated_text.textChanged.connect(self._update_reader_button_state)
+        self.target_tabs.currentChanged.connect(self._on_target_tab_changed)
         if hasattr(self, "mode_combo"):
             self.mode_combo.currentIndexChanged.connect(self._on_mode_changed)
         if hasattr(self, "edit_styles_btn") and self.edit_styles_btn:
@@ -281,6 +288,9 @@ class OverlayWindow(StyledOverlayWindow):
             logger.warning("Model returned empty translation response")
             return
 
+        if self._target_results:
+            # Several target languages: show the selected tab instead of the combined text
+            result = self._target_results.get(self.target_tabs.tabData(self.target_tabs.currentIndex()), result)
         self.translated_text.setPlainText(result)
         self.ui_builder.apply_status_style(self.status_label, 'default')
         logger.info("Translation completed and inserted into translated_text")
@@ -331,6 +341,7 @@ class OverlayWindow(StyledOverlayWindow):
         if clear_error_marker:
             self._translation_error_handled = False
         self._restore_request_controls()
+        self._update_provider_badge()
 
         if refresh_api_state:
             try:
@@ -346,8 +357,11 @@ class OverlayWindow(StyledOverlayWindow):
         """Initialize request state and loading UI before starting a worker."""
         self._translation_start_time = time.time()
         self._translation_error_handled = False
-        self.status_label.setText("Request sent")
+        self._streaming_started = False
+        self._request_status_text = "Request sent"
+        self.status_label.setText(self._request_status_text)
         self.ui_builder.apply_status_style(self.status_label, 'default')
+        self._clear_target_tabs()
 
         settings = self._cached_settings
         compact = getattr(settings, "compact_view", False)
@@ -386,6 +400,21 @@ class OverlayWindow(StyledOverlayWindow):
     def _start_style_request(self, text: str, settings) -> None:
         """Start a style worker for the current request."""
         style_name = self._resolve_style_name(settings)
+        extra_styles = getattr(settings, "ui_extra_styles", None)
+        if isinstance(extra_styles, list) and extra_styles:
+            # Rewrite in the selected preset and the extra ones in a single call;
+            # names that match no preset would fall back to the first one, so they are skipped
+            presets = {
+                (style.get("name") or "").strip().lower(): style.get("name")
+                for style in getattr(settings, "text_styles", []) or []
+                if isinstance(style, dict)
+            }
+            names = {style_name.lower(): style_name}
+            for name in extra_styles:
+                if name.lower() in presets:
+                    names.setdefault(name.lower(), presets[name.lower()])
+            if len(names) > 1:
+                style_name = list(names.values())
         logger.debug(f"Style mode selected. Style='{style_name}'")
         self._style_worker, self._style_thread = self._setup_worker(StyleWorker, text, style_name)
 
@@ -393,6 +422,10 @@ class OverlayWindow(StyledOverlayWindow):
         """Start a translation worker using the current UI language selections."""
         ui_source_lang = self.source_combo.currentData()
         ui_target_lang = self.target_combo.currentData()
+        extra_targets = getattr(getattr(self, "_cached_settings", None), "ui_extra_target_languages", None)
+        if isinstance(extra_targets, list) and extra_targets:
+            # Translate into the selected language and the extra ones in a single call
+            ui_target_lang = list(dict.fromkeys([ui_target_lang, *extra_targets]))
         logger.debug(f"Translate mode selected with UI languages: source='{ui_source_lang}', target='{ui_target_lang}'")
         self._translation_worker, self._translation_thread = self._setup_worker(
             TranslationWorker,
@@ -580,9 +613,23 @@ class OverlayWindow(StyledOverlayWindow):
             }
             display_name, prop_value = provider_map[provider]
 
-            self.provider_badge.setText(display_name)
+            # Reflect the provider's circuit breaker (open while it is not responding)
+            circuit = "closed"
+            try:
+                circuit = get_api_manager().get_circuit_state(provider)
+            except Exception as e:
+                logger.debug(f"Failed to read circuit state: {e}")
+            tooltips = {
+                "open": f"{display_name} is not responding; requests fail fast until it answers again.",
+                "half_open": f"Checking whether {display_name} is responding again.",
+            }
+
+            self.provider_badge.setText(display_name if circuit == "closed" else f"{display_name} !")
             self.provider_badge.setProperty("provider", prop_value)
-            self.provider_badge.setToolTip(f"Using {display_name}. Click to change provider.")
+            self.provider_badge.setProperty("circuit", circuit)
+            self.provider_badge.setToolTip(
+                f"{tooltips.get(circuit, f'Using {display_name}.')} Click to change provider."
+            )
 
             # Force style refresh to apply QSS
             self.provider_badge.style().unpolish(self.provider_badge)
@@ -1003,6 +1050,43 @@ class OverlayWindow(StyledOverlayWindow):
             logger.error(f"Failed to persist swap: {e}")
 
 
+    def _clear_target_tabs(self) -> None:
+        """Drop per-tab results (languages or style presets) of the previous request and hide the tabs."""
+        self._target_results = {}
+        self.target_tabs.blockSignals(True)
+        while self.target_tabs.count():
+            self.target_tabs.removeTab(0)
+        self.target_tabs.blockSignals(False)
+        self.target_tabs.setVisible(False)
+
+    def _on_translations_ready(self, translations: dict) -> None:
+        """Show one tab per target language; the first (selected) language is shown first."""
+        self._show_result_tabs(translations, lambda lang: str(lang).upper())
+
+    def _on_styles_ready(self, styles: dict) -> None:
+        """Show one tab per style preset; the first (selected) preset is shown first."""
+        self._show_result_tabs(styles, str)
+
+    def _show_result_tabs(self, results: dict, label) -> None:
+        """Show one tab per result key (labelled by ``label``) when there are several results."""
+        self._clear_target_tabs()
+        if len(results) < 2:
+            return
+        self._target_results = dict(results)
+        self.target_tabs.blockSignals(True)
+        for key in results:
+            index = self.target_tabs.addTab(label(key))
+            self.target_tabs.setTabData(index, key)
+        self.target_tabs.setCurrentIndex(0)
+        self.target_tabs.blockSignals(False)
+        self.target_tabs.setVisible(True)
+
+    def _on_target_tab_changed(self, index: int) -> None:
+        """Show the result of the selected target language or style preset tab."""
+        key = self.target_tabs.tabData(index)
+        if key in self._target_results:
+            self.translated_text.setPlainText(self._target_results[key])
+
     def _on_swap_clicked(self):
         """Swap button behavior"""
         self._perform_language_swap()
@@ -1015,6 +1099,15 @@ class OverlayWindow(StyledOverlayWindow):
 
         worker.finished.connect(self._on_translation_finished)
         worker.error.connect(self._on_translation_error)
+        partial_signal = getattr(worker, "partial", None)
+        if partial_signal is not None:
+            partial_signal.connect(self._on_translation_partial)
+        translations_signal = getattr(worker, "translations", None)
+        if translations_signal is not None:
+            translations_signal.connect(self._on_translations_ready)
+        styles_signal = getattr(worker, "styles", None)
+        if styles_signal is not None:
+            styles_signal.connect(self._on_styles_ready)
         thread.started.connect(worker.run)
 
         worker.finished.connect(thread.quit)
@@ -1037,7 +1130,7 @@ class OverlayWindow(StyledOverlayWindow):
         watchdog.setSingleShot(True)
         watchdog_active = [True]  # Mutable flag for closure
         
-        def _force_thread_termination():
+        def _cancel_stalled_request():
             if not watchdog_active[0]:
                 return
             try:
@@ -1047,21 +1140,19 @@ class OverlayWindow(StyledOverlayWindow):
                 
                 # Disconnect self to prevent re-entry
                 try:
-                    watchdog.timeout.disconnect(_force_thread_termination)
+                    watchdog.timeout.disconnect(_cancel_stalled_request)
                 except (RuntimeError, TypeError):
                     pass
-                    
-                logger.error(f"Watchdog timeout: forcing thread termination after {watchdog_timeout}s")
+
+                # Cancelling aborts the HTTP request, so the thread finishes on its own
+                logger.error(f"Watchdog timeout: cancelling request after {watchdog_timeout}s")
+                try:
+                    worker.request_cancel()
+                except (AttributeError, RuntimeError) as e:
+                    logger.debug(f"Watchdog could not cancel worker: {e}")
                 thread.quit()
-                thread.wait(1000)
-                if thread.isRunning():
-                    logger.warning("Thread still running after quit, forcing termination")
-                    thread.terminate()
-                    thread.wait(1000)
-                    if thread.isRunning():
-                        logger.error("Thread still running after terminate! System instability possible.")
             except Exception as e:
-                logger.error(f"Exception during watchdog thread termination: {e}")
+                logger.error(f"Exception during watchdog cancellation: {e}")
         
         def cleanup_watchdog():
             """Stop watchdog and clean up resources."""
@@ -1089,7 +1180,7 @@ class OverlayWindow(StyledOverlayWindow):
             except Exception as e:
                 logger.debug(f"Watchdog cleanup error: {e}")
         
-        watchdog.timeout.connect(_force_thread_termination)
+        watchdog.timeout.connect(_cancel_stalled_request)
         
 
         
@@ -1155,6 +1246,22 @@ class OverlayWindow(StyledOverlayWindow):
         finally:
             self._finalize_translation_request(success=success, refresh_api_state=False)
 
+    def _on_translation_partial(self, delta: str):
+        """Append a streamed text delta to translated_text while the request is running."""
+        if self._translation_start_time is None:
+            return  # Request already finished or cancelled
+
+        if not self._streaming_started:
+            self._streaming_started = True
+            self._request_status_text = "Receiving"
+            self.translated_text.setPlainText("")
+            elapsed = time.time() - self._translation_start_time
+            logger.debug(f"First streamed text received after {elapsed:.2f}s")
+
+        cursor = self.translated_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(delta)
+
     def _on_translation_error(self, error_message: str):
         """Handle error from background translation."""
         self._translation_error_handled = True
@@ -1176,7 +1283,12 @@ class OverlayWindow(StyledOverlayWindow):
             for signal, handler in (
                 (worker.finished, self._on_translation_finished),
                 (worker.error, self._on_translation_error),
+                (worker.partial, self._on_translation_partial),
+                (getattr(worker, "translations", None), self._on_translations_ready),
+                (getattr(worker, "styles", None), self._on_styles_ready),
             ):
+                if signal is None:
+                    continue
                 try:
                     signal.disconnect(handler)
                 except (RuntimeError, TypeError):
@@ -1286,7 +1398,7 @@ class OverlayWindow(StyledOverlayWindow):
             # Update status label with animated dots
             if hasattr(self, "status_label") and self.status_label:
                 dots = "." * self._loading_dots_count + " " * (3 - self._loading_dots_count)
-                self.status_label.setText(f"Request sent{dots}")
+                self.status_label.setText(f"{self._request_status_text}{dots}")
 
         except Exception as e:
             logger.debug(f"Failed to update loading animation: {e}")
@@ -175,7 +175,27 @@ class SettingsDialog(QDialog, BaseWindow, SettingsObserver):
                 self._set_reasoning_effort_combo,
             ),
             "deepl_plan": (self.deepl_plan_combo, "currentText", "setCurrentText"),
+            "adaptive_completion_tokens": (self.adaptive_tokens_checkbox, "isChecked", "setChecked"),
+            "http2_enabled": (self.http2_checkbox, "isChecked", "setChecked"),
+            "http_proxy": (self.http_proxy_edit, "text", "setText"),
+            "connection_warmup_enabled": (self.warmup_checkbox, "isChecked", "setChecked"),
+            "hedging_enabled": (self.hedging_checkbox, "isChecked", "setChecked"),
+            "auto_provider_routing": (self.routing_checkbox, "isChecked", "setChecked"),
+            "rate_limiting_enabled": (self.rate_limit_checkbox, "isChecked", "setChecked"),
             "auto_swap_en_ru": (self.ocr_auto_swap_checkbox, "isChecked", "setChecked"),
+            "translation_cache_enabled": (self.translation_cache_checkbox, "isChecked", "setChecked"),
+            "translation_memory_enabled": (self.translation_memory_checkbox, "isChecked", "setChecked"),
+            "streaming_enabled": (self.streaming_checkbox, "isChecked", "setChecked"),
+            "ui_extra_target_languages": (
+                self.extra_targets_edit,
+                lambda widget: [code.strip().lower() for code in widget.text().split(",") if code.strip()],
+                lambda widget, value: widget.setText(", ".join(value or [])),
+            ),
+            "ui_extra_styles": (
+                self.extra_styles_edit,
+                lambda widget: [name.strip() for name in widget.text().split(",") if name.strip()],
+                lambda widget, value: widget.setText(", ".join(value or [])),
+            ),
             "system_prompt": (self.system_prompt_edit, "toPlainText", "setPlainText"),
             "openai_vision_model": (self.openai_vision_model_combo, "currentText", "setCurrentText"),
             "google_vision_model": (self.google_vision_model_edit, "text", "setText"),
@@ -192,6 +212,14 @@ class SettingsDialog(QDialog, BaseWindow, SettingsObserver):
         # OCR-specific mappings only exist when OCR UI is present
         if BUILD_OCR_ENABLED and hasattr(self, "ocr_llm_prompt_edit"):
             self.settings_map["ocr_llm_prompt"] = (self.ocr_llm_prompt_edit, "toPlainText", "setPlainText")
+            self.settings_map["ocr_translate_in_one_request"] = (
+                self.ocr_one_request_checkbox, "isChecked", "setChecked"
+            )
+            self.settings_map["ocr_adaptive_image_encoding"] = (
+                self.ocr_adaptive_encoding_checkbox, "isChecked", "setChecked"
+            )
+            self.settings_map["ocr_crop_to_text"] = (self.ocr_crop_checkbox, "isChecked", "setChecked")
+            self.settings_map["ocr_cache_enabled"] = (self.ocr_cache_checkbox, "isChecked", "setChecked")
 
     @staticmethod
     def _set_reasoning_effort_combo(widget, value) -> None:
@@ -327,6 +355,10 @@ class SettingsDialog(QDialog, BaseWindow, SettingsObserver):
         self.api_timeout_spin = self.factory.create_spin("apiTimeoutSpin")
         model_layout.addRow(self._create_hint_label("Timeout (seconds):", "api.timeout"), self.api_timeout_spin)
 
+        self.adaptive_tokens_checkbox = self.factory.create_check("adaptiveTokensCheck")
+        self.adaptive_tokens_checkbox.setToolTip(HELP_TEXTS.get("api.adaptive_tokens", {}).get("tooltip", ""))
+        model_layout.addRow(self.adaptive_tokens_checkbox)
+
         # Vision model fields
         self.openai_vision_model_label = self.factory.create_label("openaiVisionModelLabel")
         self.openai_vision_model_label.setText("OpenAI Vision Model:")
@@ -352,6 +384,35 @@ class SettingsDialog(QDialog, BaseWindow, SettingsObserver):
 
         layout.addWidget(model_group)
 
+        # Network (shared HTTP transport)
+        network_group = self.factory.create_group_box("networkGroup")
+        network_layout = QFormLayout(network_group)
+
+        self.http_proxy_edit = self.factory.create_line_edit("httpProxyEdit")
+        network_layout.addRow(self._create_hint_label("Proxy:", "api.proxy"), self.http_proxy_edit)
+
+        self.http2_checkbox = self.factory.create_check("http2Check")
+        self.http2_checkbox.setToolTip(HELP_TEXTS.get("api.http2", {}).get("tooltip", ""))
+        network_layout.addRow(self.http2_checkbox)
+
+        self.warmup_checkbox = self.factory.create_check("warmupCheck")
+        self.warmup_checkbox.setToolTip(HELP_TEXTS.get("api.warmup", {}).get("tooltip", ""))
+        network_layout.addRow(self.warmup_checkbox)
+
+        self.hedging_checkbox = self.factory.create_check("hedgingCheck")
+        self.hedging_checkbox.setToolTip(HELP_TEXTS.get("api.hedging", {}).get("tooltip", ""))
+        network_layout.addRow(self.hedging_checkbox)
+
+        self.routing_checkbox = self.factory.create_check("routingCheck")
+        self.routing_checkbox.setToolTip(HELP_TEXTS.get("api.routing", {}).get("tooltip", ""))
+        network_layout.addRow(self.routing_checkbox)
+
+        self.rate_limit_checkbox = self.factory.create_check("rateLimitCheck")
+        self.rate_limit_checkbox.setToolTip(HELP_TEXTS.get("api.rate_limit", {}).get("tooltip", ""))
+        network_layout.addRow(self.rate_limit_checkbox)
+
+        layout.addWidget(network_group)
+
         layout.addStretch()
 
         self.tab_widget.addTab(tab, "API")
@@ -368,6 +429,26 @@ class SettingsDialog(QDialog, BaseWindow, SettingsObserver):
         self.ocr_auto_swap_checkbox.setToolTip(HELP_TEXTS.get("translation.auto_swap", {}).get("tooltip", ""))
         layout.addWidget(self.ocr_auto_swap_checkbox)
 
+        # Result cache checkbox
+        self.translation_cache_checkbox = self.factory.create_check("translationCacheCheck")
+        self.translation_cache_checkbox.setToolTip(HELP_TEXTS.get("translation.cache", {}).get("tooltip", ""))
+        layout.addWidget(self.translation_cache_checkbox)
+
+        # Translation memory checkbox
+        self.translation_memory_checkbox = self.factory.create_check("translationMemoryCheck")
+        self.translation_memory_checkbox.setToolTip(HELP_TEXTS.get("translation.memory", {}).get("tooltip", ""))
+        layout.addWidget(self.translation_memory_checkbox)
+
+        # Streaming output checkbox
+        self.streaming_checkbox = self.factory.create_check("streamingCheck")
+        self.streaming_checkbox.setToolTip(HELP_TEXTS.get("translation.streaming", {}).get("tooltip", ""))
+        layout.addWidget(self.streaming_checkbox)
+
+        # Extra target languages (the translator window shows a tab per language)
+        self.extra_targets_edit = self.factory.create_line_edit("extraTargetsEdit")
+        layout.addWidget(self._create_hint_label("Also translate to:", "translation.extra_targets"))
+        layout.addWidget(self.extra_targets_edit)
+
         # System Prompt
         prompt_group = self.factory.create_group_box("systemPromptGroup")
         prompt_layout = QVBoxLayout(prompt_group)
@@ -394,6 +475,22 @@ class SettingsDialog(QDialog, BaseWindow, SettingsObserver):
         self.ocr_llm_prompt_edit.setAcceptRichText(False)
         ocr_layout.addRow(self._create_hint_label("LLM OCR Prompt:", "ocr.llm_prompt"), self.ocr_llm_prompt_edit)
 
+        self.ocr_one_request_checkbox = self.factory.create_check("ocrOneRequestCheck")
+        self.ocr_one_request_checkbox.setToolTip(HELP_TEXTS.get("ocr.one_request", {}).get("tooltip", ""))
+        ocr_layout.addRow(self.ocr_one_request_checkbox)
+
+        self.ocr_adaptive_encoding_checkbox = self.factory.create_check("ocrAdaptiveEncodingCheck")
+        self.ocr_adaptive_encoding_checkbox.setToolTip(HELP_TEXTS.get("ocr.adaptive_encoding", {}).get("tooltip", ""))
+        ocr_layout.addRow(self.ocr_adaptive_encoding_checkbox)
+
+        self.ocr_crop_checkbox = self.factory.create_check("ocrCropCheck")
+        self.ocr_crop_checkbox.setToolTip(HELP_TEXTS.get("ocr.crop_to_text", {}).get("tooltip", ""))
+        ocr_layout.addRow(self.ocr_crop_checkbox)
+
+        self.ocr_cache_checkbox = self.factory.create_check("ocrCacheCheck")
+        self.ocr_cache_checkbox.setToolTip(HELP_TEXTS.get("ocr.cache", {}).get("tooltip", ""))
+        ocr_layout.addRow(self.ocr_cache_checkbox)
+
         layout.addWidget(ocr_group)
         layout.addStretch()
 
@@ -509,6 +606,11 @@ class SettingsDialog(QDialog, BaseWindow, SettingsObserver):
 
         gl.addLayout(btn_row)
         layout.addWidget(group)
+
+        # Extra presets (the translator window shows a tab per preset)
+        self.extra_styles_edit = self.factory.create_line_edit("extraStylesEdit")
+        layout.addWidget(self._create_hint_label("Also rewrite in:", "stylist.extra_styles"))
+        layout.addWidget(self.extra_styles_edit)
         layout.addStretch()
 
         self.tab_widget.addTab(tab, "Stylist")
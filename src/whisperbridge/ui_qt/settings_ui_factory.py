@@ -80,6 +80,34 @@ class SettingsUIFactory:
             'object_name': 'googleVisionModelEdit',
             'placeholder': 'e.g., gemini-pro-vision'
         },
+        'httpProxyEdit': {
+            'object_name': 'httpProxyEdit',
+            'placeholder': 'e.g., http://proxy.local:8080 (empty = direct)'
+        },
+        'adaptiveTokensCheck': {
+            'object_name': 'adaptiveTokensCheck',
+            'text': 'Size output token limit to the input'
+        },
+        'http2Check': {
+            'object_name': 'http2Check',
+            'text': 'Use HTTP/2 for provider connections'
+        },
+        'warmupCheck': {
+            'object_name': 'warmupCheck',
+            'text': 'Pre-warm connections at startup and after idle'
+        },
+        'hedgingCheck': {
+            'object_name': 'hedgingCheck',
+            'text': 'Send slow requests to a second provider as well'
+        },
+        'routingCheck': {
+            'object_name': 'routingCheck',
+            'text': 'Automatically use the fastest configured provider'
+        },
+        'rateLimitCheck': {
+            'object_name': 'rateLimitCheck',
+            'text': 'Pace requests to stay within provider rate limits'
+        },
         'deeplPlanCombo': {
             'object_name': 'deeplPlanCombo',
             'items': ['free', 'pro'],
@@ -89,6 +117,38 @@ class SettingsUIFactory:
             'object_name': 'autoSwapCheck',
             'text': 'Auto-swap EN ↔ RU'
         },
+        'translationCacheCheck': {
+            'object_name': 'translationCacheCheck',
+            'text': 'Reuse cached translations for repeated text'
+        },
+        'translationMemoryCheck': {
+            'object_name': 'translationMemoryCheck',
+            'text': 'Translation memory: send only new sentences'
+        },
+        'extraTargetsEdit': {
+            'object_name': 'extraTargetsEdit',
+            'placeholder': 'e.g., de, uk (empty = only the selected language)'
+        },
+        'ocrOneRequestCheck': {
+            'object_name': 'ocrOneRequestCheck',
+            'text': 'Recognize and translate in one request'
+        },
+        'ocrAdaptiveEncodingCheck': {
+            'object_name': 'ocrAdaptiveEncodingCheck',
+            'text': 'Compress captures adaptively (smaller uploads)'
+        },
+        'ocrCropCheck': {
+            'object_name': 'ocrCropCheck',
+            'text': 'Crop captures to the text area'
+        },
+        'ocrCacheCheck': {
+            'object_name': 'ocrCacheCheck',
+            'text': 'Reuse OCR results for repeated captures'
+        },
+        'streamingCheck': {
+            'object_name': 'streamingCheck',
+            'text': 'Show output while it is generated (streaming)'
+        },
         'systemPromptEdit': {
             'object_name': 'systemPromptEdit',
             'placeholder': 'Enter the system prompt for the translation model.'
@@ -189,6 +249,10 @@ class SettingsUIFactory:
             'object_name': 'modelSettingsGroup',
             'title': 'Model Settings'
         },
+        'networkGroup': {
+            'object_name': 'networkGroup',
+            'title': 'Network'
+        },
         'systemPromptGroup': {
             'object_name': 'systemPromptGroup',
             'title': 'System Prompt'
@@ -213,6 +277,10 @@ class SettingsUIFactory:
             'object_name': 'textStylistPresetsGroup',
             'title': 'Text Stylist Presets'
         },
+        'extraStylesEdit': {
+            'object_name': 'extraStylesEdit',
+            'placeholder': 'e.g., Formal, Shorten (empty = only the selected style)'
+        },
         'apiTab': {
             'object_name': 'apiTab'
         },
@@ -4,13 +4,17 @@ Provides thread-safe workers for OCR/translation and settings saving operations.
 """
 
 import asyncio
+import concurrent.futures
 import time
-from typing import Any, Coroutine, Optional
+from typing import Any, Coroutine, List, Optional, Union
 
 from loguru import logger
 from PySide6.QtCore import QObject, Signal
 
 from ..core.api_manager import get_api_manager, APIProvider
+from ..core.api_manager.cancellation import CancelToken
+from ..core.api_manager.retry import request_deadline
+from ..core.async_runtime import get_async_runtime
 from ..core.config import API_TIMEOUT_DEFAULT, API_TIMEOUT_MAX, API_TIMEOUT_MIN, Settings
 from ..core.settings_manager import settings_manager
 from ..services.config_service import config_service
@@ -36,9 +40,12 @@ class CaptureOcrTranslateWorker(QObject):
             raise ValueError("image is required")
         self.image = image
         self._cancel_requested = False
+        # Aborts the in-flight vision request (and its retries) on cancel
+        self._cancel_token = CancelToken()
 
     def request_cancel(self):
         self._cancel_requested = True
+        self._cancel_token.cancel()
 
     def run(self):
         logger.info("CaptureOcrTranslateWorker run started")
@@ -55,8 +62,19 @@ class CaptureOcrTranslateWorker(QObject):
             translation_service = get_translation_service(initialize=True)
 
             try:
+                # The OCR request also returns the translation when the provider allows it
+                translate = translation_service.is_available
+                settings = config_service.get_settings()
+                source_lang = getattr(settings, "ui_source_language", "auto")
+                target_lang = getattr(settings, "ui_target_language", "en")
                 ocr_response = ocr_service.process_image(
-                    OCRRequest(image=self.image, preprocess=True)
+                    OCRRequest(
+                        image=self.image,
+                        preprocess=True,
+                        translate_from=source_lang,
+                        translate_to=target_lang if translate else None,
+                    ),
+                    cancel_token=self._cancel_token,
                 )
                 original_text = ocr_response.text
 
@@ -72,6 +90,12 @@ class CaptureOcrTranslateWorker(QObject):
                 elif not original_text.strip():
                     translated_text = ""
                     error_message = ""
+                elif ocr_response.translated_text is not None:
+                    logger.info("OCR and translation completed in one request")
+                    translated_text = ocr_response.translated_text
+                    error_message = ""
+                    # Later text-mode requests for the same text hit the cache, as after a separate translation
+                    translation_service.cache_translation(original_text, translated_text, source_lang, target_lang)
                 else:
                     logger.info("OCR completed, checking translation availability")
                     get_notification_service().info(
@@ -79,14 +103,11 @@ class CaptureOcrTranslateWorker(QObject):
                         title="WhisperBridge",
                     )
 
-                    if not translation_service.is_available:
+                    if not translate:
                         logger.debug("Translation service not available, skipping translation")
                         translated_text = ""
                         error_message = "Translation service not configured"
                     else:
-                        settings = config_service.get_settings()
-                        source_lang = getattr(settings, "ui_source_language", "auto")
-                        target_lang = getattr(settings, "ui_target_language", "en")
                         response = translation_service.translate_text_sync(
                             original_text,
                             source_lang=source_lang,
@@ -169,39 +190,67 @@ class ApiTestWorker(QObject):
                 self.error.emit(f"Connection error: {str(e)}")
 
 class BaseAsyncWorker(QObject):
-    """Base class for workers that need an asyncio event loop.
-    
+    """Base class for workers that run a coroutine on the shared asyncio runtime.
+
+    The coroutine is submitted to the application's long-lived event loop
+    (see ``core.async_runtime``); the worker thread waits on the returned
+    future and reports the outcome through Qt signals.
+
     Signals:
         finished(bool, str): Always emitted on completion. First param is success flag, second is result or error message.
         error(str): Emitted on error.
+        partial(str): Emitted with each text delta while a streamed result arrives.
     """
 
     finished = Signal(bool, str)  # success, result_or_error
     error = Signal(str)
+    partial = Signal(str)  # text delta
 
     def __init__(self):
         super().__init__()
         self._cancel_requested = False
-        self._active_loop: Optional[asyncio.AbstractEventLoop] = None
-        self._active_task: Optional[asyncio.Task[Any]] = None
+        self._active_future: Optional[concurrent.futures.Future] = None
 
     def request_cancel(self):
         """Request cancellation of the active async task."""
         self._cancel_requested = True
 
-        loop = self._active_loop
-        task = self._active_task
-        if loop is None or task is None:
+        future = self._active_future
+        if future is None:
             return
 
         try:
-            if not task.done():
-                loop.call_soon_threadsafe(task.cancel)
+            # Cancelling the runtime future cancels the task on the shared loop
+            future.cancel()
         except Exception as e:
             logger.debug(f"Failed to request task cancellation: {e}")
 
+    def _emit_partial(self, delta: str) -> None:
+        """Forward a streamed text delta unless the request was cancelled."""
+        if delta and not self._cancel_requested:
+            self.partial.emit(delta)
+
+    def _emit_failure(self, msg: str) -> None:
+        self.error.emit(msg)
+        self.finished.emit(False, msg)
+
+    def _submit_async(self, coro: Coroutine[Any, Any, Any], timeout: float) -> concurrent.futures.Future:
+        """Submit a coroutine with a timeout to the shared runtime and track its future."""
+
+        async def with_timeout():
+            # The deadline lets API retries give up before the worker times out
+            with request_deadline(timeout):
+                return await asyncio.wait_for(coro, timeout=timeout)
+
+        future = get_async_runtime().submit(with_timeout())
+        self._active_future = future
+        if self._cancel_requested:
+            # Cancel raced with submission
+            future.cancel()
+        return future
+
     def _run_async_task(self, coro: Coroutine[Any, Any, Any], worker_name: str):
-        """Run an async coroutine in a new event loop with timeout and cleanup."""
+        """Run an async coroutine on the shared runtime with timeout and wait for it."""
         if self._cancel_requested:
             try:
                 close_coro = getattr(coro, "close", None)
@@ -209,9 +258,7 @@ class BaseAsyncWorker(QObject):
                     close_coro()
             except Exception:
                 pass
-            msg = "Request cancelled"
-            self.error.emit(msg)
-            self.finished.emit(False, msg)
+            self._emit_failure("Request cancelled")
             return None
 
         raw_timeout = config_service.get_setting("api_timeout")
@@ -228,76 +275,36 @@ class BaseAsyncWorker(QObject):
             timeout = API_TIMEOUT_DEFAULT
         start_time = time.time()
 
-        # Create and use a new event loop in this thread to avoid conflicting with Qt's loop
-        loop = asyncio.new_event_loop()
-        self._active_loop = loop
         try:
-            asyncio.set_event_loop(loop)
-
-            # Wrap async call with timeout to prevent indefinite hanging
-            async def with_timeout():
-                return await asyncio.wait_for(coro, timeout=timeout)
-
-            self._active_task = loop.create_task(with_timeout())
-            resp = loop.run_until_complete(self._active_task)
+            future = self._submit_async(coro, timeout)
+            resp = future.result()
 
             elapsed = time.time() - start_time
             logger.info(f"{worker_name} completed successfully in {elapsed:.2f}s")
             return resp
-        except asyncio.CancelledError:
+        except (concurrent.futures.CancelledError, asyncio.CancelledError):
             logger.info(f"{worker_name} cancelled by user")
-            msg = "Request cancelled"
-            self.error.emit(msg)
-            self.finished.emit(False, msg)
+            self._emit_failure("Request cancelled")
             return None
         except asyncio.TimeoutError:
             logger.error(f"{worker_name} timed out after {timeout}s")
-            msg = f"Request timed out after {timeout} seconds"
-            self.error.emit(msg)
-            self.finished.emit(False, msg)
+            self._emit_failure(f"Request timed out after {timeout} seconds")
             return None
         except Exception as e:
             logger.error(f"{worker_name} failed: {e}", exc_info=True)
-            msg = str(e)
-            self.error.emit(msg)
-            self.finished.emit(False, msg)
+            self._emit_failure(str(e))
             return None
         finally:
-            # Cancel all pending tasks before closing loop to prevent hanging
-            try:
-                pending = asyncio.all_tasks(loop)
-                if pending:
-                    logger.debug(f"Cancelling {len(pending)} pending tasks")
-                    # Note: Main task (with_timeout) is already finished here, so we only cancel 
-                    # lingering background tasks started by the service.
-                    for task in pending:
-                        task.cancel()
-                    # Give tasks a chance to handle cancellation with timeout to prevent infinite hang
-                    try:
-                        loop.run_until_complete(asyncio.wait_for(
-                            asyncio.gather(*pending, return_exceptions=True),
-                            timeout=5.0  # 5 second grace period for task cancellation
-                        ))
-                    except asyncio.TimeoutError:
-                        logger.warning("Task cancellation timed out after 5 seconds, proceeding with loop cleanup")
-            except Exception as e:
-                logger.debug(f"Error during task cancellation: {e}")
-            finally:
-                try:
-                    loop.close()
-                except Exception as e:
-                    logger.debug(f"Error closing event loop: {e}")
-                finally:
-                    # Detach loop from thread
-                    asyncio.set_event_loop(None)
-                    self._active_task = None
-                    self._active_loop = None
+            self._active_future = None
 
 
 class TranslationWorker(BaseAsyncWorker):
     """Worker for translating text asynchronously."""
 
-    def __init__(self, text_to_translate: str, ui_source_lang: str, ui_target_lang: str):
+    # Per-language texts ({lang: text}) when translating into several target languages
+    translations = Signal(dict)
+
+    def __init__(self, text_to_translate: str, ui_source_lang: str, ui_target_lang: Union[str, List[str]]):
         super().__init__()
         self.text = text_to_translate
         self.ui_source_lang = ui_source_lang
@@ -309,10 +316,20 @@ class TranslationWorker(BaseAsyncWorker):
             from ..services.translation_service import get_translation_service
             service = get_translation_service()
 
+            # Cache hits are answered here, without a round trip through the async runtime
+            cached = None
+            if isinstance(self.ui_target_lang, str):
+                cached = service.get_cached_translation(self.text, self.ui_source_lang, self.ui_target_lang)
+            if cached is not None:
+                logger.info("TranslationWorker answered from cache")
+                self.finished.emit(True, cached.translated_text or "")
+                return
+
             coro = service.translate_text_async(
                 self.text,
                 ui_source_lang=self.ui_source_lang,
                 ui_target_lang=self.ui_target_lang,
+                on_partial=self._emit_partial,
             )
 
             resp = self._run_async_task(coro, "TranslationWorker")
@@ -320,6 +337,12 @@ class TranslationWorker(BaseAsyncWorker):
                 return  # Error already emitted by _run_async_task
 
             if resp and getattr(resp, "success", False):
+                translations = getattr(resp, "translations", None)
+                if isinstance(translations, dict) and translations:
+                    self.translations.emit({
+                        lang: (r.translated_text or "") if r.success else f"Translation failed: {r.error_message}"
+                        for lang, r in translations.items()
+                    })
                 self.finished.emit(True, resp.translated_text or "")
             else:
                 msg = getattr(resp, "error_message", "Translation failed")
@@ -335,7 +358,10 @@ class TranslationWorker(BaseAsyncWorker):
 class StyleWorker(BaseAsyncWorker):
     """Worker for styling (rewriting) text asynchronously using presets."""
 
-    def __init__(self, text_to_style: str, style_name: str):
+    # Per-preset texts ({style name: text}) when rewriting in several presets
+    styles = Signal(dict)
+
+    def __init__(self, text_to_style: str, style_name: Union[str, List[str]]):
         super().__init__()
         self.text = text_to_style
         self.style_name = style_name
@@ -346,9 +372,23 @@ class StyleWorker(BaseAsyncWorker):
             from ..services.translation_service import get_translation_service
             service = get_translation_service()
 
+            if not isinstance(self.style_name, str):
+                style_names = list(dict.fromkeys(name for name in self.style_name if name))
+                if len(style_names) > 1:
+                    self._run_many(service, style_names)
+                    return
+                self.style_name = style_names[0] if style_names else ""
+
+            cached = service.get_cached_style(self.text, self.style_name)
+            if cached is not None:
+                logger.info("StyleWorker answered from cache")
+                self.finished.emit(True, cached.translated_text or "")
+                return
+
             coro = service.style_text_async(
                 self.text,
                 style_name=self.style_name,
+                on_partial=self._emit_partial,
             )
 
             resp = self._run_async_task(coro, "StyleWorker")
@@ -365,4 +405,25 @@ class StyleWorker(BaseAsyncWorker):
             logger.error(f"StyleWorker failed: {e}", exc_info=True)
             msg = str(e)
             self.error.emit(msg)
-            self.finished.emit(False, msg) 
+            self.finished.emit(False, msg)
+
+    def _run_many(self, service, style_names: List[str]) -> None:
+        """Rewrite the text in several presets with one request and emit a result per preset."""
+        responses = self._run_async_task(service.style_many_async(self.text, style_names), "StyleWorker")
+        if responses is None:
+            return  # Error already emitted by _run_async_task
+
+        results = dict(zip(style_names, responses))
+        succeeded = [name for name, resp in results.items() if resp.success]
+        if not succeeded:
+            msg = responses[0].error_message or "Styling failed"
+            self.error.emit(msg)
+            self.finished.emit(False, msg)
+            return
+
+        self.styles.emit({
+            name: (resp.translated_text or "") if resp.success else f"Styling failed: {resp.error_message}"
+            for name, resp in results.items()
+        })
+        self.finished.emit(True, "\n\n".join(f"[{name}]\n{results[name].translated_text or ''}" for name in succeeded))
+
@@ -42,11 +42,56 @@ HELP_TEXTS = {
         "detailed": "<b>DeepL Plan</b><br>Free plan has limits, Pro plan offers unlimited translations and better quality."
     },
 
+    "api.adaptive_tokens": {
+        "tooltip": "Reserve output tokens in proportion to the input instead of the model's maximum.",
+        "detailed": "<b>Adaptive output limit</b><br>Requests ask for an output budget sized to the text (plus room for reasoning on reasoning models) rather than the model's full limit, e.g. 128000 tokens. A response cut off by the budget is retried once with the full limit."
+    },
+    "api.proxy": {
+        "tooltip": "Proxy URL for all provider requests; leave empty for a direct connection.",
+        "detailed": "<b>Proxy</b><br>HTTP or HTTPS proxy used by OpenAI, Google and DeepL requests, e.g. <i>http://proxy.local:8080</i>. Leave empty to connect directly."
+    },
+    "api.http2": {
+        "tooltip": "Multiplex provider requests over HTTP/2 connections.",
+        "detailed": "<b>HTTP/2</b><br>Concurrent requests share one connection instead of opening several. Requires the optional <i>h2</i> package; without it HTTP/1.1 is used."
+    },
+    "api.warmup": {
+        "tooltip": "Open provider connections ahead of time so the first translation is fast.",
+        "detailed": "<b>Connection warm-up</b><br>At startup, and when a hotkey is pressed after an idle period, WhisperBridge connects to the configured providers in the background. Only unauthenticated requests are sent, so no API usage is billed."
+    },
+    "api.hedging": {
+        "tooltip": "If the selected provider is slower than usual, also ask another configured provider and use the first answer.",
+        "detailed": "<b>Hedged requests</b><br>When the selected provider has not answered within its usual response time (a latency percentile), or fails, the same request is sent to the next provider in the order configured for translation, styling or OCR (<i>hedge_policies</i> in the settings file). The first answer wins and the other request is cancelled. Hedged requests may be billed by both providers."
+    },
+    "api.routing": {
+        "tooltip": "Send each request to the configured provider that has recently been fastest and most reliable.",
+        "detailed": "<b>Automatic provider selection</b><br>WhisperBridge measures response times and errors of every provider and model it uses and keeps them between sessions. With this option on, each request goes to the fastest provider that currently works and can handle it (OCR only uses OpenAI or Google; the Stylist only uses LLM providers). Providers without measurements are tried first, and a failing provider is skipped for a few minutes. The selected provider is used whenever no other provider is configured."
+    },
+    "api.rate_limit": {
+        "tooltip": "Queue requests locally instead of sending more than the provider allows per minute.",
+        "detailed": "<b>Client-side rate limiting</b><br>Keeps requests and tokens per minute below the limits of each provider and model (<i>rate_limits</i> in the settings file; set them to the limits of your API account). Requests over the limit wait briefly for a free slot instead of failing with a rate-limit error, and a rate-limit error from the provider pauses further requests for as long as it asks. Requests you are waiting on go before background work such as the later parts of a long text."
+    },
+
     # Translation Tab
     "translation.auto_swap": {
         "tooltip": "Automatically swap English↔Russian for OCR translations.",
         "detailed": "<b>Auto-swap</b><br>When enabled, OCR translations will detect language and swap: English→Russian, Russian→English."
     },
+    "translation.cache": {
+        "tooltip": "Answer repeated requests for the same text from a local cache.",
+        "detailed": "<b>Translation Cache</b><br>When enabled, results for the same text, languages, provider, model and prompt are reused instead of sending a new request."
+    },
+    "translation.memory": {
+        "tooltip": "Reuse translations of sentences you have translated before.",
+        "detailed": "<b>Translation Memory</b><br>Texts are split into sentences. Sentences that match earlier ones exactly or almost exactly reuse their stored translation, and only the new sentences are sent to the provider."
+    },
+    "translation.streaming": {
+        "tooltip": "Display the result word by word as the model generates it.",
+        "detailed": "<b>Streaming</b><br>When enabled, translation and style results appear in the overlay as they are generated instead of after the full response. Providers without streaming (DeepL) show the result when it is complete."
+    },
+    "translation.extra_targets": {
+        "tooltip": "Comma-separated language codes translated along with the selected target language.",
+        "detailed": "<b>Also Translate To</b><br>The translator window translates into the selected target language and each of these languages at once, showing one tab per language. LLM providers answer all languages in a single request; DeepL translates them in parallel."
+    },
     "translation.system_prompt": {
         "tooltip": "Custom instructions for the translation model.",
         "detailed": "<b>System Prompt</b><br>Instructions that guide how the AI translates."
@@ -62,6 +107,23 @@ HELP_TEXTS = {
         "detailed": "<b>LLM OCR Prompt</b><br>Tell the AI how to extract and format text from images."
     },
 
+    "ocr.one_request": {
+        "tooltip": "Return the recognized text and its translation from the same vision request.",
+        "detailed": "<b>Recognize and Translate in One Request</b><br>When translating with OpenAI or Google, the vision model returns the recognized text and its translation together, saving a second round trip. If the answer cannot be parsed, the text is recognized and translated in two separate requests."
+    },
+    "ocr.adaptive_encoding": {
+        "tooltip": "Choose the image format, colours and size for each capture to keep uploads small.",
+        "detailed": "<b>Adaptive Capture Compression</b><br>Screenshots of text are sent as small-palette PNG, photos and video frames as JPEG or WebP, with quality and size lowered only as far as needed to stay under about 150 KB. When disabled, every capture is sent as a 1280 px JPEG."
+    },
+    "ocr.crop_to_text": {
+        "tooltip": "Cut empty margins off captures before sending them for recognition.",
+        "detailed": "<b>Crop Captures to the Text Area</b><br>A quick local check finds where the text is and removes the empty margins around it, so less image is uploaded and the vision model reads fewer input tokens. Captures that are already tight are sent unchanged."
+    },
+    "ocr.cache": {
+        "tooltip": "Return the stored text when the same region is captured again, without a vision request.",
+        "detailed": "<b>Reuse OCR Results</b><br>Captures are compared by a perceptual fingerprint. When a capture looks the same as one read before with the same model and prompt, the stored text is returned in milliseconds. Any visible change, even a single character, sends the capture to the vision model again."
+    },
+
     # Hotkeys Tab
     "hotkeys.show_translator": {
         "tooltip": "Hotkey to show the overlay translator window.",
@@ -109,4 +171,10 @@ HELP_TEXTS = {
         "tooltip": "Show system tray notifications for translation results.",
         "detailed": "<b>Notifications</b><br>When enabled, you'll see popups for completed translations and errors."
     },
+
+    # Stylist Tab
+    "stylist.extra_styles": {
+        "tooltip": "Comma-separated preset names rewritten along with the selected style.",
+        "detailed": "<b>Also Rewrite In</b><br>Style mode rewrites the text in the selected preset and each of these presets at once, showing one tab per preset. LLM providers answer all presets in a single request; names that match no preset are ignored."
+    },
 }
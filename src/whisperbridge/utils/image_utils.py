@@ -7,9 +7,50 @@ scaling, and format conversion.
 """
 
 import base64
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from io import BytesIO
+from typing import Optional, Tuple
 
-from PIL import Image
+from PIL import Image, ImageChops, features
+
+from ..core.image_parts import EncodedImage
+
+# Target payload size of an adaptively encoded OCR upload
+OCR_TARGET_BYTES = 150 * 1024
+
+# Side length of the thumbnail the capture is classified on
+_CLASSIFY_EDGE = 256
+
+# Share of thumbnail pixels the most common colours must cover for a flat (text/UI) capture
+_FLAT_COLORS = 32
+_FLAT_COVERAGE = 0.75
+
+# Share of thumbnail pixels equal to their right neighbour that also marks a
+# flat capture; dense small or subpixel-rendered text spreads over too many
+# colours for the coverage check but keeps the background between glyphs
+_FLAT_NEIGHBOURS = 0.25
+
+# A capture is encoded in grayscale when at most this share of pixels has an
+# HSV saturation (0-255) of _COLOURED_SATURATION or more, so coloured text keeps its contrast
+_COLOURED_SATURATION = 48
+_GRAY_MAX_COLOURED = 0.01
+
+# Size buckets of the encoding decision cache (pixels)
+_BUCKET_EDGE = 256
+
+# Long edge of the grayscale copy text regions are detected on
+_DETECT_EDGE = 512
+
+# Luminance difference from the background that counts as ink
+_INK_CONTRAST = 32
+
+# Ink pixels a row or column of the detection copy needs to count as text (ignores specks)
+_MIN_INK_PIXELS = 2
+
+# Crops that keep more than this share of the area are skipped
+_TIGHT_AREA = 0.85
 
 
 def resize_long_edge(image: "Image.Image", max_edge: int = 1280) -> "Image.Image":
@@ -90,3 +131,263 @@ def to_data_url_jpeg(image: "Image.Image", max_edge: int = 1280, quality: int =
     jpeg_bytes = encode_jpeg(resized, quality)
     b64 = base64.b64encode(jpeg_bytes).decode("ascii")
     return f"data:image/jpeg;base64,{b64}"
+
+
+def find_text_bbox(image: "Image.Image") -> Optional[Tuple[int, int, int, int]]:
+    """Find the bounding box of the text in a capture.
+
+    Ink is every pixel that differs from the dominant background level of a
+    downscaled grayscale copy. Row and column projection profiles of the ink
+    mask give the first and last rows and columns with text.
+
+    Args:
+        image: Input PIL image
+
+    Returns:
+        (left, top, right, bottom) in image coordinates, or None if the
+        capture has no ink
+    """
+    width, height = image.size
+    scale = min(1.0, _DETECT_EDGE / max(width, height, 1))
+    small = image.convert("L").resize((max(1, int(width * scale)), max(1, int(height * scale))), Image.BOX)
+
+    histogram = small.histogram()
+    background = histogram.index(max(histogram))
+    ink = ImageChops.difference(small, Image.new("L", small.size, background)).point(
+        lambda value: 255 if value >= _INK_CONTRAST else 0
+    )
+
+    # Projection profiles: mean ink of each row and each column
+    rows = ink.resize((1, ink.height), Image.BOX).tobytes()
+    columns = ink.resize((ink.width, 1), Image.BOX).tobytes()
+    text_rows = [y for y, value in enumerate(rows) if value * ink.width >= _MIN_INK_PIXELS * 255]
+    text_columns = [x for x, value in enumerate(columns) if value * ink.height >= _MIN_INK_PIXELS * 255]
+    if not text_rows or not text_columns:
+        return None
+
+    return (
+        int(text_columns[0] / scale),
+        int(text_rows[0] / scale),
+        min(width, int((text_columns[-1] + 1) / scale + 0.5)),
+        min(height, int((text_rows[-1] + 1) / scale + 0.5)),
+    )
+
+
+def crop_to_text(image: "Image.Image", padding: int = 8) -> "Image.Image":
+    """Crop a capture to its text, leaving a small margin.
+
+    Captures that are already tight (the crop would keep most of the area) or
+    have no detectable text are returned unchanged.
+
+    Args:
+        image: Input PIL image
+        padding: Margin kept around the text (pixels)
+
+    Returns:
+        Cropped PIL image or the original
+    """
+    bbox = find_text_bbox(image)
+    if bbox is None:
+        return image
+
+    width, height = image.size
+    left, top, right, bottom = bbox
+    box = (max(0, left - padding), max(0, top - padding), min(width, right + padding), min(height, bottom + padding))
+    if (box[2] - box[0]) * (box[3] - box[1]) > _TIGHT_AREA * width * height:
+        return image
+    return image.crop(box)
+
+
+def classify_image(image: "Image.Image") -> Tuple[str, bool]:
+    """Classify a capture for encoding.
+
+    Screenshots of text and UI are made of few flat colours, or at least of
+    runs of identical pixels; photographs and video frames are neither. The
+    check runs on a small nearest-neighbour thumbnail, so it costs well under
+    a millisecond.
+
+    Args:
+        image: Input PIL image
+
+    Returns:
+        (kind, grayscale) where kind is "text" or "photo" and grayscale tells
+        whether the capture has (almost) no colour
+    """
+    width, height = image.size
+    scale = min(1.0, _CLASSIFY_EDGE / max(width, height, 1))
+    thumb = image.convert("RGB").resize(
+        (max(1, int(width * scale)), max(1, int(height * scale))), Image.NEAREST
+    )
+    pixels = thumb.width * thumb.height
+    counts = sorted((count for count, _ in thumb.getcolors(maxcolors=pixels)), reverse=True)
+    flat = sum(counts[:_FLAT_COLORS]) >= _FLAT_COVERAGE * pixels
+    if not flat and thumb.width > 1:
+        # Pixels whose colour equals their right neighbour's in all channels
+        difference = ImageChops.difference(
+            thumb.crop((0, 0, thumb.width - 1, thumb.height)), thumb.crop((1, 0, thumb.width, thumb.height))
+        )
+        red, green, blue = difference.split()
+        unchanged = ImageChops.lighter(ImageChops.lighter(red, green), blue).histogram()[0]
+        flat = unchanged >= _FLAT_NEIGHBOURS * (thumb.width - 1) * thumb.height
+    kind = "text" if flat else "photo"
+
+    coloured = sum(thumb.convert("HSV").getchannel("S").histogram()[_COLOURED_SATURATION:])
+    return kind, coloured <= _GRAY_MAX_COLOURED * pixels
+
+
+@dataclass(frozen=True)
+class EncodingChoice:
+    """Format, colour depth, quality and scale of one encoding attempt."""
+
+    format: str  # "PNG", "WEBP" or "JPEG"
+    colors: Optional[int] = None  # palette size (PNG)
+    quality: Optional[int] = None  # lossy quality (WEBP/JPEG)
+    scale: float = 1.0  # factor applied to the max edge
+
+
+# Candidates in order of preference; the first one within the byte budget wins.
+# Text stays sharp as a small palette and is only downscaled as a last resort;
+# photographs start with plain JPEG, the fastest encoder, and trade quality next.
+_TEXT_CHOICES = (
+    EncodingChoice("PNG", colors=64),
+    EncodingChoice("PNG", colors=16),
+    EncodingChoice("WEBP", quality=85),
+    EncodingChoice("PNG", colors=16, scale=0.75),
+    EncodingChoice("WEBP", quality=70, scale=0.75),
+    EncodingChoice("WEBP", quality=60, scale=0.5),
+)
+_PHOTO_CHOICES = (
+    EncodingChoice("JPEG", quality=80),
+    EncodingChoice("JPEG", quality=65),
+    EncodingChoice("WEBP", quality=60),
+    EncodingChoice("JPEG", quality=60, scale=0.75),
+    EncodingChoice("JPEG", quality=50, scale=0.5),
+)
+
+_MIME_TYPES = {"PNG": "image/png", "WEBP": "image/webp", "JPEG": "image/jpeg"}
+
+
+def encode_choice(image: "Image.Image", choice: EncodingChoice, grayscale: bool = False) -> bytes:
+    """Encode an image (already resized to the base max edge) with one choice.
+
+    Args:
+        image: Input PIL image
+        choice: Format, palette/quality and scale to use
+        grayscale: Drop colour before encoding
+
+    Returns:
+        Encoded bytes
+    """
+    if choice.scale < 1.0:
+        width, height = image.size
+        image = image.resize(
+            (max(1, int(width * choice.scale)), max(1, int(height * choice.scale))), Image.LANCZOS
+        )
+    image = image.convert("L" if grayscale else "RGB")
+
+    buffer = BytesIO()
+    if choice.format == "PNG":
+        if grayscale:
+            # Posterize to the palette size; PNG compresses the few gray levels well
+            step = 256 // choice.colors
+            image = image.point([min(255, (value // step) * step + step // 2) for value in range(256)])
+        else:
+            image = image.quantize(choice.colors, method=Image.Quantize.FASTOCTREE)
+        image.save(buffer, format="PNG", compress_level=6)
+    elif choice.format == "WEBP":
+        # Fastest WebP method: the slower ones save a few percent at several times the cost
+        image.save(buffer, format="WEBP", quality=choice.quality, method=0)
+    else:
+        # No optimize/progressive passes: they cost encode time and save little
+        image.save(buffer, format="JPEG", quality=choice.quality)
+    return buffer.getvalue()
+
+
+class AdaptiveImageEncoder:
+    """
+    Encoder that picks format, colour mode, quality and size per capture.
+
+    Captures are classified (text/UI or photo, colour or grayscale), then
+    encoded with the first candidate that fits the byte budget. The winning
+    candidate is remembered per class and size bucket as the starting point
+    for similar captures, which then need one or two encodes instead of a
+    full search; a capture that fits a better candidate still gets it.
+    """
+
+    def __init__(self, target_bytes: int = OCR_TARGET_BYTES, max_edge: int = 1280, cache_size: int = 64):
+        """
+        Args:
+            target_bytes: Byte budget of one encoded capture
+            max_edge: Maximum length for the longest edge
+            cache_size: Number of remembered decisions (least recently used are dropped)
+        """
+        if target_bytes <= 0:
+            raise ValueError("target_bytes must be positive")
+        if max_edge <= 0:
+            raise ValueError("max_edge must be positive")
+        self.target_bytes = target_bytes
+        self.max_edge = max_edge
+        self._cache_size = cache_size
+        self._decisions: "OrderedDict[tuple, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def encode(self, image: "Image.Image") -> EncodedImage:
+        """Encode a capture within the byte budget (or as small as the candidates allow).
+
+        Args:
+            image: Input PIL image
+
+        Returns:
+            EncodedImage with the chosen format's MIME type
+        """
+        image = resize_long_edge(image, self.max_edge)
+        kind, grayscale = classify_image(image)
+        choices = self._choices(kind)
+        key = (kind, grayscale, round(image.width / _BUCKET_EDGE), round(image.height / _BUCKET_EDGE))
+
+        with self._lock:
+            hint = self._decisions.get(key)
+            if hint is not None:
+                self._decisions.move_to_end(key)
+
+        # The remembered decision is only a hint: if it fits, the better
+        # candidates before it are tried while they still fit; if it does not,
+        # the search continues with the candidates after it
+        hint = hint or 0
+        data = encode_choice(image, choices[hint], grayscale)
+        result = (data, hint)
+        if len(data) <= self.target_bytes:
+            for index in range(hint - 1, -1, -1):
+                data = encode_choice(image, choices[index], grayscale)
+                if len(data) > self.target_bytes:
+                    break
+                result = (data, index)
+        else:
+            for index in range(hint + 1, len(choices)):
+                data = encode_choice(image, choices[index], grayscale)
+                if len(data) < len(result[0]):
+                    result = (data, index)
+                if len(data) <= self.target_bytes:
+                    break
+
+        data, index = result
+        self._remember(key, index)
+        return EncodedImage(data, _MIME_TYPES[choices[index].format])
+
+    def _remember(self, key: tuple, index: int) -> None:
+        with self._lock:
+            self._decisions[key] = index
+            self._decisions.move_to_end(key)
+            while len(self._decisions) > self._cache_size:
+                self._decisions.popitem(last=False)
+
+    @staticmethod
+    def _choices(kind: str) -> Tuple[EncodingChoice, ...]:
+        choices = _TEXT_CHOICES if kind == "text" else _PHOTO_CHOICES
+        if not features.check("webp"):
+            # Pillow built without WebP: the same qualities as JPEG
+            choices = tuple(
+                EncodingChoice("JPEG", quality=c.quality, scale=c.scale) if c.format == "WEBP" else c
+                for c in choices
+            )
+        return choices
@@ -1,10 +1,11 @@
 """Translation utilities for WhisperBridge.
 
-Prompt formatting, GPT response parsing, and token estimation helpers.
+Prompt formatting, GPT response parsing, token estimation and chunking helpers.
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
 
 from .language_utils import detect_language, get_language_name
 
@@ -18,6 +19,7 @@ class TranslationRequest:
     target_lang: str
     system_prompt: str
     model: str
+    provider: Optional[str] = None  # provider serving the request; None means the selected one
 
 
 @dataclass
@@ -31,6 +33,16 @@ class TranslationResponse:
     model: str = ""
     error_message: str = ""
     tokens_used: int = 0
+    # Per-language results of a multi-target translation, keyed by target language
+    translations: Dict[str, "TranslationResponse"] = field(default_factory=dict)
+
+
+@dataclass
+class TextChunk:
+    """A chunk of source text and the separator that follows it in the original text."""
+
+    text: str
+    separator: str = ""
 
 
 @dataclass
@@ -64,6 +76,59 @@ Text to translate:
     return prompt
 
 
+def format_multi_target_prompt(request: TranslationRequest, target_langs: Sequence[str]) -> str:
+    """Format a prompt asking for one tagged translation per target language.
+
+    The response is split back with ``parse_multi_target_response``.
+    """
+    source = "" if request.source_lang == "auto" else f" from {request.source_lang}"
+    tags = "\n".join(f'<translation lang="{lang}">...</translation>' for lang in target_langs)
+    return f"""Translate the following text{source} into each of these languages: {", ".join(target_langs)}.
+Return each translation inside its own tag, exactly in this format and nothing else:
+{tags}
+If the text is already in one of these languages, return it unchanged in that tag.
+
+Text to translate:
+{request.text}
+"""
+
+
+def parse_tagged_response(response_text: str, tag: str, attribute: str, clean: bool = True) -> Dict[str, str]:
+    """Split a response of ``<tag attribute="key">text</tag>`` blocks into texts per key.
+
+    Texts are cleaned with ``parse_gpt_response``, or only stripped with
+    ``clean=False``. Blocks with an empty text are left out; the first block
+    wins for repeated keys.
+    """
+    pattern = re.compile(
+        rf'<{tag}\s+{attribute}\s*=\s*["\']([^"\']+)["\']\s*>(.*?)</{tag}\s*>', re.DOTALL | re.IGNORECASE
+    )
+    results: Dict[str, str] = {}
+    for key, text in pattern.findall(response_text or ""):
+        text = parse_gpt_response(text) if clean else text.strip()
+        if text and key.strip() not in results:
+            results[key.strip()] = text
+    return results
+
+
+def parse_multi_target_response(response_text: str, target_langs: Sequence[str]) -> Dict[str, str]:
+    """Split a multi-target translation into translations per requested language.
+
+    Languages that are missing from the response or empty are left out.
+    """
+    tagged = {key.lower(): text for key, text in parse_tagged_response(response_text, "translation", "lang").items()}
+    return {lang: tagged[lang.lower()] for lang in target_langs if lang.lower() in tagged}
+
+
+def parse_multi_style_response(response_text: str, style_names: Sequence[str]) -> Dict[str, str]:
+    """Split a multi-style rewrite into rewrites per requested style.
+
+    Styles that are missing from the response or empty are left out.
+    """
+    tagged = {key.lower(): text for key, text in parse_tagged_response(response_text, "style", "name").items()}
+    return {name: tagged[name.strip().lower()] for name in style_names if name.strip().lower() in tagged}
+
+
 def format_style_prompt(request: StyleRequest) -> str:
     """Format user message for text styling.
 
@@ -75,6 +140,23 @@ def format_style_prompt(request: StyleRequest) -> str:
 """
 
 
+def format_multi_style_prompt(styles: Sequence[Tuple[str, str]]) -> str:
+    """Format system instructions for rewriting text in several styles at once.
+
+    Args:
+        styles: (name, prompt) pairs of the style presets.
+
+    The response is split back with ``parse_multi_style_response``.
+    """
+    tags = "\n".join(f'<style name="{name}">...</style>' for name, _ in styles)
+    presets = "\n\n".join(f'Style "{name}":\n{prompt}' for name, prompt in styles)
+    return f"""Rewrite the text once for each of the styles below, following that style's instructions.
+Return each rewrite inside its own tag, exactly in this format and nothing else:
+{tags}
+
+{presets}"""
+
+
 def parse_gpt_response(response_text: str) -> str:
     """Parse and clean GPT response text."""
     if not response_text:
@@ -163,6 +245,114 @@ def estimate_tokens(text: str) -> int:
     return max(1, char_count // 4)
 
 
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n\s*")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?…。！？])\s+|\s*\n\s*")
+
+
+def _split_keeping_separators(text: str, pattern: Pattern[str]) -> List[Tuple[str, str]]:
+    """Split text on a pattern into (piece, following_separator) pairs."""
+    pieces: List[Tuple[str, str]] = []
+    position = 0
+    for match in pattern.finditer(text):
+        pieces.append((text[position:match.start()], match.group(0)))
+        position = match.end()
+    pieces.append((text[position:], ""))
+    return pieces
+
+
+def split_sentences(text: str) -> List[TextChunk]:
+    """Split text into sentence/line segments, keeping separators for stitching.
+
+    A sentence ends at a terminator followed by whitespace, or at a line break.
+    ``join_chunks(split_sentences(t))`` reproduces ``t`` exactly (leading
+    whitespace is kept on the first segment).
+    """
+    if not text:
+        return []
+    pieces = _split_keeping_separators(text, _SENTENCE_BREAK)
+    if len(pieces) > 1 and not pieces[-1][0]:
+        pieces.pop()  # Text ends with a separator
+    return [TextChunk(piece, separator) for piece, separator in pieces]
+
+
+def join_chunks(chunks: Sequence[TextChunk]) -> str:
+    """Inverse of ``split_sentences`` and ``split_text_into_chunks``."""
+    return "".join(chunk.text + chunk.separator for chunk in chunks)
+
+
+def _hard_split(text: str, max_chars: int) -> List[Tuple[str, str]]:
+    """Split an oversized piece at the last space before the limit (or mid-word)."""
+    pieces: List[Tuple[str, str]] = []
+    while len(text) > max_chars:
+        cut = text.rfind(" ", 0, max_chars + 1)
+        if cut <= 0:
+            pieces.append((text[:max_chars], ""))
+            text = text[max_chars:]
+        else:
+            pieces.append((text[:cut], " "))
+            text = text[cut + 1:]
+    pieces.append((text, ""))
+    return pieces
+
+
+def split_text_into_chunks(text: str, max_tokens: int) -> List[TextChunk]:
+    """Split text into chunks of at most ``max_tokens`` estimated tokens.
+
+    Text is split at paragraph boundaries first, then at sentence boundaries,
+    and only pieces longer than the budget on their own are cut at whitespace.
+    Adjacent pieces are packed greedily, so ``chunk.text + chunk.separator``
+    over all chunks reproduces the original text.
+
+    Args:
+        text: Source text.
+        max_tokens: Token budget per chunk.
+
+    Returns:
+        List of chunks in original order (a single chunk if the text fits).
+    """
+    if not text:
+        return []
+    # estimate_tokens never reports more than one token per two characters
+    if len(text) <= max_tokens * 2:
+        return [TextChunk(text)]
+    total_tokens = estimate_tokens(text)
+    if total_tokens <= max_tokens:
+        return [TextChunk(text)]
+
+    # Convert the budget to characters once instead of estimating every piece
+    max_chars = max(1, int(max_tokens * len(text) / total_tokens))
+
+    pieces: List[Tuple[str, str]] = []
+    for paragraph, paragraph_sep in _split_keeping_separators(text, _PARAGRAPH_BREAK):
+        if len(paragraph) <= max_chars:
+            pieces.append((paragraph, paragraph_sep))
+            continue
+        sentences = split_sentences(paragraph)
+        for index, sentence in enumerate(sentences):
+            separator = sentence.separator
+            if index == len(sentences) - 1:
+                separator += paragraph_sep
+            if len(sentence.text) <= max_chars:
+                pieces.append((sentence.text, separator))
+            else:
+                parts = _hard_split(sentence.text, max_chars)
+                parts[-1] = (parts[-1][0], separator)
+                pieces.extend(parts)
+
+    chunks: List[TextChunk] = []
+    current: Optional[str] = None
+    current_sep = ""
+    for piece, separator in pieces:
+        if current is not None and len(current) + len(current_sep) + len(piece) > max_chars:
+            chunks.append(TextChunk(current, current_sep))
+            current = None
+        current = piece if current is None else f"{current}{current_sep}{piece}"
+        current_sep = separator
+    if current is not None:
+        chunks.append(TextChunk(current, current_sep))
+    return chunks
+
+
 def format_error_message(error: Exception) -> str:
     """Format error message for user display."""
     error_type = type(error).__name__
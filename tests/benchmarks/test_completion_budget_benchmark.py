@@ -0,0 +1,131 @@
+"""
+Benchmark: fixed vs. adaptive max_completion_tokens.
+
+Runs copy-translate sized requests through the real APIManager, OpenAI
+adapter and shared HTTP transport against a local OpenAI-compatible stand-in
+server. The stand-in models provider-side admission cost as proportional to
+the reserved completion budget (``RESERVATION_SECONDS_PER_TOKEN``) on top of a
+fixed base latency, so the numbers show the effect of the budget policy, not
+real provider timings.
+
+Run directly for a report::
+
+    python tests/benchmarks/test_completion_budget_benchmark.py
+"""
+
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.core.api_manager.manager import APIManager
+from whisperbridge.core.api_manager.providers import APIProvider
+from whisperbridge.providers.http_transport import HttpTransport
+from whisperbridge.providers.openai_adapter import OpenAIChatClientAdapter
+
+pytestmark = pytest.mark.slow
+
+BASE_LATENCY_SECONDS = 0.005
+RESERVATION_SECONDS_PER_TOKEN = 0.5e-6  # 128000 reserved tokens -> +64 ms
+MODEL = "gpt-5.4-mini"
+TEXT = "Please translate this short sentence for me"
+ITERATIONS = 20
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    budgets = []
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        budget = int(payload.get("max_completion_tokens") or 0)
+        self.budgets.append(budget)
+        time.sleep(BASE_LATENCY_SECONDS + budget * RESERVATION_SECONDS_PER_TOKEN)
+        body = json.dumps({
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "Bitte übersetze diesen kurzen Satz für mich"},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 12, "completion_tokens": 10, "total_tokens": 22},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _make_manager(base_url, tmp_path, monkeypatch, adaptive):
+    settings = {"api_provider": "openai", "adaptive_completion_tokens": adaptive}
+    config = SimpleNamespace(get_setting=lambda key: settings.get(key))
+    monkeypatch.setattr("whisperbridge.core.api_manager.manager.ensure_config_dir", lambda: tmp_path)
+    manager = APIManager(config)
+    adapter = OpenAIChatClientAdapter(api_key="sk-bench", timeout=30, transport=HttpTransport())
+    adapter._client = adapter._client.with_options(base_url=base_url)
+    manager._providers._clients[APIProvider.OPENAI] = adapter
+    manager._is_initialized = True
+    return manager
+
+
+def _measure(manager):
+    messages = [{"role": "system", "content": "Translate to German."}, {"role": "user", "content": TEXT}]
+    manager.make_translation_request(messages, MODEL)  # warm the connection
+    _StandInHandler.budgets.clear()
+    timings = []
+    for _ in range(ITERATIONS):
+        started = time.perf_counter()
+        manager.make_translation_request(messages, MODEL)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000, _StandInHandler.budgets[-1]
+
+
+def run_benchmark(tmp_path, monkeypatch):
+    """Return {policy: (median_ms, max_completion_tokens)} for both policies."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        return {
+            policy: _measure(_make_manager(base_url, tmp_path, monkeypatch, adaptive))
+            for policy, adaptive in (("fixed", False), ("adaptive", True))
+        }
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_adaptive_budget_reduces_latency(tmp_path, monkeypatch):
+    """Adaptive budgets reserve far fewer tokens and finish faster on the stand-in."""
+    results = run_benchmark(tmp_path, monkeypatch)
+
+    for policy, (median_ms, budget) in results.items():
+        print(f"{policy:>8}: median {median_ms:6.1f} ms, max_completion_tokens={budget}")
+
+    fixed_ms, fixed_budget = results["fixed"]
+    adaptive_ms, adaptive_budget = results["adaptive"]
+    assert fixed_budget == 128000
+    assert adaptive_budget < fixed_budget // 10
+    assert adaptive_ms < fixed_ms
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    with tempfile.TemporaryDirectory() as directory, pytest.MonkeyPatch.context() as patcher:
+        for policy, (median_ms, budget) in run_benchmark(Path(directory), patcher).items():
+            print(f"{policy:>8}: median {median_ms:6.1f} ms over {ITERATIONS} requests, max_completion_tokens={budget}")
@@ -0,0 +1,190 @@
+"""
+Benchmark: fixed JPEG vs. adaptive OCR image encoding.
+
+Encodes a corpus of synthetic screenshots (dialogs, a code editor, a web
+page, a subtitle frame and a photo) with the previous fixed encoding (JPEG
+quality 80, optimize + progressive, 1280 px) and with AdaptiveImageEncoder,
+and reports encode time, payload size and the accuracy of an OCR stand-in.
+
+The stand-in reads a text line correctly when the decoded line still
+correlates with the original glyphs (normalized cross-correlation of the
+line's luminance above ``READ_THRESHOLD``), so it measures how much the
+encoding damages the text, not real vision-model accuracy.
+
+Run directly for a report::
+
+    python tests/benchmarks/test_ocr_encoding_benchmark.py
+"""
+
+import random
+import statistics
+import time
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont, ImageStat
+
+from whisperbridge.utils.image_utils import AdaptiveImageEncoder, encode_jpeg, resize_long_edge
+
+pytestmark = pytest.mark.slow
+
+READ_THRESHOLD = 0.85
+ITERATIONS = 5
+WORDS = "the quick brown fox jumps over lazy dog settings translate capture window error file open save".split()
+
+
+def _sentence(rng, words=8):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _text_lines(draw, rng, box, color, size=15, spacing=24):
+    """Draw lines of text into box; return the bounding boxes of the lines."""
+    font = ImageFont.load_default(size=size)
+    left, top, right, bottom = box
+    lines = []
+    y = top
+    while y + spacing <= bottom:
+        text = _sentence(rng, rng.randint(4, 10))
+        draw.text((left, y), text, fill=color, font=font)
+        x0, y0, x1, y1 = draw.textbbox((left, y), text, font=font)
+        lines.append((x0, y0, min(x1, right), y1))
+        y += spacing
+    return lines
+
+
+def _dialog(rng):
+    image = Image.new("RGB", (1100, 700), (240, 240, 240))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, 1100, 32), fill=(200, 205, 215))
+    draw.rectangle((860, 640, 1080, 680), fill=(0, 120, 215))
+    return image, _text_lines(draw, rng, (24, 56, 1060, 620), (20, 20, 20))
+
+
+def _code_editor(rng):
+    image = Image.new("RGB", (1600, 1000), (30, 30, 30))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, 220, 1000), fill=(37, 37, 38))
+    lines = []
+    for index, color in enumerate(((212, 212, 212), (86, 156, 214), (206, 145, 120), (106, 153, 85))):
+        lines += _text_lines(draw, rng, (260, 20 + index * 240, 1560, 240 + index * 240), color, size=14, spacing=20)
+    return image, lines
+
+
+def _web_page(rng):
+    image = Image.new("RGB", (1920, 1080), (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, 1920, 64), fill=(36, 41, 47))
+    lines = _text_lines(draw, rng, (320, 100, 1300, 700), (36, 41, 47), size=18, spacing=30)
+    lines += _text_lines(draw, rng, (320, 720, 1300, 1040), (9, 105, 218), size=18, spacing=30)
+    draw.rectangle((1380, 100, 1800, 400), fill=(246, 248, 250), outline=(208, 215, 222))
+    return image, lines
+
+
+def _photo(rng, size=(1280, 720)):
+    """A smooth colour gradient with grain, standing in for a photograph."""
+    small = Image.new("RGB", (16, 9))
+    small.putdata([(rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(16 * 9)])
+    image = small.resize(size, Image.BICUBIC)
+    grain = Image.effect_noise(size, 24).convert("RGB")
+    return Image.blend(image, grain, 0.2).filter(ImageFilter.SMOOTH)
+
+
+def _subtitle_frame(rng):
+    image = _photo(rng)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=34)
+    text = _sentence(rng, 6)
+    draw.text((200, 620), text, fill=(255, 255, 255), font=font, stroke_width=2, stroke_fill=(0, 0, 0))
+    return image, [draw.textbbox((200, 620), text, font=font, stroke_width=2)]
+
+
+def _tight_crop(rng):
+    image = Image.new("RGB", (520, 90), (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    return image, _text_lines(draw, rng, (8, 8, 512, 82), (0, 0, 0), size=16)
+
+
+def build_corpus(seed=7):
+    """Return [(name, image, line_boxes)] of synthetic captures."""
+    rng = random.Random(seed)
+    corpus = [
+        ("dialog", *_dialog(rng)),
+        ("code editor", *_code_editor(rng)),
+        ("web page", *_web_page(rng)),
+        ("subtitle frame", *_subtitle_frame(rng)),
+        ("tight crop", *_tight_crop(rng)),
+    ]
+    corpus.append(("photo", _photo(rng, (1600, 1200)), []))
+    return corpus
+
+
+def _correlation(a, b):
+    """Normalized cross-correlation of two equally sized L images."""
+    mean_a, mean_b = ImageStat.Stat(a).mean[0], ImageStat.Stat(b).mean[0]
+    std_a, std_b = ImageStat.Stat(a).stddev[0], ImageStat.Stat(b).stddev[0]
+    if std_a < 1e-6 or std_b < 1e-6:
+        return 0.0
+    product = ImageStat.Stat(ImageChops.multiply(a, b)).mean[0] * 255
+    return (product - mean_a * mean_b) / (std_a * std_b)
+
+
+def stand_in_accuracy(image, payload, lines):
+    """Share of text lines the OCR stand-in reads correctly from the payload."""
+    if not lines:
+        return None
+    original = image.convert("L")
+    with Image.open(BytesIO(payload)) as decoded:
+        decoded = decoded.convert("L").resize(original.size, Image.BICUBIC)
+    read = sum(_correlation(original.crop(box), decoded.crop(box)) >= READ_THRESHOLD for box in lines)
+    return read / len(lines)
+
+
+def _fixed(image):
+    return encode_jpeg(resize_long_edge(image, 1280), quality=80)
+
+
+def _measure(encode, corpus):
+    """Return per-capture (median_ms, payload_bytes, accuracy) for one encoder."""
+    results = {}
+    for name, image, lines in corpus:
+        timings = []
+        for _ in range(ITERATIONS):
+            started = time.perf_counter()
+            payload = encode(image)
+            timings.append(time.perf_counter() - started)
+        results[name] = (statistics.median(timings) * 1000, len(payload), stand_in_accuracy(image, payload, lines))
+    return results
+
+
+def run_benchmark():
+    """Return {encoder: {capture: (median_ms, bytes, accuracy)}} for both encoders."""
+    corpus = build_corpus()
+    encoder = AdaptiveImageEncoder()
+    return {
+        "fixed": _measure(_fixed, corpus),
+        "adaptive": _measure(lambda image: encoder.encode(image).data, corpus),
+    }
+
+
+def _report(results):
+    for policy, captures in results.items():
+        for name, (median_ms, size, accuracy) in captures.items():
+            read = "   n/a" if accuracy is None else f"{accuracy:6.0%}"
+            print(f"{policy:>8} {name:>14}: {median_ms:7.1f} ms, {size / 1024:7.1f} KiB, lines read {read}")
+
+
+def test_adaptive_encoding_shrinks_payloads_and_keeps_text():
+    """Adaptive encoding stays within budget, uploads less in total and reads as many lines."""
+    results = run_benchmark()
+    _report(results)
+
+    fixed, adaptive = results["fixed"], results["adaptive"]
+    assert sum(size for _, size, _ in adaptive.values()) < sum(size for _, size, _ in fixed.values())
+    assert all(size <= AdaptiveImageEncoder().target_bytes for _, size, _ in adaptive.values())
+    for name, (_, _, accuracy) in adaptive.items():
+        if accuracy is not None:
+            assert accuracy >= fixed[name][2], name
+
+
+if __name__ == "__main__":
+    _report(run_benchmark())
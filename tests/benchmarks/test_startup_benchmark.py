@@ -0,0 +1,114 @@
+"""
+Benchmark: lazy vs. eager provider client construction at startup.
+
+Each run starts a fresh interpreter that imports the API manager and
+initializes it with OpenAI, Google and DeepL keys configured. The eager run
+then builds every client, as initialization did before clients were built on
+first use. Startup time (best of ``RUNS``) and, in a separate run, the peak
+of Python allocations (tracemalloc) are measured, so the numbers show what
+importing and building unused SDK clients costs, not end-to-end application
+startup.
+
+Run directly for a report::
+
+    python tests/benchmarks/test_startup_benchmark.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.slow
+
+RUNS = 3
+
+_SCRIPT = """
+import json, sys, time, tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+mode, config_dir, trace_memory = sys.argv[1], sys.argv[2], sys.argv[3] == "memory"
+if trace_memory:
+    tracemalloc.start()
+started = time.perf_counter()
+
+from whisperbridge.core.api_manager import manager as manager_module
+from whisperbridge.core.api_manager.providers import APIProvider
+
+settings = {
+    "api_provider": "openai",
+    "openai_api_key": "sk-" + "b" * 40,
+    "google_api_key": "AIza" + "b" * 35,
+    "deepl_api_key": "00000000-0000-0000-0000-000000000000:fx",
+    "api_timeout": 30,
+}
+manager_module.ensure_config_dir = lambda: Path(config_dir)
+manager = manager_module.APIManager(SimpleNamespace(get_setting=settings.get))
+manager.initialize()
+if mode == "eager":
+    for provider in APIProvider:
+        manager._providers.get_client(provider)
+
+elapsed = time.perf_counter() - started
+_, peak = tracemalloc.get_traced_memory()
+print(json.dumps({
+    "startup_ms": elapsed * 1000,
+    "peak_mb": peak / 2**20,
+    "available": all(manager._providers.is_provider_available(p) for p in APIProvider),
+    "sdks_loaded": sorted(m for m in ("openai", "google.genai") if m in sys.modules),
+}))
+"""
+
+
+def _run(mode, config_dir, metric):
+    src = str(Path(__file__).resolve().parents[2] / "src")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))}
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, mode, str(config_dir), metric],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark(tmp_path):
+    """Return {mode: fastest timing run plus the memory run's peak} for lazy and eager startup."""
+    results = {}
+    for mode in ("lazy", "eager"):
+        result = min((_run(mode, tmp_path, "time") for _ in range(RUNS)), key=lambda run: run["startup_ms"])
+        result["peak_mb"] = _run(mode, tmp_path, "memory")["peak_mb"]
+        results[mode] = result
+    return results
+
+
+def _report(results):
+    for mode, result in results.items():
+        print(
+            f"{mode:>5}: startup {result['startup_ms']:7.1f} ms, peak {result['peak_mb']:6.1f} MB, "
+            f"SDKs loaded: {', '.join(result['sdks_loaded']) or 'none'}"
+        )
+
+
+def test_lazy_clients_reduce_startup_cost(tmp_path):
+    """Lazy startup loads no provider SDK and is faster and smaller than eager startup."""
+    results = run_benchmark(tmp_path)
+    _report(results)
+
+    lazy, eager = results["lazy"], results["eager"]
+    assert lazy["available"] and eager["available"]
+    assert lazy["sdks_loaded"] == []
+    assert lazy["startup_ms"] < eager["startup_ms"]
+    assert lazy["peak_mb"] < eager["peak_mb"]
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        _report(run_benchmark(Path(directory)))
@@ -148,22 +148,22 @@ class TestAPIManagerIntegration:
         assert source2 == "cache"
 
     def test_concurrent_translation_requests(self, api_manager, config_openai, mock_openai_client):
-        """Test handling multiple concurrent requests."""
+        """Test handling multiple concurrent distinct requests."""
         api_manager.initialize()
         
         results = []
         errors = []
-        def make_call():
+        def make_call(index):
             try:
                 resp, _ = api_manager.make_translation_request(
-                    messages=[{"role": "user", "content": "Hi"}],
+                    messages=[{"role": "user", "content": f"Hi {index}"}],
                     model_hint="gpt-5.4-mini"
                 )
                 results.append(resp)
             except Exception as e:
                 errors.append(e)
 
-        threads = [threading.Thread(target=make_call) for _ in range(5)]
+        threads = [threading.Thread(target=make_call, args=(i,)) for i in range(5)]
         for t in threads: t.start()
         for t in threads: t.join()
 
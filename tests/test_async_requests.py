@@ -0,0 +1,267 @@
+"""
+Tests for the async-native request path.
+
+This module tests:
+- Async entry points of the provider adapters
+- APIManager.make_request_async (native acreate, thread fallback, retries)
+- Concurrency, coalescing and cancellation on a single event loop
+- Async iteration of TranslationStream
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.core.api_manager import APIProvider
+from whisperbridge.core.api_manager.coalescing import RequestCoalescer
+from whisperbridge.core.api_manager.streaming import TranslationStream
+from whisperbridge.providers.deepl_adapter import DeepLClientAdapter
+from whisperbridge.providers.openai_adapter import OpenAIChatClientAdapter
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+def _completion(content="Hallo"):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+        usage=SimpleNamespace(total_tokens=4),
+    )
+
+
+class TestAsyncAdapters:
+    """Tests for acreate in provider adapters."""
+
+    def test_openai_acreate_uses_async_client(self, mocker):
+        """acreate awaits the AsyncOpenAI client with the same parameters as create."""
+        mocker.patch("openai.OpenAI")
+        async_client = mocker.Mock()
+        async_client.chat.completions.create = mocker.AsyncMock(return_value=_completion())
+        async_factory = mocker.patch("openai.AsyncOpenAI", return_value=async_client)
+        adapter = OpenAIChatClientAdapter(api_key="sk-fake-key", timeout=30)
+
+        response = asyncio.run(adapter.chat.completions.acreate(model="gpt-5.4-mini", messages=MESSAGES))
+
+        assert response.choices[0].message.content == "Hallo"
+        async_factory.assert_called_once_with(
+            api_key="sk-fake-key", base_url=adapter._client.base_url, timeout=30, http_client=None
+        )
+        assert async_client.chat.completions.create.call_args.kwargs["model"] == "gpt-5.4-mini"
+
+    def test_deepl_acreate_posts_with_async_client(self, mocker):
+        """acreate sends the same form data as create through the async HTTP client."""
+        response = mocker.Mock()
+        response.json.return_value = {"translations": [{"text": "Hallo", "detected_source_language": "EN"}]}
+        client = mocker.Mock()
+        client.is_closed = False
+        client.post = mocker.AsyncMock(return_value=response)
+        mocker.patch("whisperbridge.providers.http_transport.httpx.AsyncClient", return_value=client)
+        adapter = DeepLClientAdapter(api_key="fake-key:fx", timeout=30)
+
+        result = asyncio.run(
+            adapter.chat.completions.acreate(model="deepl-translate", messages=MESSAGES, target_lang="DE")
+        )
+
+        assert result.choices[0].message.content == "Hallo"
+        assert client.post.call_args.kwargs["data"]["target_lang"] == "DE"
+
+
+class TestMakeRequestAsync:
+    """Tests for APIManager.make_request_async."""
+
+    def test_uses_native_acreate(self, api_manager, config_openai, mock_openai_client, mocker):
+        """A coroutine acreate is awaited instead of calling create."""
+        mock_openai_client.chat.completions.acreate = mocker.AsyncMock(return_value=_completion())
+        api_manager.initialize()
+
+        response = asyncio.run(
+            api_manager.make_request_async(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+        )
+
+        assert response.choices[0].message.content == "Hallo"
+        mock_openai_client.chat.completions.create.assert_not_called()
+
+    def test_falls_back_to_create_in_thread(self, api_manager, config_openai, mock_openai_client):
+        """Clients without a coroutine acreate are called through create."""
+        api_manager.initialize()
+
+        response = asyncio.run(
+            api_manager.make_request_async(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+        )
+
+        assert response is mock_openai_client.chat.completions.create.return_value
+
+    def test_retries_retryable_errors(self, api_manager, config_openai, mock_openai_client, mocker):
+        """Rate limit errors are retried with the shared retry policy."""
+        error = Exception("rate limit exceeded")
+        mock_openai_client.chat.completions.acreate = mocker.AsyncMock(side_effect=[error, error, _completion()])
+        api_manager.initialize()
+        mocker.patch("asyncio.sleep", mocker.AsyncMock())
+
+        response = asyncio.run(
+            api_manager.make_request_async(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+        )
+
+        assert response.choices[0].message.content == "Hallo"
+        assert mock_openai_client.chat.completions.acreate.call_count == 3
+
+    def test_requires_initialization(self, api_manager):
+        """The async entry point is guarded like the sync one."""
+        with pytest.raises(RuntimeError, match="not initialized"):
+            asyncio.run(api_manager.make_request_async(APIProvider.OPENAI, model="m", messages=MESSAGES))
+
+
+class TestSingleLoopConcurrency:
+    """Tests for concurrent async translation requests on one event loop."""
+
+    @pytest.fixture
+    def manager(self, api_manager, config_openai, mock_openai_client):
+        api_manager.initialize()
+        self.client = mock_openai_client
+        return api_manager
+
+    def test_distinct_requests_overlap(self, manager):
+        """Different requests run concurrently without worker threads."""
+
+        async def acreate(**kwargs):
+            await asyncio.sleep(0.2)
+            return _completion(kwargs["messages"][0]["content"])
+
+        self.client.chat.completions.acreate = acreate
+
+        async def run():
+            return await asyncio.gather(*(
+                manager.make_translation_request_async([{"role": "user", "content": f"text {i}"}], "gpt-5.4-mini")
+                for i in range(4)
+            ))
+
+        started = time.monotonic()
+        results = asyncio.run(run())
+
+        assert time.monotonic() - started < 0.6
+        assert [response.choices[0].message.content for response, _ in results] == [f"text {i}" for i in range(4)]
+
+    def test_identical_requests_are_coalesced(self, manager):
+        """Identical concurrent requests share one provider call."""
+        calls = []
+
+        async def acreate(**kwargs):
+            calls.append(kwargs)
+            await asyncio.sleep(0.05)
+            return _completion()
+
+        self.client.chat.completions.acreate = acreate
+
+        async def run():
+            return await asyncio.gather(*(
+                manager.make_translation_request_async(MESSAGES, "gpt-5.4-mini") for _ in range(3)
+            ))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert {id(response) for response, _ in results} == {id(results[0][0])}
+
+    def test_wait_for_timeout_cancels_provider_call(self, manager):
+        """A timed-out await cancels the in-flight provider coroutine."""
+        cancelled = []
+
+        async def acreate(**kwargs):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        self.client.chat.completions.acreate = acreate
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(manager.make_translation_request_async(MESSAGES, "gpt-5.4-mini"), 0.1)
+            # Let the cancelled shared task unwind
+            await asyncio.sleep(0)
+
+        started = time.monotonic()
+        asyncio.run(run())
+
+        assert time.monotonic() - started < 1
+        assert cancelled == [True]
+        assert manager._coalescer.in_flight_count() == 0
+
+
+class TestAsyncCoalescerCancellation:
+    """Tests for reference-counted cancellation in RequestCoalescer.run_async."""
+
+    def test_one_cancelled_caller_does_not_cancel_others(self):
+        """The shared task keeps running while another caller still waits."""
+        coalescer = RequestCoalescer()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def run():
+            first = asyncio.ensure_future(coalescer.run_async("k", work))
+            second = asyncio.ensure_future(coalescer.run_async("k", work))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second, first.cancelled()
+
+        assert asyncio.run(run()) == ("done", True)
+
+    def test_requests_on_different_loops_are_not_shared(self):
+        """Each event loop gets its own shared task; finished loops leave no entries behind."""
+        coalescer = RequestCoalescer()
+        both_started = threading.Barrier(2, timeout=5)
+        loops = []
+
+        async def work():
+            loops.append(asyncio.get_running_loop())
+            await asyncio.to_thread(both_started.wait)
+            return "done"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(asyncio.run(coalescer.run_async("k", work))))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert results == ["done", "done"]
+        assert loops[0] is not loops[1]
+        assert coalescer.stats() == {"started": 2, "coalesced": 0, "in_flight": 0}
+        assert len(coalescer._async_inflight) == 0
+
+
+class TestAsyncTranslationStream:
+    """Tests for async iteration of TranslationStream."""
+
+    def test_async_iteration_yields_deltas_and_closes(self):
+        """Async chunk iterators are consumed with async for and closed afterwards."""
+        closed = []
+
+        async def chunks():
+            try:
+                for text in ("Hal", "lo"):
+                    yield SimpleNamespace(
+                        choices=[SimpleNamespace(delta=SimpleNamespace(content=text), finish_reason=None)],
+                        usage=None,
+                    )
+                yield SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=7))
+            finally:
+                closed.append(True)
+
+        stream = TranslationStream(chunks(), "gpt-5.4-mini")
+
+        async def consume():
+            return [delta async for delta in stream]
+
+        assert asyncio.run(consume()) == ["Hal", "lo"]
+        assert stream.text == "Hallo"
+        assert stream.tokens_used == 7
+        assert closed == [True]
@@ -0,0 +1,151 @@
+"""
+Tests for the shared asyncio runtime.
+
+This module tests:
+- Lazy start and reuse of one loop across submissions
+- Timeouts and cancellation through the returned futures
+- Shutdown of pending tasks
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+from whisperbridge.core.async_runtime import AsyncRuntime
+
+
+@pytest.fixture
+def runtime():
+    runtime = AsyncRuntime(name="test-runtime")
+    yield runtime
+    runtime.shutdown(timeout=1.0)
+
+
+class TestAsyncRuntime:
+    """Tests for AsyncRuntime."""
+
+    def test_starts_lazily_and_reuses_loop(self, runtime):
+        """The loop starts on first submit and serves every later coroutine."""
+        assert not runtime.is_running()
+
+        async def current():
+            return asyncio.get_running_loop(), threading.current_thread().name
+
+        first = runtime.run(current())
+        second = runtime.run(current())
+
+        assert runtime.is_running()
+        assert first[0] is second[0]
+        assert first[1] == "test-runtime"
+
+    def test_default_executor_persists(self, runtime):
+        """run_in_executor reuses the loop's default executor across requests."""
+
+        async def executor():
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, lambda: None)
+            return loop._default_executor
+
+        assert runtime.run(executor()) is runtime.run(executor())
+
+    def test_run_timeout_cancels_task(self, runtime):
+        """An expired timeout cancels the coroutine on the loop."""
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(concurrent.futures.TimeoutError):
+            runtime.run(slow(), timeout=0.05)
+
+        assert cancelled.wait(1)
+
+    def test_future_cancel_reaches_task(self, runtime):
+        """Cancelling the submitted future cancels the task."""
+        started = threading.Event()
+        cancelled = threading.Event()
+
+        async def slow():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        future = runtime.submit(slow())
+        assert started.wait(1)
+        future.cancel()
+
+        assert cancelled.wait(1)
+
+    def test_run_from_runtime_thread_is_rejected(self, runtime):
+        """Blocking on the runtime from its own thread raises instead of deadlocking."""
+
+        async def nested():
+            async def inner():
+                return 1
+
+            with pytest.raises(RuntimeError, match="runtime thread"):
+                runtime.run(inner())
+            return "ok"
+
+        assert runtime.run(nested()) == "ok"
+
+    def test_shutdown_cancels_pending_tasks(self, runtime):
+        """Shutdown cancels pending tasks and stops the thread."""
+        cancelled = threading.Event()
+
+        async def pending():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        runtime.submit(pending())
+        loop = runtime.loop
+        runtime.shutdown(timeout=1.0)
+
+        assert cancelled.is_set()
+        assert not runtime.is_running()
+        assert loop.is_closed()
+
+    def test_shutdown_warns_when_task_ignores_cancellation(self, runtime, loguru_caplog):
+        """A task that refuses to stop does not block shutdown beyond the grace period."""
+        started = threading.Event()
+
+        async def stubborn():
+            started.set()
+            for _ in range(3):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    continue
+
+        runtime.submit(stubborn())
+        assert started.wait(1)
+        runtime.shutdown(timeout=0.1)
+
+        assert any(
+            "Task cancellation timed out" in record.message and record.levelname == "WARNING"
+            for record in loguru_caplog.records
+        )
+
+    def test_restarts_after_shutdown(self, runtime):
+        """A runtime that was shut down starts a fresh loop on the next submit."""
+
+        async def loop_of():
+            return asyncio.get_running_loop()
+
+        first = runtime.run(loop_of())
+        runtime.shutdown(timeout=1.0)
+        second = runtime.run(loop_of())
+
+        assert first is not second
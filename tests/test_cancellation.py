@@ -0,0 +1,252 @@
+"""
+Tests for request cancellation.
+
+This module tests:
+- CancelToken callbacks, task cancellation and stream relaying
+- Cancellable adapter calls that close the in-flight HTTP request
+- APIManager aborting coalesced provider calls, vision requests and retry backoff
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from whisperbridge.core.api_manager.cancellation import CancelToken
+from whisperbridge.core.api_manager.errors import APIErrorType, RequestCancelledError, RetryableAPIError
+from whisperbridge.core.api_manager.retry import RetryEngine, RetryPolicy
+from whisperbridge.core.async_runtime import get_async_runtime
+from whisperbridge.core.image_parts import EncodedImage, image_part
+from whisperbridge.providers.deepl_adapter import DeepLClientAdapter
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+def _cancel_later(token, seconds=0.05):
+    timer = threading.Timer(seconds, token.cancel)
+    timer.start()
+    return timer
+
+
+class TestCancelToken:
+    """Tests for CancelToken."""
+
+    def test_callbacks_run_once(self):
+        """Callbacks run on the first cancel only; late callbacks run immediately."""
+        token = CancelToken()
+        calls = []
+        token.add_callback(lambda: calls.append("early"))
+        remove = token.add_callback(lambda: calls.append("removed"))
+        remove()
+
+        token.cancel()
+        token.set()
+        token.add_callback(lambda: calls.append("late"))
+
+        assert calls == ["early", "late"]
+        assert token.cancelled and token.is_set()
+
+    def test_run_cancels_pending_task_from_another_thread(self):
+        """Cancelling from another thread aborts the awaited task with RequestCancelledError."""
+        token = CancelToken()
+        aborted = []
+
+        async def request():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                aborted.append(True)
+                raise
+
+        async def run():
+            _cancel_later(token)
+            await token.run(request())
+
+        started = time.monotonic()
+        with pytest.raises(RequestCancelledError):
+            asyncio.run(run())
+
+        assert aborted == [True]
+        assert time.monotonic() - started < 1
+
+    def test_outer_cancellation_is_not_converted(self):
+        """Cancelling the awaiting task itself still raises CancelledError."""
+        token = CancelToken()
+
+        async def run():
+            task = asyncio.ensure_future(token.run(asyncio.sleep(10)))
+            await asyncio.sleep(0)
+            task.cancel()
+            await task
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(run())
+
+    def test_iterate_aborts_read_and_closes_stream(self):
+        """A cancelled stream stops mid-read and is closed."""
+        token = CancelToken()
+        closed = []
+
+        class Stream:
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                if token.cancelled or closed:
+                    raise StopAsyncIteration
+                await asyncio.sleep(0.01 if not received else 10)
+                return "chunk"
+
+            async def close(self):
+                closed.append(True)
+
+        received = []
+
+        async def run():
+            async for chunk in token.iterate(Stream()):
+                received.append(chunk)
+                _cancel_later(token)
+
+        with pytest.raises(RequestCancelledError):
+            asyncio.run(run())
+
+        assert received == ["chunk"]
+        assert closed == [True]
+
+
+class TestCancellableAdapters:
+    """Tests for cancel_token in provider adapters."""
+
+    def test_deepl_sync_call_is_aborted(self, mocker):
+        """A blocking create with a token returns as soon as the token is cancelled."""
+        aborted = threading.Event()
+
+        async def post(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                aborted.set()
+                raise
+
+        client = mocker.Mock()
+        client.is_closed = False
+        client.post = post
+        mocker.patch("whisperbridge.providers.http_transport.httpx.AsyncClient", return_value=client)
+        adapter = DeepLClientAdapter(api_key="fake-key:fx", timeout=30)
+        token = CancelToken()
+        _cancel_later(token)
+
+        started = time.monotonic()
+        with pytest.raises(RequestCancelledError):
+            adapter.chat.completions.create(
+                model="deepl-translate", messages=MESSAGES, target_lang="DE", cancel_token=token
+            )
+
+        assert time.monotonic() - started < 1
+        assert aborted.wait(1)
+
+    def test_deepl_cancelled_token_skips_request(self, mocker):
+        """An already cancelled token never reaches the network."""
+        client = mocker.Mock()
+        client.is_closed = False
+        client.post = mocker.AsyncMock()
+        mocker.patch("whisperbridge.providers.http_transport.httpx.AsyncClient", return_value=client)
+        adapter = DeepLClientAdapter(api_key="fake-key:fx", timeout=30)
+        token = CancelToken()
+        token.cancel()
+
+        with pytest.raises(RequestCancelledError):
+            get_async_runtime().run(
+                adapter.chat.completions.acreate(model="deepl-translate", messages=MESSAGES, cancel_token=token)
+            )
+
+        client.post.assert_not_awaited()
+
+
+class TestAPIManagerCancellation:
+    """Tests for cancellation in APIManager."""
+
+    def test_cancelled_callers_abort_shared_call(self, api_manager, config_openai, mock_openai_client):
+        """Once the only caller cancels, the provider call sees its token cancelled and returns."""
+        api_manager.initialize()
+        tokens = []
+        started = threading.Event()
+
+        def create(cancel_token=None, **kwargs):
+            tokens.append(cancel_token)
+            started.set()
+            cancel_token.wait(2)
+            raise RequestCancelledError("Request cancelled")
+
+        mock_openai_client.chat.completions.create.side_effect = create
+        cancel = CancelToken()
+        # Cancel only once the provider call is in flight, not during request setup
+        threading.Thread(target=lambda: started.wait(5) and cancel.cancel(), daemon=True).start()
+
+        with pytest.raises(RequestCancelledError):
+            api_manager.make_translation_request(
+                messages=MESSAGES, model_hint="gpt-5.4-mini", cancel_event=cancel
+            )
+
+        assert tokens and tokens[0].wait(1)
+        for _ in range(100):
+            if api_manager._coalescer.in_flight_count() == 0 and mock_openai_client.chat.completions.create.call_count:
+                break
+            time.sleep(0.01)
+        assert mock_openai_client.chat.completions.create.call_count == 1
+        assert api_manager.get_circuit_state("openai") == "closed"
+
+    def test_cancel_aborts_vision_request(self, api_manager, config_openai, mock_openai_client):
+        """The vision request hands its token to the provider call."""
+        api_manager.initialize()
+        started = threading.Event()
+
+        def create(cancel_token=None, **kwargs):
+            started.set()
+            cancel_token.wait(2)
+            cancel_token.raise_if_cancelled()
+
+        mock_openai_client.chat.completions.create.side_effect = create
+        token = CancelToken()
+        threading.Thread(target=lambda: started.wait(5) and token.cancel(), daemon=True).start()
+        messages = [{"role": "user", "content": [image_part(EncodedImage(b"jpeg"))]}]
+
+        with pytest.raises(RequestCancelledError):
+            api_manager.make_vision_request(messages, "gpt-5.4-mini", cancel_token=token)
+
+        assert mock_openai_client.chat.completions.create.call_count == 1
+
+    def test_cancellation_is_not_retried(self, api_manager, config_openai, mock_openai_client):
+        """A cancelled attempt is not retried and does not count against the provider."""
+        api_manager.initialize()
+        mock_openai_client.chat.completions.create.side_effect = RequestCancelledError("Request cancelled")
+        token = CancelToken()
+
+        with pytest.raises(RequestCancelledError):
+            api_manager.make_request_sync(
+                api_manager._resolve_provider(), cancel_token=token, model="gpt-5.4-mini", messages=MESSAGES
+            )
+
+        assert mock_openai_client.chat.completions.create.call_count == 1
+        assert "openai/gpt-5.4-mini" not in api_manager.get_router_stats()
+
+    def test_cancel_cuts_retry_backoff_short(self):
+        """Setting the token ends a pending backoff instead of sleeping it out."""
+        engine = RetryEngine(RetryPolicy(max_attempts=2, base_delay=5, max_delay=5))
+        token = CancelToken()
+        calls = []
+
+        def attempt():
+            calls.append(time.monotonic())
+            token.raise_if_cancelled()
+            _cancel_later(token)
+            raise RetryableAPIError("timeout", error_type=APIErrorType.TIMEOUT)
+
+        started = time.monotonic()
+        with pytest.raises(RequestCancelledError):
+            engine.call(attempt, cancel_token=token)
+
+        assert len(calls) == 2
+        assert time.monotonic() - started < 1
+        assert engine.metrics.stats()["recent"][-1]["outcome"] == "cancelled"
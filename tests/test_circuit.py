@@ -0,0 +1,204 @@
+"""
+Tests for per-provider circuit breakers.
+
+This module tests:
+- CircuitBreaker state transitions (open, half-open trial, close, back-off)
+- ConnectionWarmer.probe reachability checks
+- APIManager fast-fail, probing, failover and metrics
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.core.api_manager import APIErrorType, APIProvider, CircuitOpenError
+from whisperbridge.core.api_manager.circuit import CircuitBreaker, CircuitBreakers, CircuitPolicy, CircuitState
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+POLICY = CircuitPolicy(failure_threshold=3, open_seconds=10, max_open_seconds=30, trial_timeout=60)
+
+
+@pytest.fixture
+def clock(mocker):
+    """Controllable monotonic clock for the circuit module."""
+    now = SimpleNamespace(value=1000.0)
+    mocker.patch("whisperbridge.core.api_manager.circuit.time.monotonic", side_effect=lambda: now.value)
+    return now
+
+
+def _open(breaker):
+    for _ in range(breaker.policy.failure_threshold):
+        breaker.record_failure(APIErrorType.NETWORK)
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_consecutive_outage_errors(self, clock):
+        """Only consecutive network/timeout/server errors open the breaker."""
+        breaker = CircuitBreaker("openai", POLICY)
+        breaker.record_failure(APIErrorType.TIMEOUT)
+        breaker.record_failure(APIErrorType.SERVER_ERROR)
+        breaker.record_failure(APIErrorType.AUTHENTICATION)  # the provider answered
+        breaker.record_failure(APIErrorType.NETWORK)
+        breaker.record_failure(APIErrorType.NETWORK)
+        assert breaker.state == CircuitState.CLOSED
+
+        assert breaker.record_failure(APIErrorType.NETWORK) is True
+        assert breaker.state == CircuitState.OPEN
+
+    def test_open_breaker_fails_fast(self, clock):
+        """Requests are rejected until the open period has passed."""
+        breaker = CircuitBreaker("openai", POLICY)
+        _open(breaker)
+        clock.value += 4
+
+        with pytest.raises(CircuitOpenError) as excinfo:
+            breaker.allow_request()
+
+        assert excinfo.value.provider == "openai"
+        assert excinfo.value.retry_in == pytest.approx(6)
+        assert breaker.stats()["rejected"] == 1
+
+    def test_half_open_admits_one_trial(self, clock):
+        """After the open period one trial passes; a successful trial closes the breaker."""
+        breaker = CircuitBreaker("openai", POLICY)
+        _open(breaker)
+        clock.value += 10
+
+        breaker.allow_request()
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.allow_request()
+
+    def test_failed_trial_doubles_open_period(self, clock):
+        """A failing trial reopens the breaker for twice as long, up to the limit."""
+        breaker = CircuitBreaker("openai", POLICY)
+        _open(breaker)
+        for expected in (20, 30):
+            clock.value += 100
+            assert breaker.try_probe() is True
+            assert breaker.record_failure(APIErrorType.NETWORK) is True
+            assert breaker.retry_in() == pytest.approx(expected)
+
+    def test_stale_trial_frees_its_slot(self, clock):
+        """A trial that never reports back does not block the breaker forever."""
+        breaker = CircuitBreaker("openai", POLICY)
+        _open(breaker)
+        clock.value += 10
+        breaker.allow_request()
+
+        clock.value += 61
+
+        breaker.allow_request()
+
+
+class TestProbe:
+    """Tests for ConnectionWarmer.probe."""
+
+    @pytest.fixture
+    def warmer(self, api_manager, mocker):
+        transport = mocker.Mock()
+        transport.async_client.head = mocker.AsyncMock()
+        api_manager._providers.get_transport = mocker.Mock(return_value=transport)
+        return api_manager._warmer, transport.async_client.head
+
+    @pytest.mark.parametrize("status, reachable", [(401, True), (404, True), (503, False)])
+    def test_status_decides_reachability(self, warmer, status, reachable):
+        """Any answer below 500 means the endpoint is reachable."""
+        warmer, head = warmer
+        head.return_value = SimpleNamespace(status_code=status)
+
+        assert asyncio.run(warmer.probe(SimpleNamespace(warmup_url="https://api.example/v1"))) is reachable
+        assert head.await_args.args == ("https://api.example/v1",)
+
+    def test_connection_error_is_unreachable(self, warmer):
+        """A failing HEAD request means the endpoint is unreachable."""
+        warmer, head = warmer
+        head.side_effect = OSError("connection refused")
+
+        assert asyncio.run(warmer.probe(SimpleNamespace(warmup_url="https://api.example/v1"))) is False
+
+    def test_client_without_url_cannot_be_probed(self, warmer):
+        """Clients without a warm-up URL are not probed."""
+        warmer, head = warmer
+
+        assert asyncio.run(warmer.probe(SimpleNamespace())) is None
+        head.assert_not_awaited()
+
+
+class TestAPIManagerCircuit:
+    """Tests for circuit breakers in APIManager."""
+
+    @pytest.fixture
+    def down_openai(self, api_manager, config_openai, mock_openai_client, mocker):
+        mocker.patch("tenacity.nap.time.sleep")
+        mocker.patch.object(api_manager, "_schedule_probe")
+        mock_openai_client.chat.completions.create.side_effect = Exception("connection refused")
+        api_manager.initialize()
+        return mock_openai_client
+
+    def test_outage_opens_circuit_and_fails_fast(self, api_manager, down_openai):
+        """After an outage the next request fails without contacting the provider."""
+        with pytest.raises(Exception):
+            api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+        calls = down_openai.chat.completions.create.call_count
+
+        with pytest.raises(CircuitOpenError):
+            api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+
+        assert down_openai.chat.completions.create.call_count == calls
+        assert api_manager.get_circuit_state("openai") == "open"
+        stats = api_manager.get_circuit_stats()["openai"]
+        assert (stats["opened"], stats["rejected"]) == (1, 1)
+        api_manager._schedule_probe.assert_called_once_with(APIProvider.OPENAI)
+
+    def test_probe_closes_circuit(self, api_manager, down_openai, mocker):
+        """A reachable probe closes the circuit once the open period has passed."""
+        api_manager._breakers = CircuitBreakers(CircuitPolicy(open_seconds=0.01))
+        _open(api_manager._breakers.get("openai"))
+        mocker.patch.object(api_manager._warmer, "probe", mocker.AsyncMock(side_effect=[False, True]))
+
+        asyncio.run(api_manager._probe_until_closed(APIProvider.OPENAI))
+
+        assert api_manager.get_circuit_state("openai") == "closed"
+        assert api_manager._warmer.probe.await_count == 2
+
+    def test_unprobeable_provider_leaves_trial_to_next_request(self, api_manager, down_openai, mocker):
+        """Without a probe the next real request becomes the half-open trial."""
+        api_manager._breakers = CircuitBreakers(CircuitPolicy(open_seconds=0.01))
+        _open(api_manager._breakers.get("openai"))
+        mocker.patch.object(api_manager._warmer, "probe", mocker.AsyncMock(return_value=None))
+        asyncio.run(api_manager._probe_until_closed(APIProvider.OPENAI))
+        down_openai.chat.completions.create.side_effect = None
+
+        api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+
+        assert api_manager.get_circuit_state("openai") == "closed"
+
+    def test_routing_fails_over_from_open_circuit(
+        self, api_manager, mock_config_service, mock_openai_client, mock_google_client
+    ):
+        """With automatic provider selection an open provider is skipped."""
+        mock_config_service.get_setting.side_effect = {
+            "openai_api_key": "sk-test123",
+            "google_api_key": "AIzatest123",
+            "api_provider": "openai",
+            "openai_model": "gpt-5.4-mini",
+            "google_model": "gemini-2.5-flash",
+            "auto_provider_routing": True,
+        }.get
+        api_manager.initialize()
+        for seconds in (0.1, 0.1, 0.1):
+            api_manager._router.record_success("openai", "gpt-5.4-mini", seconds)
+            api_manager._router.record_success("google", "gemini-2.5-flash", seconds * 10)
+        assert api_manager.resolve_provider_name("translate") == "openai"
+
+        _open(api_manager._breakers.get("openai"))
+
+        assert api_manager.resolve_provider_name("translate") == "google"
@@ -0,0 +1,254 @@
+"""
+Tests for RequestCoalescer in api_manager.coalescing module.
+
+This module tests single-flight behavior including:
+- Key derivation
+- Sharing one in-flight call between concurrent callers
+- Error propagation to every caller
+- Reference-counted cancellation
+- APIManager integration
+"""
+
+import threading
+
+import pytest
+
+from whisperbridge.core.api_manager import throttling
+from whisperbridge.core.api_manager.coalescing import RequestCoalescer
+from whisperbridge.core.api_manager.errors import RequestCancelledError
+from whisperbridge.core.api_manager.retry import remaining_time, request_deadline
+from whisperbridge.core.api_manager.throttling import PRIORITY_BACKGROUND, request_priority
+from whisperbridge.core.image_parts import EncodedImage, image_part
+
+
+def _start_callers(coalescer, key, func, count, cancel_events=None):
+    """Start ``count`` threads calling ``coalescer.run`` and collect outcomes."""
+    outcomes = [None] * count
+    cancel_events = cancel_events or [None] * count
+
+    def call(index):
+        try:
+            outcomes[index] = ("ok", coalescer.run(key, func, cancel_events[index]))
+        except BaseException as e:
+            outcomes[index] = ("error", e)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def _wait_for_refcount(coalescer, key, count):
+    """Wait until ``count`` callers are attached to the in-flight request."""
+    for _ in range(200):
+        with coalescer._lock:
+            request = coalescer._inflight.get(key)
+            if request is not None and request.refcount == count:
+                return
+        threading.Event().wait(0.01)
+    raise AssertionError("callers did not attach in time")
+
+
+class TestCoalescingKey:
+    """Tests for coalescing key derivation."""
+
+    def test_key_is_order_independent_for_kwargs(self):
+        """Dictionary ordering does not affect the key."""
+        k1 = RequestCoalescer.make_key("openai", {"model": "m", "messages": [], "a": 1})
+        k2 = RequestCoalescer.make_key("openai", {"a": 1, "messages": [], "model": "m"})
+        assert k1 == k2
+
+    def test_key_differs_by_provider_and_messages(self):
+        """Provider and messages are part of the key."""
+        params = {"model": "m", "messages": [{"role": "user", "content": "Hi"}]}
+        other = {"model": "m", "messages": [{"role": "user", "content": "Hello"}]}
+        assert RequestCoalescer.make_key("openai", params) != RequestCoalescer.make_key("google", params)
+        assert RequestCoalescer.make_key("openai", params) != RequestCoalescer.make_key("openai", other)
+
+    def test_image_bytes_are_keyed_by_digest(self):
+        """Image parts are keyed by their content hash, not their bytes."""
+        def key(data):
+            image = EncodedImage(data, "image/jpeg")
+            return RequestCoalescer.make_key("google", {"model": "m", "messages": [{"role": "user", "content": [image_part(image)]}]})
+
+        assert key(b"a" * 1000) == key(b"a" * 1000)
+        assert key(b"a" * 1000) != key(b"b" * 1000)
+        assert str(EncodedImage(b"a" * 100_000)).startswith("image/jpeg;sha256=")
+        assert len(str(EncodedImage(b"a" * 100_000))) < 100
+
+class TestSingleFlight:
+    """Tests for sharing one in-flight call."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """All callers get the same result from a single execution."""
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+        calls = []
+
+        def func(_cancelled):
+            calls.append(1)
+            release.wait(2)
+            return "response"
+
+        threads, outcomes = _start_callers(coalescer, "key", func, 4)
+        _wait_for_refcount(coalescer, "key", 4)
+        release.set()
+        for thread in threads:
+            thread.join(2)
+
+        assert len(calls) == 1
+        assert outcomes == [("ok", "response")] * 4
+        assert coalescer.stats()["coalesced"] == 3
+        assert coalescer.in_flight_count() == 0
+
+    def test_error_is_delivered_to_every_caller(self):
+        """A failing request raises the same error for all attached callers."""
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+
+        def func(_cancelled):
+            release.wait(2)
+            raise ValueError("provider failed")
+
+        threads, outcomes = _start_callers(coalescer, "key", func, 3)
+        _wait_for_refcount(coalescer, "key", 3)
+        release.set()
+        for thread in threads:
+            thread.join(2)
+
+        assert all(kind == "error" and isinstance(err, ValueError) for kind, err in outcomes)
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Completed requests are not reused; coalescing is for in-flight calls only."""
+        coalescer = RequestCoalescer()
+        calls = []
+
+        def func(_cancelled):
+            calls.append(1)
+            return len(calls)
+
+        assert coalescer.run("key", func) == 1
+        assert coalescer.run("key", func) == 2
+
+    def test_leader_context_reaches_shared_call(self):
+        """The shared call sees the leader's request deadline and priority."""
+        coalescer = RequestCoalescer()
+
+        def func(_cancelled):
+            return remaining_time(), throttling._priority.get()
+
+        with request_deadline(30), request_priority(PRIORITY_BACKGROUND):
+            remaining, priority = coalescer.run("key", func)
+
+        assert 0 < remaining <= 30
+        assert priority == PRIORITY_BACKGROUND
+
+
+class TestReferenceCountedCancellation:
+    """Tests for reference-counted cancellation."""
+
+    def test_single_cancel_does_not_abort_others(self):
+        """One caller cancelling detaches only that caller."""
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+        shared_cancel = []
+
+        def func(cancelled):
+            shared_cancel.append(cancelled)
+            release.wait(2)
+            return "response"
+
+        cancel_events = [threading.Event(), threading.Event()]
+        threads, outcomes = _start_callers(coalescer, "key", func, 2, cancel_events)
+        _wait_for_refcount(coalescer, "key", 2)
+
+        cancel_events[0].set()
+        threads[0].join(2)
+        assert outcomes[0][0] == "error"
+        assert isinstance(outcomes[0][1], RequestCancelledError)
+        assert not shared_cancel[0].is_set()
+
+        release.set()
+        threads[1].join(2)
+        assert outcomes[1] == ("ok", "response")
+
+    def test_last_cancel_flags_shared_request(self):
+        """When every caller cancels, the shared request sees its cancel flag."""
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+        shared_cancel = []
+
+        def func(cancelled):
+            shared_cancel.append(cancelled)
+            release.wait(2)
+            return "response"
+
+        cancel_events = [threading.Event(), threading.Event()]
+        threads, outcomes = _start_callers(coalescer, "key", func, 2, cancel_events)
+        _wait_for_refcount(coalescer, "key", 2)
+
+        for event in cancel_events:
+            event.set()
+        for thread in threads:
+            thread.join(2)
+        release.set()
+
+        assert all(isinstance(err, RequestCancelledError) for _, err in outcomes)
+        assert shared_cancel[0].is_set()
+        assert coalescer.in_flight_count() == 0
+
+
+class TestAPIManagerCoalescing:
+    """Tests for coalescing in APIManager.make_translation_request."""
+
+    def test_identical_concurrent_translations_hit_provider_once(self, api_manager, config_openai, mock_openai_client):
+        """Duplicate in-flight translations share one provider call."""
+        api_manager.initialize()
+        release = threading.Event()
+        response = mock_openai_client.chat.completions.create.return_value
+
+        def slow_create(**kwargs):
+            release.wait(2)
+            return response
+
+        mock_openai_client.chat.completions.create.side_effect = slow_create
+        results = []
+
+        def call():
+            resp, _ = api_manager.make_translation_request(
+                messages=[{"role": "user", "content": "Hi"}], model_hint="gpt-5.4-mini"
+            )
+            results.append(resp)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        key = None
+        for _ in range(200):
+            key = next(iter(api_manager._coalescer._inflight), None)
+            if key is not None:
+                break
+            threading.Event().wait(0.01)
+        _wait_for_refcount(api_manager._coalescer, key, 3)
+        release.set()
+        for thread in threads:
+            thread.join(2)
+
+        assert results == [response] * 3
+        assert mock_openai_client.chat.completions.create.call_count == 1
+
+    def test_cancel_event_raises_for_caller(self, api_manager, config_openai, mock_openai_client):
+        """A pre-set cancel event makes the caller stop waiting."""
+        api_manager.initialize()
+        release = threading.Event()
+        mock_openai_client.chat.completions.create.side_effect = lambda **kwargs: release.wait(2)
+        cancel = threading.Event()
+        cancel.set()
+
+        with pytest.raises(RequestCancelledError):
+            api_manager.make_translation_request(
+                messages=[{"role": "user", "content": "Hi"}],
+                model_hint="gpt-5.4-mini",
+                cancel_event=cancel,
+            )
+        release.set()
@@ -0,0 +1,118 @@
+"""
+Tests for the completion token budget policy.
+
+This module tests:
+- Input token estimation for text and multimodal messages
+- Per-mode budgets, floors, reasoning allowance and the model cap
+- Detection of truncated responses
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.core.completion_budget import (
+    COMPLETION_BUDGET_FLOORS,
+    MODE_OCR,
+    MODE_STYLE,
+    MODE_TRANSLATE,
+    REASONING_TOKEN_ALLOWANCE,
+    estimate_message_tokens,
+    get_completion_budget,
+    is_reasoning_model,
+    is_truncated,
+)
+
+
+def _messages(text):
+    return [{"role": "system", "content": "Translate."}, {"role": "user", "content": text}]
+
+
+class TestEstimateMessageTokens:
+    """Tests for estimate_message_tokens."""
+
+    def test_counts_text_and_ignores_images(self):
+        """Text parts of multimodal messages count; image parts do not."""
+        messages = [
+            {"role": "user", "content": [
+                {"type": "text", "text": "a" * 400},
+                {"type": "image_url", "image_url": {"url": "data:image/png;base64," + "A" * 10000}},
+            ]},
+        ]
+
+        assert estimate_message_tokens(messages) == 100
+
+    def test_empty_messages(self):
+        """No messages means no tokens."""
+        assert estimate_message_tokens([]) == 0
+
+
+class TestGetCompletionBudget:
+    """Tests for get_completion_budget."""
+
+    def test_short_input_uses_floor(self):
+        """A ten-word translation reserves the floor, not the model limit."""
+        budget = get_completion_budget("gpt-4o", _messages("ten words of text to translate right now ok"))
+
+        assert budget == COMPLETION_BUDGET_FLOORS[MODE_TRANSLATE]
+
+    def test_budget_scales_with_input_and_mode(self):
+        """Long inputs scale by the per-mode multiplier (style > translate)."""
+        text = "word " * 4000  # ~5000 tokens
+
+        translate = get_completion_budget("gpt-4o", _messages(text), MODE_TRANSLATE)
+        style = get_completion_budget("gpt-4o", _messages(text), MODE_STYLE)
+
+        assert COMPLETION_BUDGET_FLOORS[MODE_TRANSLATE] < translate < style
+
+    def test_reasoning_models_get_allowance(self):
+        """Reasoning models reserve room for hidden reasoning tokens."""
+        budget = get_completion_budget("gpt-5.4-mini", _messages("Hello"))
+
+        assert budget == COMPLETION_BUDGET_FLOORS[MODE_TRANSLATE] + REASONING_TOKEN_ALLOWANCE
+
+    def test_ocr_floor_covers_image_text(self):
+        """OCR output depends on the image, so its floor is higher."""
+        assert get_completion_budget("gpt-4o", _messages("Extract the text"), MODE_OCR) == COMPLETION_BUDGET_FLOORS[MODE_OCR]
+
+    def test_budget_covers_every_output(self):
+        """A request returning several outputs reserves a budget per output."""
+        single = get_completion_budget("gpt-4o", _messages("word " * 1000))
+
+        assert get_completion_budget("gpt-4o", _messages("word " * 1000), outputs=3) == 3 * single
+
+    def test_budget_is_clamped_to_model_cap(self):
+        """The budget never exceeds the model's hard output limit."""
+        assert get_completion_budget("gpt-4", _messages("x" * 100000)) == 4096
+
+    @pytest.mark.parametrize("model,expected", [
+        ("gpt-5.4-mini", True),
+        ("gemini-2.5-flash", True),
+        ("gpt-4o-mini", False),
+        ("gemini-2.0-flash", False),
+        (None, False),
+    ])
+    def test_is_reasoning_model(self, model, expected):
+        """Reasoning families are detected by prefix."""
+        assert is_reasoning_model(model) is expected
+
+
+class TestIsTruncated:
+    """Tests for is_truncated."""
+
+    @pytest.mark.parametrize("finish_reason,expected", [
+        ("length", True),
+        ("max_tokens", True),
+        ("stop", False),
+        (None, False),
+    ])
+    def test_finish_reasons(self, finish_reason, expected):
+        """Only budget-related finish reasons count as truncated."""
+        response = SimpleNamespace(choices=[SimpleNamespace(finish_reason=finish_reason)])
+
+        assert is_truncated(response) is expected
+
+    def test_response_without_choices(self):
+        """Responses without choices are not truncated."""
+        assert is_truncated(SimpleNamespace(choices=[])) is False
+        assert is_truncated({}) is False
@@ -0,0 +1,156 @@
+"""
+Tests for connection pre-warming.
+
+This module tests:
+- Cold vs. warm request classification in LatencyTracker
+- ConnectionWarmer (SDK warm-up, endpoint selection, single flight)
+- APIManager scheduling at startup and after idle periods
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from whisperbridge.core.api_manager.warmup import ConnectionWarmer, LatencyTracker
+
+
+class TestLatencyTracker:
+    """Tests for LatencyTracker."""
+
+    def test_first_request_is_cold_then_warm(self):
+        """Only the request after startup counts as cold."""
+        tracker = LatencyTracker(idle_threshold=60)
+
+        first = tracker.begin_request()
+        tracker.record_request(0.5, first)
+        second = tracker.begin_request()
+        tracker.record_request(0.1, second)
+
+        assert (first, second) == (True, False)
+        stats = tracker.stats()
+        assert stats["cold"] == {"count": 1, "avg_ms": 500.0, "max_ms": 500.0}
+        assert stats["warm"] == {"count": 1, "avg_ms": 100.0, "max_ms": 100.0}
+
+    def test_request_after_idle_is_cold(self):
+        """Requests after the idle threshold count as cold again."""
+        tracker = LatencyTracker(idle_threshold=0.05)
+        tracker.begin_request()
+
+        time.sleep(0.1)
+
+        assert tracker.is_idle()
+        assert tracker.begin_request() is True
+
+    def test_warmup_makes_next_request_warm(self):
+        """A completed warm-up counts as activity."""
+        tracker = LatencyTracker(idle_threshold=60)
+
+        tracker.record_warmup(0.25)
+
+        assert tracker.begin_request() is False
+        assert tracker.stats()["warmups"] == 1
+        assert tracker.stats()["last_warmup_ms"] == 250.0
+
+
+class TestConnectionWarmer:
+    """Tests for ConnectionWarmer."""
+
+    @pytest.fixture
+    def registry(self, mocker):
+        transport = mocker.Mock()
+        transport.awarm = mocker.AsyncMock(side_effect=lambda urls: len(urls))
+        registry = mocker.Mock()
+        registry.get_transport.return_value = transport
+        return registry
+
+    def test_warms_sdks_and_unique_endpoints(self, registry, mocker):
+        """Every client's SDK is warmed and each endpoint is connected once."""
+        clients = [mocker.Mock(warmup_url=url) for url in ("https://a/", "https://b/", "https://a/")]
+        registry.get_all_clients.return_value = clients
+        tracker = LatencyTracker()
+        warmer = ConnectionWarmer(registry, tracker)
+
+        assert warmer.try_begin()
+        reached = asyncio.run(warmer.warm_up("startup"))
+
+        assert reached == 2
+        registry.get_transport.return_value.awarm.assert_awaited_once_with(["https://a/", "https://b/"])
+        registry.get_selected_client.assert_called_once_with()
+        for client in clients:
+            client.warm_up.assert_called_once_with()
+        assert tracker.stats()["warmups"] == 1
+
+    def test_sdk_failures_do_not_abort_warm_up(self, registry, mocker):
+        """A failing SDK warm-up is logged and the endpoints are still connected."""
+        client = mocker.Mock(warmup_url="https://a/")
+        client.warm_up.side_effect = RuntimeError("boom")
+        registry.get_all_clients.return_value = [client]
+        warmer = ConnectionWarmer(registry, LatencyTracker())
+
+        warmer.try_begin()
+
+        assert asyncio.run(warmer.warm_up("startup")) == 1
+
+    def test_only_one_warm_up_at_a_time(self, registry):
+        """try_begin is released once the warm-up finishes."""
+        registry.get_all_clients.return_value = []
+        warmer = ConnectionWarmer(registry, LatencyTracker())
+
+        assert warmer.try_begin()
+        assert not warmer.try_begin()
+        asyncio.run(warmer.warm_up("startup"))
+        assert warmer.try_begin()
+
+
+class TestAPIManagerWarmUp:
+    """Tests for warm-up scheduling in APIManager."""
+
+    @pytest.fixture
+    def config_warmup(self, mock_config_service):
+        mock_config_service.get_setting.side_effect = lambda key: {
+            "openai_api_key": "sk-test123",
+            "api_provider": "openai",
+            "api_timeout": 30,
+            "connection_warmup_enabled": True,
+        }.get(key)
+        return mock_config_service
+
+    def test_initialize_schedules_startup_warm_up(self, api_manager, config_warmup, mock_openai_client, mocker):
+        """A successful initialization warms the configured clients."""
+        mock_openai_client.warmup_url = None
+        schedule = mocker.spy(api_manager, "schedule_warm_up")
+
+        api_manager.initialize()
+
+        schedule.assert_called_once_with("startup")
+        schedule.spy_return.result(timeout=5)
+        mock_openai_client.warm_up.assert_called_once_with()
+        assert api_manager.get_latency_stats()["warmups"] == 1
+
+    def test_disabled_setting_skips_warm_up(self, api_manager, config_openai, mock_openai_client):
+        """Nothing is scheduled unless warm-up is enabled in settings."""
+        api_manager.initialize()
+
+        assert api_manager.schedule_warm_up("manual") is None
+        mock_openai_client.warm_up.assert_not_called()
+
+    def test_warm_up_if_idle_skips_warm_pool(self, api_manager, config_warmup, mock_openai_client):
+        """Recent requests keep the pool warm, so no re-warm is scheduled."""
+        mock_openai_client.warmup_url = None
+        api_manager.initialize()
+        api_manager._latency.begin_request()
+
+        assert api_manager.warm_up_if_idle() is None
+
+    def test_requests_are_split_into_cold_and_warm(self, api_manager, config_openai, mock_openai_client):
+        """The first request is cold, the following one warm."""
+        from whisperbridge.core.api_manager import APIProvider
+
+        api_manager.initialize()
+        for _ in range(2):
+            api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=[])
+
+        stats = api_manager.get_latency_stats()
+        assert stats["cold"]["count"] == 1
+        assert stats["warm"]["count"] == 1
@@ -3,7 +3,7 @@
 import httpx
 import pytest
 
-from whisperbridge.providers.deepl_adapter import DeepLClientAdapter
+from whisperbridge.providers.deepl_adapter import DeepLClientAdapter, pack_texts
 
 
 def test_create_posts_normalized_user_text_to_free_endpoint(mocker):
@@ -12,9 +12,9 @@ def test_create_posts_normalized_user_text_to_free_endpoint(mocker):
         "translations": [{"text": "Hallo", "detected_source_language": "EN"}]
     }
     client = mocker.MagicMock()
-    client.__enter__.return_value = client
+    client.is_closed = False
     client.post.return_value = response
-    client_factory = mocker.patch("whisperbridge.providers.deepl_adapter.httpx.Client", return_value=client)
+    client_factory = mocker.patch("whisperbridge.providers.http_transport.httpx.Client", return_value=client)
 
     adapter = DeepLClientAdapter(api_key="unit-test-key", timeout=7, plan="free")
     result = adapter.chat.completions.create(
@@ -29,7 +29,8 @@ def test_create_posts_normalized_user_text_to_free_endpoint(mocker):
         source_lang=" en ",
     )
 
-    client_factory.assert_called_once_with(timeout=7)
+    client_factory.assert_called_once()
+    assert client_factory.call_args.kwargs["timeout"].read == 7
     client.post.assert_called_once_with(
         "https://api-free.deepl.com/v2/translate",
         headers={
@@ -37,6 +38,7 @@ def test_create_posts_normalized_user_text_to_free_endpoint(mocker):
             "Content-Type": "application/x-www-form-urlencoded",
         },
         data={"text": "Hello\nworld", "target_lang": "DE", "source_lang": "EN"},
+        timeout=7,
     )
     response.raise_for_status.assert_called_once_with()
     assert result.choices[0].message.content == "Hallo"
@@ -46,9 +48,9 @@ def test_create_uses_pro_endpoint_and_omits_auto_detected_source(mocker):
     response = mocker.Mock()
     response.json.return_value = {"translations": [{"text": "Привет"}]}
     client = mocker.MagicMock()
-    client.__enter__.return_value = client
+    client.is_closed = False
     client.post.return_value = response
-    mocker.patch("whisperbridge.providers.deepl_adapter.httpx.Client", return_value=client)
+    mocker.patch("whisperbridge.providers.http_transport.httpx.Client", return_value=client)
 
     adapter = DeepLClientAdapter(api_key="unit-test-key", timeout=11, plan="pro")
     result = adapter.chat.completions.create(
@@ -65,6 +67,7 @@ def test_create_uses_pro_endpoint_and_omits_auto_detected_source(mocker):
             "Content-Type": "application/x-www-form-urlencoded",
         },
         data={"text": "Hello", "target_lang": "UK"},
+        timeout=11,
     )
     assert result.choices[0].message.content == "Привет"
 
@@ -75,9 +78,9 @@ def test_create_propagates_http_failures(mocker):
         "unauthorized", request=mocker.Mock(), response=mocker.Mock(status_code=401)
     )
     client = mocker.MagicMock()
-    client.__enter__.return_value = client
+    client.is_closed = False
     client.post.return_value = response
-    mocker.patch("whisperbridge.providers.deepl_adapter.httpx.Client", return_value=client)
+    mocker.patch("whisperbridge.providers.http_transport.httpx.Client", return_value=client)
 
     adapter = DeepLClientAdapter(api_key="unit-test-key")
 
@@ -87,3 +90,73 @@ def test_create_propagates_http_failures(mocker):
             messages=[{"role": "user", "content": "Hello"}],
             target_lang="EN",
         )
+
+
+def test_repeated_translations_reuse_one_pooled_client(mocker):
+    response = mocker.Mock()
+    response.json.return_value = {"translations": [{"text": "Hallo"}]}
+    client = mocker.MagicMock()
+    client.is_closed = False
+    client.post.return_value = response
+    client_factory = mocker.patch("whisperbridge.providers.http_transport.httpx.Client", return_value=client)
+
+    adapter = DeepLClientAdapter(api_key="unit-test-key")
+    for _ in range(3):
+        adapter.chat.completions.create(
+            model="ignored-model",
+            messages=[{"role": "user", "content": "Hello"}],
+            target_lang="DE",
+        )
+
+    client_factory.assert_called_once()
+    assert client.post.call_count == 3
+
+
+def test_pack_texts_respects_count_and_size_limits():
+    assert pack_texts(["a"] * 120) == [(0, 50), (50, 100), (100, 120)]
+    # Each "text=xxxxx&" field is 11 bytes: three fit in 35 bytes
+    assert pack_texts(["x" * 5] * 7, max_bytes=35) == [(0, 3), (3, 6), (6, 7)]
+    assert pack_texts(["x" * 100, "y"], max_bytes=35) == [(0, 1), (1, 2)]
+    assert pack_texts([]) == []
+
+
+def test_translate_many_sends_one_request_and_keeps_detected_languages(mocker):
+    response = mocker.Mock()
+    response.json.return_value = {
+        "translations": [
+            {"text": "Hallo", "detected_source_language": "EN"},
+            {"text": "Welt", "detected_source_language": "FR"},
+        ]
+    }
+    client = mocker.MagicMock()
+    client.is_closed = False
+    client.post.return_value = response
+    mocker.patch("whisperbridge.providers.http_transport.httpx.Client", return_value=client)
+
+    adapter = DeepLClientAdapter(api_key="unit-test-key")
+    result = adapter.translate_many(["Hello", "monde"], target_lang="de", source_lang="auto")
+
+    client.post.assert_called_once()
+    assert client.post.call_args.kwargs["data"] == {"text": ["Hello", "monde"], "target_lang": "DE"}
+    assert result == [("Hallo", "EN"), ("Welt", "FR")]
+
+
+def test_translate_many_splits_batches_over_the_limits(mocker):
+    def post(url, headers, data, timeout):
+        response = mocker.Mock()
+        response.json.return_value = {
+            "translations": [{"text": text.upper(), "detected_source_language": "EN"} for text in data["text"]]
+        }
+        return response
+
+    client = mocker.MagicMock()
+    client.is_closed = False
+    client.post.side_effect = post
+    mocker.patch("whisperbridge.providers.http_transport.httpx.Client", return_value=client)
+
+    adapter = DeepLClientAdapter(api_key="unit-test-key")
+    texts = [f"text {i}" for i in range(60)]
+    result = adapter.translate_many(texts, target_lang="DE")
+
+    assert [len(call.kwargs["data"]["text"]) for call in client.post.call_args_list] == [50, 10]
+    assert [text for text, _ in result] == [text.upper() for text in texts]
@@ -7,12 +7,16 @@ This module tests error classification functionality including:
 - Network/timeout error classification
 - Server error classification (5xx)
 - Unknown error fallback
+- Retry-After / rate-limit header parsing
 - requires_initialization decorator
 - Network diagnostics logging
 """
 
 import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 
+import httpx
 import pytest
 
 from whisperbridge.core.api_manager.errors import (
@@ -20,6 +24,7 @@ from whisperbridge.core.api_manager.errors import (
     APIErrorType,
     classify_error,
     log_network_diagnostics,
+    parse_retry_after,
     requires_initialization,
 )
 
@@ -256,3 +261,94 @@ class TestAPIErrorDataclass:
         assert error.error_type == APIErrorType.RATE_LIMIT
         assert error.status_code == 429
         assert error.retry_after == 60
+
+
+class _StatusError(Exception):
+    """Provider error carrying an HTTP response, like openai.APIStatusError."""
+
+    def __init__(self, message, status_code, headers):
+        super().__init__(message)
+        self.response = httpx.Response(status_code, headers=headers)
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({"retry-after": "7"}, 7.0),
+            ({"retry-after-ms": "1500", "retry-after": "2"}, 1.5),
+            ({"x-ratelimit-reset-requests": "1m30s"}, 90.0),
+            ({"x-ratelimit-reset-tokens": "250ms"}, 0.25),
+            ({"x-ratelimit-reset-requests": "2s", "x-ratelimit-reset-tokens": "6m0s"}, 360.0),
+            (
+                {
+                    "x-ratelimit-reset-requests": "2s",
+                    "x-ratelimit-remaining-requests": "0",
+                    "x-ratelimit-reset-tokens": "6m0s",
+                    "x-ratelimit-remaining-tokens": "1200",
+                },
+                2.0,
+            ),
+            (
+                {
+                    "x-ratelimit-reset-requests": "2s",
+                    "x-ratelimit-remaining-requests": "59",
+                    "x-ratelimit-reset-tokens": "6m0s",
+                    "x-ratelimit-remaining-tokens": "0",
+                },
+                360.0,
+            ),
+            ({"retry-after": "soon"}, None),
+            ({}, None),
+        ],
+    )
+    def test_reads_response_headers(self, headers, expected):
+        """Retry delays are read from the attached HTTP response."""
+        error = _StatusError("Error code: 429", 429, headers)
+
+        retry_after = parse_retry_after(error)
+
+        if expected is None:
+            assert retry_after is None
+        else:
+            assert retry_after == pytest.approx(expected)
+
+    def test_reads_http_date(self):
+        """Retry-After may be an HTTP date."""
+        when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        error = _StatusError("Error code: 429", 429, {"retry-after": when})
+
+        assert 25 <= parse_retry_after(error) <= 30
+
+    def test_reads_gemini_retry_info(self):
+        """Gemini reports the delay in RetryInfo error details."""
+        error = Exception("429 RESOURCE_EXHAUSTED")
+        error.details = {"error": {"details": [{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "20s"}]}}
+
+        assert parse_retry_after(error) == 20.0
+
+    def test_classify_status_429_as_rate_limit(self):
+        """A 429 response is a rate limit even without keywords in the message."""
+        error = _StatusError("Error code: 429", 429, {"retry-after": "3"})
+
+        api_error = classify_error(error)
+
+        assert api_error.error_type == APIErrorType.RATE_LIMIT
+        assert api_error.status_code == 429
+        assert api_error.retry_after == 3.0
+
+    def test_server_error_ignores_rate_limit_reset_headers(self):
+        """OpenAI sends reset headers on every response; a 5xx only honours Retry-After."""
+        error = _StatusError("Error code: 500", 500, {"x-ratelimit-reset-tokens": "6m0s"})
+
+        api_error = classify_error(error)
+
+        assert api_error.error_type == APIErrorType.SERVER_ERROR
+        assert api_error.retry_after is None
+
+    def test_server_error_reads_retry_after(self):
+        error = _StatusError("Error code: 503", 503, {"retry-after": "4", "x-ratelimit-reset-tokens": "6m0s"})
+
+        assert classify_error(error).retry_after == 4.0
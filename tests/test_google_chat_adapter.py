@@ -8,6 +8,7 @@ import base64
 import pytest
 from types import SimpleNamespace
 
+from whisperbridge.core.image_parts import EncodedImage, image_part
 from whisperbridge.providers.google_chat_adapter import GoogleChatClientAdapter
 
 
@@ -58,6 +59,21 @@ class TestTextOnlyRequests:
         assert response.choices[0].message.content == "Test response text"
         assert response.usage.total_tokens == 100
     
+    def test_max_tokens_finish_reason_maps_to_length(self, mocker, fake_google_client, mock_generate_content_response):
+        """Gemini's MAX_TOKENS finish reason is reported as OpenAI's "length"."""
+        from google.genai import types
+
+        mock_generate_content_response.candidates = [SimpleNamespace(finish_reason=types.FinishReason.MAX_TOKENS)]
+        mocker.patch.object(fake_google_client._client.models, 'generate_content', return_value=mock_generate_content_response)
+
+        response = fake_google_client.chat.completions.create(
+            model="gemini-2.0-flash",
+            messages=[{"role": "user", "content": "Hello"}],
+            max_completion_tokens=256
+        )
+
+        assert response.choices[0].finish_reason == "length"
+
     def test_text_only_with_thinking_config(self, mocker, fake_google_client, mock_generate_content_response):
         """Test that ThinkingConfig is set for Gemini 3 models."""
         # Setup
@@ -230,6 +246,20 @@ class TestMultimodalRequests:
         assert call_kwargs['data'] == jpeg_data
 
 
+    def test_multimodal_image_bytes_skip_base64(self, mocker, fake_google_client, mock_generate_content_response):
+        """Raw image bytes reach Part.from_bytes without a data URL round trip."""
+        image = EncodedImage(b"\xff\xd8raw-jpeg", "image/jpeg")
+        messages = [{"role": "user", "content": [{"type": "text", "text": "Read."}, image_part(image)]}]
+        mock_from_bytes = mocker.patch.object(fake_google_client._types.Part, "from_bytes", return_value=mocker.Mock())
+        parse = mocker.spy(fake_google_client, "_parse_data_url")
+        mocker.patch.object(fake_google_client._client.models, "generate_content", return_value=mock_generate_content_response)
+
+        fake_google_client.chat.completions.create(model="gemini-2.5-flash", messages=messages)
+
+        mock_from_bytes.assert_called_once_with(data=b"\xff\xd8raw-jpeg", mime_type="image/jpeg")
+        parse.assert_not_called()
+
+
 class TestParseDataUrl:
     """Tests for the _parse_data_url method."""
     
@@ -347,3 +377,27 @@ class TestParseDataUrl:
         # Suffix is matched by .+ but fails strict base64 validation
         with pytest.raises(ValueError, match="Failed to decode base64 data"):
             fake_google_client._parse_data_url(data_url)
+
+
+class TestSharedTransport:
+    """Tests for passing the shared HTTP transport to the SDK."""
+
+    def test_transport_clients_are_passed_to_sdk(self, mocker):
+        client = mocker.patch("google.genai.Client")
+        transport = SimpleNamespace(client=object(), async_client=object())
+
+        GoogleChatClientAdapter(api_key="fake-key-for-testing", timeout=30, transport=transport)
+
+        http_options = client.call_args.kwargs["http_options"]
+        assert http_options["httpx_client"] is transport.client
+        assert http_options["httpx_async_client"] is transport.async_client
+
+    def test_sdk_without_httpx_client_fields_keeps_its_own_client(self, mocker):
+        """Older google-genai releases reject unknown HttpOptions keys."""
+        client = mocker.patch("google.genai.Client")
+        mocker.patch("google.genai.types.HttpOptions", SimpleNamespace(model_fields={"timeout": None}))
+        transport = SimpleNamespace(client=object(), async_client=object())
+
+        GoogleChatClientAdapter(api_key="fake-key-for-testing", timeout=30, transport=transport)
+
+        assert client.call_args.kwargs["http_options"] == {"timeout": 30000}
@@ -0,0 +1,294 @@
+"""
+Tests for hedged requests.
+
+This module tests:
+- HedgePolicy parsing from settings
+- Latency percentiles per provider and mode
+- Hedger races (primary wins, hedge wins, failover, cleanup)
+- APIManager hedging of translation, stream and vision requests
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.core.api_manager import APIProvider
+from whisperbridge.core.api_manager.hedging import HedgeLatencies, HedgePolicy, Hedger
+from whisperbridge.core.config import Settings
+
+MESSAGES = [{"role": "system", "content": "Translate."}, {"role": "user", "content": "Hello"}]
+POLICY = HedgePolicy(providers=("openai", "google", "deepl"), percentile=95, delay=0.05)
+
+
+def _completion(content):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+        usage=SimpleNamespace(total_tokens=4),
+    )
+
+
+def _config(**overrides):
+    settings = {"hedging_enabled": True, **overrides}
+    return SimpleNamespace(get_setting=settings.get)
+
+
+class TestHedgePolicy:
+    """Tests for HedgePolicy.from_config."""
+
+    def test_disabled_by_default(self):
+        """No policy unless hedging is enabled."""
+        assert HedgePolicy.from_config(SimpleNamespace(get_setting=lambda key: None), "translate") is None
+
+    def test_defaults_per_mode(self):
+        """Missing policies use the built-in defaults of the mode."""
+        policy = HedgePolicy.from_config(_config(), "ocr")
+
+        assert policy.providers == ("openai", "google")
+        assert policy.percentile == 90
+        assert policy.delay == 6.0
+
+    def test_invalid_values_are_sanitized(self):
+        """Unknown providers are dropped and numbers are clamped or defaulted."""
+        config = _config(hedge_policies={
+            "style": {"providers": ["Google", "bogus", "google", "openai"], "percentile": 120, "delay_ms": "soon"}
+        })
+
+        policy = HedgePolicy.from_config(config, "style")
+
+        assert policy.providers == ("google", "openai")
+        assert policy.percentile == 99.9
+        assert policy.delay == 3.0
+
+    def test_settings_reject_unknown_modes(self):
+        """The settings model only accepts known request modes."""
+        with pytest.raises(ValueError, match="Unknown hedge_policies modes"):
+            Settings(hedge_policies={"summarize": {}})
+
+
+class TestHedgeLatencies:
+    """Tests for HedgeLatencies."""
+
+    def test_percentile_needs_samples(self):
+        """The percentile is only reported once enough samples exist."""
+        latencies = HedgeLatencies()
+        for seconds in (0.1, 0.2, 0.3, 0.4):
+            latencies.record("openai", "translate", seconds)
+        assert latencies.percentile("openai", "translate", 95) is None
+
+        latencies.record("openai", "translate", 2.0)
+
+        assert latencies.percentile("openai", "translate", 95) == 2.0
+        assert latencies.percentile("openai", "translate", 50) == 0.3
+        assert latencies.percentile("google", "translate", 50) is None
+
+
+class TestHedger:
+    """Tests for Hedger.run."""
+
+    @staticmethod
+    def _request(result, delay=0.0, error=None, log=None):
+        async def request():
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                if log is not None:
+                    log.append(f"cancelled {result}")
+                raise
+            if error is not None:
+                raise error
+            return result
+
+        return request
+
+    def test_fast_primary_is_not_hedged(self):
+        """A primary answering before the hedge delay is used alone."""
+        hedger = Hedger()
+        secondary_calls = []
+
+        async def secondary():
+            secondary_calls.append(1)
+            return "google"
+
+        result = asyncio.run(hedger.run("translate", POLICY, ("openai", self._request("openai")), ("google", secondary)))
+
+        assert result == ("openai", "openai")
+        assert secondary_calls == []
+        assert hedger.stats() == {"requests": 1, "hedged": 0, "primary_wins": 1, "hedge_wins": 0}
+
+    def test_slow_primary_is_hedged_and_cancelled(self):
+        """The hedge answers first and the slow primary is cancelled."""
+        hedger = Hedger()
+        log = []
+
+        result = asyncio.run(hedger.run(
+            "translate", POLICY,
+            ("openai", self._request("openai", delay=5, log=log)),
+            ("google", self._request("google", delay=0.01)),
+        ))
+
+        assert result == ("google", "google")
+        assert log == ["cancelled openai"]
+        assert hedger.stats()["hedge_wins"] == 1
+
+    def test_failed_primary_hedges_immediately(self):
+        """A failing primary starts the hedge without waiting for the delay."""
+        hedger = Hedger()
+        policy = HedgePolicy(providers=("openai", "google"), delay=30)
+
+        async def run():
+            return await asyncio.wait_for(hedger.run(
+                "translate", policy,
+                ("openai", self._request("openai", error=RuntimeError("down"))),
+                ("google", self._request("google")),
+            ), timeout=5)
+
+        assert asyncio.run(run()) == ("google", "google")
+
+    def test_all_failures_raise_primary_error(self):
+        """When every request fails the primary's error is raised."""
+        hedger = Hedger()
+
+        with pytest.raises(RuntimeError, match="primary down"):
+            asyncio.run(hedger.run(
+                "translate", POLICY,
+                ("openai", self._request("openai", error=RuntimeError("primary down"))),
+                ("google", self._request("google", error=RuntimeError("hedge down"))),
+            ))
+
+    def test_percentile_replaces_policy_delay(self):
+        """With enough samples the hedge delay follows the primary's latency percentile."""
+        hedger = Hedger()
+        for _ in range(10):
+            hedger.latencies.record("openai", "translate", 0.4)
+
+        assert hedger.hedge_delay("openai", "translate", POLICY) == 0.4
+        assert hedger.hedge_delay("openai", "style", POLICY) == 0.25  # policy delay, raised to the minimum
+
+    def test_completed_loser_is_discarded(self):
+        """A losing result that arrived anyway is released."""
+        hedger = Hedger()
+        discarded = []
+
+        async def discard(result):
+            discarded.append(result)
+
+        async def run():
+            primary = asyncio.Event()
+
+            async def slow_primary():
+                await primary.wait()
+                return "openai"
+
+            async def hedge():
+                primary.set()
+                return "google"
+
+            return await hedger.run("translate", POLICY, ("openai", slow_primary), ("google", hedge), discard)
+
+        result, name = asyncio.run(run())
+
+        assert {result, *discarded} == {"openai", "google"}
+        assert name == result
+
+
+class TestAPIManagerHedging:
+    """Tests for hedging in APIManager."""
+
+    @pytest.fixture
+    def config_hedging(self, mock_config_service):
+        settings = {
+            "openai_api_key": "sk-test123",
+            "google_api_key": "AIzatest123",
+            "deepl_api_key": "deepl-test-key",
+            "api_provider": "openai",
+            "api_timeout": 30,
+            "google_model": "gemini-2.5-flash",
+            "google_vision_model": "gemini-2.5-flash",
+            "hedging_enabled": True,
+            "hedge_policies": {
+                "translate": {"providers": ["openai", "deepl", "google"], "delay_ms": 50},
+                "style": {"providers": ["openai", "deepl", "google"], "delay_ms": 50},
+                "ocr": {"providers": ["openai", "google"], "delay_ms": 50},
+            },
+        }
+        mock_config_service.get_setting.side_effect = settings.get
+        return settings
+
+    @pytest.fixture
+    def slow_openai(self, mock_openai_client, mocker):
+        async def slow(**kwargs):
+            await asyncio.sleep(5)
+            return _completion("openai")
+
+        mock_openai_client.chat.completions.acreate = slow
+        return mock_openai_client
+
+    def test_translation_is_hedged_with_builder(
+        self, api_manager, config_hedging, slow_openai, mock_google_client, mock_deepl_client, mocker
+    ):
+        """The builder provides provider-specific requests, e.g. DeepL target language."""
+        mock_deepl_client.client.chat.completions.acreate = mocker.AsyncMock(return_value=_completion("Hallo"))
+        api_manager.initialize()
+        builder = mocker.Mock(return_value=([{"role": "user", "content": "Hello"}], "deepl-translate", {"target_lang": "DE"}))
+
+        response, model = asyncio.run(
+            api_manager.make_translation_request_async(MESSAGES, "gpt-5.4-mini", hedge_request=builder)
+        )
+
+        assert response.choices[0].message.content == "Hallo"
+        assert model == "deepl-translate"
+        builder.assert_called_once_with("deepl")
+        assert mock_deepl_client.client.chat.completions.acreate.call_args.kwargs["target_lang"] == "DE"
+        assert api_manager.get_hedge_stats()["hedge_wins"] == 1
+
+    def test_style_skips_non_llm_providers(self, api_manager, config_hedging, slow_openai, mock_google_client, mocker):
+        """Without a builder the same messages go to the next LLM provider with its model."""
+        mock_google_client.chat.completions.acreate = mocker.AsyncMock(return_value=_completion("styled"))
+        api_manager.initialize()
+
+        response, model = asyncio.run(
+            api_manager.make_translation_request_async(MESSAGES, "gpt-5.4-mini", completion_mode="style")
+        )
+
+        assert model == "gemini-2.5-flash"
+        assert mock_google_client.chat.completions.acreate.call_args.kwargs["messages"] == MESSAGES
+
+    def test_disabled_hedging_uses_primary_only(self, api_manager, config_hedging, mock_openai_client, mock_google_client):
+        """With hedging off only the selected provider is called."""
+        config_hedging["hedging_enabled"] = False
+        api_manager.initialize()
+
+        asyncio.run(api_manager.make_translation_request_async(MESSAGES, "gpt-5.4-mini"))
+
+        mock_google_client.chat.completions.create.assert_not_called()
+        assert api_manager.get_hedge_stats()["requests"] == 0
+
+    def test_stream_loser_is_cancelled(self, api_manager, config_hedging, slow_openai, mock_google_client, mocker):
+        """A hedged stream returns the first stream to start."""
+
+        async def chunks():
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Hi"), finish_reason="stop")], usage=None)
+
+        mock_google_client.chat.completions.acreate = mocker.AsyncMock(return_value=chunks())
+        api_manager.initialize()
+
+        async def consume():
+            stream = await api_manager.make_translation_stream_async(MESSAGES, "gpt-5.4-mini", completion_mode="style")
+            return stream.model, [delta async for delta in stream]
+
+        assert asyncio.run(consume()) == ("gemini-2.5-flash", ["Hi"])
+
+    def test_vision_request_is_hedged(self, api_manager, config_hedging, slow_openai, mock_google_client, mocker):
+        """OCR requests hedge to the other vision provider with its vision model."""
+        mock_google_client.chat.completions.acreate = mocker.AsyncMock(return_value=_completion("text"))
+        api_manager.initialize()
+        messages = [{"role": "user", "content": [
+            {"type": "text", "text": "OCR"},
+            {"type": "image_url", "image_url": {"url": "data:image/png;base64,AAAA"}},
+        ]}]
+
+        response, model = api_manager.make_vision_request(messages, "gpt-5.4-mini")
+
+        assert response.choices[0].message.content == "text"
+        assert model == "gemini-2.5-flash"
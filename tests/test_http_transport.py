@@ -0,0 +1,204 @@
+"""
+Tests for the shared HTTP transport.
+
+This module tests:
+- Building TransportConfig from settings
+- Connection reuse statistics against a local keep-alive server
+- Opening pooled connections ahead of requests (warm-up)
+- Sharing one transport between the provider adapters
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.core.api_manager.providers import APIProvider, ProviderRegistry
+from whisperbridge.providers.http_transport import HttpTransport, TransportConfig
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.send_response(401)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def _config_service(values):
+    return SimpleNamespace(get_setting=lambda key: values.get(key))
+
+
+class TestTransportConfig:
+    """Tests for TransportConfig.from_config."""
+
+    def test_reads_network_settings(self):
+        """Timeouts, pool size, HTTP/2 and proxy come from settings."""
+        config = TransportConfig.from_config(_config_service({
+            "api_timeout": 25,
+            "http_connect_timeout": 5,
+            "http_max_connections": 4,
+            "http2_enabled": True,
+            "http_proxy": " http://proxy.local:8080 ",
+        }))
+
+        assert config.read_timeout == 25
+        assert config.connect_timeout == 5
+        assert config.max_connections == 4
+        assert config.max_keepalive_connections == 4
+        assert config.http2 is True
+        assert config.proxy == "http://proxy.local:8080"
+
+    def test_missing_settings_use_defaults(self):
+        """Unset or invalid values fall back to the defaults."""
+        config = TransportConfig.from_config(_config_service({"http_proxy": "  "}))
+
+        assert config == TransportConfig()
+
+    def test_http2_falls_back_without_h2(self, mocker):
+        """HTTP/2 is disabled with a warning when h2 is missing."""
+        mocker.patch("whisperbridge.providers.http_transport.importlib.util.find_spec", return_value=None)
+
+        transport = HttpTransport(TransportConfig(http2=True))
+
+        assert transport._client_kwargs()["http2"] is False
+
+
+class TestConnectionReuse:
+    """Tests for pooled connections and their statistics."""
+
+    def test_sync_requests_reuse_connection(self, server_url):
+        """Sequential requests share one kept-alive connection."""
+        transport = HttpTransport()
+        try:
+            for _ in range(3):
+                assert transport.client.get(server_url).text == "ok"
+        finally:
+            transport.close()
+
+        assert transport.stats() == {"requests": 3, "connections_opened": 1, "connections_reused": 2}
+
+    def test_async_requests_reuse_connection(self, server_url):
+        """The async client of a loop keeps its connection alive too."""
+        transport = HttpTransport()
+
+        async def run():
+            for _ in range(3):
+                response = await transport.async_client.get(server_url)
+                assert response.text == "ok"
+            await transport.aclose()
+
+        asyncio.run(run())
+
+        assert transport.stats() == {"requests": 3, "connections_opened": 1, "connections_reused": 2}
+
+    def test_async_client_is_per_loop(self):
+        """Each event loop gets its own async client."""
+        transport = HttpTransport()
+
+        async def client_of_loop():
+            return transport.async_client
+
+        first = asyncio.run(client_of_loop())
+        second = asyncio.run(client_of_loop())
+
+        assert first is not second
+
+
+class TestWarmUp:
+    """Tests for HttpTransport.awarm."""
+
+    def test_warm_connections_are_reused(self, server_url):
+        """Warm-up opens pooled connections that later requests reuse."""
+        transport = HttpTransport()
+
+        async def run():
+            reached = await transport.awarm([server_url])
+            opened = transport.stats()["connections_opened"]
+            await transport.async_client.get(server_url)
+            await transport.aclose()
+            return reached, opened
+
+        reached, opened = asyncio.run(run())
+        transport.client.get(server_url)
+        transport.close()
+
+        assert reached == 1
+        # One connection for the sync client and one for the loop's async client
+        assert opened == 2
+        assert transport.stats() == {"requests": 4, "connections_opened": 2, "connections_reused": 2}
+
+    def test_unreachable_endpoint_is_not_counted(self):
+        """Connection errors are logged and do not raise."""
+        transport = HttpTransport(TransportConfig(connect_timeout=1.0))
+
+        async def run():
+            try:
+                return await transport.awarm(["http://127.0.0.1:9/"])
+            finally:
+                await transport.aclose()
+
+        assert asyncio.run(run()) == 0
+        transport.close()
+
+
+class TestRegistryTransport:
+    """Tests for the transport shared by ProviderRegistry clients."""
+
+    def test_all_adapters_share_one_transport(self, mocker):
+        """Every adapter created by the registry receives the same transport."""
+        mocker.patch("whisperbridge.core.api_manager.providers.validate_api_key_format", return_value=True)
+        factories = {
+            name: mocker.patch(f"whisperbridge.core.api_manager.providers.{name}")
+            for name in ("OpenAIChatClientAdapter", "GoogleChatClientAdapter", "DeepLClientAdapter")
+        }
+        registry = ProviderRegistry(_config_service({
+            "openai_api_key": "sk-test",
+            "google_api_key": "AIza-test",
+            "deepl_api_key": "deepl-test",
+            "api_provider": "openai",
+        }))
+
+        registry.initialize_all()
+        for provider in APIProvider:
+            registry.get_client(provider)
+
+        transports = {id(factory.call_args.kwargs["transport"]) for factory in factories.values()}
+        assert len(transports) == 1
+        assert registry.is_provider_available(APIProvider.DEEPL)
+        assert registry.transport_stats()["requests"] == 0
+
+    def test_clear_closes_transport(self, mocker):
+        """Clearing the registry closes the transport so new settings take effect."""
+        registry = ProviderRegistry(_config_service({}))
+        registry.initialize_all()
+        transport = registry._transport
+        close = mocker.spy(transport, "close")
+
+        registry.clear()
+
+        close.assert_called_once()
+        assert registry._transport is None
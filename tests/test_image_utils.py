@@ -0,0 +1,179 @@
+"""
+Tests for OCR capture preparation in utils.image_utils.
+
+This module tests:
+- Cropping captures to the detected text
+- Classifying captures as text/UI or photo, colour or grayscale
+- Format choice per class and the byte budget search
+- The per-size-bucket decision cache and the JPEG fallback without WebP
+"""
+
+import random
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from whisperbridge.utils import image_utils
+from whisperbridge.utils.image_utils import AdaptiveImageEncoder, classify_image, crop_to_text, find_text_bbox
+
+
+def _text_capture(size=(800, 400), color=(0, 0, 0)):
+    image = Image.new("RGB", size, (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    for y in range(10, size[1] - 20, 20):
+        draw.text((10, y), "The quick brown fox jumps over the lazy dog " * 2, fill=color)
+    return image
+
+
+def _subpixel_text_capture(size=(1280, 720)):
+    """Dense 11 px text with subpixel (ClearType-like) colour fringes."""
+    width, height = size
+    wide = Image.new("L", (width * 3 + 2, height), 255)
+    draw = ImageDraw.Draw(wide)
+    font = ImageFont.load_default(size=11)
+    for y in range(1, height, 12):
+        draw.text((1, y), "The quick brown fox jumps over the lazy dog. " * 18, fill=0, font=font)
+    channels = [wide.resize(size, Image.BOX, box=(i, 0, width * 3 + i, height)) for i in range(3)]
+    return Image.merge("RGB", channels)
+
+
+def _smooth_photo(size=(800, 600), seed=3):
+    """A colour gradient with light grain that compresses well as JPEG."""
+    rng = random.Random(seed)
+    small = Image.new("RGB", (8, 6))
+    small.putdata([(rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(8 * 6)])
+    grain = Image.effect_noise(size, 16).convert("RGB")
+    return Image.blend(small.resize(size, Image.BICUBIC), grain, 0.1).filter(ImageFilter.SMOOTH)
+
+
+def _photo_capture(size=(800, 600), seed=3):
+    rng = random.Random(seed)
+    image = Image.new("RGB", size)
+    image.putdata([(rng.randrange(256), rng.randrange(256), rng.randrange(256)) for _ in range(size[0] * size[1])])
+    return image
+
+
+class TestCropToText:
+    """Tests for find_text_bbox and crop_to_text."""
+
+    def test_loose_selection_is_cropped_with_padding(self):
+        image = Image.new("RGB", (1200, 800), "white")
+        ImageDraw.Draw(image).text((500, 380), "Hello world", fill="black")
+
+        left, top, right, bottom = find_text_bbox(image)
+        cropped = crop_to_text(image, padding=8)
+
+        assert 495 <= left <= 502 and 378 <= top <= 384 and 550 <= right <= 560 and 388 <= bottom <= 396
+        assert cropped.size == (right - left + 16, bottom - top + 16)
+
+    def test_light_text_on_dark_background_is_found(self):
+        image = Image.new("RGB", (1000, 600), (30, 30, 30))
+        ImageDraw.Draw(image).text((100, 100), "def main():", fill=(212, 212, 212))
+
+        width, height = crop_to_text(image).size
+        assert width < 100 and height < 30
+
+    def test_tight_capture_is_returned_unchanged(self):
+        """A capture already cropped to its text is not cropped again."""
+        cropped = crop_to_text(_text_capture())
+
+        assert cropped.size != (800, 400)
+        assert crop_to_text(cropped) is cropped
+
+    def test_blank_capture_is_returned_unchanged(self):
+        image = Image.new("RGB", (400, 300), "white")
+
+        assert find_text_bbox(image) is None
+        assert crop_to_text(image) is image
+
+
+class TestClassifyImage:
+    """Tests for classify_image."""
+
+    def test_text_capture_is_flat_and_gray(self):
+        assert classify_image(_text_capture()) == ("text", True)
+
+    def test_coloured_text_is_not_gray(self):
+        assert classify_image(_text_capture(color=(255, 0, 0))) == ("text", False)
+
+    def test_noise_is_photo(self):
+        assert classify_image(_photo_capture()) == ("photo", False)
+
+    def test_dense_subpixel_text_is_text(self):
+        """Small text with colour fringes has too many colours but stays flat between glyphs."""
+        assert classify_image(_subpixel_text_capture())[0] == "text"
+
+    def test_smooth_photo_is_photo(self):
+        assert classify_image(_smooth_photo()) == ("photo", False)
+
+
+class TestAdaptiveImageEncoder:
+    """Tests for AdaptiveImageEncoder."""
+
+    def test_text_is_encoded_as_grayscale_png(self):
+        """Text captures become a small-palette PNG that keeps their size."""
+        encoded = AdaptiveImageEncoder().encode(_text_capture())
+
+        assert encoded.mime_type == "image/png"
+        with Image.open(BytesIO(encoded.data)) as image:
+            assert (image.format, image.mode, image.size) == ("PNG", "L", (800, 400))
+
+    def test_photo_lowers_quality_then_size_to_fit_budget(self):
+        """Incompressible captures walk the candidates and end at the smallest payload."""
+        encoder = AdaptiveImageEncoder(target_bytes=20_000)
+        encoded = encoder.encode(_photo_capture())
+
+        assert encoded.mime_type == "image/jpeg"
+        with Image.open(BytesIO(encoded.data)) as image:
+            assert image.size == (400, 300)
+
+    def test_large_captures_are_resized_to_max_edge(self):
+        encoded = AdaptiveImageEncoder(max_edge=640).encode(_text_capture((1280, 320)))
+
+        with Image.open(BytesIO(encoded.data)) as image:
+            assert image.size == (640, 160)
+
+    def test_decision_is_reused_per_size_bucket(self, mocker):
+        """A similar capture is encoded once with the remembered candidate."""
+        encoder = AdaptiveImageEncoder(target_bytes=20_000)
+        encode = mocker.spy(image_utils, "encode_choice")
+        encoder.encode(_photo_capture(seed=1))
+        searched = encode.call_count
+
+        encoder.encode(_photo_capture(seed=2))
+
+        assert searched > 1
+        assert encode.call_count == searched + 1
+
+    def test_capture_that_fits_a_better_candidate_recovers(self):
+        """A remembered downscale is only a hint: an easier capture gets full quality again."""
+        encoder = AdaptiveImageEncoder(target_bytes=60_000)
+        encoder.encode(_photo_capture())
+        hard = next(iter(encoder._decisions.values()))
+
+        encoded = encoder.encode(_smooth_photo())
+
+        assert hard > 0
+        assert next(iter(encoder._decisions.values())) == 0
+        with Image.open(BytesIO(encoded.data)) as image:
+            assert image.size == (800, 600)
+
+    def test_least_recently_used_decision_is_dropped(self):
+        encoder = AdaptiveImageEncoder(cache_size=2)
+        for width in (300, 600, 900):
+            encoder.encode(_text_capture((width, 100)))
+
+        assert [key[2] for key in encoder._decisions] == [2, 4]
+
+    def test_jpeg_replaces_webp_when_unsupported(self, mocker):
+        """Pillow builds without WebP fall back to JPEG at the same quality."""
+        mocker.patch.object(image_utils.features, "check", return_value=False)
+
+        choices = AdaptiveImageEncoder._choices("text")
+
+        assert {choice.format for choice in choices} == {"PNG", "JPEG"}
+
+    def test_invalid_budget_is_rejected(self):
+        with pytest.raises(ValueError):
+            AdaptiveImageEncoder(target_bytes=0)
@@ -294,7 +294,7 @@ class TestTranslationRequests:
         kwargs = mock_openai_client.chat.completions.create.call_args.kwargs
         assert "reasoning_effort" not in kwargs
 
-    def test_make_translation_request_deepl(self, initialized_deepl_manager, mock_deepl_client):
+    def test_make_translation_request_deepl(self, initialized_deepl_manager, mock_deepl_client, mocker):
         """Test translation request through DeepL."""
         messages = [{"role": "user", "content": "Translate this"}]
 
@@ -313,6 +313,7 @@ class TestTranslationRequests:
             model="test-deepl-model",
             messages=messages,
             target_lang="DE",
+            cancel_token=mocker.ANY,
         )
 class TestVisionRequests:
     """Tests for make_vision_request method."""
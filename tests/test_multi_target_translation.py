@@ -0,0 +1,195 @@
+"""
+Tests for translating into several target languages at once.
+
+This module tests:
+- Parsing tagged multi-target responses
+- One LLM request for all languages, with per-language fallback for missing ones
+- Concurrent per-language DeepL requests and partial failures
+- The extra target languages setting
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from whisperbridge.core.config import Settings
+from whisperbridge.services.translation_cache import TranslationCache
+from whisperbridge.services.translation_service import TranslationService
+from whisperbridge.utils.translation_utils import (
+    TranslationRequest,
+    TranslationResponse,
+    format_multi_target_prompt,
+    parse_multi_target_response,
+)
+
+
+def _completion(content, total_tokens=30):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(total_tokens=total_tokens),
+    )
+
+
+class TestParseMultiTargetResponse:
+    """Tests for the multi-target prompt and parser."""
+
+    def test_prompt_lists_a_tag_per_language(self):
+        """The prompt asks for one tagged block per target language."""
+        request = TranslationRequest(text="Hello", source_lang="en", target_lang="de", system_prompt="", model="m")
+        prompt = format_multi_target_prompt(request, ["de", "uk"])
+
+        assert '<translation lang="de">' in prompt and '<translation lang="uk">' in prompt
+        assert "Hello" in prompt
+
+    def test_splits_blocks_per_language(self):
+        """Blocks are matched case-insensitively; missing and empty blocks are left out."""
+        text = (
+            'Here you go:\n<translation lang="DE">\nHallo Welt\n</translation>\n'
+            "<translation lang='uk'>Привіт світ</translation>\n"
+            '<translation lang="fr">  </translation>'
+        )
+
+        assert parse_multi_target_response(text, ["de", "uk", "fr", "es"]) == {"de": "Hallo Welt", "uk": "Привіт світ"}
+
+    def test_untagged_response_yields_nothing(self):
+        """A response without tags parses to no translations."""
+        assert parse_multi_target_response("Hallo Welt", ["de", "uk"]) == {}
+
+
+class TestMultiTargetTranslation:
+    """Tests for multi-target translation in TranslationService."""
+
+    @pytest.fixture
+    def service(self, mocker):
+        service = object.__new__(TranslationService)
+        service._api_manager = mocker.Mock()
+        service._api_manager.is_initialized.return_value = True
+        service._api_manager.has_clients.return_value = True
+        service._api_manager.resolve_provider_name.return_value = "openai"
+        service._api_manager.make_translation_request_async = mocker.AsyncMock()
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_settings",
+            return_value=SimpleNamespace(translation_cache_enabled=False, system_prompt="Translate."),
+        )
+        mocker.patch("whisperbridge.services.translation_service.config_service.get_setting", return_value=None)
+        mocker.patch.object(service, "_get_active_model", return_value="gpt-4o")
+        mocker.patch.object(service, "_determine_languages", mocker.AsyncMock(return_value=("en", "de")))
+        return service
+
+    def test_llm_translates_all_languages_in_one_request(self, service):
+        """One LLM request carries every language; the budget covers all outputs."""
+        service._api_manager.make_translation_request_async.return_value = (
+            _completion('<translation lang="de">Hallo</translation><translation lang="uk">Привіт</translation>'),
+            "gpt-4o",
+        )
+
+        response = asyncio.run(service.translate_text_async("Hello", "auto", ["de", "uk", "de"]))
+
+        service._api_manager.make_translation_request_async.assert_awaited_once()
+        call = service._api_manager.make_translation_request_async.call_args.kwargs
+        assert call["max_completion_tokens"] == 2 * 512
+        assert response.success
+        assert response.target_lang == "de,uk"
+        assert {lang: r.translated_text for lang, r in response.translations.items()} == {"de": "Hallo", "uk": "Привіт"}
+        assert response.translated_text == "[DE]\nHallo\n\n[UK]\nПривіт"
+        assert response.tokens_used == 30
+
+    def test_missing_language_is_requested_alone(self, service, mocker):
+        """A language missing from the tagged response gets its own request."""
+        service._api_manager.make_translation_request_async.return_value = (
+            _completion('<translation lang="de">Hallo</translation>'),
+            "gpt-4o",
+        )
+        single = mocker.patch.object(
+            service,
+            "_request_translation_async",
+            mocker.AsyncMock(return_value=TranslationResponse(success=True, translated_text="Привіт", target_lang="uk")),
+        )
+
+        response = asyncio.run(service.translate_text_async("Hello", "en", ["de", "uk"]))
+
+        assert [call.args[0].target_lang for call in single.await_args_list] == ["uk"]
+        assert response.translations["uk"].translated_text == "Привіт"
+        assert response.translations["de"].translated_text == "Hallo"
+
+    def test_deepl_requests_languages_concurrently(self, service, mocker):
+        """DeepL gets one request per language; a failed language does not fail the others."""
+        service._api_manager.resolve_provider_name.return_value = "deepl"
+        running = []
+        peak = []
+
+        async def translate(request):
+            running.append(request.target_lang)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(request.target_lang)
+            if request.target_lang == "fr":
+                raise RuntimeError("quota exceeded")
+            return TranslationResponse(success=True, translated_text=request.target_lang.upper(), target_lang=request.target_lang)
+
+        mocker.patch.object(service, "_request_translation_async", side_effect=translate)
+
+        response = asyncio.run(service.translate_text_async("Hello", "en", ["de", "uk", "fr"]))
+
+        service._api_manager.make_translation_request_async.assert_not_called()
+        assert max(peak) == 3
+        assert response.success
+        assert response.translations["fr"].success is False
+        assert response.error_message == "fr: quota exceeded"
+        assert response.translated_text == "[DE]\nDE\n\n[UK]\nUK"
+
+    def test_single_language_list_takes_regular_path(self, service, mocker):
+        """A list with one language is translated like a plain target language."""
+        regular = mocker.patch.object(service, "_translate_multi_target_async", mocker.AsyncMock())
+        mocker.patch.object(service, "_translation_cache_key", return_value=None)
+        mocker.patch.object(
+            service, "_translate_with_memory",
+            mocker.AsyncMock(return_value=TranslationResponse(success=True, translated_text="Hallo")),
+        )
+
+        response = asyncio.run(service.translate_text_async("Hello", "en", ["de"]))
+
+        regular.assert_not_awaited()
+        assert response.translated_text == "Hallo"
+        assert response.translations == {}
+
+    def test_swapped_single_target_result_is_not_reused(self, service, mocker, tmp_path):
+        """A single-target result swapped to Russian is not served for German in a multi-target request."""
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_settings",
+            return_value=SimpleNamespace(translation_cache_enabled=True, auto_swap_en_ru=True, system_prompt="Translate."),
+        )
+        service._result_cache = TranslationCache(tmp_path)
+        service._determine_languages.return_value = ("en", "ru")
+        mocker.patch.object(
+            service, "_translate_with_memory",
+            mocker.AsyncMock(return_value=TranslationResponse(success=True, translated_text="Привет мир", target_lang="ru")),
+        )
+        asyncio.run(service.translate_text_async("Hello world", "auto", "de"))
+        service._api_manager.make_translation_request_async.return_value = (
+            _completion('<translation lang="de">Hallo Welt</translation><translation lang="uk">Привіт світ</translation>'),
+            "gpt-4o",
+        )
+
+        response = asyncio.run(service.translate_text_async("Hello world", "auto", ["de", "uk"]))
+        service._result_cache.close()
+
+        assert response.translations["de"].translated_text == "Hallo Welt"
+        assert response.translations["uk"].translated_text == "Привіт світ"
+
+
+class TestExtraTargetLanguagesSetting:
+    """Tests for the ui_extra_target_languages setting."""
+
+    def test_codes_are_normalized_and_deduplicated(self):
+        """Codes are lower-cased, stripped and de-duplicated in order."""
+        settings = Settings(ui_extra_target_languages=[" DE", "uk", "de", ""])
+
+        assert settings.ui_extra_target_languages == ["de", "uk"]
+
+    def test_invalid_code_is_rejected(self):
+        """Codes must be two-letter language codes."""
+        with pytest.raises(ValidationError):
+            Settings(ui_extra_target_languages=["german"])
@@ -0,0 +1,95 @@
+"""
+Tests for OCRResultCache in services.ocr_cache module.
+
+This module tests:
+- Fingerprints of re-captured, changed and differently shaped captures
+- Hamming-distance lookups confirmed by the thumbnail and context keys
+- LRU eviction and disk persistence
+"""
+
+from PIL import Image, ImageDraw, ImageFont
+
+from whisperbridge.services.ocr_cache import DEFAULT_MAX_DISTANCE, CaptureFingerprint, OCRResultCache
+
+CONTEXT = OCRResultCache.make_context("openai", "gpt-5.4-mini", "Extract the text.")
+
+
+def _dialog(value="45", size=(900, 600), ink=(0, 0, 0)):
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=18)
+    for line in range(20):
+        draw.text((20, 20 + line * 28), f"Line {line}: setting value {value if line == 7 else 1}", fill=ink, font=font)
+    return image
+
+
+def _fingerprint(*args, **kwargs):
+    return CaptureFingerprint.from_image(_dialog(*args, **kwargs))
+
+
+class TestCaptureFingerprint:
+    """Tests for CaptureFingerprint."""
+
+    def test_recapture_with_slightly_different_tone_matches(self):
+        first, second = _fingerprint(), _fingerprint(ink=(12, 12, 12))
+
+        assert first.distance(second) <= 2
+        assert first.same_content(second)
+
+    def test_changed_digit_is_not_the_same_content(self):
+        """A hash cannot see a changed digit; the thumbnail check does."""
+        first, second = _fingerprint("45"), _fingerprint("46")
+
+        assert first.distance(second) <= DEFAULT_MAX_DISTANCE
+        assert not first.same_content(second)
+
+    def test_grid_follows_aspect_ratio(self):
+        line = CaptureFingerprint.from_image(Image.new("L", (600, 40), 255))
+
+        assert line.grid[0] > line.grid[1]
+        assert _fingerprint().distance(line) is None
+
+
+class TestOCRResultCache:
+    """Tests for OCRResultCache lookups, eviction and persistence."""
+
+    def test_near_identical_capture_returns_stored_text(self):
+        cache = OCRResultCache()
+        cache.set(_fingerprint(), CONTEXT, "Line 0 ...")
+
+        assert cache.get(_fingerprint(ink=(12, 12, 12)), CONTEXT) == "Line 0 ..."
+        assert cache.stats() == {"hits": 1, "misses": 0, "entries": 1}
+
+    def test_changed_capture_and_other_context_miss(self):
+        cache = OCRResultCache()
+        cache.set(_fingerprint("45"), CONTEXT, "45")
+
+        assert cache.get(_fingerprint("46"), CONTEXT) is None
+        other_prompt = OCRResultCache.make_context("openai", "gpt-5.4-mini", "Other prompt.")
+        assert cache.get(_fingerprint("45"), other_prompt) is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = OCRResultCache(max_entries=2)
+        shapes = [(900, 600), (600, 900), (900, 300)]
+        for size in shapes:
+            cache.set(_fingerprint(size=size), CONTEXT, str(size))
+
+        assert cache.get(_fingerprint(size=shapes[0]), CONTEXT) is None
+        assert cache.get(_fingerprint(size=shapes[2]), CONTEXT) == str(shapes[2])
+
+    def test_entries_are_persisted_to_disk(self, tmp_path):
+        cache = OCRResultCache(tmp_path)
+        cache.set(_fingerprint(), CONTEXT, "stored")
+        cache.close()
+
+        reopened = OCRResultCache(tmp_path)
+
+        assert reopened.persistent
+        assert reopened.get(_fingerprint(), CONTEXT) == "stored"
+
+    def test_memory_only_cache_writes_nothing(self, tmp_path):
+        cache = OCRResultCache()
+        cache.set(_fingerprint(), CONTEXT, "stored")
+
+        assert not cache.persistent
+        assert list(tmp_path.iterdir()) == []
@@ -5,17 +5,18 @@ Tests validate key behaviors without hitting real network.
 """
 
 import asyncio
-import base64
 from io import BytesIO
 from types import SimpleNamespace
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from PIL import Image
+from PIL import Image, ImageDraw
 from PySide6.QtTest import QSignalSpy
 
 from whisperbridge.core.api_manager import APIManager, APIProvider
+from whisperbridge.core.completion_budget import COMPLETION_BUDGET_FLOORS, MODE_OCR, REASONING_TOKEN_ALLOWANCE
 from whisperbridge.services.ocr_service import OCRService, OCRRequest
+from whisperbridge.services.translation_cache import TranslationCache
 from whisperbridge.services.translation_service import TranslationService
 from whisperbridge.ui_qt.workers import CaptureOcrTranslateWorker
 
@@ -95,19 +96,72 @@ def test_llm_success_path_preserves_valid_image_payload_and_returns_result(
         "text": "Extract the text as-is. Keep natural reading order. Return only the text.",
     }
 
+    # The image reaches the adapter as raw bytes; a flat capture is encoded as PNG
     image_part = messages[1]["content"][1]
-    assert image_part["type"] == "image_url"
-    data_url = image_part["image_url"]["url"]
-    prefix, encoded_image = data_url.split(",", 1)
-    assert prefix == "data:image/jpeg;base64"
+    assert image_part["type"] == "image_bytes"
+    assert image_part["image"].mime_type == "image/png"
+    assert image_part["image"].to_data_url().startswith("data:image/png;base64,")
 
-    decoded_image = base64.b64decode(encoded_image, validate=True)
-    with Image.open(BytesIO(decoded_image)) as encoded_pil_image:
+    with Image.open(BytesIO(image_part["image"].data)) as encoded_pil_image:
         encoded_pil_image.load()
-        assert encoded_pil_image.format == "JPEG"
+        assert encoded_pil_image.format == "PNG"
         assert encoded_pil_image.size == tiny_image.size
 
 
+def test_llm_ocr_sends_fixed_jpeg_without_adaptive_encoding(fake_config, mocker):
+    """With adaptive encoding disabled, captures are sent as 1280 px JPEG."""
+    service = OCRService(fake_config)
+    fake_config.settings.update({"ocr_adaptive_image_encoding": False, "openai_vision_model": "gpt-5.4-mini"})
+    api_manager = mocker.patch("whisperbridge.services.ocr_service.get_api_manager").return_value
+    api_manager.resolve_provider_name.return_value = "openai"
+    api_manager.make_vision_request.return_value = (None, "gpt-5.4-mini")
+    api_manager.extract_text_from_response.return_value = "Hello"
+
+    service.process_image(OCRRequest(image=Image.new("RGB", (2000, 100), "white"), preprocess=False))
+
+    image = api_manager.make_vision_request.call_args.args[0][1]["content"][1]["image"]
+    assert image.mime_type == "image/jpeg"
+    with Image.open(BytesIO(image.data)) as encoded_pil_image:
+        assert (encoded_pil_image.format, encoded_pil_image.size) == ("JPEG", (1280, 64))
+
+
+@pytest.mark.parametrize("crop, size", [(None, (70, 25)), (False, (1200, 800))])
+def test_llm_ocr_crops_loose_captures_to_text(fake_config, mocker, crop, size):
+    """Empty margins are cut off before upload unless cropping is disabled."""
+    service = OCRService(fake_config)
+    fake_config.settings.update({"ocr_crop_to_text": crop, "openai_vision_model": "gpt-5.4-mini"})
+    api_manager = mocker.patch("whisperbridge.services.ocr_service.get_api_manager").return_value
+    api_manager.resolve_provider_name.return_value = "openai"
+    api_manager.make_vision_request.return_value = (None, "gpt-5.4-mini")
+    api_manager.extract_text_from_response.return_value = "Hello"
+    capture = Image.new("RGB", (1200, 800), "white")
+    ImageDraw.Draw(capture).text((500, 380), "Hello world", fill="black")
+
+    service.process_image(OCRRequest(image=capture, preprocess=False))
+
+    image = api_manager.make_vision_request.call_args.args[0][1]["content"][1]["image"]
+    with Image.open(BytesIO(image.data)) as encoded_pil_image:
+        assert encoded_pil_image.size == size
+
+
+@pytest.mark.parametrize("enabled, requests", [(None, 1), (False, 2)])
+def test_llm_ocr_reuses_text_of_repeated_capture(fake_config, mocker, enabled, requests):
+    """A repeated capture is answered from the result cache without a vision request."""
+    service = OCRService(fake_config)
+    fake_config.settings.update({"ocr_cache_enabled": enabled, "openai_vision_model": "gpt-5.4-mini"})
+    api_manager = mocker.patch("whisperbridge.services.ocr_service.get_api_manager").return_value
+    api_manager.resolve_provider_name.return_value = "openai"
+    api_manager.make_vision_request.return_value = (None, "gpt-5.4-mini")
+    api_manager.extract_text_from_response.return_value = "Hello world"
+    capture = Image.new("RGB", (400, 120), "white")
+    ImageDraw.Draw(capture).text((20, 40), "Hello world", fill="black")
+
+    results = [service.process_image(OCRRequest(image=capture.copy(), preprocess=False)) for _ in range(2)]
+
+    assert api_manager.make_vision_request.call_count == requests
+    assert [(r.success, r.text) for r in results] == [(True, "Hello world")] * 2
+
+
 def test_llm_whitespace_response_is_reported_as_unsuccessful(
     fake_config, openai_api_manager, mocker
 ):
@@ -138,6 +192,127 @@ def test_llm_whitespace_response_is_reported_as_unsuccessful(
     assert result.error_message == "Empty OCR text from LLM"
 
 
+def _completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+
+@pytest.fixture
+def combined_ocr(fake_config, openai_api_manager, mocker):
+    """OCR service set up to recognize and translate with OpenAI."""
+    fake_config.settings.update({
+        "api_provider": "openai",
+        "ocr_llm_prompt": "Extract plain text...",
+        "openai_vision_model": "gpt-5.4-mini",
+    })
+    api_manager, external_client = openai_api_manager
+    mocker.patch("whisperbridge.services.ocr_service.get_api_manager", return_value=api_manager)
+    return OCRService(fake_config), external_client
+
+
+def _translate_request():
+    return OCRRequest(image=Image.new("RGB", (8, 8)), translate_from="auto", translate_to="de")
+
+
+def test_llm_ocr_returns_translation_from_same_request(fake_config, combined_ocr):
+    """One vision request returns the text and its translation."""
+    service, external_client = combined_ocr
+    external_client.chat.completions.create.return_value = _completion(
+        '<part name="text">Hello</part>\n<part name="translation">Hallo</part>'
+    )
+
+    result = service.process_image(_translate_request())
+
+    assert (result.success, result.text, result.translated_text) == (True, "Hello", "Hallo")
+    external_client.chat.completions.create.assert_called_once()
+    request_kwargs = external_client.chat.completions.create.call_args.kwargs
+    assert request_kwargs["messages"][0]["content"].startswith("Extract plain text...")
+    assert "into de" in request_kwargs["messages"][0]["content"]
+    assert request_kwargs["max_completion_tokens"] == 2 * COMPLETION_BUDGET_FLOORS[MODE_OCR] + REASONING_TOKEN_ALLOWANCE
+
+
+def test_llm_ocr_malformed_combined_response_falls_back_to_plain_ocr(combined_ocr):
+    """An answer without the tagged structure is recognized again with the plain prompt."""
+    service, external_client = combined_ocr
+    external_client.chat.completions.create.side_effect = [
+        _completion("Hello -> Hallo"),
+        _completion("Hello"),
+    ]
+
+    result = service.process_image(_translate_request())
+
+    assert (result.success, result.text, result.translated_text) == (True, "Hello", None)
+    assert external_client.chat.completions.create.call_count == 2
+    plain_messages = external_client.chat.completions.create.call_args.kwargs["messages"]
+    assert plain_messages[0] == {"role": "system", "content": "Extract plain text..."}
+
+
+def test_llm_ocr_missing_translation_leaves_it_to_translation_service(combined_ocr):
+    """Text without a translation part is returned for a separate translation."""
+    service, external_client = combined_ocr
+    external_client.chat.completions.create.return_value = _completion('<part name="text">Hello</part>')
+
+    result = service.process_image(_translate_request())
+
+    assert (result.text, result.translated_text) == ("Hello", None)
+    external_client.chat.completions.create.assert_called_once()
+
+
+def test_llm_ocr_empty_parts_report_no_text(combined_ocr):
+    """Empty tagged parts mean the image has no text; no second request is made."""
+    service, external_client = combined_ocr
+    external_client.chat.completions.create.return_value = _completion(
+        '<part name="text"></part><part name="translation"></part>'
+    )
+
+    result = service.process_image(_translate_request())
+
+    assert (result.success, result.text, result.translated_text) == (False, "", None)
+    external_client.chat.completions.create.assert_called_once()
+
+
+def test_llm_ocr_combined_prompt_carries_translation_system_prompt(fake_config, combined_ocr):
+    """The configured translation prompt (glossary, tone) applies to the combined request too."""
+    service, external_client = combined_ocr
+    fake_config.settings["system_prompt"] = "Translate 'capture' as 'Aufnahme'."
+    external_client.chat.completions.create.return_value = _completion(
+        '<part name="text">Hello</part><part name="translation">Hallo</part>'
+    )
+
+    service.process_image(_translate_request())
+
+    system_message = external_client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+    assert "Translate 'capture' as 'Aufnahme'." in system_message
+
+
+def test_llm_ocr_combined_text_is_not_cleaned_like_a_translation(combined_ocr):
+    """Quotes around the extracted text are kept; only the translation is cleaned."""
+    service, external_client = combined_ocr
+    external_client.chat.completions.create.return_value = _completion(
+        '<part name="text"> "Hello" </part><part name="translation">Translation: "Hallo"</part>'
+    )
+
+    result = service.process_image(_translate_request())
+
+    assert (result.text, result.translated_text) == ('"Hello"', "Hallo")
+
+
+@pytest.mark.parametrize("settings", [{"ocr_translate_in_one_request": False}, {"api_provider": "deepl"}])
+def test_llm_ocr_without_combined_mode_only_extracts_text(fake_config, combined_ocr, mocker, settings):
+    """Disabled combined mode or a non-LLM translation provider keeps the plain OCR request."""
+    service, external_client = combined_ocr
+    fake_config.settings.update(settings)
+    api_manager = mocker.patch("whisperbridge.services.ocr_service.get_api_manager").return_value
+    api_manager.resolve_provider_name.side_effect = lambda mode: "openai" if mode == "ocr" else settings.get("api_provider", "openai")
+    api_manager.make_vision_request.return_value = (_completion("Hello"), "gpt-5.4-mini")
+    api_manager.extract_text_from_response.return_value = "Hello"
+
+    result = service.process_image(_translate_request())
+
+    assert (result.text, result.translated_text) == ("Hello", None)
+    messages = api_manager.make_vision_request.call_args.args[0]
+    assert messages[0] == {"role": "system", "content": "Extract plain text..."}
+
+
 def test_capture_worker_passes_ui_languages_without_detection_or_swap(qtbot, mocker):
     """The worker passes UI language selections to TranslationService."""
     class Settings:
@@ -150,7 +325,7 @@ def test_capture_worker_passes_ui_languages_without_detection_or_swap(qtbot, moc
 
     ocr_service = mocker.Mock()
     ocr_service.process_image.return_value = MagicMock(
-        text="selected text", success=True, error_message=None
+        text="selected text", success=True, error_message=None, translated_text=None
     )
     translation_service = mocker.Mock(is_available=True)
     translation_service.translate_text_sync.return_value = MagicMock(
@@ -187,6 +362,47 @@ def test_capture_worker_passes_ui_languages_without_detection_or_swap(qtbot, moc
     )
 
 
+def test_capture_worker_caches_translation_from_ocr_request(qtbot, mocker):
+    """A translation returned with the OCR text is cached like one from TranslationService."""
+    ocr_service = mocker.Mock()
+    ocr_service.process_image.return_value = MagicMock(
+        text="selected text", success=True, error_message=None, translated_text="translated"
+    )
+    translation_service = mocker.Mock(is_available=True)
+    mocker.patch("whisperbridge.ui_qt.workers.get_ocr_service", return_value=ocr_service)
+    mocker.patch("whisperbridge.ui_qt.workers.get_translation_service", return_value=translation_service)
+    mocker.patch(
+        "whisperbridge.ui_qt.workers.config_service.get_settings",
+        return_value=SimpleNamespace(ui_source_language="auto", ui_target_language="uk"),
+    )
+
+    worker = CaptureOcrTranslateWorker(Image.new("RGB", (8, 8)))
+    finished_spy = QSignalSpy(worker.finished)
+    worker.run()
+
+    assert finished_spy.at(0) == ["selected text", "translated", "ocr", ""]
+    translation_service.translate_text_sync.assert_not_called()
+    translation_service.cache_translation.assert_called_once_with("selected text", "translated", "auto", "uk")
+
+
+def test_cached_ocr_translation_is_served_to_text_requests(mocker, tmp_path):
+    """cache_translation stores under the key a later text-mode request looks up."""
+    service = object.__new__(TranslationService)
+    service._result_cache = TranslationCache(tmp_path)
+    mocker.patch(
+        "whisperbridge.services.translation_service.config_service.get_settings",
+        return_value=SimpleNamespace(translation_cache_enabled=True, auto_swap_en_ru=False, system_prompt="Translate."),
+    )
+    mocker.patch.object(service, "_active_provider", return_value="openai")
+    mocker.patch.object(service, "_get_active_model", return_value="gpt-5.4-mini")
+
+    service.cache_translation("selected text", "translated", "auto", "uk")
+    cached = service.get_cached_translation("selected text", "auto", "uk")
+    service._result_cache.close()
+
+    assert cached.translated_text == "translated"
+
+
 def test_translation_service_owns_detection_and_auto_swap(mocker):
     """TranslationService resolves effective EN/RU direction from raw UI settings."""
     class Settings:
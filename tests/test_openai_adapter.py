@@ -5,6 +5,7 @@ Unit tests for OpenAIChatClientAdapter.
 import pytest
 from types import SimpleNamespace
 
+from whisperbridge.core.image_parts import EncodedImage, image_part
 from whisperbridge.providers.openai_adapter import OpenAIChatClientAdapter
 
 
@@ -121,6 +122,23 @@ class TestOpenAITextRequests:
         kwargs = mock_create.call_args.kwargs
         assert kwargs["messages"] == messages
 
+    def test_image_bytes_are_sent_as_data_url(self, mocker, fake_openai_client, mock_completion_response):
+        """Raw image bytes are encoded to a data URL at the edge; the caller's messages stay as they are."""
+        image = EncodedImage(b"\xff\xd8jpeg", "image/jpeg")
+        messages = [{"role": "user", "content": [{"type": "text", "text": "Read"}, image_part(image)]}]
+        mock_create = mocker.patch.object(
+            fake_openai_client._client.chat.completions, "create", return_value=mock_completion_response
+        )
+
+        fake_openai_client.chat.completions.create(model="gpt-5.4-mini", messages=messages)
+
+        sent = mock_create.call_args.kwargs["messages"]
+        assert sent[0]["content"] == [
+            {"type": "text", "text": "Read"},
+            {"type": "image_url", "image_url": {"url": "data:image/jpeg;base64,/9hqcGVn"}},
+        ]
+        assert messages[0]["content"][1] == image_part(image)
+
     def test_model_variations(self, mocker, fake_openai_client, mock_completion_response):
         """Test different model name handling."""
         models_to_test = ["gpt-5.4-mini", "gpt-5.6-luna", "gpt-5.7"]
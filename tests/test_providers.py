@@ -7,8 +7,12 @@ This module tests provider management functionality including:
 - Provider clearing
 - DeepL plan parameter handling
 - Simultaneous provider initialization
+- Lazy, thread-safe client construction
 """
 
+import threading
+import time
+
 import pytest
 
 from whisperbridge.core.api_manager.providers import APIProvider, ProviderRegistry
@@ -201,6 +205,7 @@ class TestDeepLPlanParameter:
 
         # Assert
         assert registry.is_provider_available(APIProvider.DEEPL) is True
+        registry.get_client(APIProvider.DEEPL)
         deepl_init_mock.assert_called_once()
         call_kwargs = deepl_init_mock.call_args.kwargs
         assert call_kwargs.get("plan") == "pro"
@@ -252,3 +257,79 @@ class TestSimultaneousInitialization:
         assert registry.is_provider_available(APIProvider.GOOGLE) is True
         assert registry.is_provider_available(APIProvider.DEEPL) is True
         assert registry.has_any_clients() is True
+
+
+class TestLazyConstruction:
+    """Tests for building clients on first use."""
+
+    @pytest.fixture
+    def configured(self, mock_config_service, mocker):
+        mock_config_service.get_setting.side_effect = lambda key: {
+            "api_provider": "google",
+            "openai_api_key": "sk-test123",
+            "google_api_key": "AIzatest123",
+            "api_timeout": 30,
+        }.get(key)
+        mocker.patch("whisperbridge.core.api_manager.providers.validate_api_key_format", return_value=True)
+        return {
+            "openai": mocker.patch("whisperbridge.core.api_manager.providers.OpenAIChatClientAdapter"),
+            "google": mocker.patch("whisperbridge.core.api_manager.providers.GoogleChatClientAdapter"),
+        }
+
+    def test_clients_built_on_first_use_only(self, mock_config_service, configured):
+        """Initialization validates keys without building clients; get_client builds once."""
+        registry = ProviderRegistry(mock_config_service)
+        registry.initialize_all()
+
+        assert registry.is_provider_available(APIProvider.OPENAI) is True
+        assert registry.has_any_clients() is True
+        assert registry.get_all_clients() == []
+        configured["openai"].assert_not_called()
+
+        client = registry.get_client(APIProvider.OPENAI)
+
+        assert registry.get_client(APIProvider.OPENAI) is client
+        assert registry.get_all_clients() == [client]
+        configured["openai"].assert_called_once_with(api_key="sk-test123", timeout=30, transport=registry.get_transport())
+        configured["google"].assert_not_called()
+
+    def test_selected_client(self, mock_config_service, configured):
+        """get_selected_client builds the client of the provider selected in settings."""
+        registry = ProviderRegistry(mock_config_service)
+        registry.initialize_all()
+
+        assert registry.get_selected_client() is configured["google"].return_value
+        configured["openai"].assert_not_called()
+
+    def test_concurrent_first_use_builds_once(self, mock_config_service, configured):
+        """Threads racing for a new client all get the same single instance."""
+
+        def slow_build(**kwargs):
+            time.sleep(0.05)
+            return object()
+
+        configured["openai"].side_effect = slow_build
+        registry = ProviderRegistry(mock_config_service)
+        registry.initialize_all()
+        clients = []
+        threads = [
+            threading.Thread(target=lambda: clients.append(registry.get_client(APIProvider.OPENAI)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert configured["openai"].call_count == 1
+        assert len(clients) == 8 and len({id(client) for client in clients}) == 1
+
+    def test_failed_build_makes_provider_unavailable(self, mock_config_service, configured, loguru_caplog):
+        """A client that cannot be built is reported and the provider is dropped."""
+        configured["openai"].side_effect = RuntimeError("boom")
+        registry = ProviderRegistry(mock_config_service)
+        registry.initialize_all()
+
+        assert registry.get_client(APIProvider.OPENAI) is None
+        assert registry.is_provider_available(APIProvider.OPENAI) is False
+        assert any("Failed to initialize OpenAI provider" in record.message for record in loguru_caplog.records)
@@ -0,0 +1,226 @@
+"""
+Tests for the deadline-aware retry engine.
+
+This module tests:
+- request_deadline nesting and remaining_time
+- RetryEngine backoff, Retry-After handling and early give-up
+- Attempt metrics
+- APIManager integration (deadline from api_timeout, retry stats)
+"""
+
+import asyncio
+
+import pytest
+from tenacity import RetryError
+
+from whisperbridge.core.api_manager import APIErrorType, APIProvider, RetryableAPIError
+from whisperbridge.core.api_manager.retry import (
+    RetryEngine,
+    RetryPolicy,
+    remaining_time,
+    request_deadline,
+)
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+def _rate_limited(retry_after=None):
+    return RetryableAPIError("rate limited", error_type=APIErrorType.RATE_LIMIT, retry_after=retry_after)
+
+
+class _Flaky:
+    """Callable failing with the given errors before returning "ok"."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.fixture
+def sleeps(mocker):
+    """Record backoff sleeps instead of waiting."""
+    recorded = []
+    mocker.patch("tenacity.nap.time.sleep", side_effect=recorded.append)
+    return recorded
+
+
+class TestRequestDeadline:
+    """Tests for request_deadline and remaining_time."""
+
+    def test_unbounded_by_default(self):
+        """Without a deadline there is no remaining-time limit."""
+        assert remaining_time() is None
+
+    def test_nested_deadline_never_extends_outer(self):
+        """The earlier of nested deadlines wins and is restored on exit."""
+        with request_deadline(5):
+            with request_deadline(60):
+                assert remaining_time() <= 5
+            with request_deadline(1):
+                assert remaining_time() <= 1
+            assert 1 < remaining_time() <= 5
+        assert remaining_time() is None
+
+    def test_deadline_propagates_to_tasks(self):
+        """Tasks created inside the block see the deadline."""
+
+        async def main():
+            with request_deadline(5):
+                return await asyncio.create_task(asyncio.sleep(0, result=remaining_time()))
+
+        assert 0 < asyncio.run(main()) <= 5
+
+
+class TestRetryEngine:
+    """Tests for RetryEngine."""
+
+    def test_retries_with_short_jittered_backoff(self, sleeps):
+        """Retryable errors are retried with backoffs within the policy bounds."""
+        engine = RetryEngine(RetryPolicy(base_delay=0.5, max_delay=4.0))
+        fn = _Flaky(_rate_limited(), _rate_limited())
+
+        assert engine.call(fn) == "ok"
+
+        assert fn.calls == 3
+        assert len(sleeps) == 2
+        assert 0.25 <= sleeps[0] <= 0.5
+        assert 0.5 <= sleeps[1] <= 1.0
+
+    def test_honors_retry_after(self, sleeps):
+        """A provider Retry-After replaces the backoff."""
+        engine = RetryEngine(RetryPolicy(base_delay=0.5))
+
+        engine.call(_Flaky(_rate_limited(retry_after=3.0)))
+
+        assert 3.0 <= sleeps[0] <= 3.25
+
+    def test_gives_up_when_retry_after_exceeds_limit(self, sleeps):
+        """A Retry-After longer than max_retry_after is not waited out."""
+        engine = RetryEngine(RetryPolicy(max_retry_after=10))
+        fn = _Flaky(_rate_limited(retry_after=60))
+
+        with pytest.raises(RetryError):
+            engine.call(fn)
+
+        assert fn.calls == 1
+        assert sleeps == []
+        assert engine.metrics.stats()["gave_up"] == {"retry_after": 1}
+
+    def test_gives_up_when_deadline_cannot_fit_another_attempt(self, sleeps):
+        """No retry is scheduled when backoff plus an attempt exceeds the remaining time."""
+        engine = RetryEngine(RetryPolicy(min_attempt_seconds=1.0))
+        fn = _Flaky(_rate_limited(retry_after=2.0))
+
+        with request_deadline(2.5), pytest.raises(RetryError) as excinfo:
+            engine.call(fn)
+
+        assert fn.calls == 1
+        assert sleeps == []
+        assert isinstance(excinfo.value.last_attempt.exception(), RetryableAPIError)
+        assert engine.metrics.stats()["gave_up"] == {"deadline": 1}
+
+    def test_stops_after_max_attempts(self, sleeps):
+        """Persistent errors stop at max_attempts."""
+        engine = RetryEngine(RetryPolicy(max_attempts=2))
+        fn = _Flaky(*[_rate_limited() for _ in range(5)])
+
+        with pytest.raises(RetryError):
+            engine.call(fn)
+
+        assert fn.calls == 2
+
+    def test_non_retryable_errors_are_raised_unchanged(self, sleeps):
+        """Errors other than RetryableAPIError are not retried."""
+        engine = RetryEngine()
+        fn = _Flaky(ValueError("bad request"))
+
+        with pytest.raises(ValueError, match="bad request"):
+            engine.call(fn)
+
+        assert fn.calls == 1
+        assert engine.metrics.stats()["attempts"]["error"]["count"] == 1
+
+    def test_records_attempt_metrics(self, sleeps):
+        """Every attempt is recorded with its outcome and duration."""
+        engine = RetryEngine()
+
+        engine.call(_Flaky(_rate_limited(retry_after=0.1)))
+        stats = engine.metrics.stats()
+
+        assert stats["attempts"]["rate_limit"]["count"] == 1
+        assert stats["attempts"]["success"]["count"] == 1
+        assert stats["retries"] == 1
+        assert stats["backoff_ms"] >= 100
+        assert [(a["attempt"], a["outcome"]) for a in stats["recent"]] == [(1, "rate_limit"), (2, "success")]
+
+    def test_async_retries_sleep_on_loop(self, mocker):
+        """acall waits on the event loop and gives up at the deadline."""
+        sleep = mocker.patch("asyncio.sleep", mocker.AsyncMock())
+        engine = RetryEngine(RetryPolicy(min_attempt_seconds=1.0))
+        fn = mocker.AsyncMock(side_effect=[_rate_limited(retry_after=0.2), _rate_limited(retry_after=1.5), "ok"])
+
+        async def main():
+            with request_deadline(2.0):
+                return await engine.acall(fn)
+
+        with pytest.raises(RetryError):
+            asyncio.run(main())
+
+        assert fn.await_count == 2
+        assert sleep.await_count == 1
+        assert 0.2 <= sleep.await_args.args[0] <= 0.45
+        assert engine.metrics.stats()["gave_up"] == {"deadline": 1}
+
+
+class TestAPIManagerRetries:
+    """Tests for retries in APIManager."""
+
+    def test_rate_limit_header_delay_is_used(self, api_manager, config_openai, mock_openai_client, sleeps):
+        """Retry-After from the provider response drives the wait."""
+        error = Exception("rate limit exceeded")
+        error.retry_after = 1.5
+        mock_openai_client.chat.completions.create.side_effect = [error, mock_openai_client.chat.completions.create.return_value]
+        api_manager.initialize()
+
+        api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+
+        assert 1.5 <= sleeps[0] <= 1.75
+        stats = api_manager.get_retry_stats()
+        assert stats["attempts"]["rate_limit"]["count"] == 1
+        assert stats["attempts"]["success"]["count"] == 1
+
+    def test_api_timeout_bounds_retries(self, api_manager, mock_config_service, mock_openai_client, sleeps):
+        """Without a caller deadline, api_timeout bounds the total retry time."""
+        mock_config_service.get_setting.side_effect = lambda key: {
+            "openai_api_key": "sk-test123",
+            "api_provider": "openai",
+            "api_timeout": 5,
+        }.get(key)
+        error = Exception("rate limit exceeded")
+        error.retry_after = 10
+        mock_openai_client.chat.completions.create.side_effect = error
+        api_manager.initialize()
+
+        with pytest.raises(RetryError):
+            api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+
+        assert mock_openai_client.chat.completions.create.call_count == 1
+        assert sleeps == []
+        assert api_manager.get_retry_stats()["gave_up"] == {"deadline": 1}
+
+    def test_caller_deadline_is_respected(self, api_manager, config_openai, mock_openai_client, sleeps):
+        """A shorter caller deadline (e.g. the worker timeout) overrides api_timeout."""
+        error = Exception("server overloaded: connection reset")
+        mock_openai_client.chat.completions.create.side_effect = error
+        api_manager.initialize()
+
+        with request_deadline(0.5), pytest.raises(RetryError):
+            api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+
+        assert mock_openai_client.chat.completions.create.call_count == 1
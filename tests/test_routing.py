@@ -0,0 +1,268 @@
+"""
+Tests for latency-aware provider routing.
+
+This module tests:
+- RouteStats EWMA, error rate and p95
+- ProviderRouter choice (exploration, fastest healthy, unhealthy recheck)
+- Persistence of the statistics in the config directory
+- APIManager recording and automatic provider selection
+- TranslationService requests built for the routed provider
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.core.api_manager import APIProvider
+from whisperbridge.core.api_manager.routing import UNHEALTHY_RECHECK_SECONDS, ProviderRouter, RouteStats
+from whisperbridge.services.translation_service import TranslationService
+from whisperbridge.utils.translation_utils import TranslationRequest
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+CANDIDATES = [("openai", "gpt-5.4-mini"), ("google", "gemini-2.5-flash"), ("deepl", "deepl-translate")]
+
+
+def _measure(router, provider, model, *latencies):
+    for seconds in latencies:
+        router.record_success(provider, model, seconds)
+
+
+class TestRouteStats:
+    """Tests for RouteStats."""
+
+    def test_ewma_error_rate_and_p95(self):
+        """Latency and error averages follow new samples; p95 uses the window."""
+        stats = RouteStats()
+        stats.record(1.0)
+        stats.record(2.0)
+        stats.record(None)
+
+        assert stats.latency_ewma == pytest.approx(1.2)
+        assert stats.error_ewma == pytest.approx(0.2)
+        assert stats.p95() == 2.0
+        assert (stats.requests, stats.failures) == (3, 1)
+
+    def test_round_trip(self):
+        """Serialized statistics restore the same values."""
+        stats = RouteStats()
+        for seconds in (0.5, None, 0.7):
+            stats.record(seconds)
+
+        restored = RouteStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+
+        assert restored.to_dict() == stats.to_dict()
+
+
+class TestProviderRouter:
+    """Tests for ProviderRouter.choose."""
+
+    def test_unmeasured_candidates_are_tried_first(self):
+        """Providers without data are explored, the preferred one first."""
+        router = ProviderRouter()
+        _measure(router, "openai", "gpt-5.4-mini", 0.2, 0.2, 0.2)
+
+        assert router.choose("translate", CANDIDATES, preferred="deepl") == ("deepl", "deepl-translate")
+        assert router.choose("translate", CANDIDATES, preferred="openai") == ("google", "gemini-2.5-flash")
+
+    def test_fastest_healthy_candidate_wins(self):
+        """With data for every candidate the lowest expected latency wins."""
+        router = ProviderRouter()
+        _measure(router, "openai", "gpt-5.4-mini", 1.5, 1.4, 1.6)
+        _measure(router, "google", "gemini-2.5-flash", 0.4, 0.5, 0.4)
+        _measure(router, "deepl", "deepl-translate", 0.6, 0.7, 0.6)
+
+        assert router.choose("translate", CANDIDATES, preferred="openai") == ("google", "gemini-2.5-flash")
+
+    def test_tail_latency_counts(self):
+        """A provider with a slow tail loses against a steadier one with a similar average."""
+        router = ProviderRouter()
+        _measure(router, "openai", "gpt-5.4-mini", 0.3, 0.3, 0.3, 0.3, 3.0)
+        _measure(router, "google", "gemini-2.5-flash", 0.6, 0.6, 0.6, 0.6, 0.6)
+
+        assert router.choose("style", CANDIDATES[:2]) == ("google", "gemini-2.5-flash")
+
+    def test_failing_provider_is_skipped_until_recheck(self, mocker):
+        """A provider with a high error rate is avoided, then retried after a while."""
+        router = ProviderRouter()
+        _measure(router, "openai", "gpt-5.4-mini", 0.2, 0.2, 0.2)
+        _measure(router, "google", "gemini-2.5-flash", 0.9, 0.9, 0.9)
+        for _ in range(4):
+            router.record_failure("openai", "gpt-5.4-mini")
+
+        assert router.choose("style", CANDIDATES[:2]) == ("google", "gemini-2.5-flash")
+        assert router.stats()["openai/gpt-5.4-mini"]["healthy"] is False
+
+        now = mocker.patch("whisperbridge.core.api_manager.routing.time.time")
+        now.return_value = router._stats[("openai", "gpt-5.4-mini")].last_failure + UNHEALTHY_RECHECK_SECONDS
+        assert router.choose("style", CANDIDATES[:2]) == ("openai", "gpt-5.4-mini")
+
+    def test_all_unhealthy_uses_lowest_error_rate(self):
+        """Without a healthy provider the least failing one is used."""
+        router = ProviderRouter()
+        for _ in range(6):
+            router.record_failure("openai", "gpt-5.4-mini")
+        for _ in range(4):
+            router.record_failure("google", "gemini-2.5-flash")
+
+        assert router.choose("ocr", CANDIDATES[:2]) == ("google", "gemini-2.5-flash")
+
+    def test_reasoning_is_logged(self, mocker):
+        """Each candidate's statistics and the decision appear in the debug log."""
+        debug = mocker.patch("whisperbridge.core.api_manager.routing.logger.debug")
+        router = ProviderRouter()
+        _measure(router, "openai", "gpt-5.4-mini", 0.2, 0.2, 0.2)
+        _measure(router, "google", "gemini-2.5-flash", 0.5, 0.5, 0.5)
+
+        router.choose("style", CANDIDATES[:2])
+
+        message = debug.call_args.args[0]
+        assert "openai/gpt-5.4-mini: ewma 200 ms, p95 200 ms" in message
+        assert "google/gemini-2.5-flash: ewma 500 ms" in message
+        assert message.endswith("-> openai/gpt-5.4-mini (lowest expected latency (200 ms))")
+
+
+class TestPersistence:
+    """Tests for statistics persistence."""
+
+    def test_statistics_survive_restart(self, tmp_path):
+        """Saved statistics are loaded by a new router."""
+        router = ProviderRouter(tmp_path)
+        _measure(router, "google", "gemini-2.5-flash", 0.4, 0.5)
+        router.record_failure("openai", "gpt-5.4-mini")
+        router.save()
+
+        restored = ProviderRouter(tmp_path)
+
+        assert restored.stats() == router.stats()
+        assert not (tmp_path / "provider_stats.tmp").exists()
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        """A corrupt statistics file starts the router empty."""
+        (tmp_path / "provider_stats.json").write_text("{not json", encoding="utf-8")
+
+        assert ProviderRouter(tmp_path).stats() == {}
+
+
+class TestAPIManagerRouting:
+    """Tests for routing in APIManager."""
+
+    @pytest.fixture
+    def config_routing(self, mock_config_service):
+        settings = {
+            "openai_api_key": "sk-test123",
+            "google_api_key": "AIzatest123",
+            "deepl_api_key": "deepl-test-key",
+            "api_provider": "openai",
+            "api_timeout": 30,
+            "openai_model": "gpt-5.4-mini",
+            "openai_vision_model": "gpt-5.4-mini",
+            "google_model": "gemini-2.5-flash",
+            "google_vision_model": "gemini-2.5-flash",
+            "auto_provider_routing": True,
+        }
+        mock_config_service.get_setting.side_effect = settings.get
+        return settings
+
+    def test_requests_are_recorded(self, api_manager, config_openai, mock_openai_client):
+        """Successful and failed attempts update the statistics of provider and model."""
+        api_manager.initialize()
+        api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+        mock_openai_client.chat.completions.create.side_effect = ValueError("bad request")
+        with pytest.raises(ValueError):
+            api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+
+        stats = api_manager.get_router_stats()["openai/gpt-5.4-mini"]
+        assert (stats["requests"], stats["failures"]) == (2, 1)
+        assert stats["ewma_ms"] is not None
+
+    def test_statistics_are_saved_on_shutdown(self, api_manager, config_openai, mock_openai_client, tmp_path):
+        """Shutdown writes the statistics to the config directory."""
+        api_manager.initialize()
+        api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+
+        api_manager.shutdown()
+
+        routes = json.loads((tmp_path / "provider_stats.json").read_text(encoding="utf-8"))["routes"]
+        assert [(route["provider"], route["model"]) for route in routes] == [("openai", "gpt-5.4-mini")]
+
+    def test_selected_provider_without_auto_mode(
+        self, api_manager, config_routing, mock_openai_client, mock_google_client, mock_deepl_client
+    ):
+        """Without automatic selection the selected provider is always used."""
+        config_routing["auto_provider_routing"] = False
+        api_manager.initialize()
+        _measure(api_manager._router, "google", "gemini-2.5-flash", 0.1, 0.1, 0.1)
+
+        assert api_manager.resolve_provider_name("translate") == "openai"
+
+    def test_auto_mode_picks_fastest_capable_provider(
+        self, api_manager, config_routing, mock_openai_client, mock_google_client, mock_deepl_client
+    ):
+        """The fastest provider supporting the mode is chosen; OCR and styling skip DeepL."""
+        api_manager.initialize()
+        _measure(api_manager._router, "openai", "gpt-5.4-mini", 2.0, 2.0, 2.0)
+        _measure(api_manager._router, "google", "gemini-2.5-flash", 0.8, 0.8, 0.8)
+        _measure(api_manager._router, "deepl", "deepl-translate", 0.3, 0.3, 0.3)
+
+        assert api_manager.resolve_provider_name("translate") == "deepl"
+        assert api_manager.resolve_provider_name("style") == "google"
+        assert api_manager.resolve_provider_name("ocr") == "google"
+
+    def test_unconfigured_providers_are_not_candidates(self, api_manager, config_routing, mock_openai_client):
+        """Only providers with a client are routed to."""
+        del config_routing["google_api_key"], config_routing["deepl_api_key"]
+        api_manager.initialize()
+
+        assert api_manager.resolve_provider_name("translate") == "openai"
+
+    def test_vision_request_uses_routed_provider(
+        self, api_manager, config_routing, mock_openai_client, mock_google_client, mocker
+    ):
+        """make_vision_request sends to the provider passed by the caller."""
+        mock_google_client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="text"), finish_reason="stop")], usage=None
+        )
+        api_manager.initialize()
+        messages = [{"role": "user", "content": [{"type": "image_url", "image_url": {"url": "data:,"}}]}]
+
+        _, model = api_manager.make_vision_request(messages, "gemini-2.5-flash", provider_name="google")
+
+        assert model == "gemini-2.5-flash"
+        mock_openai_client.chat.completions.create.assert_not_called()
+
+
+class TestServiceRouting:
+    """Tests for TranslationService requests on a routed provider."""
+
+    @pytest.fixture
+    def service(self, mocker):
+        service = object.__new__(TranslationService)
+        service._api_manager = mocker.Mock()
+        service._api_manager.make_translation_request_async = mocker.AsyncMock(
+            return_value=(
+                SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Hallo"))], usage=None),
+                "deepl-translate",
+            )
+        )
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_setting",
+            side_effect={"api_provider": "openai"}.get,
+        )
+        return service
+
+    def test_request_is_built_for_routed_provider(self, service):
+        """A request routed to DeepL uses DeepL's message format, not the selected provider's."""
+        request = TranslationRequest(
+            text="Hello", source_lang="en", target_lang="de", system_prompt="prompt",
+            model="deepl-translate", provider="deepl",
+        )
+
+        response = asyncio.run(service._request_translation_async(request))
+
+        kwargs = service._api_manager.make_translation_request_async.call_args.kwargs
+        assert kwargs["provider_name"] == "deepl"
+        assert kwargs["messages"] == [{"role": "user", "content": "Hello"}]
+        assert kwargs["target_lang"] == "de"
+        assert response.translated_text == "Hallo"
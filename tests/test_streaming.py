@@ -0,0 +1,246 @@
+"""
+Tests for streaming responses.
+
+This module tests:
+- TranslationStream delta iteration, usage and close handling
+- Streaming in the OpenAI and Google adapters
+- APIManager.make_translation_stream for LLM and DeepL providers
+- Streaming in TranslationService
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.core.api_manager.streaming import TranslationStream
+from whisperbridge.providers.google_chat_adapter import GoogleChatClientAdapter
+from whisperbridge.providers.openai_adapter import OpenAIChatClientAdapter
+from whisperbridge.services.translation_service import TranslationService
+from whisperbridge.utils.translation_utils import TranslationRequest
+
+
+def _chunk(content=None, finish_reason=None, usage=None):
+    choices = [] if content is None and finish_reason is None else [
+        SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)
+    ]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class _ClosableChunks:
+    """Chunk iterable that records whether it was closed."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.closed = False
+
+    def __iter__(self):
+        return iter(self._chunks)
+
+    def close(self):
+        self.closed = True
+
+
+class TestTranslationStream:
+    """Tests for TranslationStream."""
+
+    def test_yields_deltas_and_records_usage(self):
+        """Deltas are yielded in order; usage, finish reason and text are recorded."""
+        chunks = _ClosableChunks([
+            _chunk("Hal"),
+            _chunk("lo"),
+            _chunk(None, finish_reason="stop"),
+            _chunk(usage=SimpleNamespace(total_tokens=12)),
+        ])
+        stream = TranslationStream(chunks, "gpt-5.4-mini")
+
+        assert list(stream) == ["Hal", "lo"]
+        assert stream.text == "Hallo"
+        assert stream.tokens_used == 12
+        assert stream.finish_reason == "stop"
+        assert stream.first_token_latency is not None
+        assert chunks.closed
+
+    def test_from_response_wraps_complete_result(self):
+        """A non-streamed response becomes a single delta."""
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Hallo"), finish_reason="stop")],
+            usage=SimpleNamespace(total_tokens=0),
+        )
+        stream = TranslationStream.from_response(response, "deepl-translate")
+        assert list(stream) == ["Hallo"]
+        assert stream.model == "deepl-translate"
+
+    def test_closes_provider_stream_when_consumer_stops_early(self):
+        """Breaking out of iteration releases the provider stream."""
+        chunks = _ClosableChunks([_chunk("a"), _chunk("b")])
+        stream = TranslationStream(chunks, "m")
+        deltas = iter(stream)
+        assert next(deltas) == "a"
+        deltas.close()
+        assert chunks.closed
+
+    def test_iterates_only_once(self):
+        """A consumed stream cannot be replayed."""
+        stream = TranslationStream([_chunk("a")], "m")
+        list(stream)
+        with pytest.raises(RuntimeError):
+            list(stream)
+
+
+class TestAdapterStreaming:
+    """Tests for streaming in provider adapters."""
+
+    def test_openai_adapter_requests_stream_with_usage(self, mocker):
+        """stream=True is forwarded with include_usage stream options."""
+        mocker.patch("openai.OpenAI")
+        adapter = OpenAIChatClientAdapter(api_key="sk-fake-key", timeout=30)
+        create = mocker.patch.object(adapter._client.chat.completions, "create", return_value=iter([]))
+
+        adapter.chat.completions.create(model="gpt-5.4-mini", messages=[{"role": "user", "content": "Hi"}], stream=True)
+
+        kwargs = create.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["stream_options"] == {"include_usage": True}
+
+    def test_openai_adapter_non_stream_unchanged(self, mocker):
+        """Regular requests carry no stream parameters."""
+        mocker.patch("openai.OpenAI")
+        adapter = OpenAIChatClientAdapter(api_key="sk-fake-key", timeout=30)
+        create = mocker.patch.object(adapter._client.chat.completions, "create")
+
+        adapter.chat.completions.create(model="gpt-5.4-mini", messages=[{"role": "user", "content": "Hi"}])
+
+        assert "stream" not in create.call_args.kwargs
+
+    def test_google_adapter_converts_stream_chunks(self, mocker):
+        """generate_content_stream responses become OpenAI-like delta chunks."""
+        adapter = GoogleChatClientAdapter(api_key="fake-key-for-testing", timeout=30)
+        responses = [
+            SimpleNamespace(text="Hal", usage_metadata=None),
+            SimpleNamespace(text="lo", usage_metadata=SimpleNamespace(total_token_count=9)),
+        ]
+        stream_call = mocker.patch.object(adapter._client.models, "generate_content_stream", return_value=iter(responses))
+        non_stream_call = mocker.patch.object(adapter._client.models, "generate_content")
+
+        chunks = adapter.chat.completions.create(
+            model="gemini-2.0-flash", messages=[{"role": "user", "content": "Hello"}], stream=True
+        )
+        stream = TranslationStream(chunks, "gemini-2.0-flash")
+
+        assert list(stream) == ["Hal", "lo"]
+        assert stream.tokens_used == 9
+        stream_call.assert_called_once()
+        non_stream_call.assert_not_called()
+
+
+class TestAPIManagerStreaming:
+    """Tests for APIManager.make_translation_stream."""
+
+    def test_llm_provider_streams_chunks(self, api_manager, config_openai, mock_openai_client):
+        """LLM providers are called with stream=True and deltas pass through."""
+        api_manager.initialize()
+        mock_openai_client.chat.completions.create.return_value = iter([_chunk("Hal"), _chunk("lo")])
+
+        stream = api_manager.make_translation_stream(
+            messages=[{"role": "user", "content": "Hello"}], model_hint="gpt-5.4-mini"
+        )
+
+        assert list(stream) == ["Hal", "lo"]
+        assert stream.model == "gpt-5.4-mini"
+        assert mock_openai_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    def test_deepl_falls_back_to_single_delta(self, api_manager, config_deepl, mock_deepl_client):
+        """DeepL does not stream; its complete result is yielded once."""
+        api_manager.initialize()
+
+        stream = api_manager.make_translation_stream(
+            messages=[{"role": "user", "content": "Hello"}], target_lang="DE"
+        )
+
+        assert list(stream) == ["Translated text"]
+        assert "stream" not in mock_deepl_client.client.chat.completions.create.call_args.kwargs
+
+
+class TestServiceStreaming:
+    """Tests for streaming in TranslationService."""
+
+    @pytest.fixture
+    def service(self, mocker):
+        service = object.__new__(TranslationService)
+        service._api_manager = mocker.Mock()
+        service._api_manager.is_initialized.return_value = True
+        service._api_manager.has_clients.return_value = True
+        self.settings = SimpleNamespace(streaming_enabled=True)
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_settings",
+            return_value=self.settings,
+        )
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_setting",
+            return_value="openai",
+        )
+        return service
+
+    @staticmethod
+    def _request():
+        return TranslationRequest(
+            text="Hello", source_lang="en", target_lang="de", system_prompt="prompt", model="gpt-5.4-mini"
+        )
+
+    def test_partials_are_reported_and_final_text_is_parsed(self, service, mocker):
+        """Deltas reach the callback; the response holds the cleaned full text."""
+        service._api_manager.make_translation_stream_async = mocker.AsyncMock(
+            return_value=TranslationStream(
+                [_chunk("Translation: "), _chunk("Hallo"), _chunk(usage=SimpleNamespace(total_tokens=5))],
+                "gpt-5.4-mini",
+            )
+        )
+        service._api_manager.make_translation_request_async = mocker.AsyncMock()
+        partials = []
+
+        response = asyncio.run(service._call_gpt_api_async(self._request(), partials.append))
+
+        assert partials == ["Translation: ", "Hallo"]
+        assert response.translated_text == "Hallo"
+        assert response.tokens_used == 5
+        service._api_manager.make_translation_request_async.assert_not_called()
+
+    def test_streaming_disabled_uses_regular_request(self, service, mocker):
+        """With streaming off the regular request path is used."""
+        self.settings.streaming_enabled = False
+        response = mocker.Mock()
+        response.choices = [SimpleNamespace(message=SimpleNamespace(content="Hallo"))]
+        response.usage = SimpleNamespace(total_tokens=3)
+        service._api_manager.make_translation_request_async = mocker.AsyncMock(
+            return_value=(response, "gpt-5.4-mini")
+        )
+        service._api_manager.make_translation_stream_async = mocker.AsyncMock()
+
+        result = asyncio.run(service._call_gpt_api_async(self._request(), lambda delta: None))
+
+        assert result.translated_text == "Hallo"
+        service._api_manager.make_translation_stream_async.assert_not_called()
+
+    def test_truncated_stream_is_re_requested_with_full_limit(self, service, mocker):
+        """A stream cut off by its adaptive budget is replaced by one full-limit request."""
+        stream = TranslationStream(
+            [_chunk("Hal", finish_reason="length"), _chunk(usage=SimpleNamespace(total_tokens=4))],
+            "gpt-5.4-mini",
+        )
+        stream.max_completion_tokens = 4608
+        service._api_manager.make_translation_stream_async = mocker.AsyncMock(return_value=stream)
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Hallo"))],
+            usage=SimpleNamespace(total_tokens=6),
+        )
+        service._api_manager.make_translation_request_async = mocker.AsyncMock(
+            return_value=(response, "gpt-5.4-mini")
+        )
+
+        result = asyncio.run(service._call_gpt_api_async(self._request(), lambda delta: None))
+
+        assert result.translated_text == "Hallo"
+        assert result.tokens_used == 10
+        kwargs = service._api_manager.make_translation_request_async.call_args.kwargs
+        assert kwargs["max_completion_tokens"] == 128000
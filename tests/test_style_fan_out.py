@@ -0,0 +1,151 @@
+"""
+Tests for rewriting text in several style presets at once.
+
+This module tests:
+- The multi-style prompt and parsing of tagged rewrites
+- One LLM request for all presets with a shared language policy
+- Per-style fallback for missing or empty rewrites, cache reuse and failures
+- The extra style presets setting
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.core.config import Settings
+from whisperbridge.services.translation_service import TranslationService
+from whisperbridge.utils.translation_utils import (
+    TranslationResponse,
+    format_multi_style_prompt,
+    parse_multi_style_response,
+)
+
+STYLES = [
+    {"name": "Improve", "prompt": "Improve the text."},
+    {"name": "Formal", "prompt": "Make the text formal."},
+    {"name": "Casual", "prompt": "Make the text casual."},
+]
+
+
+def _completion(content, total_tokens=40):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(total_tokens=total_tokens),
+    )
+
+
+class TestParseMultiStyleResponse:
+    """Tests for the multi-style prompt and parser."""
+
+    def test_prompt_lists_presets_and_tags(self):
+        """Every preset's instructions and tag appear in the prompt."""
+        prompt = format_multi_style_prompt([("Improve", "Improve the text."), ("Formal", "Make the text formal.")])
+
+        assert '<style name="Improve">' in prompt and '<style name="Formal">' in prompt
+        assert "Improve the text." in prompt and "Make the text formal." in prompt
+
+    def test_splits_rewrites_per_style(self):
+        """Rewrites are matched case-insensitively; missing and empty ones are left out."""
+        text = '<style name="improve">Better text</style>\n<style name="Formal"> </style>'
+
+        assert parse_multi_style_response(text, ["Improve", "Formal", "Casual"]) == {"Improve": "Better text"}
+
+
+class TestStyleFanOut:
+    """Tests for TranslationService.style_many_async."""
+
+    @pytest.fixture
+    def service(self, mocker):
+        service = object.__new__(TranslationService)
+        service._api_manager = mocker.Mock()
+        service._api_manager.is_initialized.return_value = True
+        service._api_manager.has_clients.return_value = True
+        service._api_manager.resolve_provider_name.return_value = "openai"
+        service._api_manager.make_translation_request_async = mocker.AsyncMock()
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_settings",
+            return_value=SimpleNamespace(text_styles=STYLES, translation_cache_enabled=False),
+        )
+        mocker.patch("whisperbridge.services.translation_service.config_service.get_setting", return_value=None)
+        mocker.patch.object(service, "_get_active_model", return_value="gpt-4o")
+        mocker.patch.object(service, "_detect_language_async", mocker.AsyncMock(return_value="en"))
+        return service
+
+    def test_presets_share_one_request(self, service):
+        """One request rewrites every preset; detection and the policy happen once."""
+        service._api_manager.make_translation_request_async.return_value = (
+            _completion(
+                '<style name="Improve">Better</style><style name="Formal">Dear Sir</style>'
+                '<style name="Casual">Hey</style>'
+            ),
+            "gpt-4o",
+        )
+
+        responses = asyncio.run(service.style_many_async("hi", ["Improve", "Formal", "Casual"]))
+
+        service._api_manager.make_translation_request_async.assert_awaited_once()
+        service._detect_language_async.assert_awaited_once()
+        call = service._api_manager.make_translation_request_async.call_args.kwargs
+        system_prompt = call["messages"][0]["content"]
+        assert system_prompt.count("Important language policy:") == 1
+        assert "Respond in en." in system_prompt
+        assert call["max_completion_tokens"] == 3 * 512
+        assert [(r.target_lang, r.translated_text) for r in responses] == [
+            ("Improve", "Better"), ("Formal", "Dear Sir"), ("Casual", "Hey"),
+        ]
+        assert [r.tokens_used for r in responses] == [40, 0, 0]
+
+    def test_missing_style_is_requested_alone(self, service, mocker):
+        """A preset missing from the tagged answer is rewritten with its own request."""
+        service._api_manager.make_translation_request_async.return_value = (
+            _completion('<style name="Improve">Better</style><style name="Formal"></style>'),
+            "gpt-4o",
+        )
+        single = mocker.patch.object(
+            service,
+            "style_text_async",
+            mocker.AsyncMock(return_value=TranslationResponse(success=True, translated_text="Dear Sir", target_lang="Formal")),
+        )
+
+        responses = asyncio.run(service.style_many_async("hi", ["Improve", "Formal"]))
+
+        single.assert_awaited_once_with("hi", "Formal")
+        assert [r.translated_text for r in responses] == ["Better", "Dear Sir"]
+
+    def test_cached_styles_are_not_requested(self, service, mocker):
+        """Cached rewrites are reused; a single remaining preset takes the regular path."""
+        cached = TranslationResponse(success=True, translated_text="Better", target_lang="Improve")
+        mocker.patch.object(service, "_style_cache_key", side_effect=lambda text, name, prompt, provider: name)
+        mocker.patch.object(service, "_lookup_cache", side_effect=lambda key: cached if key == "Improve" else None)
+        single = mocker.patch.object(
+            service,
+            "style_text_async",
+            mocker.AsyncMock(return_value=TranslationResponse(success=True, translated_text="Hey", target_lang="Casual")),
+        )
+
+        responses = asyncio.run(service.style_many_async("hi", ["Improve", "Casual"]))
+
+        service._api_manager.make_translation_request_async.assert_not_called()
+        single.assert_awaited_once_with("hi", "Casual")
+        assert [r.translated_text for r in responses] == ["Better", "Hey"]
+
+    def test_failed_request_fails_every_style(self, service):
+        """An error of the shared request is reported for each preset."""
+        service._api_manager.make_translation_request_async.side_effect = RuntimeError("quota exceeded")
+
+        responses = asyncio.run(service.style_many_async("hi", ["Improve", "Formal"]))
+
+        assert [(r.success, r.error_message, r.target_lang) for r in responses] == [
+            (False, "quota exceeded", "Improve"), (False, "quota exceeded", "Formal"),
+        ]
+
+
+class TestExtraStylesSetting:
+    """Tests for the ui_extra_styles setting."""
+
+    def test_names_are_stripped_and_deduplicated(self):
+        """Names are stripped and de-duplicated case-insensitively, keeping the first spelling."""
+        settings = Settings(ui_extra_styles=[" Formal", "shorten", "formal", ""])
+
+        assert settings.ui_extra_styles == ["Formal", "shorten"]
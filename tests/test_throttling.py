@@ -0,0 +1,245 @@
+"""
+Tests for client-side rate limiting.
+
+This module tests:
+- RateLimits parsing from settings and request token estimates
+- RateLimiter RPM/TPM admission, usage correction, priority and 429 pauses
+- APIManager pacing of requests and background priority of text chunks
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.core.api_manager import APIErrorType, APIProvider, RetryableAPIError
+from whisperbridge.core.api_manager.retry import request_deadline
+from whisperbridge.core.api_manager.throttling import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    RateLimits,
+    _priority,
+    estimate_request_tokens,
+    request_priority,
+)
+from whisperbridge.services.translation_service import TranslationService
+from whisperbridge.utils.translation_utils import TextChunk, TranslationRequest, TranslationResponse
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+@pytest.fixture
+def clock(mocker):
+    """Controllable monotonic clock; sleeping advances it instead of blocking."""
+    now = SimpleNamespace(value=1000.0, slept=[])
+
+    def sleep(seconds):
+        now.slept.append(seconds)
+        now.value += seconds
+
+    async def async_sleep(seconds):
+        sleep(seconds)
+
+    # Replace the module's references only: patching time.monotonic itself would stall event loops and timers
+    mocker.patch(
+        "whisperbridge.core.api_manager.throttling.time",
+        SimpleNamespace(monotonic=lambda: now.value, sleep=sleep),
+    )
+    mocker.patch("whisperbridge.core.api_manager.throttling.asyncio", SimpleNamespace(sleep=async_sleep))
+    return now
+
+
+def _config(**overrides):
+    settings = {"rate_limiting_enabled": True, **overrides}
+    return SimpleNamespace(get_setting=settings.get)
+
+
+class TestRateLimits:
+    """Tests for RateLimits.from_config and token estimates."""
+
+    def test_disabled_by_default(self):
+        """No limits unless rate limiting is enabled."""
+        assert RateLimits.from_config(SimpleNamespace(get_setting=lambda key: None), "openai", "gpt-5.4-mini") is None
+
+    def test_model_entry_overrides_provider_and_defaults(self):
+        """provider/model entries override provider entries, which override the defaults."""
+        config = _config(rate_limits={"openai": {"rpm": 100}, "openai/gpt-5.4": {"tpm": 0}})
+
+        assert RateLimits.from_config(config, "openai", "gpt-5.4-mini") == RateLimits(rpm=100, tpm=200000)
+        assert RateLimits.from_config(config, "openai", "gpt-5.4") == RateLimits(rpm=100, tpm=None)
+        assert RateLimits.from_config(_config(), "deepl", "deepl-translate") == RateLimits(rpm=600, tpm=None)
+
+    def test_estimate_counts_completion_budget_and_images(self):
+        """Prompt text, the completion budget and images all count against the TPM limit."""
+        text_only = estimate_request_tokens({"messages": MESSAGES})
+        params = {
+            "messages": MESSAGES + [{"role": "user", "content": [{"type": "image_url", "image_url": {"url": "x"}}]}],
+            "max_completion_tokens": 200,
+        }
+
+        assert estimate_request_tokens(params) == text_only + 1000 + 200
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter admission."""
+
+    def test_requests_are_spread_out(self, clock):
+        """Once the burst is used up, requests are admitted at the per-minute rate."""
+        limiter = RateLimiter()
+        limits = RateLimits(rpm=60)
+        for _ in range(10):
+            limiter.acquire("openai", "gpt-5.4-mini", limits, 10)
+        assert clock.slept == []
+
+        limiter.acquire("openai", "gpt-5.4-mini", limits, 10)
+
+        assert sum(clock.slept) == pytest.approx(1.0)
+        stats = limiter.stats()["openai/gpt-5.4-mini"]
+        assert (stats["admitted"], stats["delayed"]) == (11, 1)
+        assert stats["wait_ms"] == pytest.approx(1000)
+
+    def test_usage_corrects_token_estimate(self, clock):
+        """Tokens estimated but not used are returned to the bucket."""
+        limiter = RateLimiter()
+        limits = RateLimits(tpm=600)  # 100-token bucket
+        permit = limiter.acquire("openai", "gpt-5.4-mini", limits, 100)
+
+        limiter.settle(permit, 40)
+        limiter.acquire("openai", "gpt-5.4-mini", limits, 60)
+
+        assert clock.slept == []
+
+    def test_oversized_request_waits_for_full_bucket(self, clock):
+        """A request larger than the bucket is admitted once the bucket is full."""
+        limiter = RateLimiter()
+        limits = RateLimits(tpm=600)
+        limiter.acquire("openai", "gpt-5.4-mini", limits, 50)
+
+        limiter.acquire("openai", "gpt-5.4-mini", limits, 500)
+
+        assert sum(clock.slept) == pytest.approx(5.0)
+
+    def test_background_leaves_reserve_for_interactive(self, clock):
+        """Background requests stop at the reserve; interactive ones still go through."""
+        limiter = RateLimiter()
+        limits = RateLimits(rpm=60)  # 10-request bucket, 2.5 reserved
+        with request_priority(PRIORITY_BACKGROUND):
+            for _ in range(7):
+                limiter.acquire("openai", "gpt-5.4-mini", limits, 1)
+            assert clock.slept == []
+
+            limiter.acquire("openai", "gpt-5.4-mini", limits, 1)
+            assert sum(clock.slept) == pytest.approx(0.5)
+
+        clock.slept.clear()
+        limiter.acquire("openai", "gpt-5.4-mini", limits, 1)
+        assert clock.slept == []
+
+    def test_provider_429_pauses_route(self, clock):
+        """A provider rate-limit error holds back the next requests for its Retry-After."""
+        limiter = RateLimiter()
+        limits = RateLimits(rpm=600)
+        permit = limiter.acquire("openai", "gpt-5.4-mini", limits, 10)
+
+        limiter.release(permit, rate_limited=True, retry_after=2.0)
+        limiter.acquire("openai", "gpt-5.4-mini", limits, 10)
+
+        assert sum(clock.slept) == pytest.approx(2.0)
+        assert limiter.stats()["openai/gpt-5.4-mini"]["pauses"] == 1
+
+    def test_wait_beyond_deadline_raises(self, clock):
+        """A wait that does not fit the request deadline fails as a rate-limit error."""
+        limiter = RateLimiter()
+        limits = RateLimits(rpm=6)
+        limiter.acquire("openai", "gpt-5.4-mini", limits, 1)
+
+        with request_deadline(2), pytest.raises(RetryableAPIError) as excinfo:
+            limiter.acquire("openai", "gpt-5.4-mini", limits, 1)
+
+        assert excinfo.value.error_type == APIErrorType.RATE_LIMIT
+        assert excinfo.value.retry_after == pytest.approx(10.0)
+        assert clock.slept == []
+
+    def test_async_acquire_waits_on_loop(self, clock):
+        """acquire_async sleeps on the event loop until a slot is free."""
+        limiter = RateLimiter()
+        limits = RateLimits(rpm=6)
+
+        async def run():
+            await limiter.acquire_async("google", "gemini-2.5-flash", limits, 1)
+            await limiter.acquire_async("google", "gemini-2.5-flash", limits, 1)
+
+        asyncio.run(run())
+
+        assert sum(clock.slept) == pytest.approx(10.0)
+
+
+class TestAPIManagerRateLimiting:
+    """Tests for rate limiting in APIManager."""
+
+    @pytest.fixture
+    def config_limited(self, mock_config_service):
+        settings = {
+            "openai_api_key": "sk-test123",
+            "api_provider": "openai",
+            "rate_limiting_enabled": True,
+            "rate_limits": {"openai": {"rpm": 6, "tpm": 6000}},
+        }
+        mock_config_service.get_setting.side_effect = settings.get
+        return settings
+
+    def test_requests_are_paced(self, api_manager, config_limited, mock_openai_client, clock):
+        """A request over the limit waits instead of being sent."""
+        api_manager.initialize()
+
+        api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+        api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+
+        assert mock_openai_client.chat.completions.create.call_count == 2
+        assert sum(clock.slept) == pytest.approx(10.0)
+        assert api_manager.get_rate_limit_stats()["openai/gpt-5.4-mini"]["delayed"] == 1
+
+    def test_provider_429_pauses_requests(self, api_manager, config_limited, mock_openai_client, clock, mocker):
+        """A 429 that got through pauses the route for the retry instead of failing again."""
+        config_limited["rate_limits"] = {"openai": {"rpm": 600}}
+        retry_sleep = mocker.patch("tenacity.nap.time.sleep")
+        response = mock_openai_client.chat.completions.create.return_value
+        mock_openai_client.chat.completions.create.side_effect = [Exception("429 Too Many Requests"), response]
+        api_manager.initialize()
+
+        result = api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+
+        assert result is response
+        assert retry_sleep.call_count == 1
+        assert api_manager.get_rate_limit_stats()["openai/gpt-5.4-mini"]["pauses"] == 1
+
+    def test_disabled_limiter_is_bypassed(self, api_manager, config_openai, mock_openai_client):
+        """Without rate limiting no route is tracked."""
+        api_manager.initialize()
+
+        api_manager.make_request_sync(APIProvider.OPENAI, model="gpt-5.4-mini", messages=MESSAGES)
+
+        assert api_manager.get_rate_limit_stats() == {}
+
+
+class TestChunkPriority:
+    """Tests for the priority of long-text chunk requests."""
+
+    def test_later_chunks_are_background(self, mocker):
+        """The first chunk is interactive; the rest queue behind interactive requests."""
+        service = object.__new__(TranslationService)
+        mocker.patch.object(service, "_get_int_setting", return_value=4)
+        priorities = {}
+
+        async def translate(request):
+            priorities[request.text] = _priority.get()
+            return TranslationResponse(success=True, translated_text=request.text, model="m")
+
+        mocker.patch.object(service, "_request_translation_async", side_effect=translate)
+        request = TranslationRequest(text="", source_lang="en", target_lang="de", system_prompt="", model="m")
+        chunks = [TextChunk(text=text, separator=" ") for text in ("one", "two", "three")]
+
+        asyncio.run(service._translate_chunks_async(request, chunks))
+
+        assert priorities == {"one": PRIORITY_INTERACTIVE, "two": PRIORITY_BACKGROUND, "three": PRIORITY_BACKGROUND}
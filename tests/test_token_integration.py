@@ -2,6 +2,7 @@
 import pytest
 
 from whisperbridge.core.api_manager import APIManager, APIProvider
+from whisperbridge.core.completion_budget import MODE_OCR, get_completion_budget
 from whisperbridge.services.config_service import ConfigService
 
 
@@ -24,9 +25,9 @@ def api_manager(mock_config_service, mocker):
 class TestAPIManagerTokenIntegration:
     """API manager token integration tests."""
 
-    def test_api_manager_vision_uses_hard_output_limit(self, api_manager, mock_config_service, mocker):
+    def test_api_manager_vision_uses_ocr_budget(self, api_manager, mock_config_service, mocker):
         """
-        Test that APIManager.make_vision_request passes the hard token limit.
+        Test that APIManager.make_vision_request passes the OCR completion budget.
 
         This verifies that the vision request path builds LLM params and forwards
         max_completion_tokens to the provider request.
@@ -67,13 +68,14 @@ class TestAPIManagerTokenIntegration:
         call_args = mock_client.chat.completions.create.call_args
         assert call_args is not None
         assert 'temperature' not in call_args.kwargs
-        assert call_args.kwargs.get('max_completion_tokens') == 128000
+        assert call_args.kwargs.get('max_completion_tokens') == get_completion_budget("gpt-5.6-luna", messages, MODE_OCR)
+        assert call_args.kwargs.get('max_completion_tokens') < 128000
 
 class TestTranslationRequestTokenIntegration:
     """Additional integration tests for translation requests."""
 
-    def test_translation_request_uses_hard_output_limit(self, api_manager, mock_config_service, mocker):
-        """Test that translation requests use the hard output limit."""
+    def test_translation_request_uses_adaptive_budget(self, api_manager, mock_config_service, mocker):
+        """Test that translation requests size the output budget to the input."""
         # Setup mock client
         mock_client = mocker.Mock()
         
@@ -104,7 +106,53 @@ class TestTranslationRequestTokenIntegration:
         call_args = mock_client.chat.completions.create.call_args
 
         assert 'temperature' not in call_args.kwargs
-        assert call_args.kwargs.get('max_completion_tokens') == 128000
+        assert call_args.kwargs.get('max_completion_tokens') == get_completion_budget("gpt-5.4-mini", messages)
+
+    def test_translation_request_uses_hard_output_limit_when_adaptive_disabled(
+        self, api_manager, mock_config_service, mocker
+    ):
+        """Disabling adaptive budgets restores the model's hard output limit."""
+        mock_client = mocker.Mock()
+        mock_client.chat.completions.create.return_value = mocker.Mock(usage=None)
+        api_manager._providers._clients[APIProvider.OPENAI] = mock_client
+        mock_config_service.get_setting.side_effect = lambda key: {
+            "api_provider": "openai",
+            "adaptive_completion_tokens": False,
+        }.get(key)
+
+        api_manager.make_translation_request([{"role": "user", "content": "Hi"}], "gpt-5.4-mini")
+
+        assert mock_client.chat.completions.create.call_args.kwargs["max_completion_tokens"] == 128000
+
+    def test_truncated_response_is_retried_once_with_hard_limit(self, api_manager, mock_config_service, mocker):
+        """A response cut off by the adaptive budget is retried with the model's output limit."""
+        truncated = mocker.Mock(choices=[mocker.Mock(finish_reason="length")])
+        complete = mocker.Mock(choices=[mocker.Mock(finish_reason="stop")])
+        mock_client = mocker.Mock()
+        mock_client.chat.completions.create.side_effect = [truncated, complete]
+        api_manager._providers._clients[APIProvider.OPENAI] = mock_client
+        mock_config_service.get_setting.side_effect = lambda key: {"api_provider": "openai"}.get(key)
+
+        response, _ = api_manager.make_translation_request([{"role": "user", "content": "Hi"}], "gpt-4o")
+
+        assert response is complete
+        budgets = [call.kwargs["max_completion_tokens"] for call in mock_client.chat.completions.create.call_args_list]
+        assert budgets == [get_completion_budget("gpt-4o", [{"role": "user", "content": "Hi"}]), 16384]
+
+    def test_truncated_response_at_hard_limit_is_not_retried(self, api_manager, mock_config_service, mocker):
+        """Only adaptive budgets are retried; a response truncated at the hard limit is returned."""
+        truncated = mocker.Mock(choices=[mocker.Mock(finish_reason="length")])
+        mock_client = mocker.Mock()
+        mock_client.chat.completions.create.return_value = truncated
+        api_manager._providers._clients[APIProvider.OPENAI] = mock_client
+        mock_config_service.get_setting.side_effect = lambda key: {"api_provider": "openai"}.get(key)
+
+        response, _ = api_manager.make_translation_request(
+            [{"role": "user", "content": "Hi"}], "gpt-4o", max_completion_tokens=16384
+        )
+
+        assert response is truncated
+        assert mock_client.chat.completions.create.call_count == 1
 
     def test_translation_request_omits_unconfigured_reasoning_effort(
         self, api_manager, mock_config_service, mocker
@@ -150,8 +198,8 @@ class TestTranslationRequestTokenIntegration:
         kwargs = mock_client.chat.completions.create.call_args.kwargs
         assert kwargs["reasoning_effort"] == "high"
 
-    def test_translation_request_with_large_text_uses_model_output_cap(self, api_manager, mock_config_service, mocker):
-        """Test that a large translation request still uses the model-based output cap."""
+    def test_translation_request_with_large_text_grows_budget_within_cap(self, api_manager, mock_config_service, mocker):
+        """Test that a large translation request gets a larger budget, clamped to the model cap."""
         # Setup mock client
         mock_client = mocker.Mock()
         
@@ -178,9 +226,10 @@ class TestTranslationRequestTokenIntegration:
         # Call translation request
         response, model = api_manager.make_translation_request(messages, "gpt-5.4-mini")
         
-        # Verify max_completion_tokens is within model limits
+        # Verify max_completion_tokens grows with the input and stays within model limits
         call_args = mock_client.chat.completions.create.call_args
-        assert call_args.kwargs.get('max_completion_tokens') == 128000
+        budget = call_args.kwargs.get('max_completion_tokens')
+        assert get_completion_budget("gpt-5.4-mini", [{"role": "user", "content": "Hi"}]) < budget <= 128000
 
 
 class TestAPIManagerHelperMethods:
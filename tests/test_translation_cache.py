@@ -0,0 +1,125 @@
+"""
+Tests for TranslationCache in services.translation_cache module.
+
+This module tests:
+- Key derivation and text normalization
+- Memory LRU behavior and eviction
+- Disk persistence and TTL expiration
+- Hit/miss counters
+"""
+
+from freezegun import freeze_time
+
+from whisperbridge.services.translation_cache import TranslationCache, normalize_cache_text
+
+
+def _entry(text="Hallo"):
+    return {"translated_text": text, "source_lang": "en", "target_lang": "de", "model": "gpt-5.4-mini"}
+
+
+class TestCacheKeys:
+    """Tests for cache key derivation."""
+
+    def test_key_ignores_surrounding_whitespace_and_line_endings(self):
+        """Keys are stable across trivial formatting differences."""
+        k1 = TranslationCache.make_key("Hello\r\nworld  ", "auto", "de", "openai", "gpt-5.4-mini", "prompt")
+        k2 = TranslationCache.make_key("  Hello\nworld", "auto", "de", "openai", "gpt-5.4-mini", "prompt")
+        assert k1 == k2
+
+    def test_key_depends_on_every_request_component(self):
+        """Changing language, provider, model or prompt changes the key."""
+        base = ("Hello", "auto", "de", "openai", "gpt-5.4-mini", "prompt")
+        key = TranslationCache.make_key(*base)
+        for index, value in enumerate(["Hi", "en", "uk", "google", "gpt-5.6-luna", "other prompt"]):
+            changed = list(base)
+            changed[index] = value
+            assert TranslationCache.make_key(*changed) != key
+
+    def test_normalize_preserves_inner_line_breaks(self):
+        """Inner structure of the text is kept."""
+        assert normalize_cache_text("  a\r\n\r\nb ") == "a\n\nb"
+
+
+class TestMemoryTier:
+    """Tests for the in-memory LRU tier."""
+
+    def test_set_and_get_counts_hits_and_misses(self, tmp_path):
+        """A stored entry is returned and counted as a memory hit."""
+        cache = TranslationCache(tmp_path)
+        assert cache.get("missing") is None
+
+        cache.set("k", _entry())
+        assert cache.get("k") == _entry()
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_lru_evicts_least_recently_used(self, tmp_path):
+        """The memory tier is bounded; evicted entries fall back to disk."""
+        cache = TranslationCache(tmp_path, max_memory_entries=2)
+        cache.set("a", _entry("A"))
+        cache.set("b", _entry("B"))
+        cache.get("a")  # a becomes most recently used
+        cache.set("c", _entry("C"))
+
+        assert cache.stats()["memory_entries"] == 2
+        assert cache.get("b") == _entry("B")
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_returned_entry_is_a_copy(self, tmp_path):
+        """Mutating a returned entry does not corrupt the cache."""
+        cache = TranslationCache(tmp_path)
+        cache.set("k", _entry())
+        cache.get("k")["translated_text"] = "changed"
+        assert cache.get("k")["translated_text"] == "Hallo"
+
+
+class TestDiskTier:
+    """Tests for disk persistence and eviction."""
+
+    def test_entries_survive_new_instance(self, tmp_path):
+        """Entries written by one instance are read by the next."""
+        cache1 = TranslationCache(tmp_path)
+        cache1.set("k", _entry())
+        cache1.close()
+
+        cache2 = TranslationCache(tmp_path)
+        assert cache2.get("k") == _entry()
+        assert cache2.stats()["disk_hits"] == 1
+
+    def test_ttl_expires_entries_in_both_tiers(self, tmp_path):
+        """Entries older than the TTL are treated as misses."""
+        with freeze_time("2024-01-01 00:00:00") as frozen_time:
+            cache = TranslationCache(tmp_path, ttl_seconds=10)
+            cache.set("k", _entry())
+            frozen_time.tick(11)
+            assert cache.get("k") is None
+
+    def test_prune_keeps_most_recent_entries(self, tmp_path):
+        """Size-based eviction keeps only the newest entries on disk."""
+        with freeze_time("2024-01-01 00:00:00") as frozen_time:
+            cache = TranslationCache(tmp_path, max_memory_entries=1, max_disk_entries=2)
+            for key in ("a", "b", "c"):
+                cache.set(key, _entry(key))
+                frozen_time.tick(1)
+            cache.prune()
+            cache.clear()
+
+            assert cache.get("a") is None
+            assert cache.get("b") == _entry("b")
+            assert cache.get("c") == _entry("c")
+
+    def test_clear_with_delete_persisted_empties_disk(self, tmp_path):
+        """Clearing persisted entries removes them from disk too."""
+        cache = TranslationCache(tmp_path)
+        cache.set("k", _entry())
+        cache.clear(delete_persisted=True)
+        assert cache.get("k") is None
+
+    def test_unwritable_directory_falls_back_to_memory(self, tmp_path):
+        """A broken disk store degrades to a memory-only cache."""
+        cache = TranslationCache(tmp_path / "missing" / "dir")
+        cache.set("k", _entry())
+        assert cache.get("k") == _entry()
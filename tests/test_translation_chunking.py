@@ -0,0 +1,237 @@
+"""
+Tests for long-text chunking in translation_utils and TranslationService.
+
+This module tests:
+- Splitting at paragraph/sentence boundaries within the token budget
+- Lossless reassembly of chunks
+- Bounded concurrent chunk translation, ordering and per-chunk retries
+- DeepL batch translation of chunks and of several texts
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.core.api_manager.errors import APIErrorType, RequestCancelledError, RetryableAPIError
+from whisperbridge.services.translation_service import TranslationService
+from whisperbridge.utils.translation_utils import (
+    TranslationRequest,
+    TranslationResponse,
+    split_text_into_chunks,
+)
+
+
+def _join(chunks):
+    return "".join(chunk.text + chunk.separator for chunk in chunks)
+
+
+class TestSplitTextIntoChunks:
+    """Tests for split_text_into_chunks."""
+
+    def test_short_text_is_single_chunk(self):
+        """Text within the budget is not split."""
+        chunks = split_text_into_chunks("Hello world.", 100)
+        assert len(chunks) == 1
+        assert chunks[0].text == "Hello world."
+
+    def test_splits_at_paragraph_boundaries(self):
+        """Paragraphs that fit the budget stay intact."""
+        paragraph = "This is a sentence in a paragraph. " * 10
+        text = "\n\n".join([paragraph.strip()] * 4)
+        chunks = split_text_into_chunks(text, 120)
+
+        assert len(chunks) > 1
+        assert all(chunk.text.endswith("paragraph.") for chunk in chunks)
+        assert _join(chunks) == text
+
+    def test_oversized_paragraph_splits_at_sentences(self):
+        """A paragraph above the budget is split between sentences."""
+        text = " ".join(f"Sentence number {i} is here." for i in range(200))
+        chunks = split_text_into_chunks(text, 100)
+
+        assert len(chunks) > 1
+        assert all(chunk.text.endswith(".") for chunk in chunks)
+        assert _join(chunks) == text
+
+    def test_single_huge_word_is_hard_split(self):
+        """Text without boundaries is still cut into budget-sized chunks."""
+        text = "x" * 4000
+        chunks = split_text_into_chunks(text, 200)
+
+        assert len(chunks) == 5
+        assert _join(chunks) == text
+
+    def test_empty_text(self):
+        """Empty text yields no chunks."""
+        assert split_text_into_chunks("", 100) == []
+
+
+class TestChunkedTranslation:
+    """Tests for chunked translation in TranslationService."""
+
+    @pytest.fixture
+    def service(self, mocker):
+        service = object.__new__(TranslationService)
+        service._api_manager = mocker.Mock()
+        service._api_manager.is_initialized.return_value = True
+        service._api_manager.has_clients.return_value = True
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_settings",
+            return_value=SimpleNamespace(translation_chunk_max_tokens=200, translation_max_parallel_chunks=2),
+        )
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_setting",
+            return_value="openai",
+        )
+        return service
+
+    @staticmethod
+    def _request(text):
+        return TranslationRequest(
+            text=text, source_lang="en", target_lang="de", system_prompt="prompt", model="gpt-5.4-mini"
+        )
+
+    def test_chunks_run_concurrently_within_cap_and_keep_order(self, service, mocker):
+        """No more than the configured number of chunks are in flight, and output keeps source order."""
+        paragraphs = [f"Paragraph {i}. " + "Some filler text here. " * 30 for i in range(6)]
+        text = "\n\n".join(p.strip() for p in paragraphs)
+        active = []
+        peak = []
+
+        async def fake_request(request):
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.05)
+            active.pop()
+            return TranslationResponse(
+                success=True, translated_text=request.text.split(".")[0].upper(), model="gpt-5.4-mini", tokens_used=3
+            )
+
+        mocker.patch.object(service, "_request_translation_async", side_effect=fake_request)
+
+        response = asyncio.run(service._call_gpt_api_async(self._request(text)))
+
+        assert max(peak) == 2
+        assert response.translated_text == "\n\n".join(f"PARAGRAPH {i}" for i in range(6))
+        assert response.tokens_used == 18
+
+    def test_failed_chunk_is_retried_alone(self, service, mocker):
+        """A transient failure retries only the failing chunk."""
+        text = "\n\n".join(f"Part {i}. " + "More words in this part. " * 30 for i in range(3))
+        calls = []
+
+        async def fake_request(request):
+            calls.append(request.text[:6])
+            if request.text.startswith("Part 1") and calls.count("Part 1") == 1:
+                raise RetryableAPIError("timeout", error_type=APIErrorType.TIMEOUT)
+            return TranslationResponse(success=True, translated_text="ok")
+
+        mocker.patch.object(service, "_request_translation_async", side_effect=fake_request)
+
+        response = asyncio.run(service._call_gpt_api_async(self._request(text)))
+
+        assert response.success
+        assert sorted(calls) == ["Part 0", "Part 1", "Part 1", "Part 2"]
+
+    def test_chunk_failing_every_attempt_raises(self, service, mocker):
+        """A chunk that keeps failing fails the translation."""
+        text = "\n\n".join("Words in a paragraph. " * 30 for _ in range(3))
+        mocker.patch.object(
+            service, "_request_translation_async",
+            side_effect=RetryableAPIError("down", error_type=APIErrorType.SERVER_ERROR),
+        )
+
+        with pytest.raises(RetryableAPIError, match="down"):
+            asyncio.run(service._call_gpt_api_async(self._request(text)))
+
+    @pytest.mark.parametrize("error", [ValueError("invalid request"), RequestCancelledError("Request cancelled")])
+    def test_permanent_failure_and_cancellation_are_not_retried(self, service, mocker, error):
+        """Only transient API errors retry a chunk; others fail it at once."""
+        text = "\n\n".join(f"Part {i}. " + "More words in this part. " * 30 for i in range(3))
+        calls = []
+
+        async def fake_request(request):
+            calls.append(request.text[:6])
+            raise error
+
+        mocker.patch.object(service, "_request_translation_async", side_effect=fake_request)
+
+        with pytest.raises(type(error)):
+            asyncio.run(service._call_gpt_api_async(self._request(text)))
+
+        assert calls and len(calls) == len(set(calls))
+
+    def test_budget_is_capped_by_model_output_limit(self, service, mocker):
+        """The chunk budget never exceeds half of the model's completion limit."""
+        mocker.patch(
+            "whisperbridge.services.translation_service.get_model_max_completion_tokens", return_value=300
+        )
+        assert service._chunk_token_budget("tiny-model") == 150
+
+
+class TestDeepLBatchTranslation:
+    """Tests for DeepL batch requests in TranslationService."""
+
+    @pytest.fixture
+    def service(self, mocker):
+        service = object.__new__(TranslationService)
+        service._api_manager = mocker.Mock()
+        service._api_manager.is_initialized.return_value = True
+        service._api_manager.has_clients.return_value = True
+        service._api_manager.resolve_provider_name.return_value = "deepl"
+        service._api_manager.make_translation_request_async = mocker.AsyncMock(side_effect=self._translate)
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_settings",
+            return_value=SimpleNamespace(translation_chunk_max_tokens=200, translation_cache_enabled=False),
+        )
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_setting",
+            return_value="deepl",
+        )
+        return service
+
+    @staticmethod
+    async def _translate(messages, model_hint=None, texts=(), **kwargs):
+        choices = [
+            SimpleNamespace(
+                message=SimpleNamespace(content=text.split(".")[0].upper()),
+                detected_source_language="FR" if text.startswith("Bonjour") else "EN",
+            )
+            for text in texts
+        ]
+        return SimpleNamespace(choices=choices, usage=None), model_hint
+
+    def test_long_text_chunks_take_one_request(self, service):
+        """All chunks of a long DeepL text are sent in a single batch and reassembled in order."""
+        text = "\n\n".join(f"Paragraph {i}. " + "Some filler text here. " * 30 for i in range(6))
+        request = TranslationRequest(text=text, source_lang="en", target_lang="de", system_prompt="", model="deepl")
+        partials = []
+
+        response = asyncio.run(service._call_gpt_api_async(request, partials.append))
+
+        service._api_manager.make_translation_request_async.assert_awaited_once()
+        call = service._api_manager.make_translation_request_async.call_args.kwargs
+        assert len(call["texts"]) == 6
+        assert call["hedge_request"]("openai") is None
+        assert response.translated_text == "\n\n".join(f"PARAGRAPH {i}" for i in range(6))
+        assert "".join(partials).strip() == response.translated_text
+
+    def test_translate_many_keeps_detected_source_per_text(self, service):
+        """translate_many_async sends one batch and reports each text's detected language."""
+        responses = asyncio.run(service.translate_many_async(["Hello.", "", "Bonjour."], "auto", "de"))
+
+        service._api_manager.make_translation_request_async.assert_awaited_once()
+        call = service._api_manager.make_translation_request_async.call_args.kwargs
+        assert call["texts"] == ["Hello.", "Bonjour."]
+        assert call["source_lang"] is None
+        assert [(r.translated_text, r.source_lang) for r in responses] == [("HELLO", "en"), ("", "auto"), ("BONJOUR", "fr")]
+        assert all(r.success and r.target_lang == "de" for r in responses)
+
+    def test_translate_many_reports_batch_failure_per_text(self, service):
+        """A failed batch fails every text it carried."""
+        service._api_manager.make_translation_request_async.side_effect = RuntimeError("quota exceeded")
+
+        responses = asyncio.run(service.translate_many_async(["One.", "Two."], "en", "de"))
+
+        assert [(r.success, r.error_message) for r in responses] == [(False, "quota exceeded")] * 2
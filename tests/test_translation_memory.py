@@ -0,0 +1,169 @@
+"""
+Tests for TranslationMemory in services.translation_memory module.
+
+This module tests:
+- Segment splitting and lossless re-joining
+- Exact and fuzzy segment lookup scoped by context
+- Persistence and size-based eviction
+- Piecewise translation and stitching in TranslationService
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from whisperbridge.services.translation_memory import TranslationMemory
+from whisperbridge.services.translation_service import TranslationService
+from whisperbridge.utils.translation_utils import TranslationRequest, TranslationResponse, join_chunks, split_sentences
+
+CONTEXT = TranslationMemory.make_context("en", "de", "openai", "gpt-5.4-mini", "prompt")
+
+
+class TestSegmentation:
+    """Tests for sentence segmentation."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "One sentence.",
+            "First sentence. Second one! Third?",
+            "Line one\nLine two\n\nLine three",
+            "  Leading space. Trailing space.  ",
+        ],
+    )
+    def test_join_reproduces_original_text(self, text):
+        """Splitting keeps separators so the text can be stitched back exactly."""
+        assert join_chunks(split_sentences(text)) == text
+
+    def test_splits_on_sentence_end_and_line_breaks(self):
+        """Sentence terminators and line breaks start new segments."""
+        segments = split_sentences("Hello world. How are you?\nFine")
+        assert [s.text for s in segments] == ["Hello world.", "How are you?", "Fine"]
+        assert [s.separator for s in segments] == [" ", "\n", ""]
+
+
+class TestLookup:
+    """Tests for exact and fuzzy lookup."""
+
+    def test_exact_match_ignores_case_and_spacing(self, tmp_path):
+        """Normalized segments match exactly."""
+        memory = TranslationMemory(tmp_path)
+        memory.store([("The quick brown fox.", "Der schnelle braune Fuchs.")], CONTEXT)
+
+        match = memory.lookup("the  quick brown FOX.", CONTEXT)
+        assert match is not None
+        assert match.score == 1.0
+        assert match.target == "Der schnelle braune Fuchs."
+
+    def test_fuzzy_match_above_threshold(self, tmp_path):
+        """A small edit still finds the stored segment."""
+        memory = TranslationMemory(tmp_path)
+        source = "The configuration file is stored in the user's home directory by default."
+        memory.store([(source, "Die Konfigurationsdatei liegt standardmäßig im Home-Verzeichnis.")], CONTEXT)
+
+        match = memory.lookup(source.replace("default.", "default!"), CONTEXT)
+        assert match is not None
+        assert 0.95 <= match.score < 1.0
+
+    def test_dissimilar_segment_is_a_miss(self, tmp_path):
+        """Segments below the threshold are not reused."""
+        memory = TranslationMemory(tmp_path)
+        memory.store([("The configuration file is stored at home.", "Egal.")], CONTEXT)
+        assert memory.lookup("The log file is written to a temp folder.", CONTEXT) is None
+
+    def test_context_isolates_language_pairs(self, tmp_path):
+        """Pairs stored for one context are not visible in another."""
+        memory = TranslationMemory(tmp_path)
+        memory.store([("Good morning.", "Guten Morgen.")], CONTEXT)
+        other = TranslationMemory.make_context("en", "fr", "openai", "gpt-5.4-mini", "prompt")
+        assert memory.lookup("Good morning.", other) is None
+
+
+class TestPersistence:
+    """Tests for persistence and eviction."""
+
+    def test_pairs_survive_new_instance(self, tmp_path):
+        """Stored pairs are read back by a new instance."""
+        memory = TranslationMemory(tmp_path)
+        memory.store([("Good morning.", "Guten Morgen.")], CONTEXT)
+        memory.close()
+
+        assert TranslationMemory(tmp_path).lookup("Good morning.", CONTEXT).target == "Guten Morgen."
+
+    def test_eviction_removes_segments_and_index_entries(self, tmp_path):
+        """Oldest pairs beyond the limit are dropped together with their n-grams."""
+        memory = TranslationMemory(tmp_path, max_segments=2)
+        for index in range(3):
+            memory.store([(f"Sentence number {index}.", f"Satz {index}.")], CONTEXT)
+
+        assert memory.stats()["segments"] == 2
+        assert memory.lookup("Sentence number 0.", CONTEXT) is None
+        memory.clear()
+        assert memory.stats() == {"segments": 0, "grams": 0}
+
+
+class TestServiceStitching:
+    """Tests for piecewise translation in TranslationService."""
+
+    @pytest.fixture
+    def service(self, tmp_path, mocker):
+        service = object.__new__(TranslationService)
+        service._memory = TranslationMemory(tmp_path)
+        service._api_manager = mocker.Mock()
+        service._api_manager.has_clients.return_value = True
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_settings",
+            return_value=SimpleNamespace(translation_memory_enabled=True),
+        )
+        mocker.patch(
+            "whisperbridge.services.translation_service.config_service.get_setting",
+            return_value="openai",
+        )
+        return service
+
+    def test_only_new_segments_are_sent(self, service, mocker):
+        """Known segments are reused and the new one is translated and stitched in."""
+        request = TranslationRequest(
+            text="Good morning. How are you?\nSee you later.",
+            source_lang="en",
+            target_lang="de",
+            system_prompt="prompt",
+            model="gpt-5.4-mini",
+        )
+        context = service._memory_context(request)
+        service._memory.store([("Good morning.", "Guten Morgen."), ("See you later.", "Bis später.")], context)
+
+        call = mocker.patch.object(
+            service,
+            "_call_gpt_api_async",
+            return_value=TranslationResponse(success=True, translated_text="Wie geht es dir?", model="gpt-5.4-mini", tokens_used=7),
+        )
+
+        response = asyncio.run(service._translate_with_memory(request))
+
+        assert response.translated_text == "Guten Morgen. Wie geht es dir?\nBis später."
+        assert response.tokens_used == 7
+        assert call.call_args.args[0].text == "How are you?"
+        assert service._memory.lookup("How are you?", context).target == "Wie geht es dir?"
+
+    def test_mostly_new_text_is_sent_whole_and_remembered(self, service, mocker):
+        """Below the reuse ratio the full text is sent and its aligned segments are stored."""
+        request = TranslationRequest(
+            text="Good morning. How are you?",
+            source_lang="en",
+            target_lang="de",
+            system_prompt="prompt",
+            model="gpt-5.4-mini",
+        )
+        call = mocker.patch.object(
+            service,
+            "_call_gpt_api_async",
+            return_value=TranslationResponse(success=True, translated_text="Guten Morgen. Wie geht es dir?"),
+        )
+
+        asyncio.run(service._translate_with_memory(request))
+
+        assert call.call_args.args[0].text == request.text
+        context = service._memory_context(request)
+        assert service._memory.lookup("Good morning.", context).target == "Guten Morgen."
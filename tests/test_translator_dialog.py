@@ -17,6 +17,7 @@ def test_translator_dialog_factory_integration(qapp, mocker):
     mock_settings.translator_font_size = 14
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -69,6 +70,7 @@ def test_translator_dialog_initialization_from_config(qapp, mocker):
     mock_settings.translator_font_size = 18
     mock_settings.stylist_cache_enabled = True
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = True
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -113,6 +115,7 @@ def test_compact_view_changed_callback(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -138,6 +141,7 @@ def test_autohide_buttons_changed_callback(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -158,6 +162,7 @@ def test_compact_view_rolls_back_when_save_fails(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
 
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -189,6 +194,7 @@ def test_autohide_buttons_roll_back_when_save_fails(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
 
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -221,6 +227,7 @@ def test_translator_font_size_changed_callback(qapp, mocker):
     mock_settings.translator_font_size = 14
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
 
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -242,6 +249,7 @@ def test_translator_font_size_does_not_call_parent_directly(qapp, mocker):
     mock_settings.translator_font_size = 14
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
 
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -268,6 +276,7 @@ def test_translator_font_size_rolls_back_when_save_fails(qapp, mocker):
     mock_settings.translator_font_size = 14
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
 
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -300,6 +309,7 @@ def test_auto_copy_translated_changed_callback(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -322,6 +332,7 @@ def test_translator_dialog_config_consistency(qapp, mocker):
     mock_settings.translator_font_size = 14
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -355,6 +366,7 @@ def test_compact_view_triggers_parent_update_layout(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -385,6 +397,7 @@ def test_autohide_buttons_triggers_parent_update_layout(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -414,6 +427,7 @@ def test_callback_without_parent(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -436,6 +450,7 @@ def test_callback_with_parent_without_update_layout(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -465,6 +480,7 @@ def test_error_handling_in_compact_view_callback(qapp, mocker, loguru_caplog):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -497,6 +513,7 @@ def test_dialog_properties(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -523,6 +540,7 @@ def test_dialog_has_all_groups(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -556,6 +574,7 @@ def test_all_checkboxes_text_and_tooltips(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -587,6 +606,7 @@ def test_close_button_functionality(qapp, qtbot, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -617,6 +637,7 @@ def test_checkbox_state_conversion_to_bool(qapp, mocker):
     mock_settings.overlay_side_buttons_autohide = False
     mock_settings.stylist_cache_enabled = False
     mock_settings.translation_cache_enabled = False
+    mock_settings.translation_memory_enabled = False
     mock_settings.auto_copy_translated_main_window = False
     
     mocker.patch('whisperbridge.ui_qt.overlay_ui_builder.config_service.get_settings',
@@ -5,6 +5,7 @@ Run with: python -m pytest tests/test_worker_timeout.py -v
 """
 
 import asyncio
+import threading
 import time
 import pytest
 from unittest.mock import Mock, AsyncMock
@@ -20,6 +21,7 @@ try:
     )
     from whisperbridge.ui_qt.overlay_window import OverlayWindow
     from whisperbridge.services.config_service import config_service
+    from whisperbridge.utils.translation_utils import TranslationResponse
 except ImportError:
     # Allow running non-Qt tests in minimal env
     BaseAsyncWorker = None
@@ -204,6 +206,7 @@ class TestQtIntegration:
             auto_swap_en_ru=True,
             stylist_cache_enabled=False,
             translation_cache_enabled=False,
+            translation_memory_enabled=False,
             auto_copy_translated_main_window=False,
             text_styles=[],
         )
@@ -242,6 +245,7 @@ class TestQtIntegration:
             overlay_window_geometry=None,
             stylist_cache_enabled=False,
             translation_cache_enabled=False,
+            translation_memory_enabled=False,
             auto_copy_translated_main_window=False,
             text_styles=[],
         )
@@ -328,6 +332,10 @@ class TestQtIntegration:
 
         mock_service = Mock()
 
+        mock_service.get_cached_translation.return_value = None
+
+        mock_service.get_cached_style.return_value = None
+
         async def slow_translate(*_args, **_kwargs):
             await asyncio.sleep(10)
             return Mock(success=True, translated_text="late")
@@ -351,6 +359,19 @@ class TestQtIntegration:
         assert overlay.translate_btn.isEnabled() is True
         assert "cancel" in overlay.status_label.text().lower()
 
+    def test_cancelled_worker_results_do_not_reach_overlay(self, overlay):
+        """Per-style results emitted after cancelling do not open result tabs."""
+        worker = StyleWorker("hello", ["Formal", "Shorten"])
+        worker.finished.connect(overlay._on_translation_finished)
+        worker.error.connect(overlay._on_translation_error)
+        worker.styles.connect(overlay._on_styles_ready)
+        overlay._style_worker, overlay._style_thread = worker, None
+
+        overlay._cancel_active_request()
+        worker.styles.emit({"Formal": "Dear Sir", "Shorten": "Hi"})
+
+        assert overlay.target_tabs.count() == 0
+
     def test_translate_click_starts_translation_worker_with_selected_languages(self, overlay, mocker):
         """Translate mode should pass the current source and target languages to TranslationWorker."""
         mocker.patch.object(overlay, "_is_api_ready", return_value=(True, ""))
@@ -407,6 +428,27 @@ class TestQtIntegration:
 
         mock_setup_worker.assert_called_once_with(StyleWorker, "hello", "Improve tone")
 
+    def test_translate_click_adds_extra_styles(self, overlay, mocker):
+        """Extra style presets are requested with the selected one; unknown names are skipped."""
+        mocker.patch.object(overlay, "_is_api_ready", return_value=(True, ""))
+        mocker.patch.object(overlay, "_start_loading_animation")
+        mock_setup_worker = mocker.patch.object(overlay, "_setup_worker", return_value=(Mock(), Mock()))
+
+        overlay._cached_settings = Mock(
+            compact_view=False,
+            text_styles=[{"name": "Formal"}, {"name": "Shorten"}],
+            ui_extra_styles=["shorten", "Unknown", "formal"],
+        )
+        overlay.original_text.setPlainText("hello")
+        overlay.style_combo.clear()
+        overlay.style_combo.addItem("Formal")
+        overlay.style_combo.setCurrentIndex(0)
+        overlay.mode_combo.setCurrentIndex(overlay._find_index_by_text(overlay.mode_combo, "Style"))
+
+        overlay._on_translate_clicked()
+
+        mock_setup_worker.assert_called_once_with(StyleWorker, "hello", ["Formal", "Shorten"])
+
     @pytest.mark.parametrize("api_timeout,expected_watchdog", [
         (10, 60),   # api_timeout=10 -> watchdog=max(20,60)=60
         (30, 60),   # api_timeout=30 -> watchdog=max(60,60)=60
@@ -488,6 +530,8 @@ class TestQtIntegration:
     def test_translation_worker_integration(self, qtbot, mock_config_service, mocker):
         """Integration test for TranslationWorker with mocked service."""
         mock_service = Mock()
+        mock_service.get_cached_translation.return_value = None
+        mock_service.get_cached_style.return_value = None
         mock_service.translate_text_async = AsyncMock(return_value=Mock(success=True, translated_text="Hola"))
         
         mocker.patch('whisperbridge.services.translation_service.get_translation_service', return_value=mock_service)
@@ -498,12 +542,49 @@ class TestQtIntegration:
         assert finished_spy.at(0)[0] is True
         assert finished_spy.at(0)[1] == "Hola"
         mock_service.translate_text_async.assert_awaited_once_with(
-            "Hello", ui_source_lang="en", ui_target_lang="es"
+            "Hello", ui_source_lang="en", ui_target_lang="es", on_partial=worker._emit_partial
         )
 
+    def test_translation_worker_emits_partial_text(self, qtbot, mock_config_service, mocker):
+        """Streamed deltas reported by the service are emitted as partial signals."""
+        mock_service = Mock()
+        mock_service.get_cached_translation.return_value = None
+
+        async def streaming_translate(text, ui_source_lang, ui_target_lang, on_partial):
+            for delta in ("Ho", "la"):
+                on_partial(delta)
+            return Mock(success=True, translated_text="Hola")
+
+        mock_service.translate_text_async = streaming_translate
+        mocker.patch('whisperbridge.services.translation_service.get_translation_service', return_value=mock_service)
+        worker = TranslationWorker("Hello", "en", "es")
+        partial_spy = QSignalSpy(worker.partial)
+        finished_spy = QSignalSpy(worker.finished)
+        worker.run()
+        assert [partial_spy.at(i)[0] for i in range(partial_spy.count())] == ["Ho", "la"]
+        assert finished_spy.at(0)[1] == "Hola"
+
+    def test_translation_worker_cache_hit_skips_event_loop(self, qtbot, mock_config_service, mocker):
+        """A cached translation is emitted without submitting to the async runtime."""
+        mock_service = Mock()
+        mock_service.get_cached_translation.return_value = Mock(success=True, translated_text="Hola")
+        mock_service.translate_text_async = AsyncMock()
+
+        mocker.patch('whisperbridge.services.translation_service.get_translation_service', return_value=mock_service)
+        get_runtime = mocker.patch('whisperbridge.ui_qt.workers.get_async_runtime')
+        worker = TranslationWorker("Hello", "en", "es")
+        finished_spy = QSignalSpy(worker.finished)
+        worker.run()
+        assert finished_spy.count() == 1
+        assert finished_spy.at(0)[1] == "Hola"
+        get_runtime.assert_not_called()
+        mock_service.translate_text_async.assert_not_called()
+
     def test_style_worker_integration(self, qtbot, mocker):
         """Integration test for StyleWorker."""
         mock_service = Mock()
+        mock_service.get_cached_translation.return_value = None
+        mock_service.get_cached_style.return_value = None
         mock_service.style_text_async = AsyncMock(return_value=Mock(success=True, translated_text="Styled Text"))
         
         mocker.patch('whisperbridge.services.translation_service.get_translation_service', return_value=mock_service)
@@ -518,6 +599,8 @@ class TestQtIntegration:
         """Test TranslationWorker handles timeout correctly."""
         mock_config_service[0] = 1
         mock_service = Mock()
+        mock_service.get_cached_translation.return_value = None
+        mock_service.get_cached_style.return_value = None
         async def slow_mock(*args, **kwargs): await asyncio.sleep(1.5)
         mock_service.translate_text_async = AsyncMock(side_effect=slow_mock)
         
@@ -762,93 +845,52 @@ class TestQtIntegration:
 
     # --- Additional Coverage Tests ---
     
-    def test_pending_task_cancellation_timeout(self, mocker, loguru_caplog):
-        """Test cancellation cleanup warns on timeout without deadlocking."""
-        worker = BaseAsyncWorker()
+    def test_workers_share_one_event_loop(self, mock_config_service):
+        """Consecutive workers run on the same long-lived runtime loop."""
+        loops = []
 
-        loop = asyncio.new_event_loop()
-        original_close = loop.close
-        mocker.patch("whisperbridge.ui_qt.workers.asyncio.new_event_loop", return_value=loop)
-        mocker.patch.object(loop, "close")
-
-        cancellation_received = asyncio.Event()
-        release_task = asyncio.Event()
-        background_task = None
-        cleanup_gather = None
-
-        async def main_task():
-            async def tracked_task():
-                try:
-                    await asyncio.sleep(1000)
-                except asyncio.CancelledError:
-                    cancellation_received.set()
-                    while not release_task.is_set():
-                        try:
-                            await release_task.wait()
-                        except asyncio.CancelledError:
-                            continue
-                    return "released"
-
-            nonlocal background_task
-            background_task = asyncio.create_task(tracked_task())
-            await asyncio.sleep(0)
-            return "done"
-
-        async def simulated_wait_for(awaitable, timeout):
-            nonlocal cleanup_gather
-            if timeout == 5.0:
-                cleanup_gather = awaitable
-                awaitable.cancel()
-
-                def consume_gather_exception(future):
-                    try:
-                        future.exception()
-                    except asyncio.CancelledError:
-                        pass
-
-                awaitable.add_done_callback(consume_gather_exception)
-                await cancellation_received.wait()
-                raise asyncio.TimeoutError
-            return await awaitable
+        async def record_loop():
+            loops.append(asyncio.get_running_loop())
+            return "ok"
 
-        mocker.patch(
-            "whisperbridge.ui_qt.workers.asyncio.wait_for",
-            side_effect=simulated_wait_for,
-        )
+        for _ in range(2):
+            assert BaseAsyncWorker()._run_async_task(record_loop(), "TestSharedLoop") == "ok"
 
-        try:
-            result = worker._run_async_task(main_task(), "TestCancel")
-
-            assert result == "done"
-            assert cancellation_received.is_set()
-            assert any(
-                record.message == (
-                    "Task cancellation timed out after 5 seconds, "
-                    "proceeding with loop cleanup"
-                )
-                and record.levelname == "WARNING"
-                for record in loguru_caplog.records
-            )
+        assert loops[0] is loops[1]
+        assert not loops[0].is_closed()
+
+    def test_cancel_request_cancels_runtime_task(self, qtbot, mock_config_service):
+        """request_cancel cancels the task on the shared loop and reports cancellation."""
+        worker = BaseAsyncWorker()
+        finished_spy = QSignalSpy(worker.finished)
+        cancelled = []
 
-            release_task.set()
-            assert loop.run_until_complete(background_task) == "released"
-            assert cleanup_gather is not None
-            assert cleanup_gather.done()
+        async def slow_coro():
             try:
-                cleanup_gather.exception()
+                await asyncio.sleep(10)
             except asyncio.CancelledError:
-                pass
-            assert not asyncio.all_tasks(loop)
-        finally:
-            if background_task is not None and not background_task.done():
-                release_task.set()
-                loop.run_until_complete(background_task)
-            original_close()
-    
-    
+                cancelled.append(True)
+                raise
+
+        QTimer.singleShot(100, worker.request_cancel)
+        started = time.time()
+        thread_result = []
+
+        runner = threading.Thread(target=lambda: thread_result.append(worker._run_async_task(slow_coro(), "TestCancel")))
+        runner.start()
+        qtbot.waitUntil(lambda: not runner.is_alive(), timeout=3000)
+
+        assert time.time() - started < 3
+        assert thread_result == [None]
+        assert finished_spy.count() == 1
+        assert finished_spy.at(0)[1] == "Request cancelled"
+        qtbot.waitUntil(lambda: cancelled == [True], timeout=1000)
+
     def test_translation_worker_empty_response(self, qtbot, mock_config_service, mocker):
         """Test TranslationWorker handles empty API response."""
         mock_service = Mock()
+        mock_service.get_cached_translation.return_value = None
+        mock_service.get_cached_style.return_value = None
         mock_service.translate_text_async = AsyncMock(return_value=Mock(success=True, translated_text=None))
         
         mocker.patch('whisperbridge.services.translation_service.get_translation_service', return_value=mock_service)
@@ -858,10 +900,78 @@ class TestQtIntegration:
         assert finished_spy.count() == 1
         assert finished_spy.at(0)[0] is True
         assert finished_spy.at(0)[1] == ""
-    
+
+    def test_translation_worker_emits_per_language_results(self, qtbot, mock_config_service, mocker):
+        """Test TranslationWorker emits one text per target language for several targets."""
+        translations = {
+            "de": TranslationResponse(success=True, translated_text="Hallo"),
+            "uk": TranslationResponse(success=False, error_message="quota exceeded"),
+        }
+        mock_service = Mock()
+        mock_service.translate_text_async = AsyncMock(
+            return_value=TranslationResponse(success=True, translated_text="[DE]\nHallo", translations=translations)
+        )
+
+        mocker.patch('whisperbridge.services.translation_service.get_translation_service', return_value=mock_service)
+        worker = TranslationWorker("Hello", "en", ["de", "uk"])
+        translations_spy = QSignalSpy(worker.translations)
+        finished_spy = QSignalSpy(worker.finished)
+        worker.run()
+
+        mock_service.get_cached_translation.assert_not_called()
+        assert translations_spy.count() == 1
+        assert translations_spy.at(0)[0] == {"de": "Hallo", "uk": "Translation failed: quota exceeded"}
+        assert finished_spy.at(0)[0] is True
+
+    def test_style_worker_emits_per_style_results(self, qtbot, mock_config_service, mocker):
+        """Test StyleWorker rewrites in several presets with one call and emits a text per preset."""
+        mock_service = Mock()
+        mock_service.style_many_async = AsyncMock(return_value=[
+            TranslationResponse(success=True, translated_text="Dear Sir"),
+            TranslationResponse(success=False, error_message="quota exceeded"),
+        ])
+
+        mocker.patch('whisperbridge.services.translation_service.get_translation_service', return_value=mock_service)
+        worker = StyleWorker("Hi", ["Formal", "Shorten"])
+        styles_spy = QSignalSpy(worker.styles)
+        finished_spy = QSignalSpy(worker.finished)
+        worker.run()
+
+        mock_service.style_many_async.assert_awaited_once_with("Hi", ["Formal", "Shorten"])
+        mock_service.get_cached_style.assert_not_called()
+        assert styles_spy.at(0)[0] == {"Formal": "Dear Sir", "Shorten": "Styling failed: quota exceeded"}
+        assert finished_spy.at(0)[0] is True
+        assert finished_spy.at(0)[1] == "[Formal]\nDear Sir"
+
+    def test_overlay_shows_tab_per_style(self, overlay):
+        """Style preset tabs keep the preset names."""
+        overlay._on_styles_ready({"Formal": "Dear Sir", "Shorten": "Hi"})
+        overlay._apply_successful_translation_result("[Formal]\nDear Sir\n\n[Shorten]\nHi")
+
+        assert [overlay.target_tabs.tabText(i) for i in range(overlay.target_tabs.count())] == ["Formal", "Shorten"]
+        assert overlay.translated_text.toPlainText() == "Dear Sir"
+
+    def test_overlay_shows_tab_per_target_language(self, overlay):
+        """Overlay shows one tab per language and the selected language's text."""
+        overlay._on_translations_ready({"de": "Hallo", "uk": "Привіт"})
+        overlay._apply_successful_translation_result("[DE]\nHallo\n\n[UK]\nПривіт")
+
+        assert not overlay.target_tabs.isHidden()
+        assert [overlay.target_tabs.tabText(i) for i in range(overlay.target_tabs.count())] == ["DE", "UK"]
+        assert overlay.translated_text.toPlainText() == "Hallo"
+
+        overlay.target_tabs.setCurrentIndex(1)
+        assert overlay.translated_text.toPlainText() == "Привіт"
+
+        overlay._begin_request_ui_state(is_style=False)
+        overlay._restore_request_controls()
+        assert overlay.target_tabs.isHidden() and overlay.target_tabs.count() == 0
+
     def test_translation_worker_service_error(self, qtbot, mock_config_service, mocker):
         """Test TranslationWorker handles service errors."""
         mock_service = Mock()
+        mock_service.get_cached_translation.return_value = None
+        mock_service.get_cached_style.return_value = None
         mock_service.translate_text_async = AsyncMock(side_effect=Exception("Service unavailable"))
         
         mocker.patch('whisperbridge.services.translation_service.get_translation_service', return_value=mock_service)
@@ -876,6 +986,8 @@ class TestQtIntegration:
     def test_style_worker_empty_response(self, qtbot, mock_config_service, mocker):
         """Test StyleWorker handles empty API response."""
         mock_service = Mock()
+        mock_service.get_cached_translation.return_value = None
+        mock_service.get_cached_style.return_value = None
         mock_service.style_text_async = AsyncMock(return_value=Mock(success=True, translated_text=None))
         
         mocker.patch('whisperbridge.services.translation_service.get_translation_service', return_value=mock_service)
@@ -889,6 +1001,8 @@ class TestQtIntegration:
     def test_style_worker_service_error(self, qtbot, mock_config_service, mocker):
         """Test StyleWorker handles service errors."""
         mock_service = Mock()
+        mock_service.get_cached_translation.return_value = None
+        mock_service.get_cached_style.return_value = None
         mock_service.style_text_async = AsyncMock(side_effect=Exception("Service unavailable"))
         
         mocker.patch('whisperbridge.services.translation_service.get_translation_service', return_value=mock_service)
@@ -910,7 +1024,7 @@ class TestCaptureOcrTranslateWorker:
         """Mock OCR, translation, and notification service boundaries."""
         ocr_service = Mock()
         ocr_service.process_image.return_value = Mock(
-            text="original", success=True, error_message=None
+            text="original", success=True, error_message=None, translated_text=None
         )
         translation_service = Mock(is_available=True)
         translation_service.translate_text_sync.return_value = Mock(
@@ -951,6 +1065,21 @@ class TestCaptureOcrTranslateWorker:
             "original", source_lang="auto", target_lang="uk"
         )
 
+    def test_capture_ocr_worker_cancel_aborts_vision_request(self, mock_services):
+        """Cancelling the worker cancels the token passed to the OCR request."""
+        ocr_service, _, _ = mock_services
+        worker = CaptureOcrTranslateWorker(image=Mock())
+        ocr_service.process_image.side_effect = lambda request, cancel_token=None: (
+            worker.request_cancel(),
+            Mock(text="", success=False, error_message="Request cancelled", translated_text=None),
+        )[1]
+        finished_spy = QSignalSpy(worker.finished)
+
+        worker.run()
+
+        assert ocr_service.process_image.call_args.kwargs["cancel_token"].cancelled
+        assert finished_spy.count() == 0
+
     def test_capture_ocr_worker_success_signals(self, qtbot, mock_services):
         """Test worker emits finished payload for successful OCR path."""
         _, _, notification_service = mock_services
@@ -971,7 +1100,7 @@ class TestCaptureOcrTranslateWorker:
         """OCR failures emit the original text/translation/error tuple."""
         ocr_service, _, _ = mock_services
         ocr_service.process_image.return_value = Mock(
-            text="", success=False, error_message="vision failed"
+            text="", success=False, error_message="vision failed", translated_text=None
         )
 
         worker = CaptureOcrTranslateWorker(image=Mock())
@@ -981,6 +1110,23 @@ class TestCaptureOcrTranslateWorker:
         assert finished_spy.count() == 1
         assert finished_spy.at(0) == ["", "", "ocr", "vision failed"]
 
+    def test_capture_ocr_worker_uses_translation_from_ocr_request(self, qtbot, mock_services):
+        """A translation returned by the OCR request is used without a second request."""
+        ocr_service, translation_service, notification_service = mock_services
+        ocr_service.process_image.return_value = Mock(
+            text="original", success=True, error_message=None, translated_text="translated in one"
+        )
+
+        worker = CaptureOcrTranslateWorker(image=Mock())
+        finished_spy = QSignalSpy(worker.finished)
+        worker.run()
+
+        request = ocr_service.process_image.call_args.args[0]
+        assert (request.translate_from, request.translate_to) == ("auto", "uk")
+        assert finished_spy.at(0) == ["original", "translated in one", "ocr", ""]
+        translation_service.translate_text_sync.assert_not_called()
+        notification_service.info.assert_not_called()
+
     def test_capture_ocr_worker_reports_unavailable_translation(self, mock_services):
         """A missing translation service preserves the OCR result and error."""
         ocr_service, translation_service, _ = mock_services
@@ -992,6 +1138,7 @@ class TestCaptureOcrTranslateWorker:
 
         assert finished_spy.at(0) == ["original", "", "ocr", "Translation service not configured"]
         translation_service.translate_text_sync.assert_not_called()
+        assert ocr_service.process_image.call_args.args[0].translate_to is None
 
     def test_capture_ocr_worker_cancel(self, mock_services, mocker):
         """Test worker respects cancel request."""
@@ -1154,6 +1301,10 @@ class TestErrorRecovery:
         mock_config_service[0] = 1
 
         mock_service = Mock()
+
+        mock_service.get_cached_translation.return_value = None
+
+        mock_service.get_cached_style.return_value = None
         call_count = 0
 
         async def translate_text(*_args, **_kwargs):